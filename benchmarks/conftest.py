@@ -0,0 +1,13 @@
+from pathlib import Path
+
+import pytest
+
+BENCHMARKS = Path(__file__).parent
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Mark every benchmark so that the default run, which deselects them, only runs the tests"""
+    for item in items:
+        if item.path.is_relative_to(BENCHMARKS):
+            item.add_marker(pytest.mark.benchmark)
@@ -0,0 +1,37 @@
+import orjson
+import pytest
+
+from benchmarks.utils import check_baselines, per_call_us, report
+from python_sdk.common.fill_estimator import FillEstimator
+from python_sdk.common.price_book import PriceBook
+from python_sdk.common.token_registry import TokenRegistry
+from python_sdk.mock.payloads import CHAIN, USDC, WBTC, WETH, pricing_message
+
+np = pytest.importorskip("numpy")
+
+SIZES = 10_000
+
+
+def _estimator() -> tuple[PriceBook, FillEstimator]:
+    book = PriceBook()
+    book.update(CHAIN, orjson.dumps(pricing_message(CHAIN, levels=20)))
+    registry = TokenRegistry()
+    for token, decimals in ((WETH, 18), (USDC, 6), (WBTC, 8)):
+        registry.add(CHAIN.id, token, decimals=decimals)
+    return book, FillEstimator(book, registry)
+
+
+def test_fill_estimator_speed() -> None:
+    book, estimator = _estimator()
+    prices = book.get(CHAIN, WETH, USDC)
+    assert prices is not None
+    sizes = np.linspace(0.01, 100, SIZES)
+    raw_sizes = sizes * 10**18
+
+    def level_walk() -> list[float | None]:
+        return [prices.fill_price(size, buy=False) for size in sizes.tolist()]
+
+    before = per_call_us(level_walk, number=5, repeat=3)
+    after = per_call_us(lambda: estimator.estimate(CHAIN, WETH, USDC, raw_sizes), number=50, repeat=3)
+    report(f"Fill estimate of {SIZES} sizes (20 levels)", {"WETH/USDC": (before, after)})
+    check_baselines(f"fill estimate of {SIZES} sizes", {"WETH/USDC": after})
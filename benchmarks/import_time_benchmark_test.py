@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+# Self time of all `python_sdk` modules, excluding third party dependencies, well above the current ~150ms
+IMPORT_BUDGET_US = 300_000
+# Only needed to sign, the clients import them (the quote types not importing them is checked in tests/)
+SIGNING_MODULES = {"web3", "eth_account"}
+CLIENTS = ["python_sdk.pmm.client", "python_sdk.jam.client"]
+QUOTE_TYPES = ["python_sdk.pmm.types.quote_types", "python_sdk.jam.types.quote_types"]
+
+
+def import_times(modules: list[str]) -> dict[str, tuple[int, int]]:
+    """Self and cumulative import times of every module loaded by importing `modules` in a fresh interpreter, in
+    microseconds"""
+    command = [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"]
+    result = subprocess.run(command, capture_output=True, text=True, check=True)  # noqa: S603
+    times: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        times[module.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def cumulative_us(modules: list[str], runs: int = 3) -> tuple[int, set[str]]:
+    """Best total time to import `modules`, dependencies included, and the modules that it loads"""
+    times = [import_times(modules) for _ in range(runs)]
+    return min(sum(run[module][1] for module in modules) for run in times), set(times[0])
+
+
+def test_import_time() -> None:
+    runs = [import_times(CLIENTS) for _ in range(3)]
+    sdk_modules = {module for module in runs[0] if module.startswith("python_sdk")}
+    best = {module: min(run[module][0] for run in runs) for module in sdk_modules}
+    total = sum(best.values())
+    print(f"\npython_sdk import self time: {total / 1000:.1f}ms")
+    for module, self_us in sorted(best.items(), key=lambda item: -item[1])[:5]:
+        print(f"{module:<48}{self_us / 1000:>8.1f}ms")
+    assert total < IMPORT_BUDGET_US
+
+
+def test_cumulative_import_time() -> None:
+    clients_us, client_modules = cumulative_us(CLIENTS)
+    quote_types_us, _ = cumulative_us(QUOTE_TYPES)
+    print("\ncumulative import time, dependencies included")
+    print(f"{'clients':<48}{clients_us / 1000:>8.1f}ms")
+    print(f"{'quote types':<48}{quote_types_us / 1000:>8.1f}ms")
+    assert client_modules >= SIGNING_MODULES
+    # Both measured in this run, the clients pay for web3 and eth_account on top of the quote types
+    assert quote_types_us < clients_us / 2
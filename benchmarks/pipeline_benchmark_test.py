@@ -0,0 +1,150 @@
+import asyncio
+import time
+from typing import Any
+
+import orjson
+import pytest
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
+from web3 import AsyncWeb3
+from web3.providers.async_base import AsyncBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from benchmarks.utils import async_per_call_us, check_baselines, per_call_us
+from python_sdk.common.client_config import ClientConfig
+from python_sdk.common.gas_oracle import GasConfig, GasOracle
+from python_sdk.common.transport import AioHttpTransport
+from python_sdk.common.types.types import Env
+from python_sdk.jam.types.quote_types import QuoteRequest as JamQuoteRequest
+from python_sdk.jam.types.quote_types import QuoteResponse as JamQuoteResponse
+from python_sdk.mock.payloads import (
+    CHAIN,
+    USDC,
+    USDT,
+    WBTC,
+    WETH,
+    jam_quote,
+    pmm_aggregate_quote,
+    pmm_multi_quote,
+    pmm_single_quote,
+)
+from python_sdk.mock.server import MockBebopServer, MockServerConfig
+from python_sdk.pmm.client import PMMClient
+from python_sdk.pmm.types.quote_types import QuoteRequest as PmmQuoteRequest
+from python_sdk.pmm.types.quote_types import QuoteResponse as PmmQuoteResponse
+
+PRIVATE_KEY = "0x" + "11" * 32
+ACCOUNT: LocalAccount = Account.from_key(PRIVATE_KEY)
+CONCURRENCY_LEVELS = [1, 8, 32, 128]
+PIPELINE_ORDERS = 64
+
+
+class StaticRpcProvider(AsyncBaseProvider):
+    """Answers the few RPC calls needed to sign a self-execution transaction, without a node"""
+
+    RESULTS: dict[str, Any] = {
+        "eth_chainId": hex(CHAIN.id),
+        "eth_gasPrice": hex(10_000_000),
+        "eth_feeHistory": {
+            "oldestBlock": "0x10",
+            "baseFeePerGas": [hex(10_000_000), hex(10_000_000)],
+            "reward": [["0x0"]],
+            "gasUsedRatio": [0.5],
+        },
+    }
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return {"jsonrpc": "2.0", "id": 1, "result": self.RESULTS[method]}
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        return True
+
+
+def test_to_params() -> None:
+    requests = {
+        "pmm single": PmmQuoteRequest(sell_tokens=[USDT], buy_tokens=[WETH], sell_amounts=[2_000_000]),
+        "pmm multi": PmmQuoteRequest(
+            sell_tokens=[USDT],
+            buy_tokens=[WETH, WBTC, USDC],
+            buy_tokens_ratios=[0.4, 0.3, 0.3],
+            sell_amounts=[3_000_000],
+        ),
+        "jam": JamQuoteRequest(sell_tokens=[USDT], buy_tokens=[WETH], sell_amounts=[10_000_000]),
+    }
+    check_baselines("to_params", {case: per_call_us(request.to_params) for case, request in requests.items()})
+
+
+def test_model_validate() -> None:
+    payloads = {
+        "pmm SingleOrder": (PmmQuoteResponse, orjson.dumps(pmm_single_quote())),
+        "pmm MultiOrder": (PmmQuoteResponse, orjson.dumps(pmm_multi_quote())),
+        "pmm AggregateOrder": (PmmQuoteResponse, orjson.dumps(pmm_aggregate_quote())),
+        "jam": (JamQuoteResponse, orjson.dumps(jam_quote())),
+    }
+    check_baselines(
+        "decode + model_validate",
+        {
+            case: per_call_us(lambda model=model, raw=raw: model.model_validate(orjson.loads(raw)))
+            for case, (model, raw) in payloads.items()
+        },
+    )
+
+
+def test_sign_order() -> None:
+    quotes: dict[str, PmmQuoteResponse | JamQuoteResponse] = {
+        "pmm SingleOrder": PmmQuoteResponse.model_validate(pmm_single_quote()),
+        "pmm MultiOrder": PmmQuoteResponse.model_validate(pmm_multi_quote()),
+        "pmm AggregateOrder": PmmQuoteResponse.model_validate(pmm_aggregate_quote()),
+        "jam": JamQuoteResponse.model_validate(jam_quote()),
+    }
+    check_baselines(
+        "sign_order",
+        {
+            case: per_call_us(lambda q=quote: q.sign_order(ACCOUNT), number=20, repeat=3)
+            for case, quote in quotes.items()
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_sign_transaction() -> None:
+    web3 = AsyncWeb3(StaticRpcProvider())
+    gas_oracle = GasOracle(CHAIN, web3, GasConfig(max_age=3600))
+    results: dict[str, float] = {}
+    for case, payload in {"pmm SingleOrder": pmm_single_quote, "pmm MultiOrder": pmm_multi_quote}.items():
+        quote = PmmQuoteResponse.model_validate(payload(gasless=False))
+        assert quote.tx is not None
+        tx = {**quote.tx, "from": ACCOUNT.address}
+
+        async def sign(quote: PmmQuoteResponse = quote, tx: dict[str, Any] = tx) -> None:
+            quote.tx = tx.copy()  # type: ignore[assignment]
+            await quote.sign_transaction(web3, ACCOUNT, nonce=1, gas_oracle=gas_oracle)
+
+        results[case] = await async_per_call_us(sign, number=20, repeat=3)
+    check_baselines("sign_transaction", results)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_throughput() -> None:
+    """Quote -> sign -> post order against the mock API, with 5ms of server latency per request"""
+    results: dict[str, float] = {}
+    async with MockBebopServer(MockServerConfig(latency=0.005, seed=0)) as server:
+        transport = AioHttpTransport(base_url=server.url)
+        async with PMMClient(Env.PROD, CHAIN, PRIVATE_KEY, config=ClientConfig(transport=transport)) as client:
+            for concurrency in CONCURRENCY_LEVELS:
+
+                async def order(i: int, semaphore: asyncio.Semaphore) -> None:
+                    async with semaphore:
+                        request = PmmQuoteRequest(sell_tokens=[USDT], buy_tokens=[WETH], sell_amounts=[1_000_000 + i])
+                        handle = await client.submit_gasless_order(request)
+                        handle.cancel()
+
+                start = time.perf_counter()
+                semaphore = asyncio.Semaphore(concurrency)
+                await asyncio.gather(*(order(i, semaphore) for i in range(PIPELINE_ORDERS)))
+                elapsed = time.perf_counter() - start
+                print(f"\nconcurrency {concurrency:>4}: {PIPELINE_ORDERS / elapsed:>8.1f} orders/s")
+                results[f"concurrency {concurrency}"] = elapsed / PIPELINE_ORDERS * 1e6
+        await transport.close()
+    assert server.requests["pmm/order"] == PIPELINE_ORDERS * len(CONCURRENCY_LEVELS)
+    check_baselines("pipeline (us per order)", results)
@@ -0,0 +1,60 @@
+import json
+
+import orjson
+from pydantic import BaseModel
+
+from benchmarks.utils import check_baselines, per_call_us, report
+from python_sdk.common.price_book import PriceBook
+from python_sdk.mock.payloads import CHAIN, USDC, WETH, pricing_message
+
+
+class PriceLevelModel(BaseModel):
+    price: float
+    size: float
+
+
+class PairPricesModel(BaseModel):
+    """A pair modelled with one pydantic object per level, the approach the price book avoids"""
+
+    bids: list[PriceLevelModel]
+    asks: list[PriceLevelModel]
+    last_update_ts: float
+
+
+def _pydantic_update(raw: bytes) -> dict[str, PairPricesModel]:
+    return {
+        pair: PairPricesModel(
+            bids=[PriceLevelModel(price=price, size=size) for price, size in levels["bids"]],
+            asks=[PriceLevelModel(price=price, size=size) for price, size in levels["asks"]],
+            last_update_ts=levels["last_update_ts"],
+        )
+        for pair, levels in json.loads(raw).items()
+    }
+
+
+def test_price_book_update() -> None:
+    messages = {
+        "4 pairs x 5 levels": orjson.dumps(pricing_message(CHAIN, levels=5)),
+        "4 pairs x 50 levels": orjson.dumps(pricing_message(CHAIN, levels=50)),
+    }
+    book = PriceBook()
+    rows = {
+        case: (
+            per_call_us(lambda raw=raw: _pydantic_update(raw), number=100),
+            per_call_us(lambda raw=raw: book.update(CHAIN, raw), number=500),
+        )
+        for case, raw in messages.items()
+    }
+    report("Price message decode + apply", rows)
+    check_baselines("price book update", {case: after for case, (_, after) in rows.items()})
+
+    prices = book.get(CHAIN, WETH, USDC)
+    assert prices is not None and prices.best_bid is not None and prices.best_ask is not None
+    assert prices.best_bid < prices.mid < prices.best_ask  # type: ignore[operator]
+    check_baselines(
+        "price book query",
+        {
+            "get": per_call_us(lambda: book.get(CHAIN, WETH, USDC)),
+            "fill_price 50 levels": per_call_us(lambda: prices.fill_price(1_000, buy=True)),
+        },
+    )
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from benchmarks.utils import check_baselines, per_call_us, report
+from python_sdk.common.best_quote import quote_score
+from python_sdk.common.quote_batch import QuoteBatch
+from python_sdk.mock.payloads import USDC, WBTC, WETH, build_pmm_quote
+from python_sdk.pmm.types.quote_types import QuoteResponse
+
+pytest.importorskip("numpy")
+
+QUOTES = 1_000
+
+
+def _quotes() -> list[QuoteResponse]:
+    rng = random.Random(0)  # noqa: S311
+    quotes = []
+    for i in range(QUOTES):
+        buy = {USDC: rng.randrange(1, 10**12)} if i % 3 else {USDC: rng.randrange(1, 10**12), WBTC: 10**8 + i}
+        raw = build_pmm_quote({WETH: rng.randrange(1, 10**24)}, buy, gasless=bool(i % 2))
+        if i % 4 == 0:
+            raw["protocolFee"] = {USDC.lower(): str(10**5 + i)}
+        quotes.append(QuoteResponse.model_validate(raw))
+    return quotes
+
+
+def test_quote_batch_speed() -> None:
+    quotes = _quotes()
+    batch = QuoteBatch(quotes)
+
+    def properties() -> list[float | None]:
+        return [quote_score(quote) for quote in quotes]
+
+    rows = {
+        "usd amounts + score": (
+            per_call_us(properties, number=5, repeat=3),
+            per_call_us(lambda: batch.scores, number=50, repeat=3),
+        ),
+    }
+    report(f"Quote analytics over {QUOTES} quotes", rows)
+    check_baselines(
+        f"quote batch of {QUOTES} quotes",
+        {
+            "build": per_call_us(lambda: QuoteBatch(quotes), number=5, repeat=3),
+            "scores": rows["usd amounts + score"][1],
+        },
+    )
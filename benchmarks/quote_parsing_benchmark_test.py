@@ -0,0 +1,48 @@
+import json
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+import pytest
+
+from benchmarks.utils import per_call_us, report
+from python_sdk.common.types import quote_types
+from python_sdk.jam.types.quote_types import QuoteResponse as JamQuoteResponse
+from python_sdk.mock.payloads import jam_quote, pmm_aggregate_quote, pmm_multi_quote, pmm_single_quote
+from python_sdk.pmm.types.eip712_types import OnchainOrderType
+from python_sdk.pmm.types.quote_types import QuoteResponse as PmmQuoteResponse
+from python_sdk.pmm.types.types import QuoteToSignApiResponse
+
+
+class LegacyPmmQuoteResponse(quote_types.QuoteResponse):
+    """PMM quote model without the `onchainOrderType` dispatch, `toSign` is matched against every union member"""
+
+    toSign: QuoteToSignApiResponse
+    onchainOrderType: OnchainOrderType
+    partialFillOffset: int | None = None
+
+
+CASES: dict[
+    str, tuple[Callable[..., dict[str, Any]], type[quote_types.QuoteResponse], type[quote_types.QuoteResponse]]
+] = {
+    "pmm SingleOrder": (pmm_single_quote, LegacyPmmQuoteResponse, PmmQuoteResponse),
+    "pmm MultiOrder": (pmm_multi_quote, LegacyPmmQuoteResponse, PmmQuoteResponse),
+    "pmm AggregateOrder": (pmm_aggregate_quote, LegacyPmmQuoteResponse, PmmQuoteResponse),
+    "jam": (jam_quote, JamQuoteResponse, JamQuoteResponse),
+}
+
+
+@pytest.mark.parametrize("gasless", [True, False])
+def test_quote_parsing(gasless: bool) -> None:
+    rows: dict[str, tuple[float, float]] = {}
+    for case, (payload, legacy_model, model) in CASES.items():
+        raw = orjson.dumps(payload(gasless=gasless))
+        before = legacy_model.model_validate(json.loads(raw))
+        after = model.model_validate(orjson.loads(raw))
+        assert before.model_dump() == after.model_dump()
+
+        rows[case] = (
+            per_call_us(lambda raw=raw, m=legacy_model: m.model_validate(json.loads(raw))),
+            per_call_us(lambda raw=raw, m=model: m.model_validate(orjson.loads(raw))),
+        )
+    report(f"Quote decode + validation ({gasless=})", rows)
@@ -0,0 +1,50 @@
+import threading
+
+import orjson
+import pytest
+
+from benchmarks.utils import check_baselines, per_call_us, report
+from python_sdk.common.recorder import Recorder, RecorderConfig, RecordKind, Row
+from python_sdk.common.types.types import Route
+from python_sdk.mock.payloads import CHAIN, pmm_single_quote
+from python_sdk.pmm.types.quote_types import QuoteResponse
+
+QUOTE = QuoteResponse.model_validate(pmm_single_quote())
+
+
+class BlockedWriter:
+    """Holds the writer thread until released, to fill the queue"""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.rows: list[Row] = []
+
+    def write(self, kind: RecordKind, rows: list[Row]) -> None:
+        self.release.wait()
+        self.rows.extend(rows)
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_record_quote_cost() -> None:
+    """Hot path cost of recording a quote, against serializing it as JSON in the request's task.
+
+    The writer thread is held on its first record, so the flattening and writing it does in the background does not
+    compete for the CPU with the measured calls.
+    """
+    writer = BlockedWriter()
+    recorder = Recorder(RecorderConfig(queue_size=1_000_000, batch_size=1), writer=writer)
+    try:
+        rows = {
+            "PMM single order": (
+                per_call_us(lambda: orjson.dumps(QUOTE.model_dump(mode="json")), number=2_000),
+                per_call_us(lambda: recorder.record_quote(CHAIN, Route.PMM, QUOTE), number=2_000),
+            )
+        }
+    finally:
+        writer.release.set()
+        await recorder.close()
+    report("Quote recording on the hot path", rows)
+    check_baselines("record_quote", {case: after for case, (_, after) in rows.items()})
@@ -0,0 +1,157 @@
+import asyncio
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+import orjson
+import pytest
+
+from benchmarks.utils import check_baselines
+from python_sdk.common.client_config import ClientConfig
+from python_sdk.common.order_tracker import OrderHandle, TrackerConfig
+from python_sdk.common.replay import Exchange, RecordingTransport, ReplayTransport, load_traffic, replay
+from python_sdk.common.resilience import ResilienceConfig, ResilientTransport, RetryConfig
+from python_sdk.common.transport import AioHttpTransport, Transport
+from python_sdk.common.types.types import Chain, Env, Route
+from python_sdk.jam.client import JamClient
+from python_sdk.jam.types.quote_types import QuoteRequest as JamQuoteRequest
+from python_sdk.mock.payloads import CHAIN, TAKER, USDC, USDT, WBTC, WETH, pmm_aggregate_quote
+from python_sdk.mock.server import MockBebopServer, MockServerConfig
+from python_sdk.pmm.client import PMMClient
+from python_sdk.pmm.constants import ORDER_STATUS_URL, ORDER_URL, QUOTE_URL
+from python_sdk.pmm.types.quote_types import QuoteRequest as PmmQuoteRequest
+
+PRIVATE_KEY = "0x" + "11" * 32
+TRACKER = TrackerConfig(initial_interval=0.01)
+RETRIES = ResilienceConfig(retry=RetryConfig(max_attempts=5, backoff=0.001), breaker=None)
+
+
+class Clients:
+    def __init__(self, transport: Transport) -> None:
+        config = ClientConfig(transport=transport, tracker_config=TRACKER)
+        self.pmm = PMMClient(Env.PROD, CHAIN, PRIVATE_KEY, config=config)
+        self.jam = JamClient(Env.PROD, CHAIN, PRIVATE_KEY, config=config)
+
+    def client(self, chain: Chain, route: Route) -> PMMClient | JamClient:
+        assert chain == CHAIN
+        return self.jam if route == Route.JAM else self.pmm
+
+    async def close(self) -> None:
+        await self.pmm.close()
+        await self.jam.close()
+
+
+def _aggregate_exchanges(start: float) -> list[Exchange]:
+    """An AggregateOrder quote, order and status, which the mock server does not produce"""
+    quote = pmm_aggregate_quote()
+    request = PmmQuoteRequest(
+        sell_tokens=[USDT, USDC], buy_tokens=[WETH], sell_amounts=[300_000, 300_000], taker_address=TAKER
+    )
+    tx_hash = "0x" + "ab" * 32
+    return [
+        Exchange(start, 0.004, "GET", QUOTE_URL.format(chain=CHAIN.name), params=request.to_params(), response=quote),
+        Exchange(
+            start + 0.01,
+            0.006,
+            "POST",
+            ORDER_URL.format(chain=CHAIN.name),
+            json={"quote_id": quote["quoteId"], "signature": "0x"},
+            response={"status": "Success", "expiry": quote["expiry"], "txHash": tx_hash},
+        ),
+        Exchange(
+            start + 0.03,
+            0.003,
+            "GET",
+            ORDER_STATUS_URL.format(chain=CHAIN.name),
+            params={"quote_id": quote["quoteId"]},
+            response={"status": "Settled", "txHash": tx_hash},
+        ),
+    ]
+
+
+async def _capture(path: Path) -> None:
+    """Single and Multi PMM orders, a JAM order and a quote, with 30% of the requests failing with a 503 first"""
+    config = MockServerConfig(latency=0.005, settle_after=0.02, unavailable_rate=0.3, seed=1)
+    async with MockBebopServer(config) as server:
+        recording = RecordingTransport(AioHttpTransport(base_url=server.url), path)
+        clients = Clients(ResilientTransport(recording, RETRIES))
+        requests = [
+            PmmQuoteRequest(sell_tokens=[USDT], buy_tokens=[WETH], sell_amounts=[2_000_000]),
+            PmmQuoteRequest(
+                sell_tokens=[USDT],
+                buy_tokens=[WETH, WBTC],
+                sell_amounts=[3_000_000],
+                buy_tokens_ratios=[0.5, 0.5],
+            ),
+        ]
+        handles: list[OrderHandle[Any]] = [await clients.pmm.submit_gasless_order(request) for request in requests]
+        handles.append(
+            await clients.jam.submit_gasless_order(
+                JamQuoteRequest(sell_tokens=[USDT], buy_tokens=[WETH], sell_amounts=[10_000_000])
+            )
+        )
+        await clients.pmm.get_quote(PmmQuoteRequest(sell_tokens=[WETH], buy_tokens=[USDC], buy_amounts=[5_000_000]))
+        for handle in handles:
+            await handle.settled()
+        await clients.close()
+        await recording.close()
+    with path.open("ab") as file:
+        for exchange in _aggregate_exchanges(start=load_traffic(path)[-1].ts + 0.01):
+            file.write(orjson.dumps(asdict(exchange)) + b"\n")
+
+
+@pytest.mark.asyncio
+async def test_replay_reproduces_orders(tmp_path: Path) -> None:
+    path = tmp_path / "traffic.jsonl"
+    await _capture(path)
+    traffic = load_traffic(path)
+    assert any(exchange.error is not None for exchange in traffic)
+
+    transport = ReplayTransport(traffic, speed=None)
+    clients = Clients(ResilientTransport(transport, RETRIES))
+    results = await replay(clients.client, traffic, speed=None)
+    for result in results:
+        assert result.error is None, result.error
+    orders = {
+        result.quote.onchainOrderType.value
+        for result in results
+        if result.handle and result.quote and result.exchange.route == Route.PMM
+    }
+    assert orders == {"SingleOrder", "MultiOrder", "AggregateOrder"}
+    assert [result.exchange.route for result in results if result.handle].count(Route.JAM) == 1
+    assert sum(result.handle is None for result in results) == 1
+    # The replayed quotes and orders are the captured ones, including the 503s that were retried
+    for result in results:
+        assert result.quote is not None and result.exchange.response is not None
+        assert result.quote.quoteId == result.exchange.response["quoteId"]
+    settled = [await result.handle.settled() for result in results if result.handle]
+    assert all(status.status == "Settled" for status in settled)
+    await clients.close()
+    assert transport.misses == 0
+
+
+@pytest.mark.asyncio
+async def test_replay_speed(tmp_path: Path) -> None:
+    path = tmp_path / "traffic.jsonl"
+    await _capture(path)
+    traffic = load_traffic(path)
+    quotes = [exchange for exchange in traffic if exchange.path.endswith("/quote")]
+    captured = max(exchange.ts for exchange in quotes)
+
+    results: dict[str, float] = {}
+    for case, speed in (("original speed", 1.0), ("10x", 10.0), ("max speed", None)):
+        clients = Clients(ResilientTransport(ReplayTransport(traffic, speed=speed), RETRIES))
+        start = time.perf_counter()
+        replayed = await replay(clients.client, traffic, speed=speed)
+        results[case] = (time.perf_counter() - start) / len(replayed) * 1e6
+        for result in replayed:
+            if result.handle is not None:
+                result.handle.cancel()
+        await clients.close()
+        await asyncio.sleep(0)
+        if speed is not None:
+            # The last quote starts at its captured offset, scaled by the replay speed
+            assert results[case] / 1e6 * len(replayed) >= captured / speed
+    assert results["max speed"] < results["original speed"]
+    check_baselines("replay (us per quote)", {"max speed": results["max speed"]})
@@ -0,0 +1,70 @@
+from collections.abc import Callable
+from dataclasses import asdict
+from typing import Any
+
+import pytest
+from eth_account import Account
+from eth_account.messages import SignableMessage, encode_typed_data
+from eth_account.signers.local import LocalAccount
+
+from benchmarks.utils import per_call_us, report
+from python_sdk.jam.types.eip712_types import JamOrderSchema
+from python_sdk.jam.types.quote_types import QuoteResponse as JamQuoteResponse
+from python_sdk.mock.payloads import jam_quote, pmm_aggregate_quote, pmm_multi_quote, pmm_single_quote
+from python_sdk.pmm.types.eip712_types import ORDER_TYPE_TO_SCHEMA
+from python_sdk.pmm.types.quote_types import QuoteResponse as PmmQuoteResponse
+
+PRIVATE_KEY = "0x" + "11" * 32
+ACCOUNT: LocalAccount = Account.from_key(PRIVATE_KEY)
+
+
+def _quotes() -> dict[str, PmmQuoteResponse | JamQuoteResponse]:
+    return {
+        "pmm SingleOrder": PmmQuoteResponse.model_validate(pmm_single_quote()),
+        "pmm MultiOrder": PmmQuoteResponse.model_validate(pmm_multi_quote()),
+        "pmm AggregateOrder": PmmQuoteResponse.model_validate(pmm_aggregate_quote()),
+        "jam": JamQuoteResponse.model_validate(jam_quote()),
+    }
+
+
+def _legacy_encode(quote: PmmQuoteResponse | JamQuoteResponse) -> SignableMessage:
+    """The per-call `encode_typed_data` path `sign_order` used before the schema caches"""
+    message: Any = quote.toSign.signable_message
+    if isinstance(quote, PmmQuoteResponse):
+        structured_msg = ORDER_TYPE_TO_SCHEMA[quote.onchainOrderType].structured_message(quote.chainId, message)
+    else:
+        structured_msg = JamOrderSchema.structured_message(quote.chainId, message)
+    return encode_typed_data(full_message=asdict(structured_msg))
+
+
+def _encode(quote: PmmQuoteResponse | JamQuoteResponse) -> SignableMessage:
+    message: Any = quote.toSign.signable_message
+    if isinstance(quote, PmmQuoteResponse):
+        return ORDER_TYPE_TO_SCHEMA[quote.onchainOrderType].encode_typed_data(quote.chainId, message)
+    return JamOrderSchema.encode_typed_data(quote.chainId, message)
+
+
+@pytest.mark.parametrize("case", list(_quotes()))
+def test_signatures_are_identical(case: str) -> None:
+    quote = _quotes()[case]
+    assert _encode(quote) == _legacy_encode(quote)
+    legacy_signature = ACCOUNT.sign_message(_legacy_encode(quote)).signature.hex()
+    assert quote.sign_order(ACCOUNT) == legacy_signature
+
+
+def test_signing_speed() -> None:
+    encode_rows: dict[str, tuple[float, float]] = {}
+    sign_rows: dict[str, tuple[float, float]] = {}
+    for case, quote in _quotes().items():
+        legacy_sign: Callable[[], Any] = lambda q=quote: ACCOUNT.sign_message(_legacy_encode(q))
+        encode_rows[case] = (
+            per_call_us(lambda q=quote: _legacy_encode(q), number=500),
+            per_call_us(lambda q=quote: _encode(q), number=500),
+        )
+        sign_rows[case] = (
+            per_call_us(legacy_sign, number=20, repeat=3),
+            per_call_us(lambda q=quote: q.sign_order(ACCOUNT), number=20, repeat=3),
+        )
+        assert encode_rows[case][1] < encode_rows[case][0]
+    report("EIP-712 encoding (domain separator + struct hash)", encode_rows)
+    report("sign_order (encoding + ECDSA)", sign_rows)
@@ -0,0 +1,59 @@
+import os
+import time
+import timeit
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+BASELINES_PATH = Path(__file__).parent / "baselines.json"
+# Allowed slowdown against the stored baseline before a benchmark fails, as a fraction of the baseline
+TOLERANCE = float(os.getenv("BENCHMARK_TOLERANCE", "1.0"))
+UPDATE_BASELINES = os.getenv("BENCHMARK_UPDATE_BASELINES") == "1"
+
+
+def per_call_us(fn: Callable[[], Any], number: int = 2_000, repeat: int = 5) -> float:
+    """Best-of-`repeat` cost of a single `fn()` call, in microseconds"""
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e6
+
+
+async def async_per_call_us(fn: Callable[[], Awaitable[Any]], number: int = 200, repeat: int = 5) -> float:
+    """Best-of-`repeat` cost of a single `await fn()` call on the running loop, in microseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            await fn()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+def report(title: str, rows: dict[str, tuple[float, float]]) -> None:
+    print(f"\n{title}")
+    print(f"{'case':<24}{'before (us)':>14}{'after (us)':>14}{'speedup':>10}")
+    for case, (before, after) in rows.items():
+        print(f"{case:<24}{before:>14.1f}{after:>14.1f}{before / after:>9.2f}x")
+
+
+def check_baselines(title: str, results: dict[str, float]) -> None:
+    """Compare per-call costs (lower is better) to `baselines.json` and fail on regressions beyond `TOLERANCE`.
+
+    Run with `BENCHMARK_UPDATE_BASELINES=1` to record the current results as the new baselines instead.
+    """
+    baselines: dict[str, float] = orjson.loads(BASELINES_PATH.read_bytes()) if BASELINES_PATH.exists() else {}
+    print(f"\n{title}")
+    print(f"{'case':<40}{'baseline (us)':>16}{'current (us)':>16}{'change':>10}")
+    regressions = []
+    for case, current in results.items():
+        key = f"{title} / {case}"
+        baseline = baselines.get(key)
+        change = f"{current / baseline - 1:>+9.0%}" if baseline else f"{'new':>9}"
+        print(f"{case:<40}{baseline or float('nan'):>16.1f}{current:>16.1f}{change:>10}")
+        if UPDATE_BASELINES:
+            baselines[key] = round(current, 2)
+        elif baseline and current > baseline * (1 + TOLERANCE):
+            regressions.append(f"{key}: {current:.1f}us vs baseline {baseline:.1f}us")
+    if UPDATE_BASELINES:
+        BASELINES_PATH.write_bytes(orjson.dumps(baselines, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS) + b"\n")
+    assert not regressions, "Benchmark regressions:\n" + "\n".join(regressions)
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
-from typing import Any
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any
+
+from eth_utils.address import is_address
+from eth_utils.crypto import keccak
+from hexbytes import HexBytes
+
+if TYPE_CHECKING:
+    from eth_account.messages import SignableMessage
 
 # Example of message object: https://github.com/ethereum/eth-account/blob/master/tests/fixtures/valid_eip712_example_with_array.json
 
@@ -38,6 +47,31 @@ class EIP712TypeSchema(ABC):
     @abstractmethod
     def structured_message(cls, chain_id: int, message: Any) -> StructuredEIP712Message: ...
 
+    @classmethod
+    @abstractmethod
+    def domain(cls, chain_id: int) -> EIP712Domain: ...
+
+    @classmethod
+    def type_hash(cls) -> bytes:
+        return _compile_schema(cls)[0]
+
+    @classmethod
+    def hash_struct(cls, message: Mapping[str, Any]) -> bytes:
+        type_hash, encoders = _compile_schema(cls)
+        return keccak(type_hash + b"".join(encode(message[name]) for name, encode in encoders))
+
+    @classmethod
+    def encode_typed_data(cls, chain_id: int, message: Mapping[str, Any]) -> SignableMessage:
+        """Equivalent of `eth_account.messages.encode_typed_data` using the cached type hash and domain separator"""
+        from eth_account.messages import SignableMessage
+
+        domain = cls.domain(chain_id)
+        return SignableMessage(
+            HexBytes(b"\x01"),
+            domain_separator(domain.name, domain.version, domain.chainId, domain.verifyingContract),
+            cls.hash_struct(message),
+        )
+
 
 class EIP712DomainSeparatorSchema(EIP712TypeSchema):
     name: str = "EIP712Domain"
@@ -47,3 +81,60 @@ class EIP712DomainSeparatorSchema(EIP712TypeSchema):
         EIP712Type(name="chainId", type="uint256"),
         EIP712Type(name="verifyingContract", type="address"),
     ]
+
+
+@lru_cache(maxsize=256)
+def domain_separator(name: str, version: str, chain_id: int, verifying_contract: str) -> bytes:
+    return EIP712DomainSeparatorSchema.hash_struct(
+        {"name": name, "version": version, "chainId": chain_id, "verifyingContract": verifying_contract}
+    )
+
+
+@cache
+def _compile_schema(schema: type[EIP712TypeSchema]) -> tuple[bytes, list[tuple[str, Callable[[Any], bytes]]]]:
+    encoded_type = f"{schema.name}({','.join(f'{field.type} {field.name}' for field in schema.types)})"
+    return keccak(text=encoded_type), [(field.name, _field_encoder(field.type)) for field in schema.types]
+
+
+@cache
+def _field_encoder(type_: str) -> Callable[[Any], bytes]:
+    """Build the `encodeData` function for a single atomic, dynamic or array EIP-712 field type"""
+    if type_.endswith("]"):
+        encode_item = _field_encoder(type_[: type_.rindex("[")])
+        return lambda value: keccak(b"".join(encode_item(item) for item in value))
+    if type_ == "address":
+        return _encode_address
+    if type_ == "bool":
+        return lambda value: int(bool(value)).to_bytes(32, "big")
+    if type_.startswith("uint"):
+        return lambda value: int(value).to_bytes(32, "big")
+    if type_.startswith("int"):
+        return lambda value: int(value).to_bytes(32, "big", signed=True)
+    if type_ == "string":
+        return lambda value: keccak(text=value)
+    if type_ == "bytes":
+        return lambda value: keccak(HexBytes(value))
+    if type_.startswith("bytes"):
+        return lambda value: _encode_fixed_bytes(type_, value)
+    raise ValueError(f"Unsupported EIP-712 field type: {type_}")
+
+
+@lru_cache(maxsize=4096)
+def _encode_address(value: str | bytes) -> bytes:
+    """Hex addresses are validated like `eth_abi` does (0x prefix and 40 hex digits), anything else goes through
+    `eth_abi` itself, raising on malformed addresses. Cached, since the same addresses come back in every quote"""
+    if isinstance(value, str) and is_address(value):
+        return bytes.fromhex(value[2:]).rjust(32, b"\x00")
+    from eth_abi.abi import encode  # slow to import, and only needed to raise on malformed addresses
+
+    return encode(["address"], [value])
+
+
+def _encode_fixed_bytes(type_: str, value: Any) -> bytes:
+    """`bytesN` values longer than N bytes go through `eth_abi`, raising like the uncached encoder does"""
+    data = bytes(HexBytes(value))
+    if len(data) > int(type_[5:]):
+        from eth_abi.abi import encode
+
+        return encode([type_], [data])
+    return data.ljust(32, b"\x00")
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from python_sdk.common.exceptions import NoQuoteError
+from python_sdk.common.types.quote_types import QuoteRequest, QuoteResponse, ResponseToken
+from python_sdk.common.types.types import Route
+from python_sdk.common.utils.logger import Logger
+from python_sdk.jam.types.quote_types import QuoteRequest as JamQuoteRequest
+from python_sdk.jam.types.quote_types import QuoteResponse as JamQuoteResponse
+from python_sdk.pmm.types.quote_types import QuoteRequest as PmmQuoteRequest
+from python_sdk.pmm.types.quote_types import QuoteResponse as PmmQuoteResponse
+
+LOGGER = Logger(__name__)
+
+# Fields shared by both routes, route specific ones (`fee` is a percentage on PMM but bps on JAM) are not carried over
+COMMON_FIELDS = set(QuoteRequest.model_fields)
+
+
+@dataclass(frozen=True)
+class BestQuoteConfig:
+    deadline: float = 1.5  # seconds to wait for the routes, the best quote received by then wins
+    # Stop waiting for the slower route once a quote returns at least this fraction of the value sold, e.g. 0.999
+    good_enough: float | None = None
+
+
+@dataclass(frozen=True)
+class BestQuote:
+    route: Route
+    quote: PmmQuoteResponse | JamQuoteResponse
+    runner_up: PmmQuoteResponse | JamQuoteResponse | None = None  # the losing quote, if the other route answered
+    errors: dict[Route, Exception] = field(default_factory=dict)  # routes that failed or missed the deadline
+
+    @property
+    def score(self) -> float | None:
+        return quote_score(self.quote)
+
+
+def quote_score(quote: QuoteResponse) -> float | None:
+    """USD value received per USD sold, net of the gas paid by the taker. `None` without USD prices for every token.
+
+    Gasless quotes already deduct the gas fee from the buy amounts, it is only subtracted for self-execution.
+    """
+    sell_usd = _usd_value(quote.sellTokens)
+    buy_usd = _usd_value(quote.buyTokens)
+    if not sell_usd or buy_usd is None:
+        return None
+    gas_usd = (quote.gasFee.usd or 0.0) if quote.tx is not None else 0.0
+    return (buy_usd - gas_usd) / sell_usd
+
+
+def is_better(quote: QuoteResponse, other: QuoteResponse) -> bool:
+    """Compare by `quote_score`, falling back to the token amounts when USD prices are missing.
+
+    Amounts of different tokens are not comparable, so without prices only quotes for the same tokens are ranked:
+    `quote` is better if it buys at least as much of every token, for at most as much of every token sold, and
+    differs from `other` in one of them. Quotes that cannot be ranked are never better.
+    """
+    score, other_score = quote_score(quote), quote_score(other)
+    if score is not None and other_score is not None:
+        return score > other_score
+    buy, other_buy = _raw_amounts(quote.buyTokens), _raw_amounts(other.buyTokens)
+    sell, other_sell = _raw_amounts(quote.sellTokens), _raw_amounts(other.sellTokens)
+    if buy.keys() != other_buy.keys() or sell.keys() != other_sell.keys():
+        return False
+    gains = [buy[token] - other_buy[token] for token in buy] + [other_sell[token] - sell[token] for token in sell]
+    return all(gain >= 0 for gain in gains) and any(gain > 0 for gain in gains)
+
+
+def route_request(request: QuoteRequest, route: Route) -> PmmQuoteRequest | JamQuoteRequest:
+    """`request` as a request of `route`, keeping it as is if it is already one"""
+    model: type[PmmQuoteRequest] | type[JamQuoteRequest] = JamQuoteRequest if route == Route.JAM else PmmQuoteRequest
+    if isinstance(request, PmmQuoteRequest | JamQuoteRequest) and isinstance(request, model):
+        return request
+    fields = request.model_dump(include=COMMON_FIELDS, exclude_unset=True)
+    # Sent as a header, `source_auth` is excluded from dumps
+    return model.model_validate({**fields, "source_auth": request.source_auth})
+
+
+async def get_best_quote(
+    get_pmm_quote: Callable[[PmmQuoteRequest], Awaitable[PmmQuoteResponse]],
+    get_jam_quote: Callable[[JamQuoteRequest], Awaitable[JamQuoteResponse]],
+    request: QuoteRequest,
+    config: BestQuoteConfig | None = None,
+) -> BestQuote:
+    """Quote `request` on PMM and JAM concurrently and return the better one, with the other attached.
+
+    Routes still pending at the deadline, or once a quote is `good_enough`, are cancelled. Raises if neither
+    route returned a quote.
+    """
+    config = config or BestQuoteConfig()
+    deadline = asyncio.get_running_loop().time() + config.deadline
+    getters: dict[Route, Callable[[Any], Awaitable[PmmQuoteResponse | JamQuoteResponse]]] = {
+        Route.PMM: get_pmm_quote,
+        Route.JAM: get_jam_quote,
+    }
+    tasks = {
+        asyncio.create_task(_quote(get_quote, route_request(request, route))): route
+        for route, get_quote in getters.items()
+    }
+    quotes, errors = await _race(tasks, deadline, config)
+    for route, error in errors.items():
+        LOGGER.info(f"{route.value} quote left out of the comparison: {error}")
+
+    pmm, jam = quotes.get(Route.PMM), quotes.get(Route.JAM)
+    if pmm is not None and jam is not None:
+        if is_better(jam, pmm):
+            return BestQuote(route=Route.JAM, quote=jam, runner_up=pmm, errors=errors)
+        return BestQuote(route=Route.PMM, quote=pmm, runner_up=jam, errors=errors)
+    if pmm is not None:
+        return BestQuote(route=Route.PMM, quote=pmm, errors=errors)
+    if jam is not None:
+        return BestQuote(route=Route.JAM, quote=jam, errors=errors)
+    raise NoQuoteError(f"No quote from any route: {', '.join(f'{r.value}: {e}' for r, e in errors.items())}")
+
+
+async def _race(
+    tasks: dict[asyncio.Task[PmmQuoteResponse | JamQuoteResponse], Route], deadline: float, config: BestQuoteConfig
+) -> tuple[dict[Route, PmmQuoteResponse | JamQuoteResponse], dict[Route, Exception]]:
+    """Collect the quotes (and errors) of each route until all are in, the deadline or a good enough quote"""
+    loop = asyncio.get_running_loop()
+    quotes: dict[Route, PmmQuoteResponse | JamQuoteResponse] = {}
+    errors: dict[Route, Exception] = {}
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, timeout=max(deadline - loop.time(), 0), return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                for task in pending:
+                    errors[tasks[task]] = TimeoutError(f"No {tasks[task].value} quote within {config.deadline}s")
+                break
+            for task in done:
+                if (error := task.exception()) is None:
+                    quotes[tasks[task]] = task.result()
+                elif isinstance(error, Exception):
+                    errors[tasks[task]] = error
+                else:
+                    raise error
+            if config.good_enough is not None and any(
+                (score := quote_score(quote)) is not None and score >= config.good_enough for quote in quotes.values()
+            ):
+                break
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+    return quotes, errors
+
+
+async def _quote(
+    get_quote: Callable[[Any], Awaitable[PmmQuoteResponse | JamQuoteResponse]], request: QuoteRequest
+) -> PmmQuoteResponse | JamQuoteResponse:
+    return await get_quote(request)
+
+
+def _raw_amounts(tokens: Mapping[str, ResponseToken]) -> dict[str, int]:
+    return {address.lower(): int(token.amount) for address, token in tokens.items()}
+
+
+def _usd_value(tokens: Mapping[str, ResponseToken]) -> float | None:
+    """Total USD value of `tokens`, `None` if any of them has no USD price"""
+    if any(not token.priceUsd for token in tokens.values()):
+        return None
+    return sum((token.priceUsd or 0.0) * float(token.amount_decimal) for token in tokens.values())
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import aiohttp
+from web3 import AsyncWeb3
+
+from python_sdk.common.gas_oracle import GasConfig, GasOracle
+from python_sdk.common.metrics import Metrics
+from python_sdk.common.nonce_manager import NonceManager
+from python_sdk.common.order_tracker import TrackerConfig
+from python_sdk.common.quote_cache import QuoteCache
+from python_sdk.common.receipt_waiter import ReceiptWaiter, ReceiptWaiterConfig
+from python_sdk.common.recorder import Recorder
+from python_sdk.common.resilience import ResilienceConfig
+from python_sdk.common.session import SessionConfig
+from python_sdk.common.signer import Signer
+from python_sdk.common.token_registry import TokenRegistry
+from python_sdk.common.token_state import TokenStateReader
+from python_sdk.common.transport import Transport
+
+
+@dataclass(frozen=True)
+class ClientConfig:
+    """Optional settings and resources of `PMMClient` and `JamClient`.
+
+    Resources left unset are created by the client, which closes them with itself. Resources passed in may be shared
+    with other clients (e.g. by `BebopRouter`), they are used as is and owned by the caller.
+    """
+
+    # ---------------------------------- Settings --------------------------------- #
+    ws_rpc_url: str | None = None  # subscribes to `newHeads` to wait for taker order receipts
+    rpc_timeout: float = 6
+    session_config: SessionConfig | None = None
+    resilience: ResilienceConfig | None = None
+    tracker_config: TrackerConfig | None = None
+    receipt_config: ReceiptWaiterConfig | None = None
+    gas_config: GasConfig | None = None
+    # --------------------------------- Resources --------------------------------- #
+    session: aiohttp.ClientSession | None = None  # wrapped in the transport the client creates
+    transport: Transport | None = None  # wrap it in a `ResilientTransport` for retries, hedging and circuit breaking
+    web3: AsyncWeb3 | None = None
+    gas_oracle: GasOracle | None = None
+    receipt_waiter: ReceiptWaiter | None = None
+    token_state: TokenStateReader | None = None  # must read the allowances to the client's spender and Permit2
+    nonce_manager: NonceManager | None = None  # defaults to the process wide `shared_nonce_manager()`
+    token_registry: TokenRegistry | None = None
+    quote_cache: QuoteCache | None = None
+    metrics: Metrics | None = None  # a transport passed in only records the network phases if created with it
+    signer: Signer | None = None  # signs orders instead of the private key when given, e.g. a `PoolSigner`
+    recorder: Recorder | None = None  # quotes, orders and final order statuses are recorded to it
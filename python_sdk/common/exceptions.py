@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import Any
+
+
+class BebopError(Exception):
+    """Base class of the errors raised by the SDK when talking to the Bebop API"""
+
+
+# --------------------------------- Transport -------------------------------- #
+class BebopTransportError(BebopError):
+    """The request failed at the network level, it may or may not have reached the API"""
+
+
+class BebopConnectionError(BebopTransportError, ConnectionError):
+    """No connection could be established, the request was never sent"""
+
+
+class BebopTimeoutError(BebopTransportError, TimeoutError):
+    """No (complete) response in time, the request may still have been processed"""
+
+
+class CircuitOpenError(BebopError):
+    """The endpoint failed repeatedly and is not called until its circuit breaker lets a trial request through"""
+
+    def __init__(self, endpoint: str, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {endpoint}, retrying in {retry_in:.1f}s")
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+# ------------------------------------ HTTP ----------------------------------- #
+class BebopHTTPError(BebopError):
+    """The API answered with a non-2xx status"""
+
+    def __init__(self, status: int, reason: str | None, method: str = "GET") -> None:
+        super().__init__(f"Failed to send {method.upper()} request: {status} - {reason}")
+        self.status = status
+        self.reason = reason
+
+
+class BebopRateLimitError(BebopHTTPError):
+    """HTTP 429, `retry_after` is the delay requested by the API in seconds, if any"""
+
+    def __init__(self, status: int, reason: str | None, method: str = "GET", retry_after: float | None = None) -> None:
+        super().__init__(status, reason, method)
+        self.retry_after = retry_after
+
+
+class BebopServerError(BebopHTTPError):
+    """HTTP 5xx"""
+
+
+def http_error(status: int, reason: str | None, method: str, headers: Any = None) -> BebopHTTPError:
+    """The typed error for a non-2xx response"""
+    if status == 429:
+        retry_after = headers.get("Retry-After") if headers else None
+        try:
+            delay = float(retry_after) if retry_after is not None else None
+        except ValueError:  # an HTTP date, not worth parsing
+            delay = None
+        return BebopRateLimitError(status, reason, method, retry_after=delay)
+    if status >= 500:
+        return BebopServerError(status, reason, method)
+    return BebopHTTPError(status, reason, method)
+
+
+# ------------------------------------ API ------------------------------------ #
+class BebopAPIError(BebopError):
+    """The API answered with an `error` payload, e.g. an unsupported pair or an expired quote"""
+
+    def __init__(self, error: Any) -> None:
+        super().__init__(f"Failed to get valid response: {error}")
+        self.error = error
+        self.code: int | None = error.get("errorCode") if isinstance(error, dict) else None
+        self.message: str | None = error.get("message") if isinstance(error, dict) else None
+
+
+class NoQuoteError(BebopError):
+    """None of the routes raced by `get_best_quote` returned a quote"""
+
+
+# ---------------------------------- Replay ---------------------------------- #
+class ReplayMismatchError(BebopError):
+    """A `ReplayTransport` received a request that is not in the recorded traffic"""
+
+    def __init__(self, key: str) -> None:
+        super().__init__(f"No recorded response for {key}")
+        self.key = key
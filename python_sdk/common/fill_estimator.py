@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from python_sdk.common.price_book import Level, PairPrices, PriceBook
+from python_sdk.common.token_registry import TokenRegistry
+from python_sdk.common.types.quote_types import QuoteRequest
+from python_sdk.common.types.types import Chain
+from python_sdk.common.utils.lazy import import_optional
+
+# `numpy.ndarray`, typed loosely since numpy is an optional dependency
+Array = Any
+
+
+class _Side:
+    """One side of a pair as contiguous arrays: level prices and the cumulative base sizes and quote notionals
+    filled up to the start of each level (a leading 0 included)"""
+
+    __slots__ = ("cum_notional", "cum_size", "prices")
+
+    def __init__(self, np: Any, levels: list[Level]) -> None:
+        array = np.asarray(levels, dtype=np.float64).reshape(-1, 2)
+        self.prices = np.ascontiguousarray(array[:, 0])
+        self.cum_size = np.concatenate(([0.0], np.cumsum(array[:, 1])))
+        self.cum_notional = np.concatenate(([0.0], np.cumsum(array[:, 0] * array[:, 1])))
+
+    def walk(self, np: Any, amounts: Array, by_notional: bool) -> Array:
+        """Quote notional filled for base `amounts`, or base size filled for quote `amounts` if `by_notional`.
+
+        NaN where the levels are not deep enough.
+        """
+        if not len(self.prices):
+            return np.full(amounts.shape, np.nan)
+        cumulative, other = (self.cum_notional, self.cum_size) if by_notional else (self.cum_size, self.cum_notional)
+        # Level at which each amount is completely filled
+        index = np.searchsorted(cumulative[1:], amounts, side="left")
+        level = np.minimum(index, len(self.prices) - 1)
+        remainder = amounts - cumulative[level]
+        price = self.prices[level]
+        filled = other[level] + (remainder / price if by_notional else remainder * price)
+        return np.where(index < len(self.prices), filled, np.nan)
+
+
+@dataclass(frozen=True)
+class FillEstimate:
+    """Estimated raw amounts of the other token, for each requested amount"""
+
+    amounts: Array  # float64 raw amounts, NaN where the levels are not deep enough
+    filled: Array  # bool mask of the amounts the levels can fill
+
+    def raw(self) -> list[int | None]:
+        """The amounts as exact Python integers, raw 18 decimals amounts do not fit in int64"""
+        return [None if amount != amount else int(amount) for amount in self.amounts.tolist()]
+
+
+class FillEstimator:
+    """Estimates fills for whole arrays of sizes from the levels of a `PriceBook`, without requesting quotes.
+
+    Levels are converted to contiguous arrays once per pair update. Amounts are raw integer units, converted with
+    the decimals of `token_registry`. Estimates ignore fees and gas, they are meant to pre-screen which requests are
+    worth a firm quote.
+    """
+
+    def __init__(self, book: PriceBook, token_registry: TokenRegistry) -> None:
+        self.__np = import_optional("numpy", "numpy", "FillEstimator", "numpy")
+        self.__book = book
+        self.__token_registry = token_registry
+        self.__arrays: dict[tuple[Chain, str, str], tuple[PairPrices, _Side, _Side]] = {}
+
+    def estimate(
+        self,
+        chain: Chain,
+        sell_token: str,
+        buy_token: str,
+        amounts: Sequence[int] | Array,
+        exact_in: bool = True,
+        max_age: float | None = None,
+    ) -> FillEstimate:
+        """Raw `buy_token` amounts received for selling each raw `sell_token` amount, or with `exact_in=False` the
+        raw `sell_token` amounts needed to buy each raw `buy_token` amount. NaN for unknown or stale pairs.
+        """
+        np = self.__np
+        values = np.asarray(amounts, dtype=np.float64)
+        decimals_in = self.__token_registry.decimals(chain.id, sell_token if exact_in else buy_token)
+        decimals_out = self.__token_registry.decimals(chain.id, buy_token if exact_in else sell_token)
+        sides = self.__sides(chain, sell_token, buy_token, max_age)
+        if sides is None:
+            result = np.full(values.shape, np.nan)
+        else:
+            (bids, asks), sell_is_base = sides
+            # Selling the base token hits the bids, selling the quote token lifts the asks
+            side = bids if sell_is_base else asks
+            by_notional = sell_is_base != exact_in
+            result = side.walk(np, values / 10.0**decimals_in, by_notional) * 10.0**decimals_out
+        # Round against the taker: less received when selling, more paid when buying
+        result = np.floor(result) if exact_in else np.ceil(result)
+        return FillEstimate(amounts=result, filled=~np.isnan(result))
+
+    def estimate_many(
+        self,
+        chain: Chain,
+        pairs: Sequence[tuple[str, str]],
+        amounts: Sequence[int] | Array,
+        exact_in: bool = True,
+        max_age: float | None = None,
+    ) -> Array:
+        """`estimate` of the same amounts for each `(sell_token, buy_token)` pair, as a (pairs, amounts) array"""
+        np = self.__np
+        rows = [self.estimate(chain, sell, buy, amounts, exact_in, max_age).amounts for sell, buy in pairs]
+        return np.vstack(rows) if rows else np.empty((0, len(amounts)))
+
+    def estimate_requests(
+        self, chain: Chain, requests: Sequence[QuoteRequest], max_age: float | None = None
+    ) -> list[int | None]:
+        """Estimated buy amount of each sell-amount request, or sell amount of each buy-amount request.
+
+        `None` for multi-token requests and pairs the book cannot price. Requests are grouped by pair and direction
+        so that each group is estimated in one vectorized call.
+        """
+        groups: defaultdict[tuple[str, str, bool], list[int]] = defaultdict(list)
+        for i, request in enumerate(requests):
+            if len(request.sell_tokens) == 1 and len(request.buy_tokens) == 1:
+                groups[(request.sell_tokens[0], request.buy_tokens[0], bool(request.sell_amounts))].append(i)
+        estimates: list[int | None] = [None] * len(requests)
+        for (sell_token, buy_token, exact_in), indices in groups.items():
+            amounts = [(requests[i].sell_amounts if exact_in else requests[i].buy_amounts)[0] for i in indices]
+            try:
+                estimate = self.estimate(chain, sell_token, buy_token, amounts, exact_in=exact_in, max_age=max_age)
+            except ValueError:  # unknown decimals
+                continue
+            for i, amount in zip(indices, estimate.raw(), strict=True):
+                estimates[i] = amount
+        return estimates
+
+    def __sides(
+        self, chain: Chain, sell_token: str, buy_token: str, max_age: float | None
+    ) -> tuple[tuple[_Side, _Side], bool] | None:
+        """Bid and ask arrays of the pair trading the two tokens, and whether `sell_token` is its base"""
+        for base, quote, sell_is_base in ((sell_token, buy_token, True), (buy_token, sell_token, False)):
+            prices = self.__book.get(chain, base, quote, max_age=max_age)
+            if prices is None:
+                continue
+            key = (chain, base.lower(), quote.lower())
+            cached = self.__arrays.get(key)
+            if cached is None or cached[0] is not prices:  # the book replaces the levels object on each update
+                cached = (prices, _Side(self.__np, prices.bids), _Side(self.__np, prices.asks))
+                self.__arrays[key] = cached
+            return (cached[1], cached[2]), sell_is_base
+        return None
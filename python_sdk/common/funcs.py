@@ -1,4 +1,5 @@
 import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from typing import Any
 
 import aiohttp
@@ -6,48 +7,145 @@ from eth_account.signers.local import LocalAccount
 from eth_typing import HexStr
 from hexbytes import HexBytes
 from web3 import AsyncWeb3
-from web3.exceptions import TransactionNotFound
 
-from python_sdk.common.constants import ERROR_KEY
-from python_sdk.common.types.order_types import OrderRequest, OrderResponse, OrderStatusRequest, OrderStatusResponse
-from python_sdk.common.types.types import Chain, Env
+from python_sdk.common.gas_oracle import GasOracle
+from python_sdk.common.metrics import Metrics, Phase, metric_tags, timed
+from python_sdk.common.nonce_manager import NonceManager
+from python_sdk.common.receipt_waiter import ReceiptWaiter
+from python_sdk.common.recorder import Recorder
+from python_sdk.common.signer import Signer
+from python_sdk.common.transport import Transport, request_json
+from python_sdk.common.types.order_types import (
+    OrderApiStatus,
+    OrderRequest,
+    OrderResponse,
+    OrderStatusRequest,
+    OrderStatusResponse,
+)
+from python_sdk.common.types.quote_types import QuoteRequestT, QuoteResponseT, QuoteResult
+from python_sdk.common.types.types import Chain, Env, Route
 from python_sdk.common.utils.logger import Logger
+from python_sdk.common.utils.utils import gather_with_concurrency
 from python_sdk.jam.types.quote_types import QuoteResponse as JamQuoteResponse
 from python_sdk.pmm.types.quote_types import QuoteResponse as PmmQuoteResponse
 
 LOGGER = Logger(__name__)
 
 
+async def sign_order(quote: PmmQuoteResponse | JamQuoteResponse, account: LocalAccount | Signer) -> str:
+    """Sign `quote` for gasless execution, with a local account or a `Signer` backend"""
+    if isinstance(account, LocalAccount):
+        return quote.sign_order(account)
+    (signature,) = await account.sign_messages([quote.signable_message()])
+    return signature
+
+
 async def send_taker_order(
-    chain: Chain, web3: AsyncWeb3, account: LocalAccount, quote: PmmQuoteResponse | JamQuoteResponse
+    chain: Chain,
+    web3: AsyncWeb3,
+    account: LocalAccount | Signer,
+    quote: PmmQuoteResponse | JamQuoteResponse,
+    receipt_waiter: ReceiptWaiter | None = None,
+    nonce_manager: NonceManager | None = None,
+    gas_oracle: GasOracle | None = None,
+    metrics: Metrics | None = None,
+    recorder: Recorder | None = None,
 ) -> tuple[HexStr, bool]:
-    raw_tx: HexBytes = await quote.sign_transaction(web3=web3, account=account)
-    tx_hash = AsyncWeb3.to_hex(await web3.eth.send_raw_transaction(raw_tx))
-    LOGGER.info(tx_hash)
-
-    retries: int = 1
-    success: bool = False
-    while True:
-        try:
-            receipt = await web3.eth.get_transaction_receipt(tx_hash)
-        except TransactionNotFound:
-            status = 0
+    route = Route.JAM if isinstance(quote, JamQuoteResponse) else Route.PMM
+    with metric_tags(chain=chain, route=route, quote_id=quote.quoteId):
+        if nonce_manager is None:
+            with timed(metrics, Phase.SIGN):
+                raw_tx: HexBytes = await quote.sign_transaction(web3=web3, account=account, gas_oracle=gas_oracle)
+            tx_hash = AsyncWeb3.to_hex(await web3.eth.send_raw_transaction(raw_tx))
         else:
-            status = receipt["status"]
-        retries += 1
-        if status == 1:
-            success = True
-            break
-        if retries > 20:
-            break
-        await asyncio.sleep(0.5)
+            async with nonce_manager.reserve(web3, chain.id, account.address) as reservation:
+                with timed(metrics, Phase.SIGN):
+                    raw_tx = await quote.sign_transaction(
+                        web3=web3, account=account, nonce=reservation.nonce, gas_oracle=gas_oracle
+                    )
+                reservation.sent = True
+                tx_hash = AsyncWeb3.to_hex(await web3.eth.send_raw_transaction(raw_tx))
+        LOGGER.info(tx_hash)
+
+        with timed(metrics, Phase.SETTLEMENT) as tags:
+            if receipt_waiter is None:
+                receipt_waiter = ReceiptWaiter(chain=chain, web3=web3)
+                try:
+                    receipt = await receipt_waiter.wait(tx_hash)
+                finally:
+                    await receipt_waiter.close()
+            else:
+                receipt = await receipt_waiter.wait(tx_hash)
+            success: bool = receipt is not None and receipt["status"] == 1
+            tags["success"] = success
+        if receipt is None and nonce_manager is not None:
+            # Not mined in time, maybe queued behind a nonce that never reached the RPC
+            await nonce_manager.check(web3, chain.id, account.address)
+    if recorder is not None:
+        # Reported like the status of a gasless order: pending if no receipt was received in time
+        status = (
+            OrderApiStatus.Pending
+            if receipt is None
+            else (OrderApiStatus.Confirmed if success else OrderApiStatus.Failed)
+        )
+        recorder.record_status(chain, route, quote.quoteId, OrderStatusResponse(status=status, txHash=tx_hash))
     if success:
         LOGGER.info(f"Order completed. {chain.tx_link(tx_hash)}")
+    elif receipt is not None:
+        LOGGER.warning(f"Order reverted. {chain.tx_link(tx_hash)}")
     else:
         LOGGER.warning("Could not confirm order status")
     return tx_hash, success
 
 
+async def get_quote_result(
+    get_quote: Callable[[QuoteRequestT], Awaitable[QuoteResponseT]],
+    index: int,
+    quote_request: QuoteRequestT,
+    timeout: float | None = None,
+) -> QuoteResult[QuoteRequestT, QuoteResponseT]:
+    try:
+        quote = await asyncio.wait_for(get_quote(quote_request), timeout=timeout)
+    except Exception as e:
+        return QuoteResult(index=index, request=quote_request, error=e)
+    return QuoteResult(index=index, request=quote_request, quote=quote)
+
+
+async def get_quotes(
+    get_quote: Callable[[QuoteRequestT], Awaitable[QuoteResponseT]],
+    quote_requests: Sequence[QuoteRequestT],
+    max_concurrency: int = 10,
+    timeout: float | None = None,
+) -> list[QuoteResult[QuoteRequestT, QuoteResponseT]]:
+    """Request many quotes concurrently, results are returned in request order and failures never abort the batch"""
+    return await gather_with_concurrency(
+        max_concurrency,
+        *(get_quote_result(get_quote, index, request, timeout) for index, request in enumerate(quote_requests)),
+    )
+
+
+async def iter_quotes(
+    get_quote: Callable[[QuoteRequestT], Awaitable[QuoteResponseT]],
+    quote_requests: Sequence[QuoteRequestT],
+    max_concurrency: int = 10,
+    timeout: float | None = None,
+) -> AsyncIterator[QuoteResult[QuoteRequestT, QuoteResponseT]]:
+    """Same as `get_quotes`, but yields each result as soon as it completes"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def sem_task(index: int, request: QuoteRequestT) -> QuoteResult[QuoteRequestT, QuoteResponseT]:
+        async with semaphore:
+            return await get_quote_result(get_quote, index, request, timeout)
+
+    tasks = [asyncio.create_task(sem_task(index, request)) for index, request in enumerate(quote_requests)]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 async def _post_order(
     env: Env,
     order_url: str,
@@ -55,6 +153,8 @@ async def _post_order(
     order_request: OrderRequest,
     headers: dict[str, Any] | None,
     auth: aiohttp.BasicAuth | None,
+    session: aiohttp.ClientSession | None = None,
+    transport: Transport | None = None,
 ) -> OrderResponse:
     result = await send_request(
         env=env,
@@ -63,6 +163,8 @@ async def _post_order(
         json=order_request.model_dump(),
         headers=headers,
         auth=auth,
+        session=session,
+        transport=transport,
     )
     return OrderResponse.model_validate(result)
 
@@ -74,6 +176,8 @@ async def _get_order_status(
     order_status_request: OrderStatusRequest,
     headers: dict[str, Any] | None,
     auth: aiohttp.BasicAuth | None,
+    session: aiohttp.ClientSession | None = None,
+    transport: Transport | None = None,
 ) -> OrderStatusResponse:
     result = await send_request(
         env=env,
@@ -82,6 +186,8 @@ async def _get_order_status(
         params=order_status_request.model_dump(),
         headers=headers,
         auth=auth,
+        session=session,
+        transport=transport,
     )
     return OrderStatusResponse.model_validate(result)
 
@@ -94,27 +200,22 @@ async def send_request(
     headers: dict[str, Any] | None = None,
     json: dict[str, Any] | None = None,
     auth: aiohttp.BasicAuth | None = None,
+    session: aiohttp.ClientSession | None = None,
+    transport: Transport | None = None,
 ) -> dict[str, Any]:
+    """Send a request to the Bebop API.
+
+    The request goes through `transport` when given. Otherwise it reuses the pooled connections of `session`, or
+    opens a short-lived session.
+    """
     if env == Env.TEST and not auth:
         raise ValueError("BasicAuth is required for test environment")
+    if method.lower() not in {"get", "post"}:
+        raise ValueError("Unsupported HTTP method. Use 'get' or 'post'.")
     url = url if env == Env.PROD else url.replace("api", "api-test")
-    session = aiohttp.ClientSession(headers=headers, auth=auth)
-    async with session:
-        if method.lower() == "get":
-            async with session.get(url, params=params) as response:
-                if not response.ok:
-                    raise Exception(f"Failed to send GET request: {response.status} - {response.reason}")
-                result: dict[str, Any] = await response.json()
-                if ERROR_KEY in result:
-                    raise Exception(f"Failed to get valid response: {result[ERROR_KEY]}")
-                return result
-        elif method.lower() == "post":
-            async with session.post(url, json=json) as response:
-                if not response.ok:
-                    raise Exception(f"Failed to send POST request: {response.status} - {response.reason}")
-                result = await response.json()
-                if ERROR_KEY in result:
-                    raise Exception(f"Failed to get valid response: {result[ERROR_KEY]}")
-                return result
-        else:
-            raise ValueError("Unsupported HTTP method. Use 'get' or 'post'.")
+    if transport is not None:
+        return await transport.request(method, url, params=params, json=json, headers=headers, auth=auth)
+    if session is None:
+        async with aiohttp.ClientSession(headers=headers, auth=auth) as own_session:
+            return await request_json(own_session, url=url, method=method, params=params, json=json)
+    return await request_json(session, url=url, method=method, params=params, json=json, headers=headers, auth=auth)
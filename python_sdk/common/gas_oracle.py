@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+from web3 import AsyncWeb3
+
+from python_sdk.common.types.types import Chain
+from python_sdk.common.utils.logger import Logger
+
+LOGGER = Logger(__name__)
+
+
+@dataclass(frozen=True)
+class GasConfig:
+    eip1559: bool = True  # fall back to legacy `gasPrice` on chains without a base fee regardless
+    base_fee_multiplier: float = 2.0
+    priority_fee_multiplier: float = 1.0
+    priority_fee_percentile: float = 50.0
+    min_priority_fee: int | None = None  # wei, defaults to a chain specific floor
+    legacy_gas_price_multiplier: float = 1.5
+    gas_limit_multiplier: float = 4.0
+    max_age: float | None = None  # seconds a fee estimate is reused, defaults to the chain block time
+
+
+@dataclass(frozen=True)
+class GasFees:
+    block_number: int | None
+    fetched_at: float
+    gas_price: int | None = None
+    max_fee_per_gas: int | None = None
+    max_priority_fee_per_gas: int | None = None
+
+    @property
+    def eip1559(self) -> bool:
+        return self.max_fee_per_gas is not None
+
+    def tx_params(self) -> dict[str, int]:
+        if self.max_fee_per_gas is not None and self.max_priority_fee_per_gas is not None:
+            return {"maxFeePerGas": self.max_fee_per_gas, "maxPriorityFeePerGas": self.max_priority_fee_per_gas}
+        assert self.gas_price is not None
+        return {"gasPrice": self.gas_price}
+
+
+class GasOracle:
+    """Per chain gas fee estimates, refreshed at most once per block.
+
+    EIP-1559 fees come from a single `eth_feeHistory` call: the next block base fee scaled by
+    `base_fee_multiplier` plus a percentile of the last block priority fees. Arbitrum ignores priority fees,
+    so they are zeroed there, while OP-stack chains get a small floor so transactions are not deprioritized.
+    """
+
+    def __init__(self, chain: Chain, web3: AsyncWeb3, config: GasConfig | None = None) -> None:
+        self.__chain = chain
+        self.__web3 = web3
+        self.__config = config or GasConfig()
+        self.__fees: GasFees | None = None
+        self.__legacy = not self.__config.eip1559
+        self.__lock = asyncio.Lock()
+
+    @property
+    def max_age(self) -> float:
+        return self.__config.max_age if self.__config.max_age is not None else self.__chain.block_time
+
+    @property
+    def min_priority_fee(self) -> int:
+        if self.__config.min_priority_fee is not None:
+            return self.__config.min_priority_fee
+        return 1_000_000 if self.__chain.optimism_like else 0
+
+    def gas_limit(self, gas: int) -> int:
+        return int(gas * self.__config.gas_limit_multiplier)
+
+    async def fees(self) -> GasFees:
+        loop = asyncio.get_running_loop()
+        if self.__fees is not None and loop.time() - self.__fees.fetched_at < self.max_age:
+            return self.__fees
+        async with self.__lock:
+            if self.__fees is None or loop.time() - self.__fees.fetched_at >= self.max_age:
+                self.__fees = await self.__fetch()
+            return self.__fees
+
+    async def tx_params(self) -> dict[str, int]:
+        return (await self.fees()).tx_params()
+
+    async def __fetch(self) -> GasFees:
+        fetched_at = asyncio.get_running_loop().time()
+        if not self.__legacy:
+            fee_history: Any = await self.__web3.eth.fee_history(1, "latest", [self.__config.priority_fee_percentile])
+            base_fees: list[int] = fee_history.get("baseFeePerGas") or []
+            if base_fees and base_fees[-1]:
+                rewards: list[list[int]] = fee_history.get("reward") or [[0]]
+                priority_fee = int(rewards[-1][0] * self.__config.priority_fee_multiplier)
+                priority_fee = 0 if self.__chain.arbitrum_like else max(priority_fee, self.min_priority_fee)
+                return GasFees(
+                    block_number=int(fee_history["oldestBlock"]),
+                    fetched_at=fetched_at,
+                    max_fee_per_gas=int(base_fees[-1] * self.__config.base_fee_multiplier) + priority_fee,
+                    max_priority_fee_per_gas=priority_fee,
+                )
+            LOGGER.info(f"No base fee reported on {self.__chain.display_name}, using legacy gas price")
+            self.__legacy = True
+        gas_price = await self.__web3.eth.gas_price
+        return GasFees(
+            block_number=None,
+            fetched_at=fetched_at,
+            gas_price=int(gas_price * self.__config.legacy_gas_price_multiplier),
+        )
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import contextlib
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from enum import Enum
+from types import SimpleNamespace
+from typing import Any, Protocol
+
+import aiohttp
+
+from python_sdk.common.types.types import Chain, Route
+from python_sdk.common.utils.lazy import import_optional
+from python_sdk.common.utils.logger import Logger
+
+LOGGER = Logger(__name__)
+
+PROMETHEUS_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Phase(str, Enum):
+    DNS = "dns"  # host name resolution, only on cache misses
+    CONNECT = "connect"  # new TCP (+ TLS) connection, including DNS
+    SEND = "send"  # from the request start until it is fully written, including waiting for a pooled connection
+    FIRST_BYTE = "first_byte"  # from the request being written until the response headers are received
+    DECODE = "decode"  # JSON decoding of the response body
+    VALIDATE = "validate"  # pydantic validation of a quote
+    SIGN = "sign"  # signing of an order or a self-execution transaction
+    ORDER_POST = "order_post"  # round trip of an order submission
+    SETTLEMENT = "settlement"  # from the order being submitted until its final status or receipt
+
+
+@dataclass(frozen=True)
+class MetricTags:
+    chain: Chain | None = None
+    route: Route | None = None
+    quote_id: str | None = None
+
+    def merge(self, **tags: Any) -> MetricTags:
+        """Copy with the given tags overriding the current ones, `None` values are ignored"""
+        updates = {name: value for name, value in tags.items() if value is not None}
+        return replace(self, **updates) if updates else self
+
+
+@dataclass(frozen=True)
+class MetricEvent:
+    phase: Phase
+    duration: float  # seconds
+    success: bool = True
+    tags: MetricTags = field(default_factory=MetricTags)
+    timestamp: float = field(default_factory=time.time)  # end of the phase, unix time in seconds
+
+    def labels(self) -> dict[str, str]:
+        labels = {"phase": self.phase.value}
+        if self.tags.chain is not None:
+            labels["chain"] = self.tags.chain.name
+        if self.tags.route is not None:
+            labels["route"] = self.tags.route.value
+        if self.tags.quote_id is not None:
+            labels["quote_id"] = self.tags.quote_id
+        return labels
+
+
+class MetricsSink(Protocol):
+    def record(self, event: MetricEvent) -> None: ...
+
+
+# Tags of the request being processed, set by the PMM/JAM functions and read wherever an event is recorded,
+# e.g. in the aiohttp trace callbacks of a transport that is shared by several chains
+_TAGS: ContextVar[MetricTags] = ContextVar("bebop_metric_tags", default=MetricTags())
+
+
+def current_tags() -> MetricTags:
+    return _TAGS.get()
+
+
+@contextlib.contextmanager
+def metric_tags(chain: Chain | None = None, route: Route | None = None, quote_id: str | None = None) -> Iterator[None]:
+    """Tag every event recorded within the block, in the current task and the tasks it creates"""
+    token = _TAGS.set(_TAGS.get().merge(chain=chain, route=route, quote_id=quote_id))
+    try:
+        yield
+    finally:
+        _TAGS.reset(token)
+
+
+class Metrics:
+    """Records the duration of each phase of the request lifecycle to one or more sinks.
+
+    Sink errors are logged and never propagate to the request being measured.
+    """
+
+    def __init__(self, *sinks: MetricsSink) -> None:
+        self.__sinks = list(sinks)
+
+    @property
+    def sinks(self) -> list[MetricsSink]:
+        return list(self.__sinks)
+
+    def add_sink(self, sink: MetricsSink) -> None:
+        self.__sinks.append(sink)
+
+    def record(self, phase: Phase, duration: float, success: bool = True, **tags: Any) -> None:
+        event = MetricEvent(phase=phase, duration=duration, success=success, tags=current_tags().merge(**tags))
+        for sink in self.__sinks:
+            try:
+                sink.record(event)
+            except Exception as e:
+                LOGGER.warning(f"Metrics sink {type(sink).__name__} failed: {e}")
+
+    @contextlib.contextmanager
+    def measure(self, phase: Phase, **tags: Any) -> Iterator[dict[str, Any]]:
+        """Time the block, tags (or `success`) set on the yielded dict within the block are attached to the event"""
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield tags
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            # Popped even on failure, so that it never collides with the `success` argument
+            success = bool(tags.pop("success", True))
+            self.record(phase, time.perf_counter() - start, success=success and not failed, **tags)
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """aiohttp tracing hooks recording the DNS, connect, send and time-to-first-byte phases of each request"""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any) -> None:
+            ctx.start = ctx.sent = time.perf_counter()
+
+        async def on_request_sent(session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any) -> None:
+            ctx.sent = time.perf_counter()
+
+        async def on_request_end(session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any) -> None:
+            now = time.perf_counter()
+            self.record(Phase.SEND, ctx.sent - ctx.start)
+            self.record(Phase.FIRST_BYTE, now - ctx.sent)
+
+        async def on_request_exception(session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any) -> None:
+            self.record(Phase.FIRST_BYTE, time.perf_counter() - ctx.sent, success=False)
+
+        async def on_dns_start(session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any) -> None:
+            ctx.dns_start = time.perf_counter()
+
+        async def on_dns_end(session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any) -> None:
+            self.record(Phase.DNS, time.perf_counter() - ctx.dns_start)
+
+        async def on_connect_start(session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any) -> None:
+            ctx.connect_start = time.perf_counter()
+
+        async def on_connect_end(session: aiohttp.ClientSession, ctx: SimpleNamespace, params: Any) -> None:
+            self.record(Phase.CONNECT, time.perf_counter() - ctx.connect_start)
+
+        # Typed loosely, aiohttp 3.10 annotates its trace signals with the wrong callback type
+        hooks: list[tuple[Any, Callable[..., Awaitable[None]]]] = [
+            (trace_config.on_request_start, on_request_start),
+            (trace_config.on_request_headers_sent, on_request_sent),
+            (trace_config.on_request_chunk_sent, on_request_sent),
+            (trace_config.on_request_end, on_request_end),
+            (trace_config.on_request_exception, on_request_exception),
+            (trace_config.on_dns_resolvehost_start, on_dns_start),
+            (trace_config.on_dns_resolvehost_end, on_dns_end),
+            (trace_config.on_connection_create_start, on_connect_start),
+            (trace_config.on_connection_create_end, on_connect_end),
+        ]
+        for signal, callback in hooks:
+            signal.append(callback)
+        return trace_config
+
+
+def timed(metrics: Metrics | None, phase: Phase, **tags: Any) -> contextlib.AbstractContextManager[dict[str, Any]]:
+    """`metrics.measure(phase)`, or a no-op when metrics are disabled"""
+    if metrics is None:
+        return contextlib.nullcontext(tags)
+    return metrics.measure(phase, **tags)
+
+
+# ----------------------------------- Sinks ---------------------------------- #
+class CallbackSink:
+    def __init__(self, callback: Callable[[MetricEvent], None]) -> None:
+        self.__callback = callback
+
+    def record(self, event: MetricEvent) -> None:
+        self.__callback(event)
+
+
+class PrometheusSink:
+    """Observes phase durations in a histogram labelled by phase, chain, route and success.
+
+    The quote id is not used as a label: one time series per quote would grow without bound.
+    """
+
+    def __init__(
+        self,
+        name: str = "bebop_sdk_phase_seconds",
+        registry: Any | None = None,
+        buckets: tuple[float, ...] = PROMETHEUS_BUCKETS,
+    ) -> None:
+        prometheus_client = import_optional("prometheus_client", "prometheus-client", "PrometheusSink", "metrics")
+        kwargs = {"registry": registry} if registry is not None else {}
+        self.__histogram = prometheus_client.Histogram(
+            name,
+            "Duration of each phase of Bebop SDK requests, in seconds",
+            labelnames=("phase", "chain", "route", "success"),
+            buckets=buckets,
+            **kwargs,
+        )
+
+    def record(self, event: MetricEvent) -> None:
+        labels = event.labels()
+        self.__histogram.labels(
+            phase=labels["phase"],
+            chain=labels.get("chain", ""),
+            route=labels.get("route", ""),
+            success="true" if event.success else "false",
+        ).observe(event.duration)
+
+
+class OpenTelemetrySink:
+    """Exports each phase as a span named `bebop.<phase>`, with the event tags as attributes"""
+
+    def __init__(self, tracer: Any | None = None) -> None:
+        self.__trace = import_optional("opentelemetry.trace", "opentelemetry-api", "OpenTelemetrySink", "metrics")
+        self.__tracer = tracer or self.__trace.get_tracer("python_sdk")
+
+    def record(self, event: MetricEvent) -> None:
+        end = int(event.timestamp * 1e9)
+        span = self.__tracer.start_span(
+            f"bebop.{event.phase.value}", start_time=end - int(event.duration * 1e9), attributes=event.labels()
+        )
+        if not event.success:
+            span.set_status(self.__trace.Status(self.__trace.StatusCode.ERROR))
+        span.end(end_time=end)
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from weakref import WeakKeyDictionary
+
+from web3 import AsyncWeb3
+
+from python_sdk.common.utils.logger import Logger
+
+LOGGER = Logger(__name__)
+
+NONCE_ERRORS = ("nonce too low", "nonce too high", "already known", "replacement transaction underpriced")
+
+
+def is_nonce_error(error: Exception) -> bool:
+    message = str(error).lower()
+    return any(nonce_error in message for nonce_error in NONCE_ERRORS)
+
+
+class AccountNonces:
+    """Local nonce sequence of a single account on a single chain.
+
+    Allocated nonces stay in flight until the transaction is sent (`consume`) or abandoned (`release`). A resync
+    rebases the sequence on the RPC's pending transaction count, and never hands out a nonce still in flight.
+    """
+
+    def __init__(self, address: str) -> None:
+        self.address = AsyncWeb3.to_checksum_address(address)
+        # The state outlives event loops when shared, the lock is bound to one
+        self.__locks: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = WeakKeyDictionary()
+        self.__next_nonce: int | None = None
+        self.__released: list[int] = []
+        self.__in_flight: set[int] = set()
+        self.__syncs = 0
+
+    @property
+    def in_flight(self) -> frozenset[int]:
+        return frozenset(self.__in_flight)
+
+    def resync(self) -> None:
+        """Discard the local sequence, the next allocation reloads the pending transaction count from the RPC"""
+        self.__next_nonce = None
+        self.__released.clear()
+        self.__syncs += 1
+
+    async def allocate(self, web3: AsyncWeb3) -> int:
+        async with self.__lock():
+            while self.__next_nonce is None:
+                syncs = self.__syncs
+                pending = await web3.eth.get_transaction_count(self.address, "pending")
+                if syncs == self.__syncs:  # otherwise resynced meanwhile, the count may predate it
+                    self.__next_nonce = pending
+                    LOGGER.info(f"Synced nonce for {self.address}: {pending}")
+            if self.__released:
+                nonce = heapq.heappop(self.__released)
+            else:
+                # In flight nonces above the pending count have not reached the RPC yet
+                while self.__next_nonce in self.__in_flight:
+                    self.__next_nonce += 1
+                nonce = self.__next_nonce
+                self.__next_nonce += 1
+            self.__in_flight.add(nonce)
+            return nonce
+
+    async def check(self, web3: AsyncWeb3) -> bool:
+        """Resync if the RPC's pending transaction count fell behind the local sequence, and returns whether it did.
+
+        A nonce below the local sequence that is neither pending at the RPC, in flight nor released is a gap: it was
+        consumed by a transaction that never reached the RPC, and every later transaction is queued behind it.
+        """
+        async with self.__lock():
+            if self.__next_nonce is None:
+                return False
+            pending = await web3.eth.get_transaction_count(self.address, "pending")
+            if self.__next_nonce is None or pending >= self.__next_nonce:
+                return False
+            if pending in self.__in_flight or pending in self.__released:
+                return False
+            LOGGER.warning(f"Nonce gap for {self.address} at {pending} (local {self.__next_nonce}), resyncing")
+            self.resync()
+            return True
+
+    def consume(self, nonce: int) -> None:
+        """Mark an allocated nonce as used by a sent transaction"""
+        self.__in_flight.discard(nonce)
+
+    def release(self, nonce: int) -> None:
+        """Return an unused nonce so that it is handed out again before any new one"""
+        self.__in_flight.discard(nonce)
+        if self.__next_nonce is None or nonce >= self.__next_nonce:
+            return
+        if nonce == self.__next_nonce - 1:
+            self.__next_nonce = nonce
+            while self.__released and self.__released[0] == self.__next_nonce - 1:
+                self.__next_nonce = heapq.heappop(self.__released)
+        elif nonce not in self.__released:
+            heapq.heappush(self.__released, nonce)
+
+    def __lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if loop not in self.__locks:
+            self.__locks[loop] = asyncio.Lock()
+        return self.__locks[loop]
+
+
+@dataclass
+class NonceReservation:
+    """A nonce held by `NonceManager.reserve`, `sent` must be set right before sending the transaction"""
+
+    nonce: int
+    sent: bool = False
+
+
+class NonceManager:
+    """Allocates transaction nonces locally per (chain id, account).
+
+    Nonces are synced from the RPC's pending transaction count on first use, handed out under a lock, and
+    reclaimed when a transaction fails to send. A nonce related send error triggers a resync, and `check` resyncs
+    once a nonce gap is detected, e.g. when a transaction is not mined in time.
+    Clients share `shared_nonce_manager()` by default, so that they never hand out the same nonce of an account.
+    """
+
+    def __init__(self) -> None:
+        self.__accounts: dict[tuple[int, str], AccountNonces] = {}
+
+    def account(self, chain_id: int, address: str) -> AccountNonces:
+        key = (chain_id, address.lower())
+        if key not in self.__accounts:
+            self.__accounts[key] = AccountNonces(address)
+        return self.__accounts[key]
+
+    @asynccontextmanager
+    async def reserve(self, web3: AsyncWeb3, chain_id: int, address: str) -> AsyncIterator[NonceReservation]:
+        """Yield the next nonce, it is released again if the block raises or is cancelled before it is `sent`"""
+        account = self.account(chain_id, address)
+        nonce = await account.allocate(web3)
+        reservation = NonceReservation(nonce)
+        try:
+            yield reservation
+        except Exception as e:
+            if is_nonce_error(e):
+                LOGGER.warning(f"Nonce {nonce} rejected for {account.address}, resyncing: {e}")
+                account.consume(nonce)
+                account.resync()
+            else:
+                account.release(nonce)
+            raise
+        except BaseException:
+            if reservation.sent:
+                # The transaction may have reached the RPC: a gap is recovered by `check`, a reused nonce is not
+                account.consume(nonce)
+            else:
+                account.release(nonce)
+            raise
+        else:
+            account.consume(nonce)
+
+    async def check(self, web3: AsyncWeb3, chain_id: int, address: str) -> bool:
+        """See `AccountNonces.check`"""
+        return await self.account(chain_id, address).check(web3)
+
+
+_SHARED = NonceManager()
+
+
+def shared_nonce_manager() -> NonceManager:
+    """The process wide nonce manager, used by every client and router not given one"""
+    return _SHARED
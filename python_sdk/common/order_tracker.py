@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Generic
+
+from python_sdk.common.metrics import Metrics, MetricTags, Phase, current_tags
+from python_sdk.common.recorder import Recorder
+from python_sdk.common.types.order_types import OrderApiStatus, OrderResponse, OrderStatusResponse
+from python_sdk.common.types.quote_types import QuoteResponseT
+from python_sdk.common.utils.logger import Logger
+
+LOGGER = Logger(__name__)
+
+FINAL_STATUSES = {OrderApiStatus.Settled, OrderApiStatus.Confirmed, OrderApiStatus.Failed}
+SUCCESS_STATUSES = {OrderApiStatus.Settled, OrderApiStatus.Confirmed}
+
+# Called with the final (or last known) status, or with `None` if the order timed out without any status
+StatusCallback = Callable[[OrderStatusResponse | None], None]
+
+
+@dataclass(frozen=True)
+class TrackerConfig:
+    initial_interval: float = 0.25
+    max_interval: float = 2.0
+    backoff: float = 1.5
+    settlement_grace: float = 30.0  # how long to keep polling after the quote expiry
+    min_duration: float = 5.0  # minimum tracking window, in case the quote expiry is already close
+    max_concurrency: int = 20
+
+
+@dataclass
+class Waiter:
+    """One `track()` call: its own future, so that cancelling it leaves the other waiters of the order untouched"""
+
+    future: asyncio.Future[OrderStatusResponse]
+    callback: StatusCallback | None = None
+
+
+@dataclass
+class TrackedOrder:
+    quote_id: str
+    deadline: float
+    interval: float
+    waiters: list[Waiter] = field(default_factory=list)
+    last_status: OrderStatusResponse | None = None
+    started: float = 0.0
+    generation: int = 0  # sequence of its latest schedule entry, older entries are stale
+    tags: MetricTags = field(default_factory=MetricTags)
+
+
+class OrderTracker:
+    """Polls the status of many in-flight orders from a single scheduler task.
+
+    Each order is polled with an exponential backoff until it reaches a final status or its deadline,
+    derived from the quote expiry, passes. At the deadline the future resolves with the last known status, or fails
+    with a `TimeoutError` if no status was ever received. Status callbacks are called in both cases.
+    Every `track()` call gets its own future: cancelling it only drops that waiter (and its callback), and an order
+    stops being polled once none of its waiters are left.
+    With `metrics`, the time from `track()` to that resolution is recorded as the settlement phase, tagged with `tags`
+    and the metric tags current when the order was tracked. With `recorder`, the resolved status is recorded.
+    """
+
+    def __init__(
+        self,
+        fetch_status: Callable[[str], Awaitable[OrderStatusResponse]],
+        config: TrackerConfig | None = None,
+        metrics: Metrics | None = None,
+        tags: MetricTags | None = None,
+        recorder: Recorder | None = None,
+    ) -> None:
+        self.__fetch_status = fetch_status
+        self.__config = config or TrackerConfig()
+        self.__metrics = metrics
+        self.__recorder = recorder
+        self.__tags = tags or MetricTags()
+        self.__orders: dict[str, TrackedOrder] = {}
+        self.__schedule: list[tuple[float, int, str]] = []
+        self.__sequence = 0
+        self.__wakeup = asyncio.Event()
+        self.__task: asyncio.Task[None] | None = None
+        self.__polls: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending(self) -> int:
+        return len(self.__orders)
+
+    def track(
+        self, quote_id: str, expiry: int, callback: StatusCallback | None = None
+    ) -> asyncio.Future[OrderStatusResponse]:
+        """Start tracking `quote_id`, the returned future resolves with its final (or last known) status"""
+        loop = asyncio.get_running_loop()
+        if quote_id in self.__orders:
+            order = self.__orders[quote_id]
+        else:
+            now = loop.time()
+            remaining = max(expiry + self.__config.settlement_grace - time.time(), self.__config.min_duration)
+            order = TrackedOrder(
+                quote_id=quote_id,
+                deadline=now + remaining,
+                interval=self.__config.initial_interval,
+                started=now,
+                tags=self.__tags.merge(**vars(current_tags())).merge(quote_id=quote_id),
+            )
+            self.__orders[quote_id] = order
+            self.__push(now + order.interval, order)
+            self.__ensure_running()
+        waiter = Waiter(future=loop.create_future(), callback=callback)
+        order.waiters.append(waiter)
+        waiter.future.add_done_callback(partial(self.__discard, order, waiter))
+        return waiter.future
+
+    def last_status(self, quote_id: str) -> OrderStatusResponse | None:
+        order = self.__orders.get(quote_id)
+        return order.last_status if order else None
+
+    def untrack(self, quote_id: str) -> None:
+        """Stop tracking `quote_id` for every waiter, their futures are cancelled"""
+        order = self.__orders.pop(quote_id, None)
+        for waiter in order.waiters if order else []:
+            waiter.future.cancel()
+
+    async def close(self) -> None:
+        for quote_id in list(self.__orders):
+            self.untrack(quote_id)
+        tasks = [*self.__polls, *([self.__task] if self.__task else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.__task = None
+
+    def __push(self, when: float, order: TrackedOrder) -> None:
+        self.__sequence += 1
+        order.generation = self.__sequence
+        heapq.heappush(self.__schedule, (when, self.__sequence, order.quote_id))
+        self.__wakeup.set()
+
+    def __discard(self, order: TrackedOrder, waiter: Waiter, future: asyncio.Future[OrderStatusResponse]) -> None:
+        """Forget a cancelled waiter, and the order itself if it was the last one"""
+        if not future.cancelled() or waiter not in order.waiters:
+            return
+        order.waiters.remove(waiter)
+        if not order.waiters and self.__orders.get(order.quote_id) is order:
+            del self.__orders[order.quote_id]
+
+    def __ensure_running(self) -> None:
+        if self.__task is None or self.__task.done():
+            self.__task = asyncio.create_task(self.__run())
+
+    async def __run(self) -> None:
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.__config.max_concurrency)
+        while True:
+            self.__wakeup.clear()
+            if not self.__schedule:
+                await self.__wakeup.wait()
+                continue
+            delay = self.__schedule[0][0] - loop.time()
+            if delay > 0:
+                # A timer rather than `wait_for`, which can swallow a `cancel()` on Python < 3.12 and hang `close()`
+                timer = loop.call_later(delay, self.__wakeup.set)
+                try:
+                    await self.__wakeup.wait()
+                finally:
+                    timer.cancel()
+                continue
+
+            now = loop.time()
+            while self.__schedule and self.__schedule[0][0] <= now:
+                _, sequence, quote_id = heapq.heappop(self.__schedule)
+                order = self.__orders.get(quote_id)
+                # Entries left behind by an untracked order are skipped, even once it is tracked again
+                if order is not None and order.generation == sequence:
+                    poll = asyncio.create_task(self.__poll(order, semaphore))
+                    self.__polls.add(poll)
+                    poll.add_done_callback(self.__polls.discard)
+
+    async def __poll(self, order: TrackedOrder, semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            try:
+                order.last_status = await self.__fetch_status(order.quote_id)
+            except Exception as e:
+                LOGGER.warning(f"Failed to fetch status for {order.quote_id}: {e}")
+        if self.__orders.get(order.quote_id) is not order:
+            return  # untracked (and maybe tracked again) while polling
+
+        now = asyncio.get_running_loop().time()
+        final = order.last_status is not None and OrderApiStatus(order.last_status.status) in FINAL_STATUSES
+        if final or now >= order.deadline:
+            self.__resolve(order)
+        else:
+            order.interval = min(order.interval * self.__config.backoff, self.__config.max_interval)
+            self.__push(min(now + order.interval, order.deadline), order)
+
+    def __resolve(self, order: TrackedOrder) -> None:
+        del self.__orders[order.quote_id]
+        waiters = [waiter for waiter in order.waiters if not waiter.future.done()]
+        if not waiters:
+            return
+        if self.__metrics is not None:
+            self.__metrics.record(
+                Phase.SETTLEMENT,
+                asyncio.get_running_loop().time() - order.started,
+                success=order.last_status is not None and OrderApiStatus(order.last_status.status) in SUCCESS_STATUSES,
+                **vars(order.tags),
+            )
+        error = TimeoutError(f"No status received for order {order.quote_id}") if order.last_status is None else None
+        if self.__recorder is not None:
+            self.__recorder.record_status(
+                order.tags.chain, order.tags.route, order.quote_id, order.last_status, error=error
+            )
+        for waiter in waiters:
+            if error is not None:
+                waiter.future.set_exception(error)
+            else:
+                assert order.last_status is not None
+                waiter.future.set_result(order.last_status)
+        for waiter in waiters:
+            if waiter.callback is None:
+                continue
+            try:
+                waiter.callback(order.last_status)
+            except Exception as e:
+                LOGGER.warning(f"Order status callback failed for {order.quote_id}: {e}")
+
+
+class OrderHandle(Generic[QuoteResponseT]):
+    """A submitted gasless order whose settlement is tracked in the background"""
+
+    def __init__(self, quote: QuoteResponseT, order: OrderResponse, tracker: OrderTracker) -> None:
+        self.quote = quote
+        self.order = order
+        self.__tracker = tracker
+        self.__future = tracker.track(quote.quoteId, quote.expiry)
+
+    @property
+    def quote_id(self) -> str:
+        return self.quote.quoteId
+
+    @property
+    def status(self) -> OrderStatusResponse | None:
+        """The last known order status, `None` until the first status poll returns"""
+        if self.__future.done() and not self.__future.cancelled() and self.__future.exception() is None:
+            return self.__future.result()
+        return self.__tracker.last_status(self.quote_id)
+
+    @property
+    def done(self) -> bool:
+        return self.__future.done()
+
+    @property
+    def success(self) -> bool:
+        status = self.status
+        return self.done and status is not None and OrderApiStatus(status.status) in SUCCESS_STATUSES
+
+    async def settled(self) -> OrderStatusResponse:
+        """Wait for the final (or last known, once the deadline passes) order status"""
+        return await asyncio.shield(self.__future)
+
+    def cancel(self) -> None:
+        """Stop waiting for the order through this handle, this does not cancel the order itself. Other handles and
+        callbacks of the same order are unaffected, it stops being polled once none are left"""
+        self.__future.cancel()
+
+
+async def wait_for_order_status(
+    quote_id: str,
+    expiry: int,
+    fetch_status: Callable[[str], Awaitable[OrderStatusResponse]],
+    tracker: OrderTracker | None = None,
+    metrics: Metrics | None = None,
+    recorder: Recorder | None = None,
+) -> OrderStatusResponse:
+    """Wait for the final status of a single order, using a one-off tracker if none is shared"""
+    if tracker is not None:
+        return await tracker.track(quote_id, expiry)
+    tracker = OrderTracker(fetch_status, metrics=metrics, recorder=recorder)
+    try:
+        return await tracker.track(quote_id, expiry)
+    finally:
+        await tracker.close()
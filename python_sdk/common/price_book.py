@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import orjson
+
+from python_sdk.common.types.types import Chain
+
+# A price level as decoded from the stream: [price, size], the price in quote tokens per base token and the size in
+# base tokens, both in whole (not raw) token units
+Level = list[float]
+
+
+class PairPrices:
+    """Latest bid and ask levels of a pair, best first, kept as the decoded lists to avoid per-level objects"""
+
+    __slots__ = ("asks", "bids", "received", "timestamp")
+
+    def __init__(self, bids: list[Level], asks: list[Level], timestamp: float, received: float) -> None:
+        self.bids = bids
+        self.asks = asks
+        self.timestamp = timestamp  # update time reported by the stream, unix seconds
+        self.received = received  # local `time.monotonic()` when the update was applied
+
+    @property
+    def best_bid(self) -> float | None:
+        return self.bids[0][0] if self.bids else None
+
+    @property
+    def best_ask(self) -> float | None:
+        return self.asks[0][0] if self.asks else None
+
+    @property
+    def mid(self) -> float | None:
+        if not self.bids or not self.asks:
+            return None
+        return (self.bids[0][0] + self.asks[0][0]) / 2
+
+    def age(self) -> float:
+        return time.monotonic() - self.received
+
+    def fill_price(self, size: float, buy: bool) -> float | None:
+        """Average price to buy (walking the asks) or sell (walking the bids) `size` base tokens.
+
+        `None` if the levels are not deep enough.
+        """
+        if size <= 0:
+            raise ValueError(f"Fill size must be positive, got {size}")
+        remaining = size
+        cost = 0.0
+        for price, level_size in self.asks if buy else self.bids:
+            filled = min(remaining, level_size)
+            cost += filled * price
+            remaining -= filled
+            if remaining <= 0:
+                return cost / size
+        return None
+
+
+class PriceBook:
+    """In-memory prices per chain and pair, updated by a `PriceStream` and queried synchronously.
+
+    Pairs are `base/quote` token addresses, matched case-insensitively.
+    """
+
+    def __init__(self) -> None:
+        self.__pairs: dict[Chain, dict[str, PairPrices]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(pairs) for pairs in self.__pairs.values())
+
+    def __iter__(self) -> Iterator[tuple[Chain, str, PairPrices]]:
+        for chain, pairs in self.__pairs.items():
+            for pair, prices in pairs.items():
+                yield chain, pair, prices
+
+    def get(self, chain: Chain, base: str, quote: str, max_age: float | None = None) -> PairPrices | None:
+        """Latest prices of `base/quote`, `None` if unknown or older than `max_age` seconds"""
+        prices = self.__pairs.get(chain, {}).get(f"{base}/{quote}".lower())
+        if prices is None or (max_age is not None and prices.age() > max_age):
+            return None
+        return prices
+
+    def pairs(self, chain: Chain) -> list[str]:
+        return list(self.__pairs.get(chain, {}))
+
+    def update(self, chain: Chain, message: bytes | str) -> int:
+        """Apply a raw stream message, `{"<base>/<quote>": {"bids": [...], "asks": [...], "last_update_ts": ...}}`.
+
+        Each pair in the message replaces the previous levels of that pair. Returns the number of pairs updated.
+        """
+        return self.apply(chain, orjson.loads(message))
+
+    def apply(self, chain: Chain, message: dict[str, Any]) -> int:
+        pairs = self.__pairs.setdefault(chain, {})
+        received = time.monotonic()
+        for pair, levels in message.items():
+            pairs[pair.lower()] = PairPrices(
+                levels.get("bids") or [], levels.get("asks") or [], levels.get("last_update_ts") or 0.0, received
+            )
+        return len(message)
+
+    def clear(self, chain: Chain | None = None) -> None:
+        """Drop the prices of `chain` (or of every chain), e.g. when its stream disconnects and they go stale"""
+        if chain is None:
+            self.__pairs.clear()
+        else:
+            self.__pairs.pop(chain, None)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from types import TracebackType
+from urllib.parse import urlsplit, urlunsplit
+
+import aiohttp
+
+from python_sdk.common.price_book import PriceBook
+from python_sdk.common.session import SessionConfig, SessionManager
+from python_sdk.common.types.types import Chain, Env, Route
+from python_sdk.common.utils.logger import Logger
+from python_sdk.jam.constants import PRICING_URL as JAM_PRICING_URL
+from python_sdk.pmm.constants import PRICING_URL as PMM_PRICING_URL
+
+LOGGER = Logger(__name__)
+
+PRICING_URLS = {Route.PMM: PMM_PRICING_URL, Route.JAM: JAM_PRICING_URL}
+
+UpdateCallback = Callable[[Route, Chain, int], None]
+
+
+@dataclass(frozen=True)
+class PriceStreamConfig:
+    reconnect_delay: float = 0.5  # first delay before reconnecting, doubled on each consecutive failure
+    max_reconnect_delay: float = 30.0
+    heartbeat: float | None = 20.0  # websocket ping interval, detects half-open connections
+    clear_on_disconnect: bool = (
+        True  # drop the prices of a chain while its stream is down, rather than serve stale ones
+    )
+
+
+class PriceStream:
+    """Streams indicative prices from the PMM and JAM pricing websockets into one `PriceBook` per route.
+
+    Each subscribed (route, chain) stream runs in its own task that reconnects with an exponential backoff, so
+    subscriptions survive disconnects. `base_url` replaces the scheme and host of the stream urls, e.g. to point at
+    a `MockBebopServer`.
+    """
+
+    def __init__(
+        self,
+        env: Env = Env.PROD,
+        source_auth: str | None = None,
+        auth: aiohttp.BasicAuth | None = None,
+        session: aiohttp.ClientSession | None = None,
+        session_config: SessionConfig | None = None,
+        config: PriceStreamConfig | None = None,
+        base_url: str | None = None,
+        on_update: UpdateCallback | None = None,
+    ) -> None:
+        if env == Env.TEST and not auth:
+            raise ValueError("BasicAuth is required for test environment")
+        self.__env = env
+        self.__headers = {"source-auth": source_auth} if source_auth else None
+        self.__auth = auth
+        self.__session = SessionManager(config=session_config, session=session)
+        self.__config = config or PriceStreamConfig()
+        self.__base_url = urlsplit(base_url) if base_url else None
+        self.__on_update = on_update
+        self.books: dict[Route, PriceBook] = {Route.PMM: PriceBook(), Route.JAM: PriceBook()}
+        self.__tasks: dict[tuple[Route, Chain], asyncio.Task[None]] = {}
+        self.__ready: dict[tuple[Route, Chain], asyncio.Event] = {}
+
+    async def __aenter__(self) -> PriceStream:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    @property
+    def subscriptions(self) -> list[tuple[Route, Chain]]:
+        return list(self.__tasks)
+
+    def book(self, route: Route = Route.PMM) -> PriceBook:
+        return self.books[route]
+
+    def connected(self, chain: Chain, route: Route = Route.PMM) -> bool:
+        ready = self.__ready.get((route, chain))
+        return ready is not None and ready.is_set()
+
+    def subscribe(self, chain: Chain, route: Route = Route.PMM) -> None:
+        """Start streaming the prices of `chain` on `route`, a no-op if already subscribed"""
+        key = (route, chain)
+        if key not in self.__tasks:
+            self.__ready[key] = asyncio.Event()
+            self.__tasks[key] = asyncio.create_task(self.__run(route, chain))
+
+    async def unsubscribe(self, chain: Chain, route: Route = Route.PMM) -> None:
+        task = self.__tasks.pop((route, chain), None)
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        self.__ready.pop((route, chain), None)
+        self.books[route].clear(chain)
+
+    async def wait_ready(self, chain: Chain, route: Route = Route.PMM, timeout: float | None = None) -> None:
+        """Wait until the stream of `chain` on `route` is connected and its first prices are in the book"""
+        self.subscribe(chain, route)
+        await asyncio.wait_for(self.__ready[(route, chain)].wait(), timeout=timeout)
+
+    async def close(self) -> None:
+        for route, chain in list(self.__tasks):
+            await self.unsubscribe(chain, route)
+        await self.__session.close()
+
+    def url(self, chain: Chain, route: Route) -> str:
+        url = PRICING_URLS[route].format(chain=chain.name)
+        if self.__env != Env.PROD:
+            url = url.replace("api", "api-test")
+        if self.__base_url is not None:
+            scheme = {"http": "ws", "https": "wss"}.get(self.__base_url.scheme, self.__base_url.scheme)
+            url = urlunsplit(urlsplit(url)._replace(scheme=scheme, netloc=self.__base_url.netloc))
+        return url
+
+    async def __run(self, route: Route, chain: Chain) -> None:
+        delay = self.__config.reconnect_delay
+        while True:
+            try:
+                if await self.__stream(route, chain):
+                    delay = self.__config.reconnect_delay
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                LOGGER.warning(f"{route.value} price stream for {chain.name} failed: {e!r}")
+            finally:
+                self.__ready[(route, chain)].clear()
+                if self.__config.clear_on_disconnect:
+                    self.books[route].clear(chain)
+            LOGGER.info(f"Reconnecting the {route.value} price stream for {chain.name} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.__config.max_reconnect_delay)
+
+    async def __stream(self, route: Route, chain: Chain) -> bool:
+        """Apply the messages of one connection until it closes, returns whether any message was received"""
+        session = await self.__session.get()
+        book = self.books[route]
+        ready = self.__ready[(route, chain)]
+        received = False
+        async with session.ws_connect(
+            self.url(chain, route), headers=self.__headers, auth=self.__auth, heartbeat=self.__config.heartbeat
+        ) as ws:
+            async for message in ws:
+                if message.type not in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                    break  # ERROR, or CLOSE/CLOSING
+                try:
+                    updated = book.update(chain, message.data)
+                except Exception as e:
+                    LOGGER.warning(f"Skipping malformed {route.value} price message for {chain.name}: {e}")
+                    continue
+                received = True
+                ready.set()
+                if self.__on_update is not None:
+                    try:
+                        self.__on_update(route, chain, updated)
+                    except Exception as e:
+                        LOGGER.warning(f"Price update callback failed: {e}")
+        return received
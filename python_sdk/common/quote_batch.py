@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from python_sdk.common.types.quote_types import QuoteResponse, ResponseToken
+from python_sdk.common.utils.lazy import import_optional
+
+# `numpy.ndarray`, typed loosely since numpy is an optional dependency
+Array = Any
+
+# Raw amounts are split into base 10**9 limbs: any uint256 fits in 9 of them, and up to ~9 billion limbs can be summed
+# in int64 without overflowing
+LIMB_DIGITS = 9
+LIMB = 10**LIMB_DIGITS
+
+
+def _parse_limbs(np: Any, amounts: list[str]) -> Array:
+    """Unsigned integer strings as an (amounts, limbs) int64 array, most significant limb first, parsed in bulk
+    from their ASCII digits rather than one Python int at a time"""
+    if not amounts:
+        return np.zeros((0, 1), dtype=np.int64)
+    raw = np.array(amounts, dtype=np.bytes_)
+    width = -(-raw.dtype.itemsize // LIMB_DIGITS) * LIMB_DIGITS
+    digits = np.char.zfill(raw, width).view(np.uint8).reshape(len(amounts), -1, LIMB_DIGITS) - ord("0")
+    if (digits > 9).any():  # non-digits wrap around below 0
+        raise ValueError("Token amounts must be unsigned integer strings")
+    return digits.astype(np.int64) @ 10 ** np.arange(LIMB_DIGITS - 1, -1, -1, dtype=np.int64)
+
+
+def _limbs_to_int(limbs: Sequence[int]) -> int:
+    """Exact value of a row of limbs, limbs may exceed `LIMB` after summing"""
+    value = 0
+    for limb in limbs:
+        value = value * LIMB + limb
+    return value
+
+
+class TokenColumns:
+    """One row per token of each quote: the quote index, chain, token, raw amount, decimals and USD price.
+
+    Raw amounts are kept exact as base 10**9 limbs for integer totals, and as float64 whole token units for
+    vectorized USD math. Decimals are -1 and amounts NaN where unknown, USD prices are NaN where unknown.
+    """
+
+    __slots__ = ("__np", "amounts", "chain_ids", "decimals", "index", "limbs", "prices_usd", "tokens")
+
+    def __init__(
+        self,
+        np: Any,
+        index: list[int],
+        chain_ids: list[int],
+        tokens: list[str],
+        amounts: list[str],
+        decimals: list[int],
+        prices_usd: list[float | None],
+    ) -> None:
+        self.__np = np
+        self.index = np.array(index, dtype=np.int64)
+        self.chain_ids = np.array(chain_ids, dtype=np.int64)
+        self.tokens = tokens
+        self.limbs = _parse_limbs(np, amounts)
+        self.decimals = np.array(decimals, dtype=np.int64)
+        self.prices_usd = np.array([price or np.nan for price in prices_usd], dtype=np.float64)
+        scale = float(LIMB) ** np.arange(self.limbs.shape[1] - 1, -1, -1)
+        known = self.decimals >= 0
+        self.amounts = np.where(known, (self.limbs @ scale) / 10.0 ** np.where(known, self.decimals, 0), np.nan)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    @property
+    def usd(self) -> Array:
+        """USD value of each row, NaN without a price"""
+        return self.amounts * self.prices_usd
+
+    def raw(self, row: int) -> int:
+        return _limbs_to_int(self.limbs[row].tolist())
+
+    def raw_amounts(self) -> list[int]:
+        return [_limbs_to_int(limbs) for limbs in self.limbs.tolist()]
+
+    def totals(self) -> dict[tuple[int, str], int]:
+        """Exact raw amount per `(chain id, lowercase token)` summed over all rows"""
+        np = self.__np
+        if not len(self):
+            return {}
+        keys = [
+            f"{chain_id}:{token}".lower() for chain_id, token in zip(self.chain_ids.tolist(), self.tokens, strict=True)
+        ]
+        groups, inverse = np.unique(np.array(keys), return_inverse=True)
+        sums = np.zeros((len(groups), self.limbs.shape[1]), dtype=np.int64)
+        np.add.at(sums, inverse, self.limbs)
+        totals = {}
+        for key, limbs in zip(groups.tolist(), sums.tolist(), strict=True):
+            chain_id, token = key.split(":", 1)
+            totals[(int(chain_id), token)] = _limbs_to_int(limbs)
+        return totals
+
+
+class QuoteBatch:
+    """Columnar view of many quotes, for risk and analytics loops evaluating thousands of quotes at once.
+
+    The quotes are walked once on construction. Per-quote results are arrays aligned with `quotes`, computed with
+    numpy instead of the `Decimal` based properties of `QuoteResponse`, and integer totals are exact.
+    """
+
+    def __init__(self, quotes: Sequence[QuoteResponse]) -> None:
+        np = self.__np = import_optional("numpy", "numpy", "QuoteBatch", "numpy")
+        self.quotes = list(quotes)
+        self.chain_ids = np.array([quote.chainId for quote in self.quotes], dtype=np.int64)
+        self.sell = self.__columns(lambda quote: quote.sellTokens)
+        self.buy = self.__columns(lambda quote: quote.buyTokens)
+        self.protocol_fees = self.__fee_columns(lambda quote: quote.protocolFee)
+        self.partner_fees = self.__fee_columns(lambda quote: quote.partnerFee)
+        self.gas_native = np.array([float(quote.gasFee.native) for quote in self.quotes]) / 1e18
+        self.gas_usd = np.array([quote.gasFee.usd or np.nan for quote in self.quotes], dtype=np.float64)
+        self.self_executed = np.array([quote.tx is not None for quote in self.quotes], dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.quotes)
+
+    # ---- Per quote ---- #
+
+    @property
+    def sell_usd(self) -> Array:
+        """USD value sold by each quote, NaN if any of its tokens has no USD price"""
+        return self.__usd_per_quote(self.sell)
+
+    @property
+    def buy_usd(self) -> Array:
+        """USD value bought by each quote, NaN if any of its tokens has no USD price"""
+        return self.__usd_per_quote(self.buy)
+
+    @property
+    def protocol_fee_usd(self) -> Array:
+        return self.__per_quote(self.protocol_fees, self.protocol_fees.usd)
+
+    @property
+    def partner_fee_usd(self) -> Array:
+        return self.__per_quote(self.partner_fees, self.partner_fees.usd)
+
+    @property
+    def fee_usd(self) -> Array:
+        """Protocol and partner fees in USD, fees in tokens without a price are left out"""
+        return self.protocol_fee_usd + self.partner_fee_usd
+
+    @property
+    def price(self) -> Array:
+        """Effective price of single pair quotes, in buy tokens per sell token. NaN for multi-token quotes"""
+        np = self.__np
+        single = (self.__count(self.sell) == 1) & (self.__count(self.buy) == 1)
+        sold = self.__per_quote(self.sell, self.sell.amounts)
+        bought = self.__per_quote(self.buy, self.buy.amounts)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(single & (sold > 0), bought / sold, np.nan)
+
+    @property
+    def scores(self) -> Array:
+        """Vectorized `best_quote.quote_score`, USD received per USD sold net of self-execution gas. NaN without
+        USD prices for every token"""
+        np = self.__np
+        sell_usd, buy_usd = self.sell_usd, self.buy_usd
+        gas_usd = np.where(self.self_executed, np.nan_to_num(self.gas_usd), 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(sell_usd != 0, (buy_usd - gas_usd) / sell_usd, np.nan)
+
+    # ---- Batch totals, `sell.totals()` and `buy.totals()` for the traded amounts ---- #
+
+    def fee_totals(self) -> dict[tuple[int, str], int]:
+        """Exact raw protocol plus partner fees per `(chain id, lowercase token)` over the batch"""
+        totals = self.protocol_fees.totals()
+        for key, amount in self.partner_fees.totals().items():
+            totals[key] = totals.get(key, 0) + amount
+        return totals
+
+    # ---- Internals ---- #
+
+    def __per_quote(self, columns: TokenColumns, values: Array) -> Array:
+        np = self.__np
+        return np.bincount(columns.index, weights=np.nan_to_num(values), minlength=len(self.quotes))
+
+    def __usd_per_quote(self, columns: TokenColumns) -> Array:
+        """Summed USD value of each quote, NaN where a row has no USD value"""
+        np = self.__np
+        usd = columns.usd
+        unpriced = np.bincount(columns.index, weights=np.isnan(usd), minlength=len(self.quotes))
+        return np.where(unpriced > 0, np.nan, self.__per_quote(columns, usd))
+
+    def __count(self, columns: TokenColumns) -> Array:
+        return self.__np.bincount(columns.index, minlength=len(self.quotes))
+
+    def __columns(self, side: Any) -> TokenColumns:
+        index, chain_ids, tokens, amounts, decimals, prices = [], [], [], [], [], []
+        for i, quote in enumerate(self.quotes):
+            token: ResponseToken
+            for address, token in side(quote).items():
+                index.append(i)
+                chain_ids.append(quote.chainId)
+                tokens.append(address)
+                amounts.append(token.amount)
+                decimals.append(token.decimals)
+                prices.append(token.priceUsd)
+        return TokenColumns(self.__np, index, chain_ids, tokens, amounts, decimals, prices)
+
+    def __fee_columns(self, fees: Any) -> TokenColumns:
+        """Fees are raw amounts keyed by token, priced with the matching buy or sell token of the quote"""
+        index, chain_ids, tokens, amounts, decimals, prices = [], [], [], [], [], []
+        for i, quote in enumerate(self.quotes):
+            quote_fees: Mapping[str, str] | None = fees(quote)
+            if not quote_fees:
+                continue
+            known: dict[str, ResponseToken] = {address.lower(): token for address, token in quote.sellTokens.items()}
+            known.update((address.lower(), token) for address, token in quote.buyTokens.items())
+            for address, amount in quote_fees.items():
+                token = known.get(address.lower())
+                index.append(i)
+                chain_ids.append(quote.chainId)
+                tokens.append(address)
+                amounts.append(amount)
+                decimals.append(token.decimals if token is not None else -1)
+                prices.append(token.priceUsd if token is not None else None)
+        return TokenColumns(self.__np, index, chain_ids, tokens, amounts, decimals, prices)
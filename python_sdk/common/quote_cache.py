@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, cast
+
+from python_sdk.common.types.quote_types import QuoteResponse, QuoteResponseT
+from python_sdk.common.types.types import Chain, Env, Route
+
+
+@dataclass(frozen=True)
+class QuoteCacheConfig:
+    staleness_budget: float = 1.0  # seconds a quote is served from the cache after it was received
+    min_time_to_expiry: float = 5.0  # quotes closer than this to their `expiry` are never served
+    max_size: int = 1024
+
+
+@dataclass(frozen=True)
+class QuoteCacheStats:
+    hits: int
+    misses: int
+    coalesced: int
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.misses + self.coalesced
+
+
+@dataclass(frozen=True)
+class CachedQuote:
+    quote: QuoteResponse
+    received_at: float
+
+
+def quote_cache_key(route: Route, env: Env, chain: Chain, params: dict[str, Any]) -> Hashable:
+    """Normalised `QuoteRequest.to_params()` output, addresses are compared case-insensitively"""
+    normalised = tuple(
+        sorted(
+            (name, value.lower() if isinstance(value, str) and value.startswith("0x") else value)
+            for name, value in params.items()
+        )
+    )
+    return route, env, chain.id, normalised
+
+
+class QuoteCache:
+    """Short lived cache for identical quote requests, with single-flight request coalescing.
+
+    A quote is served for at most `staleness_budget` seconds after it was received, and never once it is within
+    `min_time_to_expiry` of its `expiry`. Concurrent requests for a key that is being fetched wait for that fetch
+    instead of sending their own. Cached quotes share the same `quoteId`, so they are meant for pricing: only one
+    order can be executed per quote.
+    """
+
+    def __init__(self, config: QuoteCacheConfig | None = None) -> None:
+        self.__config = config or QuoteCacheConfig()
+        self.__entries: OrderedDict[Hashable, CachedQuote] = OrderedDict()
+        self.__inflight: dict[Hashable, asyncio.Task[QuoteResponse]] = {}
+        self.__hits = 0
+        self.__misses = 0
+        self.__coalesced = 0
+
+    @property
+    def stats(self) -> QuoteCacheStats:
+        return QuoteCacheStats(hits=self.__hits, misses=self.__misses, coalesced=self.__coalesced)
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[QuoteResponseT]]) -> QuoteResponseT:
+        """Return the cached quote for `key`, joining an in-flight fetch or starting one if there is none"""
+        entry = self.__entries.get(key)
+        if entry is not None:
+            if self.__is_fresh(entry):
+                self.__hits += 1
+                self.__entries.move_to_end(key)
+                return cast(QuoteResponseT, entry.quote)
+            del self.__entries[key]
+
+        task = self.__inflight.get(key)
+        if task is not None:
+            self.__coalesced += 1
+        else:
+            self.__misses += 1
+            task = asyncio.create_task(self.__fetch(key, fetch))
+            self.__inflight[key] = task
+        # Shielded so that a cancelled caller does not cancel the fetch others are waiting for
+        return cast(QuoteResponseT, await asyncio.shield(task))
+
+    def invalidate(self, key: Hashable) -> None:
+        self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.__entries.clear()
+
+    async def __fetch(self, key: Hashable, fetch: Callable[[], Awaitable[QuoteResponse]]) -> QuoteResponse:
+        try:
+            quote = await fetch()
+        finally:
+            del self.__inflight[key]
+        entry = CachedQuote(quote=quote, received_at=time.monotonic())
+        if self.__is_fresh(entry):
+            self.__entries[key] = entry
+            while len(self.__entries) > self.__config.max_size:
+                self.__entries.popitem(last=False)
+        return quote
+
+    def __is_fresh(self, entry: CachedQuote) -> bool:
+        return (
+            time.monotonic() - entry.received_at < self.__config.staleness_budget
+            and entry.quote.expiry - time.time() > self.__config.min_time_to_expiry
+        )
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+
+from eth_typing import HexStr
+from web3 import AsyncWeb3
+from web3.exceptions import TransactionNotFound
+from web3.providers import WebsocketProviderV2
+from web3.types import TxReceipt
+
+from python_sdk.common.types.types import Chain
+from python_sdk.common.utils.logger import Logger
+
+LOGGER = Logger(__name__)
+
+
+@dataclass(frozen=True)
+class ReceiptWaiterConfig:
+    timeout_blocks: int = 20  # confirmation timeout, expressed in blocks of the chain
+    min_timeout: float = 10.0
+    poll_interval: float | None = None  # defaults to half the chain block time
+    reconnect_delay: float = 1.0
+    heartbeat: float | None = None  # seconds without a new head before the connection is checked, 2 blocks by default
+
+
+class ReceiptWaiter:
+    """Waits for transaction receipts of many pending transactions at once.
+
+    With a websocket RPC url, pending hashes are checked once per `newHeads` notification of a single shared
+    subscription. Without one, or while the subscription is down, they are checked on a polling interval. A
+    subscription quiet for `heartbeat` seconds has its connection checked, and is re-established if it was lost.
+    """
+
+    def __init__(
+        self,
+        chain: Chain,
+        web3: AsyncWeb3,
+        ws_rpc_url: str | None = None,
+        config: ReceiptWaiterConfig | None = None,
+    ) -> None:
+        self.__chain = chain
+        self.__web3 = web3
+        self.__ws_rpc_url = ws_rpc_url
+        self.__config = config or ReceiptWaiterConfig()
+        self.__pending: dict[HexStr, asyncio.Future[TxReceipt]] = {}
+        self.__waiters: dict[HexStr, int] = {}  # `wait()` calls sharing each pending future
+        self.__has_pending = asyncio.Event()
+        self.__task: asyncio.Task[None] | None = None
+        self.__subscribed = False
+
+    @property
+    def timeout(self) -> float:
+        return max(self.__config.min_timeout, self.__chain.block_time * self.__config.timeout_blocks)
+
+    @property
+    def poll_interval(self) -> float:
+        if self.__config.poll_interval is not None:
+            return self.__config.poll_interval
+        return min(max(self.__chain.block_time / 2, 0.25), 2.0)
+
+    @property
+    def heartbeat(self) -> float:
+        if self.__config.heartbeat is not None:
+            return self.__config.heartbeat
+        return max(self.__chain.block_time * 2, 1.0)
+
+    async def wait(self, tx_hash: HexStr, timeout: float | None = None) -> TxReceipt | None:
+        """Wait for the receipt of `tx_hash`, returns `None` if it is not mined within the timeout"""
+        future = self.__pending.get(tx_hash)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self.__pending[tx_hash] = future
+            self.__has_pending.set()
+        self.__waiters[tx_hash] = self.__waiters.get(tx_hash, 0) + 1
+        if self.__task is None or self.__task.done():
+            self.__task = asyncio.create_task(self.__run())
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout or self.timeout)
+        except TimeoutError:
+            return None
+        finally:
+            # Timed out or cancelled: stop checking the hash once its last waiter is gone
+            self.__waiters[tx_hash] -= 1
+            if not self.__waiters[tx_hash]:
+                del self.__waiters[tx_hash]
+                if self.__pending.get(tx_hash) is future and not future.done():
+                    del self.__pending[tx_hash]
+
+    async def close(self) -> None:
+        for future in self.__pending.values():
+            future.cancel()
+        self.__pending.clear()
+        if self.__task:
+            self.__task.cancel()
+            await asyncio.gather(self.__task, return_exceptions=True)
+            self.__task = None
+
+    async def __run(self) -> None:
+        loops = [self.__poll_loop()]
+        if self.__ws_rpc_url:
+            loops.append(self.__subscription_loop(self.__ws_rpc_url))
+        await asyncio.gather(*loops)
+
+    async def __subscription_loop(self, ws_rpc_url: str) -> None:
+        while True:
+            try:
+                await self.__watch_heads(ws_rpc_url)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                LOGGER.warning(f"newHeads subscription failed, polling for receipts instead: {e}")
+            finally:
+                self.__subscribed = False
+            await asyncio.sleep(self.__config.reconnect_delay)
+
+    async def __watch_heads(self, ws_rpc_url: str) -> None:
+        async with AsyncWeb3.persistent_websocket(WebsocketProviderV2(ws_rpc_url)) as ws_web3:
+            await ws_web3.eth.subscribe("newHeads")
+            self.__subscribed = True
+            # Catch up on anything mined while the subscription was being set up
+            await self.__check_pending()
+            heads = ws_web3.ws.process_subscriptions()
+            next_head = asyncio.ensure_future(anext(heads))
+            try:
+                while True:
+                    done, _ = await asyncio.wait({next_head}, timeout=self.heartbeat)
+                    if not done:
+                        # web3 does not end the stream when the node closes the connection, so a quiet one is checked
+                        if not await ws_web3.provider.is_connected():
+                            raise ConnectionError("newHeads subscription connection lost")
+                        continue
+                    if next_head.exception() is not None:
+                        raise ConnectionError(f"newHeads subscription ended: {next_head.exception()!r}")
+                    next_head = asyncio.ensure_future(anext(heads))
+                    await self.__check_pending()
+            finally:
+                next_head.cancel()
+
+    async def __poll_loop(self) -> None:
+        while True:
+            await self.__has_pending.wait()
+            await asyncio.sleep(self.poll_interval)
+            if not self.__subscribed:
+                await self.__check_pending()
+
+    async def __check_pending(self) -> None:
+        if not self.__pending:
+            self.__has_pending.clear()
+            return
+        pending = list(self.__pending.items())
+        receipts = await asyncio.gather(*(self.__get_receipt(tx_hash) for tx_hash, _ in pending))
+        for (tx_hash, future), receipt in zip(pending, receipts, strict=True):
+            if receipt is not None and not future.done():
+                future.set_result(receipt)
+                self.__pending.pop(tx_hash, None)
+        if not self.__pending:
+            self.__has_pending.clear()
+
+    async def __get_receipt(self, tx_hash: HexStr) -> TxReceipt | None:
+        try:
+            return await self.__web3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+        except Exception as e:
+            LOGGER.warning(f"Failed to fetch receipt for {tx_hash}: {e}")
+            return None
@@ -0,0 +1,475 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Protocol
+
+import orjson
+
+from python_sdk.common.types.order_types import OrderResponse, OrderStatusResponse
+from python_sdk.common.types.quote_types import QuoteResponse
+from python_sdk.common.types.types import Chain, Route
+from python_sdk.common.utils.lazy import import_optional
+from python_sdk.common.utils.logger import Logger
+
+LOGGER = Logger(__name__)
+
+
+class RecordFormat(str, Enum):
+    PARQUET = "parquet"
+    JSONL = "jsonl"
+
+
+class RecordKind(str, Enum):
+    QUOTE = "quote"
+    ORDER = "order"
+    STATUS = "status"
+
+
+# Flat columns of each record kind, as Arrow type names. Token lists are aligned: `sell_amounts[i]` is the raw amount
+# of `sell_tokens[i]`. `error` is set instead of the response fields when the request failed
+_COMMON = {"ts": "float64", "chain": "string", "route": "string", "quote_id": "string", "error": "string"}
+COLUMNS: dict[RecordKind, dict[str, str]] = {
+    RecordKind.QUOTE: _COMMON
+    | {
+        "type": "string",
+        "status": "string",
+        "expiry": "int64",
+        "taker": "string",
+        "gasless": "bool",
+        "sell_tokens": "list<string>",
+        "sell_amounts": "list<string>",
+        "sell_decimals": "list<int64>",
+        "sell_prices_usd": "list<float64>",
+        "buy_tokens": "list<string>",
+        "buy_amounts": "list<string>",
+        "buy_decimals": "list<int64>",
+        "buy_prices_usd": "list<float64>",
+        "gas_native": "string",
+        "gas_usd": "float64",
+    },
+    RecordKind.ORDER: _COMMON | {"status": "string", "expiry": "int64", "tx_hash": "string"},
+    RecordKind.STATUS: _COMMON
+    | {"status": "string", "tx_hash": "string", "tokens": "list<string>", "amounts": "list<string>"},
+}
+
+Row = dict[str, Any]
+
+
+@dataclass(frozen=True)
+class RecorderConfig:
+    directory: str = "bebop_records"  # one sub-directory per record kind
+    format: RecordFormat | None = None  # Parquet when pyarrow is installed, JSON lines otherwise
+    queue_size: int = 10_000
+    batch_size: int = 1_000  # records written at once, per kind
+    flush_interval: float = 1.0  # seconds before a partial batch is written
+    rotate_bytes: int = 64 * 1024 * 1024
+    rotate_interval: float = 3600.0  # seconds before starting a new file
+    sample_above: float = 0.5  # queue fill ratio from which quotes are sampled, orders and statuses never are
+    sample_rate: float = 0.1  # share of quotes kept while sampling
+
+
+@dataclass(frozen=True)
+class RecorderStats:
+    recorded: int  # accepted onto the queue
+    written: int
+    sampled_out: int  # quotes skipped while the queue was filling up
+    dropped: int  # records rejected because the queue was full or the recorder closed
+    failed: int  # records lost to write errors
+
+
+class RecordWriter(Protocol):
+    def write(self, kind: RecordKind, rows: list[Row]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class Recorder:
+    """Records quotes, orders and order statuses for TCA and post-mortems, without slowing down the hot path.
+
+    `record_*` only put the response objects on a bounded queue. A background thread flattens them into the rows of
+    `COLUMNS` and writes them in batches, to rotating Parquet files (or JSON lines without pyarrow). When the queue
+    fills up quotes are sampled, and once it is full records are dropped: recording never blocks nor raises.
+    Parquet files are only readable once rotated or closed.
+    """
+
+    def __init__(self, config: RecorderConfig | None = None, writer: RecordWriter | None = None) -> None:
+        self.config = config or RecorderConfig()
+        self.__writer = writer or _default_writer(self.config)
+        self.__queue: queue.Queue[tuple[RecordKind | None, tuple[Any, ...]]] = queue.Queue(self.config.queue_size)
+        self.__sample_from = int(self.config.queue_size * self.config.sample_above)
+        self.__keep_every = max(1, round(1 / self.config.sample_rate)) if self.config.sample_rate > 0 else 0
+        self.__sampled = 0
+        self.__recorded = self.__sampled_out = self.__dropped = 0
+        self.__written = self.__failed = 0  # updated by the writer thread, under `__lock`
+        self.__lock = threading.Lock()
+        self.__closed = False
+        self.__thread = threading.Thread(target=self.__run, name="bebop-recorder", daemon=True)
+        self.__thread.start()
+
+    async def __aenter__(self) -> Recorder:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    @property
+    def stats(self) -> RecorderStats:
+        with self.__lock:
+            written, failed = self.__written, self.__failed
+        return RecorderStats(
+            recorded=self.__recorded,
+            written=written,
+            sampled_out=self.__sampled_out,
+            dropped=self.__dropped,
+            failed=failed,
+        )
+
+    # ---- Hot path ---- #
+
+    def record_quote(
+        self,
+        chain: Chain | None,
+        route: Route | None,
+        quote: QuoteResponse | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        if len(self.__queue.queue) >= self.__sample_from:  # unlocked, an approximate fill level is enough
+            self.__sampled += 1
+            if not self.__keep_every or self.__sampled % self.__keep_every:
+                self.__sampled_out += 1
+                return
+        self.__put(RecordKind.QUOTE, (time.time(), chain, route, quote, error))
+
+    def record_order(
+        self,
+        chain: Chain | None,
+        route: Route | None,
+        quote_id: str,
+        order: OrderResponse | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        self.__put(RecordKind.ORDER, (time.time(), chain, route, quote_id, order, error))
+
+    def record_status(
+        self,
+        chain: Chain | None,
+        route: Route | None,
+        quote_id: str,
+        status: OrderStatusResponse | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        self.__put(RecordKind.STATUS, (time.time(), chain, route, quote_id, status, error))
+
+    def __put(self, kind: RecordKind, args: tuple[Any, ...]) -> None:
+        if self.__closed:
+            self.__dropped += 1
+            return
+        try:
+            self.__queue.put_nowait((kind, args))
+            self.__recorded += 1
+        except queue.Full:
+            self.__dropped += 1
+
+    # ---- Lifecycle ---- #
+
+    async def flush(self) -> None:
+        """Wait until every record queued so far is written, returns at once after `close()` which wrote them all"""
+        if self.__closed:
+            return
+        done = threading.Event()
+        await asyncio.to_thread(self.__queue.put, (None, (done,)))
+        await asyncio.to_thread(self.__wait_flushed, done)
+
+    async def close(self) -> None:
+        """Write the queued records and close the current files, later records are dropped"""
+        if self.__closed:
+            return
+        self.__closed = True
+        await asyncio.to_thread(self.__queue.put, (None, (None,)))
+        await asyncio.to_thread(self.__thread.join)
+
+    def __wait_flushed(self, done: threading.Event) -> None:
+        """Wait for a flush marker to be reached, or for the writer thread to stop if closed in the meantime"""
+        while not done.wait(0.1):
+            if not self.__thread.is_alive():
+                return
+
+    # ---- Writer thread ---- #
+
+    def __run(self) -> None:
+        batches: dict[RecordKind, list[Row]] = {kind: [] for kind in RecordKind}
+        deadline = time.monotonic() + self.config.flush_interval
+        while True:
+            try:
+                kind, args = self.__queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                kind, args = None, ()
+            if kind is not None:
+                self.__add(batches, kind, args)
+                if time.monotonic() < deadline:
+                    continue
+            for pending_kind, batch in batches.items():
+                self.__write(pending_kind, batch)
+                batches[pending_kind] = []
+            deadline = time.monotonic() + self.config.flush_interval
+            if kind is None and args:  # flush or close marker
+                (done,) = args
+                if done is None:
+                    break
+                done.set()
+        try:
+            self.__writer.close()
+        except Exception as e:
+            LOGGER.warning(f"Failed to close the recorder files: {e}")
+
+    def __add(self, batches: dict[RecordKind, list[Row]], kind: RecordKind, args: tuple[Any, ...]) -> None:
+        try:
+            batches[kind].append(_ROW_BUILDERS[kind](*args))
+        except Exception as e:
+            with self.__lock:
+                self.__failed += 1
+            LOGGER.warning(f"Failed to flatten a {kind.value} record: {e}")
+            return
+        if len(batches[kind]) >= self.config.batch_size:
+            self.__write(kind, batches[kind])
+            batches[kind] = []
+
+    def __write(self, kind: RecordKind, rows: list[Row]) -> None:
+        if not rows:
+            return
+        try:
+            self.__writer.write(kind, rows)
+            with self.__lock:
+                self.__written += len(rows)
+        except Exception as e:
+            with self.__lock:
+                self.__failed += len(rows)
+            LOGGER.warning(f"Failed to write {len(rows)} {kind.value} records: {e}")
+
+
+# ---------------------------------------------------------------------------- #
+#                                 Flattening                                   #
+# ---------------------------------------------------------------------------- #
+def _row(kind: RecordKind, ts: float, chain: Chain | None, route: Route | None, error: BaseException | None) -> Row:
+    row: Row = dict.fromkeys(COLUMNS[kind])
+    row["ts"] = ts
+    row["chain"] = chain.name if chain is not None else None
+    row["route"] = route.value if route is not None else None
+    row["error"] = f"{type(error).__name__}: {error}" if error is not None else None
+    return row
+
+
+def _quote_row(
+    ts: float, chain: Chain | None, route: Route | None, quote: QuoteResponse | None, error: BaseException | None
+) -> Row:
+    row = _row(RecordKind.QUOTE, ts, chain, route, error)
+    if quote is None:
+        return row
+    row |= {
+        "quote_id": quote.quoteId,
+        "type": quote.type,
+        "status": quote.status,
+        "expiry": quote.expiry,
+        "taker": quote.taker,
+        "gasless": quote.tx is None,
+        "gas_native": quote.gasFee.native,
+        "gas_usd": quote.gasFee.usd,
+    }
+    for side, tokens in (("sell", quote.sellTokens), ("buy", quote.buyTokens)):
+        row[f"{side}_tokens"] = list(tokens)
+        row[f"{side}_amounts"] = [token.amount for token in tokens.values()]
+        row[f"{side}_decimals"] = [token.decimals for token in tokens.values()]
+        row[f"{side}_prices_usd"] = [token.priceUsd for token in tokens.values()]
+    return row
+
+
+def _order_row(
+    ts: float,
+    chain: Chain | None,
+    route: Route | None,
+    quote_id: str,
+    order: OrderResponse | None,
+    error: BaseException | None,
+) -> Row:
+    row = _row(RecordKind.ORDER, ts, chain, route, error)
+    row["quote_id"] = quote_id
+    if order is not None:
+        row["status"] = order.status
+        row["expiry"] = order.expiry
+        row["tx_hash"] = order.txHash
+    return row
+
+
+def _status_row(
+    ts: float,
+    chain: Chain | None,
+    route: Route | None,
+    quote_id: str,
+    status: OrderStatusResponse | None,
+    error: BaseException | None,
+) -> Row:
+    row = _row(RecordKind.STATUS, ts, chain, route, error)
+    row["quote_id"] = quote_id
+    if status is not None:
+        row["status"] = status.status.value
+        row["tx_hash"] = status.txHash
+        if status.amounts:
+            row["tokens"] = list(status.amounts)
+            row["amounts"] = list(status.amounts.values())
+    return row
+
+
+_ROW_BUILDERS: dict[RecordKind, Callable[..., Row]] = {
+    RecordKind.QUOTE: _quote_row,
+    RecordKind.ORDER: _order_row,
+    RecordKind.STATUS: _status_row,
+}
+
+
+# ---------------------------------------------------------------------------- #
+#                                   Writers                                    #
+# ---------------------------------------------------------------------------- #
+def _default_writer(config: RecorderConfig) -> RecordWriter:
+    record_format = config.format
+    if record_format is None:
+        record_format = RecordFormat.PARQUET if importlib.util.find_spec("pyarrow") else RecordFormat.JSONL
+    if record_format == RecordFormat.PARQUET:
+        return ParquetWriter(config.directory, config.rotate_bytes, config.rotate_interval)
+    return JsonlWriter(config.directory, config.rotate_bytes, config.rotate_interval)
+
+
+class _RotatingFiles(ABC):
+    """One open file per record kind, replaced once it reaches `rotate_bytes` or `rotate_interval` seconds"""
+
+    extension = ""
+
+    def __init__(self, directory: str, rotate_bytes: int, rotate_interval: float) -> None:
+        self.directory = Path(directory)
+        self.__rotate_bytes = rotate_bytes
+        self.__rotate_interval = rotate_interval
+        self.__opened: dict[RecordKind, float] = {}
+        self.__sequence = 0
+
+    def write(self, kind: RecordKind, rows: list[Row]) -> None:
+        opened = self.__opened.get(kind)
+        if opened is not None and (
+            self._size(kind) >= self.__rotate_bytes or time.monotonic() - opened >= self.__rotate_interval
+        ):
+            self.__close(kind)
+            opened = None
+        if opened is None:
+            self.__sequence += 1
+            path = self.directory / kind.value
+            path.mkdir(parents=True, exist_ok=True)
+            stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+            self._open(kind, path / f"{kind.value}-{stamp}-{self.__sequence:04d}.{self.extension}")
+            self.__opened[kind] = time.monotonic()
+        self._append(kind, rows)
+
+    def close(self) -> None:
+        for kind in list(self.__opened):
+            self.__close(kind)
+
+    def __close(self, kind: RecordKind) -> None:
+        del self.__opened[kind]
+        self._close(kind)
+
+    @abstractmethod
+    def _open(self, kind: RecordKind, path: Path) -> None:
+        """Start writing the rows of `kind` to a new file at `path`"""
+
+    @abstractmethod
+    def _append(self, kind: RecordKind, rows: list[Row]) -> None:
+        """Write the rows to the open file of `kind`"""
+
+    @abstractmethod
+    def _size(self, kind: RecordKind) -> int:
+        """Bytes written so far to the open file of `kind`"""
+
+    @abstractmethod
+    def _close(self, kind: RecordKind) -> None:
+        """Close the open file of `kind`"""
+
+
+class JsonlWriter(_RotatingFiles):
+    """One JSON object per line, the fallback when pyarrow is not installed"""
+
+    extension = "jsonl"
+
+    def __init__(self, directory: str, rotate_bytes: int, rotate_interval: float) -> None:
+        super().__init__(directory, rotate_bytes, rotate_interval)
+        self.__files: dict[RecordKind, Any] = {}
+
+    def _open(self, kind: RecordKind, path: Path) -> None:
+        self.__files[kind] = path.open("ab")
+
+    def _append(self, kind: RecordKind, rows: list[Row]) -> None:
+        file = self.__files[kind]
+        file.write(b"".join(orjson.dumps(row) + b"\n" for row in rows))
+        file.flush()
+
+    def _size(self, kind: RecordKind) -> int:
+        return int(self.__files[kind].tell())
+
+    def _close(self, kind: RecordKind) -> None:
+        self.__files.pop(kind).close()
+
+
+class ParquetWriter(_RotatingFiles):
+    """Zstd-compressed Parquet files with the `COLUMNS` schema, each batch written as a row group"""
+
+    extension = "parquet"
+
+    def __init__(self, directory: str, rotate_bytes: int, rotate_interval: float) -> None:
+        super().__init__(directory, rotate_bytes, rotate_interval)
+        self.__pa = import_optional("pyarrow", "pyarrow", "ParquetWriter", "parquet")
+        self.__pq = import_optional("pyarrow.parquet", "pyarrow", "ParquetWriter", "parquet")
+        self.__schemas = {kind: self.__schema(columns) for kind, columns in COLUMNS.items()}
+        self.__writers: dict[RecordKind, tuple[Any, Path]] = {}
+
+    def __schema(self, columns: dict[str, str]) -> Any:
+        pa = self.__pa
+        types = {"string": pa.string(), "int64": pa.int64(), "float64": pa.float64(), "bool": pa.bool_()}
+        types |= {f"list<{name}>": pa.list_(value) for name, value in list(types.items())}
+        return pa.schema([(name, types[type_name]) for name, type_name in columns.items()])
+
+    def _open(self, kind: RecordKind, path: Path) -> None:
+        self.__writers[kind] = (self.__pq.ParquetWriter(path, self.__schemas[kind], compression="zstd"), path)
+
+    def _append(self, kind: RecordKind, rows: list[Row]) -> None:
+        writer, _ = self.__writers[kind]
+        writer.write_table(self.__pa.Table.from_pylist(rows, schema=self.__schemas[kind]))
+
+    def _size(self, kind: RecordKind) -> int:
+        _, path = self.__writers[kind]
+        return path.stat().st_size
+
+    def _close(self, kind: RecordKind) -> None:
+        writer, _ = self.__writers.pop(kind)
+        writer.close()
+
+
+def read_records(path: str | Path) -> list[Row]:
+    """Rows of one recorded file, Parquet or JSON lines"""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        return list(
+            import_optional("pyarrow.parquet", "pyarrow", "read_records", "parquet").read_table(path).to_pylist()
+        )
+    with path.open("rb") as file:
+        return [orjson.loads(line) for line in file if line.strip()]
@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit
+
+import aiohttp
+import orjson
+
+from python_sdk.common.exceptions import (
+    BebopAPIError,
+    BebopConnectionError,
+    BebopError,
+    BebopHTTPError,
+    BebopRateLimitError,
+    BebopTimeoutError,
+    BebopTransportError,
+    ReplayMismatchError,
+    http_error,
+)
+from python_sdk.common.order_tracker import OrderHandle
+from python_sdk.common.transport import Transport
+from python_sdk.common.types.types import Chain, Route
+from python_sdk.common.utils.logger import Logger
+from python_sdk.jam.types.quote_types import QuoteRequest as JamQuoteRequest
+from python_sdk.pmm.types.quote_types import QuoteRequest as PmmQuoteRequest
+
+if TYPE_CHECKING:
+    from python_sdk.jam.client import JamClient
+    from python_sdk.pmm.client import PMMClient
+
+LOGGER = Logger(__name__)
+
+# Quote request params sent as comma separated lists, see `QuoteRequest.to_params`
+_LIST_PARAMS: dict[str, Callable[[str], Any]] = {
+    "sell_tokens": str,
+    "buy_tokens": str,
+    "sell_amounts": int,
+    "buy_amounts": int,
+    "sell_tokens_ratios": float,
+    "buy_tokens_ratios": float,
+}
+
+
+@dataclass(frozen=True)
+class Exchange:
+    """One request sent through a `Transport` and its outcome: the decoded response, or the error raised"""
+
+    ts: float  # seconds from the start of the capture to the request being sent
+    elapsed: float  # seconds until the response (or error)
+    method: str
+    url: str
+    params: dict[str, Any] | None = None
+    json: dict[str, Any] | None = None
+    response: dict[str, Any] | None = None
+    error: dict[str, Any] | None = None
+
+    @property
+    def path(self) -> str:
+        return urlsplit(self.url).path
+
+    @property
+    def key(self) -> str:
+        return exchange_key(self.method, self.url, self.params, self.json)
+
+    @property
+    def route(self) -> Route:
+        return Route.JAM if self.path.split("/")[1] == "jam" else Route.PMM
+
+    @property
+    def chain(self) -> Chain:
+        return Chain[self.path.split("/")[2]]
+
+
+def exchange_key(method: str, url: str, params: dict[str, Any] | None, json: dict[str, Any] | None) -> str:
+    """What a replayed request is matched on: method, url path and params, or the quote id of a posted order.
+
+    The host is left out so that traffic captured against a mock server replays against production urls, and order
+    signatures are left out so that it replays with another private key.
+    """
+    identity = {"quote_id": json.get("quote_id")} if json is not None else params or {}
+    return f"{method.upper()} {urlsplit(url).path} {orjson.dumps(identity, option=orjson.OPT_SORT_KEYS).decode()}"
+
+
+def load_traffic(path: str | Path) -> list[Exchange]:
+    """Exchanges captured by a `RecordingTransport`, in the order they were sent"""
+    with Path(path).open("rb") as file:
+        exchanges = [Exchange(**orjson.loads(line)) for line in file if line.strip()]
+    return sorted(exchanges, key=lambda exchange: exchange.ts)
+
+
+# ---------------------------------------------------------------------------- #
+#                                    Errors                                    #
+# ---------------------------------------------------------------------------- #
+def _capture_error(error: BebopError) -> dict[str, Any]:
+    if isinstance(error, BebopAPIError):
+        return {"kind": "api", "error": error.error}
+    if isinstance(error, BebopHTTPError):
+        retry_after = error.retry_after if isinstance(error, BebopRateLimitError) else None
+        return {"kind": "http", "status": error.status, "reason": error.reason, "retry_after": retry_after}
+    if isinstance(error, BebopConnectionError):
+        return {"kind": "connection", "message": str(error)}
+    if isinstance(error, BebopTimeoutError):
+        return {"kind": "timeout", "message": str(error)}
+    return {"kind": "transport", "message": str(error)}
+
+
+def _replay_error(error: dict[str, Any], method: str) -> BebopError:
+    kind = error["kind"]
+    if kind == "api":
+        return BebopAPIError(error["error"])
+    if kind == "http":
+        retry_after = error.get("retry_after")
+        headers = {"Retry-After": str(retry_after)} if retry_after is not None else None
+        return http_error(error["status"], error.get("reason"), method, headers)
+    if kind == "connection":
+        return BebopConnectionError(error["message"])
+    if kind == "timeout":
+        return BebopTimeoutError(error["message"])
+    return BebopTransportError(error["message"])
+
+
+# ---------------------------------------------------------------------------- #
+#                                  Transports                                  #
+# ---------------------------------------------------------------------------- #
+class RecordingTransport:
+    """Captures every request sent through `transport`, and its response or error, as JSON lines in `path`.
+
+    Wrap the network transport (e.g. `ResilientTransport(RecordingTransport(AioHttpTransport()))`) so that retries
+    are captured as separate exchanges. Headers and auth are not captured. Exchanges are serialized and written by a
+    background thread, like `Recorder` does, so capturing never blocks the event loop: the file is complete once
+    `close()` returns, which also closes the wrapped transport.
+    """
+
+    def __init__(self, transport: Transport, path: str | Path) -> None:
+        self.__transport = transport
+        self.__file = Path(path).open("ab")  # noqa: SIM115
+        self.__start: float | None = None
+        self.__queue: queue.Queue[Exchange | None] = queue.Queue()
+        self.__thread = threading.Thread(target=self.__run, name="bebop-traffic-recorder", daemon=True)
+        self.__thread.start()
+        self.captured = 0
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        auth: aiohttp.BasicAuth | None = None,
+    ) -> dict[str, Any]:
+        start = time.monotonic()
+        if self.__start is None:
+            self.__start = start
+        response: dict[str, Any] | None = None
+        error: dict[str, Any] | None = None
+        try:
+            response = await self.__transport.request(method, url, params=params, json=json, headers=headers, auth=auth)
+        except BebopError as e:
+            error = _capture_error(e)
+            raise
+        finally:
+            exchange = Exchange(
+                ts=start - self.__start,
+                elapsed=time.monotonic() - start,
+                method=method.upper(),
+                url=url,
+                params=params,
+                json=json,
+                response=response,
+                error=error,
+            )
+            if response is not None or error is not None:  # not cancelled, nor failed before reaching the API
+                self.__queue.put_nowait(exchange)
+                self.captured += 1
+        return response
+
+    async def close(self) -> None:
+        self.__queue.put_nowait(None)
+        await asyncio.to_thread(self.__thread.join)
+        await self.__transport.close()
+
+    def __run(self) -> None:
+        """Write the queued exchanges, all those waiting at once, until the close marker"""
+        closed = False
+        while not closed:
+            exchanges = [self.__queue.get()]
+            while not self.__queue.empty():
+                exchanges.append(self.__queue.get_nowait())
+            closed = None in exchanges
+            lines = [orjson.dumps(asdict(exchange)) + b"\n" for exchange in exchanges if exchange is not None]
+            try:
+                self.__file.write(b"".join(lines))
+                self.__file.flush()
+            except Exception as e:
+                LOGGER.warning(f"Failed to write {len(lines)} captured exchanges: {e}")
+        self.__file.close()
+
+
+class ReplayTransport:
+    """Answers requests from captured traffic, without any network.
+
+    Requests are matched on `exchange_key` and each key is answered with its recorded exchanges in order, e.g. a
+    failure then the retry that succeeded. Once they are used up, the last one is repeated (status polls). Responses
+    are delayed by their recorded latency divided by `speed`: 1 for the original latencies, 10 for ten times faster,
+    `None` for no delay at all. Unknown requests raise a `ReplayMismatchError`.
+    """
+
+    def __init__(self, traffic: Iterable[Exchange] | str | Path, speed: float | None = 1.0) -> None:
+        exchanges = load_traffic(traffic) if isinstance(traffic, str | Path) else list(traffic)
+        self.__pending: defaultdict[str, deque[Exchange]] = defaultdict(deque)
+        for exchange in exchanges:
+            self.__pending[exchange.key].append(exchange)
+        self.__last: dict[str, Exchange] = {}
+        self.__speed = speed
+        self.served = 0
+        self.misses = 0
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        auth: aiohttp.BasicAuth | None = None,
+    ) -> dict[str, Any]:
+        key = exchange_key(method, url, params, json)
+        pending = self.__pending.get(key)
+        exchange = pending.popleft() if pending else self.__last.get(key)
+        if exchange is None:
+            self.misses += 1
+            raise ReplayMismatchError(key)
+        self.__last[key] = exchange
+        self.served += 1
+        if self.__speed is not None:
+            await asyncio.sleep(exchange.elapsed / self.__speed)
+        if exchange.error is not None:
+            raise _replay_error(exchange.error, method)
+        assert exchange.response is not None
+        return exchange.response
+
+    async def close(self) -> None:
+        pass
+
+
+# ---------------------------------------------------------------------------- #
+#                                    Driver                                    #
+# ---------------------------------------------------------------------------- #
+@dataclass(frozen=True)
+class ReplayResult:
+    exchange: Exchange  # the recorded quote request
+    handle: OrderHandle[Any] | None = None  # for quotes that were ordered
+    quote: Any | None = None
+    error: Exception | None = None
+    elapsed: float = 0.0  # seconds from the scheduled start to the quote (and order) completing
+
+
+def quote_request(exchange: Exchange) -> PmmQuoteRequest | JamQuoteRequest:
+    """The quote request of a captured quote exchange, rebuilt from its params"""
+    params: dict[str, Any] = dict(exchange.params or {})
+    for name, parse in _LIST_PARAMS.items():
+        if name in params:
+            params[name] = [parse(value) for value in str(params[name]).split(",")]
+    model: type[PmmQuoteRequest] | type[JamQuoteRequest] = (
+        JamQuoteRequest if exchange.route == Route.JAM else PmmQuoteRequest
+    )
+    return model.model_validate(params)
+
+
+def replayed_quotes(traffic: Iterable[Exchange]) -> list[Exchange]:
+    """One quote exchange per quote the client asked for: failed attempts that were retried are left out"""
+    quotes = [exchange for exchange in traffic if exchange.method == "GET" and exchange.path.endswith("/quote")]
+    retried: set[str] = set()
+    replayed = []
+    for exchange in reversed(quotes):
+        if exchange.error is None or exchange.key not in retried:
+            replayed.append(exchange)
+        retried.add(exchange.key)
+    return replayed[::-1]
+
+
+async def replay(
+    client: Callable[[Chain, Route], PMMClient | JamClient],
+    traffic: Iterable[Exchange] | str | Path,
+    speed: float | None = 1.0,
+    max_concurrency: int | None = None,
+) -> list[ReplayResult]:
+    """Replay captured quotes and gasless orders through the clients, e.g. `BebopRouter.client` over a
+    `ReplayTransport` of the same traffic.
+
+    Each captured quote is requested again at its original offset divided by `speed` (all at once with `None`).
+    Quotes that were ordered go through the full quote, sign and post path with `submit_gasless_order`, the returned
+    handles track their status in the background. Results are in the captured order.
+    """
+    exchanges = load_traffic(traffic) if isinstance(traffic, str | Path) else list(traffic)
+    ordered = {
+        exchange.json.get("quote_id")
+        for exchange in exchanges
+        if exchange.method == "POST" and exchange.path.endswith("/order") and exchange.json
+    }
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    start = time.monotonic()
+
+    async def run(exchange: Exchange) -> ReplayResult:
+        if speed is not None:
+            await asyncio.sleep(max(start + exchange.ts / speed - time.monotonic(), 0))
+        if semaphore is not None:
+            await semaphore.acquire()
+        began = time.monotonic()
+        try:
+            target = client(exchange.chain, exchange.route)
+            request: Any = quote_request(exchange)
+            if exchange.response is not None and exchange.response.get("quoteId") in ordered:
+                handle = await target.submit_gasless_order(request)
+                return ReplayResult(exchange, handle=handle, quote=handle.quote, elapsed=time.monotonic() - began)
+            quote = await target.get_quote(request, cached=False)
+            return ReplayResult(exchange, quote=quote, elapsed=time.monotonic() - began)
+        except Exception as e:
+            return ReplayResult(exchange, error=e, elapsed=time.monotonic() - began)
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    return list(await asyncio.gather(*(run(exchange) for exchange in replayed_quotes(exchanges))))
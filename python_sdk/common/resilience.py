@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from python_sdk.common.exceptions import (
+    BebopConnectionError,
+    BebopRateLimitError,
+    BebopServerError,
+    BebopTransportError,
+    CircuitOpenError,
+)
+from python_sdk.common.transport import Transport
+from python_sdk.common.utils.logger import Logger
+
+LOGGER = Logger(__name__)
+
+
+@dataclass(frozen=True)
+class RetryConfig:
+    max_attempts: int = 3  # including the first one
+    backoff: float = 0.1  # delay before the first retry, doubled on each one
+    max_backoff: float = 2.0
+    jitter: float = 0.2  # random extra delay, as a fraction of the backoff
+    # Retried for idempotent requests (GET), along with transport errors
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    # Retried for POST requests: statuses the API answers without processing the request. A POST is otherwise only
+    # retried when it could not connect at all, an order may have been accepted before a timeout or a 502.
+    post_retry_statuses: frozenset[int] = frozenset({429, 503})
+
+
+@dataclass(frozen=True)
+class HedgeConfig:
+    """Send a duplicate request when the first is slower than usual, the first response wins"""
+
+    paths: tuple[str, ...] = ("/quote",)  # GET endpoints that are hedged, matched against the end of the url path
+    delay: float | None = None  # fixed hedge delay in seconds, by default the `percentile` of recent latencies
+    percentile: float = 0.95
+    min_delay: float = 0.05
+    min_samples: int = 20  # no hedging until this many latencies were observed
+    window: int = 200  # number of recent latencies kept per endpoint
+    max_hedges: int = 1  # extra requests per call
+
+
+@dataclass(frozen=True)
+class BreakerConfig:
+    failure_threshold: int = 5  # consecutive transport errors or 429/5xx before the circuit opens
+    reset_timeout: float = 10.0  # seconds before a trial request is let through an open circuit
+
+
+@dataclass(frozen=True)
+class ResilienceConfig:
+    """Policies applied by `ResilientTransport`, each one is disabled when set to `None`"""
+
+    retry: RetryConfig | None = field(default_factory=RetryConfig)
+    hedge: HedgeConfig | None = None
+    breaker: BreakerConfig | None = field(default_factory=BreakerConfig)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Fails fast once an endpoint keeps failing, then lets a single trial request through every `reset_timeout`"""
+
+    def __init__(self, endpoint: str, config: BreakerConfig) -> None:
+        self.endpoint = endpoint
+        self.__config = config
+        self.__failures = 0
+        self.__opened_at = 0.0
+        self.__state = CircuitState.CLOSED
+
+    @property
+    def state(self) -> CircuitState:
+        return self.__state
+
+    def before_request(self) -> bool:
+        """Raise `CircuitOpenError` unless the request may go through, return whether it is the trial request"""
+        if self.__state == CircuitState.CLOSED:
+            return False
+        retry_in = self.__opened_at + self.__config.reset_timeout - time.monotonic()
+        if self.__state == CircuitState.OPEN and retry_in <= 0:
+            self.__state = CircuitState.HALF_OPEN
+            return True
+        raise CircuitOpenError(self.endpoint, max(retry_in, 0.0))
+
+    def record_success(self) -> None:
+        self.__failures = 0
+        self.__state = CircuitState.CLOSED
+
+    def record_failure(self) -> None:
+        self.__failures += 1
+        if self.__state == CircuitState.HALF_OPEN or self.__failures >= self.__config.failure_threshold:
+            if self.__state != CircuitState.OPEN:
+                LOGGER.warning(f"Circuit opened for {self.endpoint} after {self.__failures} failures")
+            self.__state = CircuitState.OPEN
+            self.__opened_at = time.monotonic()
+
+    def release_trial(self) -> None:
+        """End a trial request that had no outcome (e.g. it was cancelled), the next request is the new trial"""
+        if self.__state == CircuitState.HALF_OPEN:
+            self.__state = CircuitState.OPEN
+
+
+class LatencyWindow:
+    """Recent latencies of an endpoint, to derive the hedge delay"""
+
+    def __init__(self, size: int) -> None:
+        self.__latencies: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self.__latencies)
+
+    def add(self, latency: float) -> None:
+        self.__latencies.append(latency)
+
+    def percentile(self, q: float) -> float:
+        latencies = sorted(self.__latencies)
+        return latencies[min(int(q * len(latencies)), len(latencies) - 1)]
+
+
+def is_endpoint_failure(error: BaseException) -> bool:
+    """Errors that count against the health of an endpoint, API errors and 4xx are the caller's problem"""
+    return isinstance(error, BebopTransportError | BebopServerError | BebopRateLimitError)
+
+
+def is_retryable(error: BaseException, method: str, config: RetryConfig) -> bool:
+    status = getattr(error, "status", None)
+    if method.lower() == "get":
+        return isinstance(error, BebopTransportError) or status in config.retry_statuses
+    return isinstance(error, BebopConnectionError) or status in config.post_retry_statuses
+
+
+class ResilientTransport:
+    """Wraps a `Transport` with retries, hedged requests and a circuit breaker per endpoint.
+
+    An endpoint is a method and url path, e.g. `GET /pmm/arbitrum/v3/quote`. GET requests are retried on transport
+    errors and `retry_statuses`, order POSTs only when they cannot have been processed. Transport errors, 429 and 5xx
+    count against the circuit breaker, any other answer closes it. `close()` closes the wrapped transport.
+    """
+
+    def __init__(self, transport: Transport, config: ResilienceConfig | None = None) -> None:
+        self.__transport = transport
+        self.__config = config or ResilienceConfig()
+        self.__breakers: dict[str, CircuitBreaker] = {}
+        self.__latencies: dict[str, LatencyWindow] = {}
+
+    def breaker(self, endpoint: str) -> CircuitBreaker | None:
+        if self.__config.breaker is None:
+            return None
+        if endpoint not in self.__breakers:
+            self.__breakers[endpoint] = CircuitBreaker(endpoint, self.__config.breaker)
+        return self.__breakers[endpoint]
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        auth: aiohttp.BasicAuth | None = None,
+    ) -> dict[str, Any]:
+        endpoint = f"{method.upper()} {urlsplit(url).path}"
+        breaker = self.breaker(endpoint)
+        retry = self.__config.retry
+        max_attempts = retry.max_attempts if retry is not None else 1
+
+        async def send() -> dict[str, Any]:
+            return await self.__transport.request(method, url, params=params, json=json, headers=headers, auth=auth)
+
+        attempt = 1
+        while True:
+            trial = breaker.before_request() if breaker is not None else False
+            try:
+                result = await self.__hedged(endpoint, method, send)
+            except Exception as e:
+                if breaker is not None:
+                    if is_endpoint_failure(e):
+                        breaker.record_failure()
+                    else:
+                        # API errors and other 4xx: the endpoint answered, the request was at fault
+                        breaker.record_success()
+                if retry is None or attempt >= max_attempts or not is_retryable(e, method, retry):
+                    raise
+                delay = self.__backoff(retry, attempt, e)
+                LOGGER.warning(f"{endpoint} failed ({e}), retry {attempt}/{max_attempts - 1} in {delay:.2f}s")
+            else:
+                if breaker is not None:
+                    breaker.record_success()
+                return result
+            finally:
+                # A trial without an outcome, e.g. cancelled, must not leave the circuit half open
+                if trial and breaker is not None:
+                    breaker.release_trial()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def close(self) -> None:
+        await self.__transport.close()
+
+    def __hedge_delay(self, endpoint: str, method: str) -> float | None:
+        hedge = self.__config.hedge
+        if hedge is None or method.lower() != "get" or not endpoint.endswith(hedge.paths):
+            return None
+        if hedge.delay is not None:
+            return hedge.delay
+        latencies = self.__latencies.get(endpoint)
+        if latencies is None or len(latencies) < hedge.min_samples:
+            return None
+        return max(latencies.percentile(hedge.percentile), hedge.min_delay)
+
+    async def __hedged(
+        self, endpoint: str, method: str, send: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """`send()`, duplicated after the hedge delay while no response arrived, the first success wins"""
+        hedge = self.__config.hedge
+        start = time.perf_counter()
+        delay = self.__hedge_delay(endpoint, method)
+        if hedge is None or delay is None:
+            result = await send()
+        else:
+            result = await _first_success(send, delay, hedge.max_hedges)
+        if hedge is not None:
+            if endpoint not in self.__latencies:
+                self.__latencies[endpoint] = LatencyWindow(hedge.window)
+            self.__latencies[endpoint].add(time.perf_counter() - start)
+        return result
+
+    @staticmethod
+    def __backoff(retry: RetryConfig, attempt: int, error: Exception) -> float:
+        if isinstance(error, BebopRateLimitError) and error.retry_after is not None:
+            return min(error.retry_after, retry.max_backoff)
+        delay = min(retry.backoff * 2.0 ** (attempt - 1), retry.max_backoff)
+        return delay * (1 + random.uniform(0, retry.jitter))  # noqa: S311
+
+
+async def _first_success(
+    send: Callable[[], Awaitable[dict[str, Any]]], delay: float, max_hedges: int
+) -> dict[str, Any]:
+    """Start `send()`, then up to `max_hedges` duplicates `delay` seconds apart, return the first successful result"""
+    tasks: set[asyncio.Task[dict[str, Any]]] = {asyncio.ensure_future(send())}
+    hedges = 0
+    error: BaseException | None = None
+    try:
+        while tasks:
+            timeout = delay if hedges < max_hedges else None
+            done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                hedges += 1
+                tasks.add(asyncio.ensure_future(send()))
+                continue
+            for task in done:
+                tasks.discard(task)
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        assert error is not None
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+
+import aiohttp
+
+
+@dataclass(frozen=True)
+class SessionConfig:
+    """Connection pool settings for the HTTP session shared by a client"""
+
+    limit: int = 100
+    limit_per_host: int = 32
+    keepalive_timeout: float = 30.0
+    ttl_dns_cache: int | None = 300
+    total_timeout: float | None = 10.0
+    connect_timeout: float | None = 3.0
+    enable_cleanup_closed: bool = True
+
+
+def create_session(
+    config: SessionConfig | None = None,
+    headers: dict[str, str] | None = None,
+    auth: aiohttp.BasicAuth | None = None,
+    trace_configs: list[aiohttp.TraceConfig] | None = None,
+) -> aiohttp.ClientSession:
+    config = config or SessionConfig()
+    connector = aiohttp.TCPConnector(
+        limit=config.limit,
+        limit_per_host=config.limit_per_host,
+        keepalive_timeout=config.keepalive_timeout,
+        use_dns_cache=config.ttl_dns_cache is not None,
+        ttl_dns_cache=config.ttl_dns_cache,
+        enable_cleanup_closed=config.enable_cleanup_closed,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers=headers,
+        auth=auth,
+        timeout=aiohttp.ClientTimeout(total=config.total_timeout, connect=config.connect_timeout),
+        trace_configs=trace_configs,
+    )
+
+
+class SessionManager:
+    """Lazily creates one long-lived `aiohttp.ClientSession` and keeps it alive until `close()`.
+
+    The session is created on first use so that clients can be instantiated outside a running event loop.
+    A session passed in by the caller is used as is and never closed by the manager.
+    """
+
+    def __init__(
+        self,
+        config: SessionConfig | None = None,
+        session: aiohttp.ClientSession | None = None,
+        trace_configs: list[aiohttp.TraceConfig] | None = None,
+    ) -> None:
+        self.__config = config or SessionConfig()
+        self.__session = session
+        self.__trace_configs = trace_configs
+        self.__owns_session = session is None
+        self.__lock = asyncio.Lock()
+
+    @property
+    def closed(self) -> bool:
+        return self.__session is None or self.__session.closed
+
+    async def get(self) -> aiohttp.ClientSession:
+        if self.__session is not None and not self.__session.closed:
+            return self.__session
+        async with self.__lock:
+            if self.__session is None or self.__session.closed:
+                if not self.__owns_session:
+                    raise RuntimeError("The injected aiohttp session has been closed")
+                self.__session = create_session(self.__config, trace_configs=self.__trace_configs)
+            return self.__session
+
+    async def close(self) -> None:
+        if self.__owns_session and self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+        self.__session = None if self.__owns_session else self.__session
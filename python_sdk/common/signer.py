@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import multiprocessing
+import os
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from types import TracebackType
+from typing import Any, Protocol
+
+from eth_account import Account
+from eth_account.messages import SignableMessage
+from eth_account.signers.local import LocalAccount
+from eth_typing import ChecksumAddress
+from hexbytes import HexBytes
+from web3.types import TxParams
+
+
+class Signer(Protocol):
+    """Signs EIP-712 orders and self-execution transactions for a single address.
+
+    Both methods take a batch so that remote or HSM backed signers can sign many quotes per round trip.
+    """
+
+    @property
+    def address(self) -> ChecksumAddress: ...
+
+    async def sign_messages(self, messages: Sequence[SignableMessage]) -> list[str]: ...
+
+    async def sign_transactions(self, transactions: Sequence[TxParams]) -> list[HexBytes]: ...
+
+    async def close(self) -> None: ...
+
+
+class LocalSigner:
+    """Signs on the event loop thread with a `LocalAccount`, the default behaviour of the clients"""
+
+    def __init__(self, account: LocalAccount) -> None:
+        self.__account = account
+        self.__address = ChecksumAddress(account.address)
+
+    @property
+    def address(self) -> ChecksumAddress:
+        return self.__address
+
+    async def sign_messages(self, messages: Sequence[SignableMessage]) -> list[str]:
+        return [self.__account.sign_message(message).signature.hex() for message in messages]
+
+    async def sign_transactions(self, transactions: Sequence[TxParams]) -> list[HexBytes]:
+        return [self.__account.sign_transaction(transaction).rawTransaction for transaction in transactions]
+
+    async def close(self) -> None:
+        pass
+
+
+# --------------------------------- Pool Workers --------------------------------- #
+# The account lives in the worker (thread local, so several thread pools can hold different keys), it is created
+# once by the pool initializer and the private key never travels with the signing calls
+_WORKER = threading.local()
+
+
+def _init_worker(private_key: str) -> None:
+    _WORKER.account = Account.from_key(private_key)
+
+
+def _sign_messages(messages: list[SignableMessage]) -> list[str]:
+    account: LocalAccount = _WORKER.account
+    return [account.sign_message(message).signature.hex() for message in messages]
+
+
+def _sign_transactions(transactions: list[TxParams]) -> list[bytes]:
+    account: LocalAccount = _WORKER.account
+    return [bytes(account.sign_transaction(transaction).rawTransaction) for transaction in transactions]
+
+
+@dataclass(frozen=True)
+class SignerPoolConfig:
+    max_workers: int | None = None  # defaults to the number of CPUs
+    # Threads only run in parallel if ECDSA releases the GIL (e.g. with `coincurve` installed), processes always do
+    use_threads: bool = False
+    max_batch_size: int = 64  # messages signed per worker round trip
+    mp_context: str | None = None  # multiprocessing start method of the process pool, platform default if None
+
+
+class PoolSigner:
+    """Offloads signing to a process (or thread) pool so that bursts of orders do not stall the event loop.
+
+    Messages signed concurrently by many coroutines within the same event loop iteration are coalesced and split
+    into one batch per worker. The pool is started on first use and shut down by `close()`.
+    """
+
+    def __init__(self, private_key: str, config: SignerPoolConfig | None = None) -> None:
+        self.__config = config or SignerPoolConfig()
+        self.__private_key = private_key
+        self.__address = ChecksumAddress(Account.from_key(private_key).address)
+        self.__workers = self.__config.max_workers or os.cpu_count() or 1
+        self.__executor: Executor | None = None
+        self.__pending: list[tuple[SignableMessage, asyncio.Future[str]]] = []
+        self.__flush_scheduled = False
+
+    @property
+    def address(self) -> ChecksumAddress:
+        return self.__address
+
+    async def __aenter__(self) -> PoolSigner:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def sign_messages(self, messages: Sequence[SignableMessage]) -> list[str]:
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[str]] = [loop.create_future() for _ in messages]
+        self.__pending.extend(zip(messages, futures, strict=True))
+        if not self.__flush_scheduled:
+            self.__flush_scheduled = True
+            loop.call_soon(self.__flush)
+        return list(await asyncio.gather(*futures))
+
+    async def sign_transactions(self, transactions: Sequence[TxParams]) -> list[HexBytes]:
+        loop = asyncio.get_running_loop()
+        executor = self.__get_executor()
+        batches = await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, _sign_transactions, list(batch))
+                for batch in self.__batches(list(transactions))
+            )
+        )
+        return [HexBytes(raw_tx) for batch in batches for raw_tx in batch]
+
+    async def close(self) -> None:
+        for _, future in self.__pending:
+            future.cancel()
+        self.__pending.clear()
+        if self.__executor is not None:
+            executor, self.__executor = self.__executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    def __get_executor(self) -> Executor:
+        if self.__executor is None:
+            if self.__config.use_threads:
+                self.__executor = ThreadPoolExecutor(
+                    self.__workers, initializer=_init_worker, initargs=(self.__private_key,)
+                )
+            else:
+                context = multiprocessing.get_context(self.__config.mp_context) if self.__config.mp_context else None
+                self.__executor = ProcessPoolExecutor(
+                    self.__workers, mp_context=context, initializer=_init_worker, initargs=(self.__private_key,)
+                )
+        return self.__executor
+
+    def __batches(self, items: list[Any]) -> list[list[Any]]:
+        size = min(self.__config.max_batch_size, max(1, math.ceil(len(items) / self.__workers)))
+        return [items[i : i + size] for i in range(0, len(items), size)]
+
+    def __flush(self) -> None:
+        self.__flush_scheduled = False
+        pending, self.__pending = self.__pending, []
+        pending = [(message, future) for message, future in pending if not future.done()]
+        if not pending:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            executor = self.__get_executor()
+        except Exception as e:
+            for _, future in pending:
+                future.set_exception(e)
+            return
+        for batch in self.__batches(pending):
+            signing = loop.run_in_executor(executor, _sign_messages, [message for message, _ in batch])
+            signing.add_done_callback(partial(_resolve, [future for _, future in batch]))
+
+
+def _resolve(futures: list[asyncio.Future[str]], signing: asyncio.Future[list[str]]) -> None:
+    if signing.cancelled():
+        for future in futures:
+            future.cancel()
+        return
+    error = signing.exception()
+    for i, future in enumerate(futures):
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(signing.result()[i])
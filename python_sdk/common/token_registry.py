@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, replace
+from decimal import Decimal
+from pathlib import Path
+
+from eth_abi.abi import decode
+from eth_typing import ChecksumAddress
+from eth_utils.abi import function_signature_to_4byte_selector
+from web3 import AsyncWeb3
+
+from python_sdk.common.constants import NATIVE_TOKEN
+from python_sdk.common.token_state import TokenStateReader
+from python_sdk.common.types.quote_types import QuoteResponse, ResponseToken
+from python_sdk.common.types.types import Chain
+from python_sdk.common.utils.logger import Logger
+
+LOGGER = Logger(__name__)
+
+DECIMALS_SELECTOR = function_signature_to_4byte_selector("decimals()")
+SYMBOL_SELECTOR = function_signature_to_4byte_selector("symbol()")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tokens (
+    chain_id INTEGER NOT NULL,
+    address TEXT NOT NULL,
+    symbol TEXT,
+    decimals INTEGER,
+    PRIMARY KEY (chain_id, address)
+)
+"""
+
+
+def _decode_decimals(data: bytes | None) -> int | None:
+    if data is None or len(data) < 32:
+        return None
+    return int.from_bytes(data[:32], "big")
+
+
+def _decode_symbol(data: bytes | None) -> str | None:
+    """Decode `symbol()` as a string, or as bytes32 for older tokens such as MKR"""
+    if not data:
+        return None
+    try:
+        (symbol,) = decode(["string"], data)
+        return str(symbol)
+    except Exception:
+        return data[:32].rstrip(b"\x00").decode("utf-8", errors="ignore") or None
+
+
+@dataclass(frozen=True)
+class TokenInfo:
+    chain_id: int
+    address: ChecksumAddress
+    symbol: str | None = None
+    decimals: int | None = None
+
+    @property
+    def complete(self) -> bool:
+        return self.symbol is not None and self.decimals is not None
+
+
+class TokenRegistry:
+    """Token symbols and decimals per chain, indexed by address and by symbol.
+
+    Chains are seeded from `Chain.tokens` on first use, tokens seen in quote responses are learned as they are
+    parsed, and anything still unknown is loaded with a single multicall. With a `path` every token is persisted
+    to a sqlite file, so that a restarted process starts with a warm registry.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.__tokens: dict[int, dict[str, TokenInfo]] = {}
+        self.__symbols: dict[int, dict[str, ChecksumAddress]] = {}
+        self.__seeded: set[int] = set()
+        self.__db: sqlite3.Connection | None = None
+        if path is not None:
+            self.__db = sqlite3.connect(path)
+            self.__db.execute(SCHEMA)
+            for chain_id, address, symbol, decimals in self.__db.execute("SELECT * FROM tokens"):
+                self.__index(TokenInfo(chain_id, AsyncWeb3.to_checksum_address(address), symbol, decimals))
+
+    def close(self) -> None:
+        if self.__db is not None:
+            self.__db.close()
+            self.__db = None
+
+    # ---------------------------------- Lookups --------------------------------- #
+    def get(self, chain_id: int, address: str) -> TokenInfo | None:
+        self.__seed(chain_id)
+        return self.__tokens.get(chain_id, {}).get(address.lower())
+
+    def by_symbol(self, chain_id: int, symbol: str) -> TokenInfo | None:
+        self.__seed(chain_id)
+        address = self.__symbols.get(chain_id, {}).get(symbol.upper())
+        return self.get(chain_id, address) if address else None
+
+    def decimals(self, chain_id: int, address: str) -> int:
+        token = self.get(chain_id, address)
+        if token is None or token.decimals is None:
+            raise ValueError(f"Unknown decimals for {address} on chain {chain_id}")
+        return token.decimals
+
+    def amount_decimal(self, chain_id: int, address: str, amount: int | str) -> Decimal:
+        """Convert a raw token amount to a decimal one without any network call"""
+        return Decimal(int(amount)) / Decimal(10 ** self.decimals(chain_id, address))
+
+    def amount_raw(self, chain_id: int, address: str, amount: Decimal | float | str) -> int:
+        """Convert a decimal token amount to the raw integer amount"""
+        return int(Decimal(str(amount)) * Decimal(10 ** self.decimals(chain_id, address)))
+
+    # --------------------------------- Learning --------------------------------- #
+    def add(self, chain_id: int, address: str, symbol: str | None = None, decimals: int | None = None) -> TokenInfo:
+        """Add or complete a token, values already known are kept unless new ones are given"""
+        self.__seed(chain_id)
+        known = self.__tokens.get(chain_id, {}).get(address.lower())
+        if known is None:
+            token = TokenInfo(chain_id, AsyncWeb3.to_checksum_address(address), symbol, decimals)
+        else:
+            token = replace(
+                known,
+                symbol=symbol if symbol is not None else known.symbol,
+                decimals=decimals if decimals is not None else known.decimals,
+            )
+            if token == known:
+                return known
+        self.__index(token)
+        self.__persist([token])
+        return token
+
+    def learn(self, quote: QuoteResponse) -> None:
+        """Record the symbol and decimals of every token in a quote response"""
+        tokens: Iterable[tuple[str, ResponseToken]] = [*quote.sellTokens.items(), *quote.buyTokens.items()]
+        for address, token in tokens:
+            self.add(quote.chainId, address, symbol=token.symbol, decimals=token.decimals)
+
+    async def load(self, reader: TokenStateReader, addresses: Sequence[str]) -> list[TokenInfo]:
+        """Return the info of `addresses`, reading symbols and decimals still missing with one multicall"""
+        chain_id = reader.chain.id
+        missing = [
+            AsyncWeb3.to_checksum_address(address)
+            for address in dict.fromkeys(addresses)
+            if not (token := self.get(chain_id, address)) or not token.complete
+        ]
+        if missing:
+            results = await reader.aggregate(
+                [(address, selector) for address in missing for selector in (DECIMALS_SELECTOR, SYMBOL_SELECTOR)]
+            )
+            for i, address in enumerate(missing):
+                decimals, symbol = _decode_decimals(results[2 * i]), _decode_symbol(results[2 * i + 1])
+                if decimals is None:
+                    LOGGER.warning(f"Failed to read decimals of {address} on {reader.chain.display_name}")
+                known = self.get(chain_id, address)
+                # Seeded and learned symbols are the ones the API uses, keep them over the on-chain ones
+                self.add(chain_id, address, symbol=known.symbol if known else symbol, decimals=decimals)
+        return [
+            self.get(chain_id, address) or TokenInfo(chain_id, AsyncWeb3.to_checksum_address(address))
+            for address in addresses
+        ]
+
+    # --------------------------------- Internals -------------------------------- #
+    def __seed(self, chain_id: int) -> None:
+        if chain_id in self.__seeded:
+            return
+        self.__seeded.add(chain_id)
+        try:
+            chain = Chain(chain_id)
+        except ValueError:
+            return
+        native = self.__tokens.get(chain_id, {}).get(NATIVE_TOKEN.lower())
+        if native is None:
+            self.__index(TokenInfo(chain_id, AsyncWeb3.to_checksum_address(NATIVE_TOKEN), chain.native_symbol, 18))
+        for symbol, address in chain.tokens.items():
+            if address.lower() not in self.__tokens.get(chain_id, {}):
+                self.__index(TokenInfo(chain_id, AsyncWeb3.to_checksum_address(address), symbol))
+            self.__symbols.setdefault(chain_id, {})[symbol.upper()] = AsyncWeb3.to_checksum_address(address)
+
+    def __index(self, token: TokenInfo) -> None:
+        self.__tokens.setdefault(token.chain_id, {})[token.address.lower()] = token
+        if token.symbol:
+            self.__symbols.setdefault(token.chain_id, {}).setdefault(token.symbol.upper(), token.address)
+
+    def __persist(self, tokens: Sequence[TokenInfo]) -> None:
+        if self.__db is None:
+            return
+        with self.__db:
+            self.__db.executemany(
+                "INSERT OR REPLACE INTO tokens (chain_id, address, symbol, decimals) VALUES (?, ?, ?, ?)",
+                [(token.chain_id, token.address, token.symbol, token.decimals) for token in tokens],
+            )
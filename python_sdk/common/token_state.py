@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from eth_abi.abi import encode
+from eth_typing import ChecksumAddress
+from eth_utils.abi import function_signature_to_4byte_selector
+from web3 import AsyncWeb3
+from web3.types import BlockIdentifier
+
+from python_sdk.common import constants
+from python_sdk.common.constants import NATIVE_TOKEN
+from python_sdk.common.types.types import Chain
+from python_sdk.common.utils.logger import Logger
+from python_sdk.jam.constants import JAM_BALANCE_MANAGER
+from python_sdk.pmm.constants import PMM_SETTLEMENT_ADDRESS
+
+LOGGER = Logger(__name__)
+
+MAX_UINT256 = 2**256 - 1
+
+BALANCE_OF_SELECTOR = function_signature_to_4byte_selector("balanceOf(address)")
+ALLOWANCE_SELECTOR = function_signature_to_4byte_selector("allowance(address,address)")
+GET_ETH_BALANCE_SELECTOR = function_signature_to_4byte_selector("getEthBalance(address)")
+
+Call = tuple[ChecksumAddress, bytes]
+
+
+def _decode_uint(data: bytes | None) -> int | None:
+    if data is None or len(data) < 32:
+        return None
+    return int.from_bytes(data[:32], "big")
+
+
+@dataclass(frozen=True)
+class TokenState:
+    """Balance and allowances of `owner` for `token`, `None` where the call failed"""
+
+    token: ChecksumAddress
+    owner: ChecksumAddress
+    balance: int | None
+    allowances: dict[ChecksumAddress, int | None]
+
+    def allowance(self, spender: str) -> int | None:
+        return self.allowances.get(AsyncWeb3.to_checksum_address(spender))
+
+    def is_approved(self, spender: str, amount: int) -> bool:
+        allowance = self.allowance(spender)
+        return allowance is not None and allowance >= amount
+
+
+class TokenStateReader:
+    """Reads balances and allowances of N tokens x M accounts through Multicall3 `aggregate3`.
+
+    Every (token, account) pair costs one `balanceOf` plus one `allowance` call per spender, all packed in a single
+    `eth_call` unless the total exceeds `max_calls`. Native token balances are read with the multicall contract's
+    own `getEthBalance`, and need no allowance.
+    """
+
+    def __init__(
+        self,
+        chain: Chain,
+        web3: AsyncWeb3,
+        spenders: Sequence[str] | None = None,
+        max_calls: int = 1000,
+    ) -> None:
+        self.__chain = chain
+        self.__web3 = web3
+        self.__spenders = [AsyncWeb3.to_checksum_address(spender) for spender in spenders or default_spenders(chain)]
+        self.__max_calls = max_calls
+        self.__multicall = web3.eth.contract(
+            address=AsyncWeb3.to_checksum_address(chain.multicall_address), abi=constants.MULTICALL3_ABI
+        )
+
+    @property
+    def chain(self) -> Chain:
+        return self.__chain
+
+    @property
+    def spenders(self) -> list[ChecksumAddress]:
+        return list(self.__spenders)
+
+    async def aggregate(
+        self, calls: Sequence[Call], block_identifier: BlockIdentifier = "latest"
+    ) -> list[bytes | None]:
+        """Execute `(target, calldata)` calls, returning the raw return data or `None` for each failed call"""
+        chunks = [
+            [(target, True, calldata) for target, calldata in calls[start : start + self.__max_calls]]
+            for start in range(0, len(calls), self.__max_calls)
+        ]
+        responses: list[list[Any]] = await asyncio.gather(
+            *(self.__multicall.functions.aggregate3(chunk).call(block_identifier=block_identifier) for chunk in chunks)
+        )
+        return [bytes(data) if success else None for response in responses for success, data in response]
+
+    async def read(
+        self,
+        tokens: Sequence[str],
+        accounts: Sequence[str],
+        block_identifier: BlockIdentifier = "latest",
+    ) -> dict[tuple[ChecksumAddress, ChecksumAddress], TokenState]:
+        """Read the state of every (token, account) pair, keyed by their checksum addresses"""
+        token_addresses = [AsyncWeb3.to_checksum_address(token) for token in tokens]
+        owners = [AsyncWeb3.to_checksum_address(account) for account in accounts]
+        multicall_address = self.__multicall.address
+
+        calls: list[Call] = []
+        for token in token_addresses:
+            native = token == NATIVE_TOKEN
+            for owner in owners:
+                encoded_owner = encode(["address"], [owner])
+                if native:
+                    calls.append((multicall_address, GET_ETH_BALANCE_SELECTOR + encoded_owner))
+                    continue
+                calls.append((token, BALANCE_OF_SELECTOR + encoded_owner))
+                calls.extend(
+                    (token, ALLOWANCE_SELECTOR + encode(["address", "address"], [owner, spender]))
+                    for spender in self.__spenders
+                )
+
+        results = iter(await self.aggregate(calls, block_identifier=block_identifier))
+        states: dict[tuple[ChecksumAddress, ChecksumAddress], TokenState] = {}
+        for token in token_addresses:
+            native = token == NATIVE_TOKEN
+            for owner in owners:
+                balance = _decode_uint(next(results))
+                if native:
+                    allowances: dict[ChecksumAddress, int | None] = dict.fromkeys(self.__spenders, MAX_UINT256)
+                else:
+                    allowances = {spender: _decode_uint(next(results)) for spender in self.__spenders}
+                if balance is None:
+                    LOGGER.warning(f"Failed to read balance of {token} for {owner} on {self.__chain.display_name}")
+                states[(token, owner)] = TokenState(token=token, owner=owner, balance=balance, allowances=allowances)
+        return states
+
+
+def default_spenders(chain: Chain) -> list[ChecksumAddress]:
+    """The contracts that pull tokens for gasless orders: PMM settlement and the JAM balance manager"""
+    return [PMM_SETTLEMENT_ADDRESS, JAM_BALANCE_MANAGER[chain.id]]
+
+
+async def missing_approvals(
+    reader: TokenStateReader,
+    owner: str,
+    spender: str,
+    tokens: Sequence[str],
+    amounts: Sequence[int] | None = None,
+) -> list[str]:
+    """Tokens of `owner` whose allowance to `spender` is below the given amount (or zero, without amounts)"""
+    if AsyncWeb3.to_checksum_address(spender) not in reader.spenders:
+        raise ValueError(f"{spender=} is not read by this TokenStateReader")
+    states = await reader.read(tokens, [owner])
+    owner = AsyncWeb3.to_checksum_address(owner)
+    return [
+        token
+        for token, amount in zip(tokens, amounts or [1] * len(tokens), strict=True)
+        if not states[(AsyncWeb3.to_checksum_address(token), owner)].is_approved(spender, amount)
+    ]
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from typing import Any, Protocol
+from urllib.parse import urlsplit, urlunsplit
+
+import aiohttp
+import orjson
+
+from python_sdk.common.constants import ERROR_KEY
+from python_sdk.common.exceptions import (
+    BebopAPIError,
+    BebopConnectionError,
+    BebopTimeoutError,
+    BebopTransportError,
+    http_error,
+)
+from python_sdk.common.metrics import Metrics, Phase, timed
+from python_sdk.common.session import SessionConfig, SessionManager
+
+
+class Transport(Protocol):
+    """Sends requests to the Bebop API and returns the decoded JSON body"""
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        auth: aiohttp.BasicAuth | None = None,
+    ) -> dict[str, Any]: ...
+
+    async def close(self) -> None: ...
+
+
+async def request_json(
+    session: aiohttp.ClientSession,
+    url: str,
+    method: str,
+    params: dict[str, Any] | None = None,
+    json: dict[str, Any] | None = None,
+    headers: dict[str, Any] | None = None,
+    auth: aiohttp.BasicAuth | None = None,
+    metrics: Metrics | None = None,
+) -> dict[str, Any]:
+    """Send a request and decode its JSON body, failures are raised as typed `BebopError`s"""
+    try:
+        if method.lower() == "get":
+            async with session.get(url, params=params, headers=headers, auth=auth) as response:
+                if not response.ok:
+                    raise http_error(response.status, response.reason, method, response.headers)
+                body = await response.read()
+        else:
+            async with session.post(url, json=json, headers=headers, auth=auth) as response:
+                if not response.ok:
+                    raise http_error(response.status, response.reason, method, response.headers)
+                body = await response.read()
+    except (aiohttp.ClientConnectorError, aiohttp.ConnectionTimeoutError) as e:
+        raise BebopConnectionError(f"Failed to connect to {url}: {e}") from e
+    except TimeoutError as e:
+        raise BebopTimeoutError(f"Timed out waiting for {url}") from e
+    except aiohttp.ClientError as e:
+        raise BebopTransportError(f"Failed to send {method.upper()} request to {url}: {e!r}") from e
+    with timed(metrics, Phase.DECODE):
+        result: dict[str, Any] = orjson.loads(body)
+    if ERROR_KEY in result:
+        raise BebopAPIError(result[ERROR_KEY])
+    return result
+
+
+class AioHttpTransport:
+    """`Transport` over a pooled `aiohttp.ClientSession`.
+
+    `base_url` replaces the scheme and host of every request, e.g. to point a client at a local mock server.
+    With `metrics`, the network phases of each request and the JSON decoding are recorded; the DNS, connect, send
+    and time-to-first-byte phases are only available on sessions created by the transport.
+    """
+
+    def __init__(
+        self,
+        config: SessionConfig | None = None,
+        session: aiohttp.ClientSession | None = None,
+        base_url: str | None = None,
+        metrics: Metrics | None = None,
+    ) -> None:
+        trace_configs = [metrics.trace_config()] if metrics else None
+        self.__session = SessionManager(config=config, session=session, trace_configs=trace_configs)
+        self.__base_url = urlsplit(base_url) if base_url else None
+        self.__metrics = metrics
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        auth: aiohttp.BasicAuth | None = None,
+    ) -> dict[str, Any]:
+        if self.__base_url is not None:
+            parts = urlsplit(url)
+            url = urlunsplit(parts._replace(scheme=self.__base_url.scheme, netloc=self.__base_url.netloc))
+        return await request_json(
+            await self.__session.get(),
+            url=url,
+            method=method,
+            params=params,
+            json=json,
+            headers=headers,
+            auth=auth,
+            metrics=self.__metrics,
+        )
+
+    async def close(self) -> None:
+        await self.__session.close()
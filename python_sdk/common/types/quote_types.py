@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
-from eth_account.datastructures import SignedTransaction
-from eth_account.signers.local import LocalAccount
-from eth_typing import HexAddress, HexStr
-from hexbytes import HexBytes
+from eth_typing import ChecksumAddress, HexAddress, HexStr
 from pydantic import BaseModel, Field, model_validator
 from typing_extensions import TypedDict
-from web3 import AsyncWeb3
-from web3.types import Nonce
 
 from python_sdk.common.types.types import ApprovalType
 
+if TYPE_CHECKING:
+    # web3 and eth_account are only needed to sign, importing them takes longer than the rest of the SDK
+    from eth_account.datastructures import SignedTransaction
+    from eth_account.signers.local import LocalAccount
+    from hexbytes import HexBytes
+    from web3 import AsyncWeb3
+    from web3.types import TxParams
+
+    from python_sdk.common.gas_oracle import GasOracle
+    from python_sdk.common.signer import Signer
+
 
 # ---------------------------------------------------------------------------- #
 #                                 Request Types                                #
@@ -116,7 +123,10 @@ TxData = TypedDict(
         "data": HexStr,
         "gas": int | None,
         "gasPrice": int | None,
-        "nonce": Nonce | None,
+        "maxFeePerGas": int | None,
+        "maxPriorityFeePerGas": int | None,
+        "chainId": int | None,
+        "nonce": int | None,
     },
     total=False,
 )
@@ -158,13 +168,57 @@ class QuoteResponse(BaseModel):
             if buy_token.priceUsd
         )
 
-    async def sign_transaction(self, web3: AsyncWeb3, account: LocalAccount) -> HexBytes:
+    async def sign_transaction(
+        self,
+        web3: AsyncWeb3,
+        account: LocalAccount | Signer,
+        nonce: int | None = None,
+        gas_oracle: GasOracle | None = None,
+    ) -> HexBytes:
         """Sign transaction for self execution"""
+        from eth_account.signers.local import LocalAccount
+
+        tx = await self.prepare_transaction(web3, account.address, nonce=nonce, gas_oracle=gas_oracle)
+        if isinstance(account, LocalAccount):
+            signed_tx: SignedTransaction = account.sign_transaction(tx)
+            return signed_tx.rawTransaction
+        (raw_tx,) = await account.sign_transactions([tx])
+        return raw_tx
+
+    async def prepare_transaction(
+        self, web3: AsyncWeb3, address: ChecksumAddress, nonce: int | None = None, gas_oracle: GasOracle | None = None
+    ) -> TxParams:
+        """Fill in the nonce and gas fields of `tx` for self execution, ready to be signed"""
         if not self.tx:
             raise ValueError("No tx data found, ensure `gasless`=`False` when requesting quote.")
-        self.tx["nonce"] = await web3.eth.get_transaction_count(account.address)
-        self.tx["gasPrice"] = int((await web3.eth.gas_price) * 1.5)
+        self.tx["nonce"] = nonce if nonce is not None else await web3.eth.get_transaction_count(address)
         assert self.tx["gas"]
-        self.tx["gas"] = int(self.tx["gas"] * 4)
-        signed_tx: SignedTransaction = account.sign_transaction(self.tx)
-        return signed_tx.rawTransaction
+        if gas_oracle is None:
+            self.tx["gasPrice"] = int((await web3.eth.gas_price) * 1.5)
+            self.tx["gas"] = int(self.tx["gas"] * 4)
+        else:
+            fees = await gas_oracle.fees()
+            for key in ("gasPrice", "maxFeePerGas", "maxPriorityFeePerGas"):
+                self.tx.pop(key, None)  # type: ignore[misc]
+            self.tx.update(fees.tx_params())  # type: ignore[typeddict-item]
+            self.tx["chainId"] = self.chainId
+            self.tx["gas"] = gas_oracle.gas_limit(self.tx["gas"])
+        return cast("TxParams", self.tx)
+
+
+QuoteRequestT = TypeVar("QuoteRequestT", bound=QuoteRequest)
+QuoteResponseT = TypeVar("QuoteResponseT", bound=QuoteResponse)
+
+
+@dataclass(frozen=True)
+class QuoteResult(Generic[QuoteRequestT, QuoteResponseT]):
+    """Outcome of one request in a quote batch, `index` is the position of `request` in the batch"""
+
+    index: int
+    request: QuoteRequestT
+    quote: QuoteResponseT | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.quote is not None
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from enum import Enum, IntEnum
 from typing import Any
 
@@ -32,6 +32,7 @@ class ChainInfo:
     explorer: str
     tokens: dict[str, str]
     public_rpc: str
+    block_time: float = 2.0  # average block time in seconds
     permit2_address: str = "0x000000000022D473030F116dDEE9F6B43aC78BA3"
     multicall_address: str = "0xcA11bde05977b3631167028862bE2a173976CA11"
     arbitrum_like: bool = False
@@ -48,6 +49,7 @@ class Chain(IntEnum):
             wrapped_symbol="WETH",
             explorer="https://etherscan.io",
             public_rpc="https://eth.drpc.org",
+            block_time=12.0,
             tokens={
                 "1INCH": "0x111111111117dC0aa78b770fA6A738034120C302",
                 "AAVE": "0x7Fc66500c84A76Ad7e9c93437bFc5Ac33E2DDaE9",
@@ -92,6 +94,7 @@ class Chain(IntEnum):
             wrapped_symbol="WMATIC",
             explorer="https://polygonscan.com",
             public_rpc="https://polygon.drpc.org",
+            block_time=2.0,
             tokens={
                 "AAVE": "0xD6DF932A45C0f255f85145f286eA0b292B21C90B",
                 "BAL": "0x9a71012B13CA4d3D0Cdc72A177DF3ef03b0E76A3",
@@ -116,6 +119,7 @@ class Chain(IntEnum):
             arbitrum_like=True,
             explorer="https://arbiscan.io",
             public_rpc="https://arbitrum.drpc.org",
+            block_time=0.25,
             tokens={
                 "RDNT": "0x3082CC23568eA640225c2467653dB90e9250AaA0",
                 "WETH": "0x82aF49447D8a07e3bd95BD0d56f35241523fBab1",
@@ -140,6 +144,7 @@ class Chain(IntEnum):
             wrapped_symbol="WBNB",
             explorer="https://bscscan.com",
             public_rpc="https://bsc.drpc.org",
+            block_time=0.75,
             tokens={},
         ),
     )
@@ -155,6 +160,7 @@ class Chain(IntEnum):
             multicall_address="0xF9cda624FBC7e059355ce98a31693d299FACd963",
             explorer="https://era.zksync.network",
             public_rpc="https://zksync.drpc.org",
+            block_time=1.0,
             tokens={},
         ),
     )
@@ -170,6 +176,7 @@ class Chain(IntEnum):
             optimism_like=True,
             explorer="https://optimistic.etherscan.io",
             public_rpc="https://mainnet.optimism.io",
+            block_time=2.0,
             tokens={
                 "WETH": "0x4200000000000000000000000000000000000006",
                 "USDC": "0x0b2C639c533813f4Aa9D7837CAf62653d097Ff85",
@@ -191,6 +198,7 @@ class Chain(IntEnum):
             optimism_like=True,
             explorer="https://blastscan.io",
             public_rpc="https://blast.drpc.org/",
+            block_time=2.0,
             tokens={},
         ),
     )
@@ -206,6 +214,7 @@ class Chain(IntEnum):
             optimism_like=True,
             explorer="https://basescan.org",
             public_rpc="https://base.drpc.org",
+            block_time=2.0,
             tokens={},
         ),
     )
@@ -221,6 +230,7 @@ class Chain(IntEnum):
             optimism_like=True,
             explorer="https://explorer.mode.network",
             public_rpc="https://mode.drpc.org/",
+            block_time=2.0,
             tokens={},
         ),
     )
@@ -236,6 +246,7 @@ class Chain(IntEnum):
             optimism_like=True,
             explorer="https://scrollscan.com",
             public_rpc="https://scroll.drpc.org",
+            block_time=3.0,
             tokens={},
         ),
     )
@@ -251,6 +262,7 @@ class Chain(IntEnum):
             optimism_like=False,
             explorer="https://taikoscan.io",
             public_rpc="https://rpc.mainnet.taiko.xyz",
+            block_time=12.0,
             tokens={},
         ),
     )
@@ -270,13 +282,14 @@ class Chain(IntEnum):
         self.tokens: dict[str, str]
         self.emoji: str
         self.public_rpc: str
+        self.block_time: float
 
     def __new__(cls, value: int, info: ChainInfo) -> Chain:
         obj = int.__new__(cls, value)
         obj._value_ = value
         obj.id = value
-        for kev, value in asdict(info).items():
-            setattr(obj, kev, value)
+        # `vars` instead of `asdict`, which deep copies every field of every chain at import time
+        obj.__dict__.update(vars(info))
         return obj
 
     @property
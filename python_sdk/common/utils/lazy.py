@@ -0,0 +1,31 @@
+import importlib
+import sys
+from collections.abc import Callable, Iterable
+from typing import Any
+
+
+def lazy_attributes(module_name: str, source: str, names: Iterable[str]) -> Callable[[str], Any]:
+    """Build a PEP 562 module `__getattr__` importing `names` from the `source` module on first access.
+
+    The value is then stored on the module itself, so the lookup only goes through `__getattr__` once.
+    """
+    lazy_names = frozenset(names)
+
+    def __getattr__(name: str) -> Any:
+        if name not in lazy_names:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(source), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
+
+
+def import_optional(module: str, package: str, feature: str, extra: str | None = None) -> Any:
+    """Import an optional dependency, raising an `ImportError` that names the package, or the `python-sdk` extra
+    that installs it, if it is missing"""
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        install = f"pip install 'python-sdk[{extra}]'" if extra else f"pip install {package}"
+        raise ImportError(f"{feature} requires the optional `{package}` package, install it with `{install}`") from e
@@ -5,15 +5,27 @@ from typing import Any
 from eth_account.datastructures import SignedTransaction
 from eth_account.signers.local import LocalAccount
 from hexbytes import HexBytes
-from web3 import AsyncWeb3
-from web3.types import TxParams, Wei
+from web3 import AsyncHTTPProvider, AsyncWeb3
+from web3.exceptions import TimeExhausted
+from web3.middleware.geth_poa import async_geth_poa_middleware
+from web3.types import Nonce, TxParams, Wei
 
-from python_sdk.common.constants import ERC20_ABI
+from python_sdk.common import constants
+from python_sdk.common.gas_oracle import GasOracle
+from python_sdk.common.nonce_manager import NonceManager
+from python_sdk.common.types.types import Chain
 from python_sdk.common.utils.logger import Logger
 
 LOGGER = Logger(__name__)
 
 
+def create_web3(chain: Chain, rpc_url: str | None = None, timeout: float = 6) -> AsyncWeb3:
+    """HTTP provider for `chain`, falling back to its public RPC, with the POA middleware the clients rely on"""
+    web3 = AsyncWeb3(AsyncHTTPProvider(rpc_url if rpc_url else chain.public_rpc, request_kwargs={"timeout": timeout}))
+    web3.middleware_onion.inject(async_geth_poa_middleware, "poa", layer=0)
+    return web3
+
+
 async def gather_with_concurrency(n: int, *tasks: Coroutine) -> list[Any]:
     semaphore = asyncio.Semaphore(n)
 
@@ -25,30 +37,60 @@ async def gather_with_concurrency(n: int, *tasks: Coroutine) -> list[Any]:
 
 
 async def approve_token(
-    web3: AsyncWeb3, account: LocalAccount, token_address: str, amount: int, spender: str
+    web3: AsyncWeb3,
+    account: LocalAccount,
+    token_address: str,
+    amount: int,
+    spender: str,
+    nonce_manager: NonceManager | None = None,
+    gas_oracle: GasOracle | None = None,
 ) -> HexBytes:
-    token_contract = web3.eth.contract(AsyncWeb3.to_checksum_address(token_address), abi=ERC20_ABI)
+    token_contract = web3.eth.contract(AsyncWeb3.to_checksum_address(token_address), abi=constants.ERC20_ABI)
     input_data = token_contract.encodeABI(fn_name="approve", args=[spender, amount])
-    nonce = await web3.eth.get_transaction_count(account.address)
+    chain_id = await web3.eth.chain_id
     data = TxParams(
         **{
             "from": account.address,
-            "chainId": await web3.eth.chain_id,
-            "nonce": nonce,
-            "gasPrice": Wei(int(await web3.eth.gas_price * 1.5)),
+            "chainId": chain_id,
             "data": input_data,
             "value": Wei(0),
             "to": token_address,
         }
     )
+    if gas_oracle is None:
+        data["gasPrice"] = Wei(int(await web3.eth.gas_price * 1.5))
+    else:
+        data.update(await gas_oracle.tx_params())  # type: ignore[typeddict-item]
     gas_estimate = await web3.eth.estimate_gas(data)
     data["gas"] = gas_estimate
-    signed_tx: SignedTransaction = web3.eth.account.sign_transaction(transaction_dict=data, private_key=account.key)
-    result = await web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-    await web3.eth.wait_for_transaction_receipt(result)
+    if nonce_manager is None:
+        data["nonce"] = await web3.eth.get_transaction_count(account.address)
+        signed_tx: SignedTransaction = web3.eth.account.sign_transaction(transaction_dict=data, private_key=account.key)
+        result = await web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+    else:
+        async with nonce_manager.reserve(web3, chain_id, account.address) as reservation:
+            data["nonce"] = Nonce(reservation.nonce)
+            signed_tx = web3.eth.account.sign_transaction(transaction_dict=data, private_key=account.key)
+            reservation.sent = True
+            result = await web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+    try:
+        await web3.eth.wait_for_transaction_receipt(result)
+    except TimeExhausted:
+        if nonce_manager is not None:
+            await nonce_manager.check(web3, chain_id, account.address)
+        raise
     LOGGER.info(f"Approved {amount=} for {token_address=} on {spender=}")
     return result
 
 
-async def revoke_token(web3: AsyncWeb3, account: LocalAccount, token_address: str, spender: str) -> HexBytes:
-    return await approve_token(web3, account, token_address, 0, spender)
+async def revoke_token(
+    web3: AsyncWeb3,
+    account: LocalAccount,
+    token_address: str,
+    spender: str,
+    nonce_manager: NonceManager | None = None,
+    gas_oracle: GasOracle | None = None,
+) -> HexBytes:
+    return await approve_token(
+        web3, account, token_address, 0, spender, nonce_manager=nonce_manager, gas_oracle=gas_oracle
+    )
@@ -34,11 +34,15 @@ class JamOrderSchema(EIP712TypeSchema):
         EIP712Type(name="hooksHash", type="bytes32"),
     ]
 
+    @classmethod
+    def domain(cls, chain_id: int) -> JamDomain:
+        return JamDomain(chainId=chain_id, verifyingContract=JAM_SETTLEMENT_CONTRACT[chain_id])
+
     @classmethod
     def structured_message(cls, chain_id: int, message: JamOrder) -> StructuredEIP712Message:
         return StructuredEIP712Message(
             primaryType=cls.name,
-            domain=JamDomain(chainId=chain_id, verifyingContract=JAM_SETTLEMENT_CONTRACT[chain_id]),
+            domain=cls.domain(chain_id),
             types={
                 EIP712DomainSeparatorSchema.name: EIP712DomainSeparatorSchema.types,
                 cls.name: cls.types,
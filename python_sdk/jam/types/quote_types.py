@@ -1,13 +1,16 @@
-from dataclasses import asdict
+from __future__ import annotations
 
-from eth_account.datastructures import SignedMessage
-from eth_account.messages import SignableMessage, encode_typed_data
-from eth_account.signers.local import LocalAccount
+from typing import TYPE_CHECKING
 
 import python_sdk.common.types.quote_types as common_types
 from python_sdk.jam.types.eip712_types import JamOrderSchema
 from python_sdk.jam.types.types import JamOrderToSign
 
+if TYPE_CHECKING:
+    from eth_account.datastructures import SignedMessage
+    from eth_account.messages import SignableMessage
+    from eth_account.signers.local import LocalAccount
+
 
 class QuoteRequest(common_types.QuoteRequest):
     include_solvers: str | None = None
@@ -20,9 +23,11 @@ class QuoteResponse(common_types.QuoteResponse):
     toSign: JamOrderToSign
     solver: str
 
+    def signable_message(self) -> SignableMessage:
+        """EIP-712 message signed for gasless execution"""
+        return JamOrderSchema.encode_typed_data(chain_id=self.chainId, message=self.toSign.signable_message)
+
     def sign_order(self, account: LocalAccount) -> str:
         """Sign order for gasless execution"""
-        structured_msg = JamOrderSchema.structured_message(chain_id=self.chainId, message=self.toSign.signable_message)
-        signable_msg: SignableMessage = encode_typed_data(full_message=asdict(structured_msg))
-        signed_msg: SignedMessage = account.sign_message(signable_msg)
+        signed_msg: SignedMessage = account.sign_message(self.signable_message())
         return signed_msg.signature.hex()
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import time
+import uuid
+from typing import Any
+
+from python_sdk.common.constants import NATIVE_TOKEN
+from python_sdk.common.types.types import Chain
+from python_sdk.jam.constants import JAM_BALANCE_MANAGER, JAM_SETTLEMENT_CONTRACT
+from python_sdk.pmm.constants import PMM_SETTLEMENT_ADDRESS
+
+CHAIN = Chain.arbitrum
+TAKER = "0x2FC2Fe2b2e5c6c7eA1Bd2E4dD0ba1e37C2e8B3f1"
+MAKERS = [
+    "0x51C72848c68a965f66FA7a88855F9f7784502a7F",
+    "0xdEf1CA1fb7FBcDC777520aa7f396b4E015F497aB",
+]
+WETH = CHAIN.tokens["WETH"]
+USDC = CHAIN.tokens["USDC"]
+USDT = CHAIN.tokens["USDT"]
+WBTC = CHAIN.tokens["WBTC"]
+
+# symbol -> (decimals, usd price), tokens that are not listed are priced as 18 decimals at $1
+_SYMBOL_INFO: dict[str, tuple[int, float]] = {
+    "ETH": (18, 2650.12),
+    "WETH": (18, 2650.12),
+    "USDC": (6, 1.0),
+    "USDC.e": (6, 1.0),
+    "USDT": (6, 0.9998),
+    "DAI": (18, 1.0001),
+    "WBTC": (8, 62011.5),
+    "MATIC": (18, 0.41),
+    "WMATIC": (18, 0.41),
+    "ARB": (18, 0.57),
+    "OP": (18, 1.61),
+}
+
+
+def token_info(chain: Chain, address: str) -> tuple[str, int, float]:
+    """Symbol, decimals and usd price of a token for mock payloads"""
+    if address.lower() == NATIVE_TOKEN.lower():
+        symbol = chain.native_symbol
+    elif address.lower() == chain.wrapped_address.lower():
+        symbol = chain.wrapped_symbol
+    else:
+        symbol = next((symbol for symbol, token in chain.tokens.items() if token.lower() == address.lower()), "TKN")
+    decimals, price_usd = _SYMBOL_INFO.get(symbol, (18, 1.0))
+    return symbol, decimals, price_usd
+
+
+def _tokens(chain: Chain, amounts: dict[str, int], buy: bool) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    for address, amount in amounts.items():
+        symbol, decimals, price_usd = token_info(chain, address)
+        token: dict[str, Any] = {
+            "amount": str(amount),
+            "decimals": decimals,
+            "priceUsd": price_usd,
+            "symbol": symbol,
+            "price": 0.000377,
+            "priceBeforeFee": 0.000377,
+        }
+        if buy:
+            token["amountBeforeFee"] = str(amount)
+            token["deltaFromExpected"] = 0
+        result[address] = token
+    return result
+
+
+def _quote(
+    sell: dict[str, int],
+    buy: dict[str, int],
+    quote_type: str,
+    expiry: int,
+    gasless: bool,
+    chain: Chain = CHAIN,
+    taker: str = TAKER,
+    quote_id: str | None = None,
+) -> dict[str, Any]:
+    quote: dict[str, Any] = {
+        "type": quote_type,
+        "status": "QUOTE_SUCCESS",
+        "quoteId": quote_id or "f8a2b7c4-4ad9-4d5a-9d3f-1c1f9e2b1a7e",
+        "chainId": chain.id,
+        "approvalType": "Standard",
+        "nativeToken": chain.native_symbol,
+        "taker": taker,
+        "receiver": taker,
+        "makers": MAKERS,
+        "expiry": expiry,
+        "slippage": 0,
+        "gasFee": {"native": "1437921000000", "usd": 0.0038},
+        "buyTokens": _tokens(chain, buy, buy=True),
+        "sellTokens": _tokens(chain, sell, buy=False),
+        "settlementAddress": PMM_SETTLEMENT_ADDRESS,
+        "approvalTarget": PMM_SETTLEMENT_ADDRESS,
+        "requiredSignatures": [],
+        "priceImpact": -0.0002,
+        "warnings": [],
+    }
+    if not gasless:
+        quote["tx"] = {
+            "chainId": chain.id,
+            "from": taker,
+            "to": PMM_SETTLEMENT_ADDRESS,
+            "value": "0x0",
+            "data": "0x4dcebcba" + "00" * 352,
+            "gas": 180000,
+            "gasPrice": 10000000,
+        }
+    return quote
+
+
+def build_pmm_quote(
+    sell: dict[str, int],
+    buy: dict[str, int],
+    gasless: bool = True,
+    chain: Chain = CHAIN,
+    taker: str = TAKER,
+    expiry: int | None = None,
+) -> dict[str, Any]:
+    """A PMM quote filled by a single maker, as a `SingleOrder` for one token pair or a `MultiOrder` otherwise"""
+    expiry = expiry or int(time.time()) + 60
+    quote_type = f"{'1' if len(sell) == 1 else 'M'}2{'1' if len(buy) == 1 else 'M'}"
+    quote = _quote(sell, buy, quote_type, expiry, gasless, chain=chain, taker=taker, quote_id=str(uuid.uuid4()))
+    maker_nonce = str(time.time_ns() // 1000)
+    if len(sell) == 1 and len(buy) == 1:
+        ((taker_token, taker_amount),), ((maker_token, maker_amount),) = sell.items(), buy.items()
+        quote["onchainOrderType"] = "SingleOrder"
+        quote["partialFillOffset"] = 12
+        quote["toSign"] = {
+            "partner_id": 0,
+            "expiry": expiry,
+            "taker_address": taker,
+            "maker_address": MAKERS[0],
+            "maker_nonce": maker_nonce,
+            "taker_token": taker_token,
+            "maker_token": maker_token,
+            "taker_amount": str(taker_amount),
+            "maker_amount": str(maker_amount),
+            "receiver": taker,
+            "packed_commands": "0",
+        }
+    else:
+        quote["onchainOrderType"] = "MultiOrder"
+        quote["partialFillOffset"] = 0
+        quote["toSign"] = {
+            "partner_id": 0,
+            "expiry": expiry,
+            "taker_address": taker,
+            "maker_address": MAKERS[0],
+            "maker_nonce": maker_nonce,
+            "taker_tokens": list(sell),
+            "maker_tokens": list(buy),
+            "taker_amounts": [str(amount) for amount in sell.values()],
+            "maker_amounts": [str(amount) for amount in buy.values()],
+            "receiver": taker,
+            "commands": "0x" + "00" * (len(sell) + len(buy)),
+        }
+    return quote
+
+
+def build_jam_quote(
+    sell: dict[str, int],
+    buy: dict[str, int],
+    gasless: bool = True,
+    chain: Chain = CHAIN,
+    taker: str = TAKER,
+    expiry: int | None = None,
+) -> dict[str, Any]:
+    """A JAM quote for any number of sell and buy tokens"""
+    expiry = expiry or int(time.time()) + 60
+    quote_type = f"{'1' if len(sell) == 1 else 'M'}2{'1' if len(buy) == 1 else 'M'}"
+    quote = _quote(sell, buy, quote_type, expiry, gasless, chain=chain, taker=taker, quote_id=str(uuid.uuid4()))
+    quote["settlementAddress"] = JAM_SETTLEMENT_CONTRACT[chain.id]
+    quote["approvalTarget"] = JAM_BALANCE_MANAGER[chain.id]
+    quote["solver"] = "solver-1"
+    quote["hooksHash"] = "0x" + "00" * 32
+    quote["toSign"] = {
+        "taker": taker,
+        "receiver": taker,
+        "expiry": expiry,
+        "exclusivityDeadline": expiry,
+        "nonce": str(uuid.uuid4().int),
+        "executor": "0x0000000000000000000000000000000000000000",
+        "partnerInfo": 0,
+        "sellTokens": list(sell),
+        "buyTokens": list(buy),
+        "sellAmounts": [str(amount) for amount in sell.values()],
+        "buyAmounts": [str(amount) for amount in buy.values()],
+        "hooksHash": "0x" + "00" * 32,
+    }
+    return quote
+
+
+def pmm_single_quote(gasless: bool = True) -> dict[str, Any]:
+    expiry = int(time.time()) + 60
+    quote = _quote({USDT: 2_000_000}, {WETH: 754_321_000_000_000}, "121", expiry, gasless)
+    quote["onchainOrderType"] = "SingleOrder"
+    quote["partialFillOffset"] = 12
+    quote["toSign"] = {
+        "partner_id": 0,
+        "expiry": expiry,
+        "taker_address": TAKER,
+        "maker_address": MAKERS[0],
+        "maker_nonce": "1718290311742",
+        "taker_token": USDT,
+        "maker_token": WETH,
+        "taker_amount": "2000000",
+        "maker_amount": "754321000000000",
+        "receiver": TAKER,
+        "packed_commands": "0",
+    }
+    return quote
+
+
+def pmm_multi_quote(gasless: bool = True) -> dict[str, Any]:
+    expiry = int(time.time()) + 60
+    quote = _quote({USDT: 3_000_000}, {WETH: 377_160_500_000_000, WBTC: 1_612, USDC: 999_700}, "12M", expiry, gasless)
+    quote["onchainOrderType"] = "MultiOrder"
+    quote["partialFillOffset"] = 0
+    quote["toSign"] = {
+        "partner_id": 0,
+        "expiry": expiry,
+        "taker_address": TAKER,
+        "maker_address": MAKERS[0],
+        "maker_nonce": "1718290311743",
+        "taker_tokens": [USDT],
+        "maker_tokens": [WETH, WBTC, USDC],
+        "taker_amounts": ["3000000"],
+        "maker_amounts": ["377160500000000", "1612", "999700"],
+        "receiver": TAKER,
+        "commands": "0x00000000",
+    }
+    return quote
+
+
+def pmm_aggregate_quote(gasless: bool = True) -> dict[str, Any]:
+    expiry = int(time.time()) + 60
+    quote = _quote({USDT: 300_000, USDC: 300_000}, {WETH: 226_296_300_000_000}, "M21", expiry, gasless)
+    quote["onchainOrderType"] = "AggregateOrder"
+    quote["toSign"] = {
+        "partner_id": 0,
+        "expiry": expiry,
+        "taker_address": TAKER,
+        "maker_addresses": MAKERS,
+        "maker_nonces": ["1718290311744", "1718290311745"],
+        "taker_tokens": [[USDT], [USDC]],
+        "maker_tokens": [[WETH], [WETH]],
+        "taker_amounts": [["300000"], ["300000"]],
+        "maker_amounts": [["113148150000000"], ["113148150000000"]],
+        "receiver": TAKER,
+        "commands": "0x000000",
+    }
+    return quote
+
+
+def jam_quote(gasless: bool = True) -> dict[str, Any]:
+    expiry = int(time.time()) + 60
+    quote = _quote({USDT: 10_000_000}, {WETH: 3_771_605_000_000_000}, "121", expiry, gasless)
+    quote["settlementAddress"] = JAM_SETTLEMENT_CONTRACT[CHAIN.id]
+    quote["approvalTarget"] = JAM_BALANCE_MANAGER[CHAIN.id]
+    quote["solver"] = "solver-1"
+    quote["hooksHash"] = "0x" + "00" * 32
+    quote["toSign"] = {
+        "taker": TAKER,
+        "receiver": TAKER,
+        "expiry": expiry,
+        "exclusivityDeadline": expiry,
+        "nonce": "190734589234759204735",
+        "executor": "0x0000000000000000000000000000000000000000",
+        "partnerInfo": 0,
+        "sellTokens": [USDT],
+        "buyTokens": [WETH],
+        "sellAmounts": ["10000000"],
+        "buyAmounts": ["3771605000000000"],
+        "hooksHash": "0x" + "00" * 32,
+    }
+    return quote
+
+
+# ------------------------------- Price stream ------------------------------- #
+def stream_pairs(chain: Chain = CHAIN) -> list[tuple[str, str]]:
+    """`base/quote` pairs published by the mock pricing stream of `chain`"""
+    candidates = [
+        (chain.wrapped_symbol, "USDC"),
+        (chain.wrapped_symbol, "USDT"),
+        ("WBTC", "USDC"),
+        ("USDT", "USDC"),
+    ]
+    tokens = chain.tokens | {chain.wrapped_symbol: chain.wrapped_address}
+    return [(tokens[base], tokens[quote]) for base, quote in candidates if base in tokens and quote in tokens]
+
+
+def price_levels(
+    chain: Chain, base: str, quote: str, levels: int = 5, spread: float = 0.0005, drift: float = 0.0
+) -> dict[str, Any]:
+    """Bid and ask levels of a pair around the mock usd prices, `drift` shifts the mid price by that fraction"""
+    mid = token_info(chain, base)[2] / token_info(chain, quote)[2] * (1 + drift)
+    size = 10_000 / token_info(chain, base)[2]  # $10k per level
+    return {
+        "last_update_ts": time.time(),
+        "bids": [[mid * (1 - spread * (i + 1)), size * (i + 1)] for i in range(levels)],
+        "asks": [[mid * (1 + spread * (i + 1)), size * (i + 1)] for i in range(levels)],
+    }
+
+
+def pricing_message(chain: Chain = CHAIN, levels: int = 5, drift: float = 0.0) -> dict[str, Any]:
+    """One message of the JSON pricing stream, with the levels of every pair of `stream_pairs`"""
+    return {
+        f"{base}/{quote}": price_levels(chain, base, quote, levels=levels, drift=drift)
+        for base, quote in stream_pairs(chain)
+    }
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import Counter
+from collections.abc import Callable
+from types import TracebackType
+from typing import Any
+
+import orjson
+from aiohttp import WSMsgType, web
+
+from python_sdk.common.types.types import Chain
+from python_sdk.mock.payloads import CHAIN
+
+# Handler of one JSON-RPC method, called with the request params
+RpcHandler = Callable[[list[Any]], Any]
+
+
+def _hash(number: int) -> str:
+    return "0x" + f"{number:064x}"
+
+
+class MockRpcNode:
+    """In-process JSON-RPC node, over http (`url`) and websocket (`ws_url`, with `newHeads` subscriptions).
+
+    Only the calls the SDK makes are answered: chain id, block number, receipts and gas fees out of the box, anything
+    else (`eth_call`, ...) through `handlers`. Blocks are produced on demand with `mine()`, which also makes the given
+    transactions' receipts available and notifies the `newHeads` subscribers.
+    """
+
+    def __init__(
+        self,
+        chain: Chain = CHAIN,
+        base_fee: int = 10_000_000,
+        priority_fee: int = 1_000_000,
+        gas_price: int = 20_000_000,
+        handlers: dict[str, RpcHandler] | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.chain = chain
+        self.base_fee: int | None = base_fee  # `None` for a chain without EIP-1559
+        self.priority_fee = priority_fee
+        self.gas_price = gas_price
+        self.block_number = 1
+        self.calls: Counter[str] = Counter()
+        self.__handlers: dict[str, RpcHandler] = {
+            "eth_chainId": lambda params: hex(self.chain.id),
+            "eth_blockNumber": lambda params: hex(self.block_number),
+            "eth_gasPrice": lambda params: hex(self.gas_price),
+            "eth_feeHistory": self.__fee_history,
+            "eth_getTransactionReceipt": lambda params: self.__receipts.get(params[0].lower()),
+            **(handlers or {}),
+        }
+        self.__receipts: dict[str, dict[str, Any]] = {}
+        self.__subscribers: dict[str, web.WebSocketResponse] = {}
+        self.__subscription_ids = itertools.count(1)
+        self.__host = host
+        self.__port = port
+        self.__runner: web.AppRunner | None = None
+        self.__url: str | None = None
+
+    @property
+    def url(self) -> str:
+        if self.__url is None:
+            raise RuntimeError("The mock RPC node has not been started")
+        return self.__url
+
+    @property
+    def ws_url(self) -> str:
+        return self.url.replace("http://", "ws://", 1) + "/ws"
+
+    @property
+    def subscribers(self) -> int:
+        return len(self.__subscribers)
+
+    async def __aenter__(self) -> MockRpcNode:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_post("/", self.__http)
+        app.router.add_get("/ws", self.__ws)
+        self.__runner = web.AppRunner(app, access_log=None)
+        await self.__runner.setup()
+        await web.TCPSite(self.__runner, self.__host, self.__port).start()
+        host, port = self.__runner.addresses[0][:2]
+        self.__url = f"http://{host}:{port}"
+        return self.__url
+
+    async def close(self) -> None:
+        await self.drop_subscriptions()
+        if self.__runner is not None:
+            await self.__runner.cleanup()
+            self.__runner = None
+
+    async def drop_subscriptions(self) -> None:
+        """Close every websocket connection, as a node restart would, to exercise the polling fallback"""
+        subscribers, self.__subscribers = list(self.__subscribers.values()), {}
+        await asyncio.gather(*(ws.close() for ws in subscribers), return_exceptions=True)
+
+    async def mine(self, *tx_hashes: str, notify: bool = True) -> int:
+        """Produce a block including `tx_hashes`, returns its number"""
+        self.block_number += 1
+        for index, tx_hash in enumerate(tx_hashes):
+            self.__receipts[tx_hash.lower()] = self.__receipt(tx_hash, index)
+        if notify:
+            for subscription, ws in list(self.__subscribers.items()):
+                message = {
+                    "jsonrpc": "2.0",
+                    "method": "eth_subscription",
+                    "params": {"subscription": subscription, "result": self.__head()},
+                }
+                await ws.send_bytes(orjson.dumps(message))
+        return self.block_number
+
+    # --------------------------------- Handlers --------------------------------- #
+    async def __http(self, request: web.Request) -> web.StreamResponse:
+        return web.Response(body=orjson.dumps(self.__answer(await request.json())), content_type="application/json")
+
+    async def __ws(self, request: web.Request) -> web.StreamResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for message in ws:
+            if message.type != WSMsgType.TEXT and message.type != WSMsgType.BINARY:
+                break
+            payload = orjson.loads(message.data)
+            if payload["method"] == "eth_subscribe":
+                self.calls["eth_subscribe"] += 1
+                subscription = hex(next(self.__subscription_ids))
+                self.__subscribers[subscription] = ws
+                response = {"jsonrpc": "2.0", "id": payload["id"], "result": subscription}
+            else:
+                response = self.__answer(payload)
+            await ws.send_bytes(orjson.dumps(response))
+        self.__subscribers = {key: value for key, value in self.__subscribers.items() if value is not ws}
+        return ws
+
+    # --------------------------------- Internals -------------------------------- #
+    def __answer(self, payload: dict[str, Any]) -> dict[str, Any]:
+        method = payload["method"]
+        self.calls[method] += 1
+        if method not in self.__handlers:
+            return {"jsonrpc": "2.0", "id": payload["id"], "error": {"code": -32601, "message": f"{method} not found"}}
+        return {"jsonrpc": "2.0", "id": payload["id"], "result": self.__handlers[method](payload.get("params", []))}
+
+    def __fee_history(self, params: list[Any]) -> dict[str, Any]:
+        base_fees = [hex(self.base_fee)] * 2 if self.base_fee is not None else []
+        return {
+            "oldestBlock": hex(self.block_number),
+            "baseFeePerGas": base_fees,
+            "reward": [[hex(self.priority_fee)]] if self.base_fee is not None else [],
+            "gasUsedRatio": [0.5],
+        }
+
+    def __head(self) -> dict[str, Any]:
+        return {
+            "number": hex(self.block_number),
+            "hash": _hash(self.block_number),
+            "parentHash": _hash(self.block_number - 1),
+            "timestamp": hex(1_700_000_000 + self.block_number),
+            "gasLimit": hex(30_000_000),
+            "gasUsed": hex(15_000_000),
+            "miner": "0x" + "00" * 20,
+            **({"baseFeePerGas": hex(self.base_fee)} if self.base_fee is not None else {}),
+        }
+
+    def __receipt(self, tx_hash: str, index: int) -> dict[str, Any]:
+        return {
+            "transactionHash": tx_hash,
+            "transactionIndex": hex(index),
+            "blockHash": _hash(self.block_number),
+            "blockNumber": hex(self.block_number),
+            "from": "0x" + "11" * 20,
+            "to": "0x" + "22" * 20,
+            "contractAddress": None,
+            "cumulativeGasUsed": hex(21_000 * (index + 1)),
+            "gasUsed": hex(21_000),
+            "effectiveGasPrice": hex(self.gas_price),
+            "logs": [],
+            "logsBloom": "0x" + "00" * 256,
+            "status": "0x1",
+            "type": "0x2",
+        }
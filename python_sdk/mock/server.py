@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+import orjson
+from aiohttp import web
+
+from python_sdk.common.types.order_types import OrderApiStatus
+from python_sdk.common.types.types import Chain
+from python_sdk.mock.payloads import build_jam_quote, build_pmm_quote, pricing_message, token_info
+
+SPREAD = 0.0005
+MAX_ORDERS = 100_000
+
+
+@dataclass(frozen=True)
+class MockServerConfig:
+    latency: float = 0.0  # seconds added to every response
+    jitter: float = 0.0  # uniform random extra latency, in seconds
+    error_rate: float = 0.0  # fraction of requests answered with a Bebop error payload
+    unavailable_rate: float = 0.0  # fraction of requests answered with HTTP 503
+    settle_after: float = 0.5  # seconds between an order being posted and its status becoming final
+    failure_rate: float = 0.0  # fraction of orders that end up `Failed`
+    quote_ttl: int = 60
+    price_interval: float = 0.1  # seconds between two messages of the pricing stream
+    price_levels: int = 5
+    price_volatility: float = 0.0005  # standard deviation of the mid price random walk, per message
+    seed: int | None = None
+
+
+@dataclass
+class MockOrder:
+    route: str
+    expiry: int
+    posted_at: float | None = None
+    tx_hash: str | None = None
+    failed: bool = False
+
+
+def _error(code: int, message: str) -> dict[str, Any]:
+    return {"error": {"errorCode": code, "message": message}}
+
+
+def _fill_amounts(chain: Chain, params: dict[str, str]) -> tuple[dict[str, int], dict[str, int]]:
+    """Amounts of a quote priced from the mock usd prices, minus a small spread"""
+    sell_tokens, buy_tokens = params["sell_tokens"].split(","), params["buy_tokens"].split(",")
+    if params.get("sell_amounts"):
+        known_tokens, known_amounts, other_tokens = sell_tokens, params["sell_amounts"], buy_tokens
+        ratios = params.get("buy_tokens_ratios")
+    else:
+        known_tokens, known_amounts, other_tokens = buy_tokens, params["buy_amounts"], sell_tokens
+        ratios = params.get("sell_tokens_ratios")
+    known = dict(zip(known_tokens, (int(amount) for amount in known_amounts.split(",")), strict=True))
+    usd = sum(
+        amount / 10 ** token_info(chain, token)[1] * token_info(chain, token)[2] for token, amount in known.items()
+    )
+    weights = [float(ratio) for ratio in ratios.split(",")] if ratios else [1 / len(other_tokens)] * len(other_tokens)
+    factor = 1 - SPREAD if params.get("sell_amounts") else 1 + SPREAD
+    other = {
+        token: int(usd * weight * factor / token_info(chain, token)[2] * 10 ** token_info(chain, token)[1])
+        for token, weight in zip(other_tokens, weights, strict=True)
+    }
+    return (known, other) if params.get("sell_amounts") else (other, known)
+
+
+class MockBebopServer:
+    """In-process aiohttp server serving the PMM and JAM quote, order, order-status and pricing stream endpoints.
+
+    Quotes are priced from fixed usd prices and stored by quote id, orders settle `settle_after` seconds after they
+    are posted. Latency and error rates are configurable so that clients can be benchmarked and load-tested offline,
+    by pointing an `AioHttpTransport(base_url=server.url)` (or a `PriceStream(base_url=server.url)`) at it.
+    """
+
+    def __init__(self, config: MockServerConfig | None = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or MockServerConfig()
+        self.requests: Counter[str] = Counter()
+        self.__host = host
+        self.__port = port
+        self.__random = random.Random(self.config.seed)  # noqa: S311
+        self.__orders: dict[str, MockOrder] = {}
+        self.__streams: set[web.WebSocketResponse] = set()
+        self.__runner: web.AppRunner | None = None
+        self.__url: str | None = None
+
+    @property
+    def url(self) -> str:
+        if self.__url is None:
+            raise RuntimeError("The mock server has not been started")
+        return self.__url
+
+    async def __aenter__(self) -> MockBebopServer:
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/{route:pmm|jam}/{chain}/v{version}/quote", self.__quote)
+        app.router.add_post("/{route:pmm|jam}/{chain}/v{version}/order", self.__order)
+        app.router.add_get("/{route:pmm|jam}/{chain}/v{version}/order-status", self.__order_status)
+        app.router.add_get("/{route:pmm|jam}/{chain}/v{version}/pricing", self.__pricing)
+        self.__runner = web.AppRunner(app, access_log=None)
+        await self.__runner.setup()
+        await web.TCPSite(self.__runner, self.__host, self.__port).start()
+        host, port = self.__runner.addresses[0][:2]
+        self.__url = f"http://{host}:{port}"
+        return self.__url
+
+    async def close(self) -> None:
+        await self.drop_streams()
+        if self.__runner is not None:
+            await self.__runner.cleanup()
+            self.__runner = None
+
+    async def drop_streams(self) -> None:
+        """Close every open pricing stream, as a server restart would, to exercise client reconnects"""
+        await asyncio.gather(*(ws.close() for ws in list(self.__streams)), return_exceptions=True)
+
+    # --------------------------------- Handlers --------------------------------- #
+    async def __quote(self, request: web.Request) -> web.StreamResponse:
+        if (failure := await self.__simulate(request, "quote")) is not None:
+            return failure
+        try:
+            chain = Chain[request.match_info["chain"]]
+        except KeyError:
+            return self.__json(_error(101, f"Unsupported chain {request.match_info['chain']}"))
+        params = dict(request.query)
+        try:
+            sell, buy = _fill_amounts(chain, params)
+        except (KeyError, ValueError) as e:
+            return self.__json(_error(102, f"Invalid quote request: {e}"))
+        build = build_pmm_quote if request.match_info["route"] == "pmm" else build_jam_quote
+        quote = build(
+            sell,
+            buy,
+            gasless=params.get("gasless", "true") == "true",
+            chain=chain,
+            taker=params.get("taker_address", "0x0000000000000000000000000000000000000001"),
+            expiry=int(time.time()) + self.config.quote_ttl,
+        )
+        if len(self.__orders) >= MAX_ORDERS:
+            self.__prune()
+        self.__orders[quote["quoteId"]] = MockOrder(route=request.match_info["route"], expiry=quote["expiry"])
+        return self.__json(quote)
+
+    async def __order(self, request: web.Request) -> web.StreamResponse:
+        if (failure := await self.__simulate(request, "order")) is not None:
+            return failure
+        body = orjson.loads(await request.read())
+        order = self.__orders.get(body.get("quote_id", ""))
+        if order is None or order.route != request.match_info["route"]:
+            return self.__json(_error(404, "Quote not found"))
+        if order.posted_at is not None:
+            return self.__json(_error(409, "Order already submitted"))
+        if order.expiry < time.time():
+            return self.__json(_error(410, "Quote expired"))
+        order.posted_at = time.monotonic()
+        order.tx_hash = "0x" + self.__random.randbytes(32).hex()
+        order.failed = self.__random.random() < self.config.failure_rate
+        return self.__json({"status": "Success", "expiry": order.expiry, "txHash": order.tx_hash})
+
+    async def __order_status(self, request: web.Request) -> web.StreamResponse:
+        if (failure := await self.__simulate(request, "order-status")) is not None:
+            return failure
+        order = self.__orders.get(request.query.get("quote_id", ""))
+        if order is None or order.posted_at is None:
+            return self.__json(_error(404, "Order not found"))
+        status = OrderApiStatus.Pending
+        if time.monotonic() - order.posted_at >= self.config.settle_after:
+            status = OrderApiStatus.Failed if order.failed else OrderApiStatus.Settled
+        return self.__json({"status": status.value, "txHash": order.tx_hash})
+
+    async def __pricing(self, request: web.Request) -> web.StreamResponse:
+        """JSON pricing stream: the levels of every mock pair, every `price_interval` seconds"""
+        self.requests[f"{request.match_info['route']}/pricing"] += 1
+        try:
+            chain = Chain[request.match_info["chain"]]
+        except KeyError:
+            return self.__json(_error(101, f"Unsupported chain {request.match_info['chain']}"))
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.__streams.add(ws)
+        drift = 0.0
+        try:
+            while not ws.closed:
+                drift += self.__random.gauss(0, self.config.price_volatility)
+                message = pricing_message(chain, levels=self.config.price_levels, drift=drift)
+                await ws.send_str(orjson.dumps(message).decode())
+                await asyncio.sleep(self.config.price_interval)
+        except ConnectionResetError:
+            pass
+        finally:
+            self.__streams.discard(ws)
+        return ws
+
+    # --------------------------------- Internals -------------------------------- #
+    async def __simulate(self, request: web.Request, endpoint: str) -> web.StreamResponse | None:
+        """Count the request, apply the configured latency and return an injected failure, if any"""
+        self.requests[f"{request.match_info['route']}/{endpoint}"] += 1
+        delay = self.config.latency + self.__random.uniform(0, self.config.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        draw = self.__random.random()
+        if draw < self.config.unavailable_rate:
+            return web.Response(status=503, reason="Service Unavailable")
+        if draw < self.config.unavailable_rate + self.config.error_rate:
+            return self.__json(_error(500, "Internal error"))
+        return None
+
+    def __prune(self) -> None:
+        """Forget quotes that expired more than a quote ttl ago, so that long load tests run in bounded memory"""
+        cutoff = time.time() - self.config.quote_ttl
+        self.__orders = {quote_id: order for quote_id, order in self.__orders.items() if order.expiry > cutoff}
+
+    @staticmethod
+    def __json(payload: dict[str, Any]) -> web.Response:
+        return web.Response(body=orjson.dumps(payload), content_type="application/json")
@@ -1,23 +1,44 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Sequence
+from types import TracebackType
+
 import aiohttp
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
 from eth_typing import HexStr
 from hexbytes import HexBytes
-from web3 import AsyncHTTPProvider, AsyncWeb3
-from web3.middleware.geth_poa import async_geth_poa_middleware
 
-from python_sdk.common.funcs import send_taker_order
+from python_sdk.common.client_config import ClientConfig
+from python_sdk.common.funcs import get_quotes, iter_quotes, send_taker_order
+from python_sdk.common.gas_oracle import GasOracle
+from python_sdk.common.metrics import MetricTags
+from python_sdk.common.nonce_manager import shared_nonce_manager
+from python_sdk.common.order_tracker import OrderHandle, OrderTracker, StatusCallback
+from python_sdk.common.receipt_waiter import ReceiptWaiter
+from python_sdk.common.resilience import ResilientTransport
+from python_sdk.common.token_registry import TokenInfo, TokenRegistry
+from python_sdk.common.token_state import TokenStateReader, missing_approvals
+from python_sdk.common.transport import AioHttpTransport, Transport
 from python_sdk.common.types.order_types import (
     OrderRequest,
     OrderResponse,
     OrderStatusRequest,
     OrderStatusResponse,
 )
-from python_sdk.common.types.types import Chain, Env
+from python_sdk.common.types.quote_types import QuoteResult
+from python_sdk.common.types.types import ApprovalType, Chain, Env, Route
 from python_sdk.common.utils.logger import Logger
-from python_sdk.common.utils.utils import approve_token, revoke_token
+from python_sdk.common.utils.utils import approve_token, create_web3, revoke_token
 from python_sdk.pmm.constants import PMM_SETTLEMENT_ADDRESS
-from python_sdk.pmm.funcs import get_order_status, get_quote, post_order, send_gasless_order
+from python_sdk.pmm.funcs import (
+    get_order_status,
+    get_quote,
+    post_order,
+    send_gasless_order,
+    submit_gasless_order,
+)
 from python_sdk.pmm.types.quote_types import QuoteRequest, QuoteResponse
 
 LOGGER = Logger(__name__)
@@ -32,32 +53,109 @@ class PMMClient:
         rpc_url: str | None = None,
         source_auth: str | None = None,
         auth: aiohttp.BasicAuth | None = None,
+        config: ClientConfig | None = None,
     ):
+        config = config or ClientConfig()
         self.__chain = chain
         self.__env = env
         self.__headers = {"source-auth": source_auth} if source_auth else None
         self.__auth = auth
+        # ------------------------------ HTTP Transport ------------------------------ #
+        # A transport passed in by the caller may be shared with other clients, it is not closed by this one
+        self.__owns_transport = config.transport is None
+        self.__transport: Transport = config.transport or ResilientTransport(
+            AioHttpTransport(config=config.session_config, session=config.session, metrics=config.metrics),
+            config.resilience,
+        )
+        # ---------------------------------- Metrics --------------------------------- #
+        self.metrics = config.metrics
+        self.recorder = config.recorder
+        self.__order_tracker = OrderTracker(
+            fetch_status=self.get_order_status,
+            config=config.tracker_config,
+            metrics=config.metrics,
+            recorder=config.recorder,
+            tags=MetricTags(chain=chain, route=Route.PMM),
+        )
         # ----------------------------------- Web3 ----------------------------------- #
-        self.web3 = AsyncWeb3(
-            AsyncHTTPProvider(rpc_url if rpc_url else chain.public_rpc, request_kwargs={"timeout": 6})
+        # A provider, gas oracle, receipt waiter and token state reader passed in (e.g. by `BebopRouter`) may be
+        # shared with other clients on the same chain
+        self.web3 = config.web3 or create_web3(chain, rpc_url, timeout=config.rpc_timeout)
+        self.gas_oracle = config.gas_oracle or GasOracle(chain=chain, web3=self.web3, config=config.gas_config)
+        self.__owns_receipt_waiter = config.receipt_waiter is None
+        self.__receipt_waiter = config.receipt_waiter or ReceiptWaiter(
+            chain=chain, web3=self.web3, ws_rpc_url=config.ws_rpc_url, config=config.receipt_config
         )
-        self.web3.middleware_onion.inject(async_geth_poa_middleware, "poa", layer=0)
+        self.token_state = config.token_state or TokenStateReader(
+            chain=chain, web3=self.web3, spenders=[PMM_SETTLEMENT_ADDRESS, chain.permit2_address]
+        )
+        self.token_registry = config.token_registry or TokenRegistry()
+        self.quote_cache = config.quote_cache
         # ------------------------------- Local Account ------------------------------ #
         self.account: LocalAccount | None = Account.from_key(private_key) if private_key else None
+        self.signer = config.signer
+        self.nonce_manager = config.nonce_manager or shared_nonce_manager()
         # -------------------- Source Auth (if provided by Bebop) -------------------- #
 
-    async def get_quote(self, quote_request: QuoteRequest) -> QuoteResponse:
-        if not quote_request.taker_address and self.account:
-            quote_request.taker_address = self.account.address
+    async def __aenter__(self) -> PMMClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self.__order_tracker.close()
+        if self.__owns_receipt_waiter:
+            await self.__receipt_waiter.close()
+        if self.__owns_transport:
+            await self.__transport.close()
+
+    async def get_quote(self, quote_request: QuoteRequest, cached: bool = True) -> QuoteResponse:
+        """Request a quote, served from `quote_cache` (if any) unless `cached` is False"""
+        owner = self.signer or self.account
+        if not quote_request.taker_address and owner:
+            quote_request.taker_address = owner.address
         if not quote_request.receiver_address:
             quote_request.receiver_address = quote_request.taker_address
-        return await get_quote(
-            env=self.__env, chain=self.__chain, quote_request=quote_request, headers=self.__headers, auth=self.__auth
+        quote: QuoteResponse = await get_quote(
+            env=self.__env,
+            chain=self.__chain,
+            quote_request=quote_request,
+            headers=self.__headers,
+            auth=self.__auth,
+            transport=self.__transport,
+            cache=self.quote_cache if cached else None,
+            metrics=self.metrics,
+            recorder=self.recorder,
         )
+        self.token_registry.learn(quote)
+        return quote
+
+    async def get_quotes(
+        self, quote_requests: Sequence[QuoteRequest], max_concurrency: int = 10, timeout: float | None = None
+    ) -> list[QuoteResult[QuoteRequest, QuoteResponse]]:
+        return await get_quotes(self.get_quote, quote_requests, max_concurrency=max_concurrency, timeout=timeout)
+
+    def iter_quotes(
+        self, quote_requests: Sequence[QuoteRequest], max_concurrency: int = 10, timeout: float | None = None
+    ) -> AsyncIterator[QuoteResult[QuoteRequest, QuoteResponse]]:
+        return iter_quotes(self.get_quote, quote_requests, max_concurrency=max_concurrency, timeout=timeout)
 
     async def post_order(self, order_request: OrderRequest) -> OrderResponse:
         return await post_order(
-            env=self.__env, chain=self.__chain, order_request=order_request, headers=self.__headers, auth=self.__auth
+            env=self.__env,
+            chain=self.__chain,
+            order_request=order_request,
+            metrics=self.metrics,
+            recorder=self.recorder,
+            headers=self.__headers,
+            auth=self.__auth,
+            transport=self.__transport,
         )
 
     async def get_order_status(self, quote_id: str) -> OrderStatusResponse:
@@ -67,30 +165,107 @@ class PMMClient:
             order_status_request=OrderStatusRequest(quote_id=quote_id),
             headers=self.__headers,
             auth=self.__auth,
+            transport=self.__transport,
+        )
+
+    def track_order(
+        self, quote_id: str, expiry: int, callback: StatusCallback | None = None
+    ) -> asyncio.Future[OrderStatusResponse]:
+        return self.__order_tracker.track(quote_id, expiry, callback=callback)
+
+    async def submit_gasless_order(self, request: QuoteRequest) -> OrderHandle[QuoteResponse]:
+        """Quote, sign and post a gasless order, returning as soon as the order is accepted"""
+        account = self.signer or self.account
+        assert account, "Account is required for order"
+        quote: QuoteResponse = await self.get_quote(request, cached=False)
+        order: OrderResponse = await submit_gasless_order(
+            env=self.__env,
+            chain=self.__chain,
+            account=account,
+            quote=quote,
+            headers=self.__headers,
+            auth=self.__auth,
+            transport=self.__transport,
+            metrics=self.metrics,
+            recorder=self.recorder,
         )
+        return OrderHandle(quote=quote, order=order, tracker=self.__order_tracker)
 
     async def send_gasless_order(self, request: QuoteRequest) -> OrderStatusResponse:
-        assert self.account, "Account is required for order"
-        quote: QuoteResponse = await self.get_quote(request)
+        account = self.signer or self.account
+        assert account, "Account is required for order"
+        quote: QuoteResponse = await self.get_quote(request, cached=False)
         return await send_gasless_order(
             env=self.__env,
             chain=self.__chain,
-            account=self.account,
+            account=account,
             quote=quote,
             headers=self.__headers,
             auth=self.__auth,
+            transport=self.__transport,
+            tracker=self.__order_tracker,
+            metrics=self.metrics,
+            recorder=self.recorder,
         )
 
     async def send_taker_order(self, request: QuoteRequest) -> tuple[QuoteResponse, HexStr, bool]:
-        assert self.account, "Account is required for order"
-        quote: QuoteResponse = await self.get_quote(request)
-        tx_hash, success = await send_taker_order(chain=self.__chain, web3=self.web3, account=self.account, quote=quote)
+        account = self.signer or self.account
+        assert account, "Account is required for order"
+        quote: QuoteResponse = await self.get_quote(request, cached=False)
+        tx_hash, success = await send_taker_order(
+            chain=self.__chain,
+            web3=self.web3,
+            account=account,
+            quote=quote,
+            receipt_waiter=self.__receipt_waiter,
+            nonce_manager=self.nonce_manager,
+            gas_oracle=self.gas_oracle,
+            metrics=self.metrics,
+            recorder=self.recorder,
+        )
         return quote, tx_hash, success
 
+    async def get_token_info(self, token_addresses: Sequence[str]) -> list[TokenInfo]:
+        """Symbols and decimals of the given tokens, from the registry or a single multicall for unknown ones"""
+        return await self.token_registry.load(self.token_state, token_addresses)
+
+    async def check_approvals(self, request: QuoteRequest) -> list[str]:
+        """Sell tokens the taker still has to approve for `request`, to be checked before quoting"""
+        owner = self.signer or self.account
+        taker_address = request.taker_address or (owner.address if owner else None)
+        assert taker_address, "Taker address is required to check approvals"
+        if request.approval_type == ApprovalType.Permit:
+            return []
+        spender = (
+            self.__chain.permit2_address if request.approval_type == ApprovalType.Permit2 else PMM_SETTLEMENT_ADDRESS
+        )
+        return await missing_approvals(
+            self.token_state,
+            owner=taker_address,
+            spender=spender,
+            tokens=request.sell_tokens,
+            amounts=request.sell_amounts or None,
+        )
+
     async def approve_token(self, token_address: str, amount: int) -> HexBytes:
         assert self.account, "Account is required for token approval"
-        return await approve_token(self.web3, self.account, token_address, amount, spender=PMM_SETTLEMENT_ADDRESS)
+        return await approve_token(
+            self.web3,
+            self.account,
+            token_address,
+            amount,
+            spender=PMM_SETTLEMENT_ADDRESS,
+            nonce_manager=self.nonce_manager,
+            gas_oracle=self.gas_oracle,
+        )
 
     async def revoke_token(self, token_address: str) -> HexBytes:
         assert self.account, "Account is required for token approval"
-        return await revoke_token(self.web3, self.account, token_address, spender=PMM_SETTLEMENT_ADDRESS)
+        return await revoke_token(
+            self.web3,
+            self.account,
+            token_address,
+            spender=PMM_SETTLEMENT_ADDRESS,
+            nonce_manager=self.nonce_manager,
+            gas_oracle=self.gas_oracle,
+        )
@@ -1,10 +1,15 @@
-import asyncio
 from typing import Any
 
 import aiohttp
 from eth_account.signers.local import LocalAccount
 
-from python_sdk.common.funcs import _get_order_status, _post_order, send_request
+from python_sdk.common.funcs import _get_order_status, _post_order, send_request, sign_order
+from python_sdk.common.metrics import Metrics, Phase, metric_tags, timed
+from python_sdk.common.order_tracker import SUCCESS_STATUSES, OrderTracker, wait_for_order_status
+from python_sdk.common.quote_cache import QuoteCache, quote_cache_key
+from python_sdk.common.recorder import Recorder
+from python_sdk.common.signer import Signer
+from python_sdk.common.transport import Transport
 from python_sdk.common.types.order_types import (
     OrderApiStatus,
     OrderRequest,
@@ -12,7 +17,7 @@ from python_sdk.common.types.order_types import (
     OrderStatusRequest,
     OrderStatusResponse,
 )
-from python_sdk.common.types.types import Chain, Env
+from python_sdk.common.types.types import Chain, Env, Route
 from python_sdk.common.utils.logger import Logger
 from python_sdk.pmm.constants import ORDER_STATUS_URL, ORDER_URL, QUOTE_URL
 from python_sdk.pmm.types.quote_types import QuoteRequest, QuoteResponse
@@ -26,26 +31,75 @@ async def get_quote(
     quote_request: QuoteRequest,
     headers: dict[str, Any] | None = None,
     auth: aiohttp.BasicAuth | None = None,
+    session: aiohttp.ClientSession | None = None,
+    transport: Transport | None = None,
+    cache: QuoteCache | None = None,
+    metrics: Metrics | None = None,
+    recorder: Recorder | None = None,
 ) -> QuoteResponse:
     source_auth = {"source-auth": quote_request.source_auth} if quote_request.source_auth else {}
     headers = (headers or {}) | source_auth
-    result = await send_request(
-        env=env,
-        method="get",
-        headers=headers,
-        auth=auth,
-        url=QUOTE_URL.format(chain=chain.name),
-        params=quote_request.to_params(),
-    )
-    return QuoteResponse.model_validate(result)
+    params = quote_request.to_params()
+
+    async def fetch() -> QuoteResponse:
+        with metric_tags(chain=chain, route=Route.PMM):
+            try:
+                result = await send_request(
+                    env=env,
+                    method="get",
+                    headers=headers,
+                    auth=auth,
+                    url=QUOTE_URL.format(chain=chain.name),
+                    params=params,
+                    session=session,
+                    transport=transport,
+                )
+                with timed(metrics, Phase.VALIDATE) as tags:
+                    quote = QuoteResponse.model_validate(result)
+                    tags["quote_id"] = quote.quoteId
+            except Exception as e:
+                if recorder is not None:
+                    recorder.record_quote(chain, Route.PMM, error=e)
+                raise
+            if recorder is not None:
+                recorder.record_quote(chain, Route.PMM, quote)
+            return quote
+
+    if cache is None:
+        return await fetch()
+    return await cache.get(quote_cache_key(Route.PMM, env, chain, params), fetch)
 
 
 async def post_order(
-    env: Env, chain: Chain, order_request: OrderRequest, headers: dict[str, Any] | None, auth: aiohttp.BasicAuth | None
+    env: Env,
+    chain: Chain,
+    order_request: OrderRequest,
+    headers: dict[str, Any] | None,
+    auth: aiohttp.BasicAuth | None,
+    session: aiohttp.ClientSession | None = None,
+    transport: Transport | None = None,
+    metrics: Metrics | None = None,
+    recorder: Recorder | None = None,
 ) -> OrderResponse:
-    return await _post_order(
-        env=env, order_url=ORDER_URL, chain=chain, order_request=order_request, headers=headers, auth=auth
-    )
+    with metric_tags(chain=chain, route=Route.PMM, quote_id=order_request.quote_id), timed(metrics, Phase.ORDER_POST):
+        try:
+            order = await _post_order(
+                env=env,
+                order_url=ORDER_URL,
+                chain=chain,
+                order_request=order_request,
+                headers=headers,
+                auth=auth,
+                session=session,
+                transport=transport,
+            )
+        except Exception as e:
+            if recorder is not None:
+                recorder.record_order(chain, Route.PMM, order_request.quote_id, error=e)
+            raise
+    if recorder is not None:
+        recorder.record_order(chain, Route.PMM, order_request.quote_id, order=order)
+    return order
 
 
 async def get_order_status(
@@ -54,55 +108,99 @@ async def get_order_status(
     order_status_request: OrderStatusRequest,
     headers: dict[str, Any] | None,
     auth: aiohttp.BasicAuth | None,
+    session: aiohttp.ClientSession | None = None,
+    transport: Transport | None = None,
 ) -> OrderStatusResponse:
-    return await _get_order_status(
+    with metric_tags(chain=chain, route=Route.PMM, quote_id=order_status_request.quote_id):
+        return await _get_order_status(
+            env=env,
+            order_status_url=ORDER_STATUS_URL,
+            chain=chain,
+            order_status_request=order_status_request,
+            headers=headers,
+            auth=auth,
+            session=session,
+            transport=transport,
+        )
+
+
+async def submit_gasless_order(
+    env: Env,
+    chain: Chain,
+    account: LocalAccount | Signer,
+    quote: QuoteResponse,
+    headers: dict[str, Any] | None,
+    auth: aiohttp.BasicAuth | None,
+    session: aiohttp.ClientSession | None = None,
+    transport: Transport | None = None,
+    metrics: Metrics | None = None,
+    recorder: Recorder | None = None,
+) -> OrderResponse:
+    with metric_tags(chain=chain, route=Route.PMM, quote_id=quote.quoteId), timed(metrics, Phase.SIGN):
+        signature: str = await sign_order(quote, account)
+    order_request = OrderRequest(
+        quote_id=quote.quoteId,
+        signature=signature,
+    )
+    order: OrderResponse = await post_order(
         env=env,
-        order_status_url=ORDER_STATUS_URL,
         chain=chain,
-        order_status_request=order_status_request,
+        order_request=order_request,
         headers=headers,
         auth=auth,
+        session=session,
+        transport=transport,
+        metrics=metrics,
+        recorder=recorder,
     )
+    assert order.txHash
+    LOGGER.info(f"Order sent, tx hash: {order.txHash}")
+    return order
 
 
 async def send_gasless_order(
     env: Env,
     chain: Chain,
-    account: LocalAccount,
+    account: LocalAccount | Signer,
     quote: QuoteResponse,
     headers: dict[str, Any] | None,
     auth: aiohttp.BasicAuth | None,
+    session: aiohttp.ClientSession | None = None,
+    transport: Transport | None = None,
+    tracker: OrderTracker | None = None,
+    metrics: Metrics | None = None,
+    recorder: Recorder | None = None,
 ) -> OrderStatusResponse:
-    signature: str = quote.sign_order(account=account)
-    order_request = OrderRequest(
-        quote_id=quote.quoteId,
-        signature=signature,
-    )
-    order: OrderResponse = await post_order(
-        env=env, chain=chain, order_request=order_request, headers=headers, auth=auth
+    order: OrderResponse = await submit_gasless_order(
+        env=env,
+        chain=chain,
+        account=account,
+        quote=quote,
+        headers=headers,
+        auth=auth,
+        session=session,
+        transport=transport,
+        metrics=metrics,
+        recorder=recorder,
     )
     assert order.txHash
-    LOGGER.info(f"Order sent, tx hash: {order.txHash}")
 
-    retries: int = 1
-    success: bool = False
-    while True:
-        order_status_response = await get_order_status(
+    async def fetch_status(quote_id: str) -> OrderStatusResponse:
+        return await get_order_status(
             env=env,
             chain=chain,
-            order_status_request=OrderStatusRequest(quote_id=quote.quoteId),
+            order_status_request=OrderStatusRequest(quote_id=quote_id),
             headers=headers,
             auth=auth,
+            session=session,
+            transport=transport,
         )
-        status = OrderApiStatus(order_status_response.status)
-        retries += 1
-        if status in {OrderApiStatus.Settled, OrderApiStatus.Confirmed}:
-            success = True
-            break
-        if retries > 20:
-            break
-        await asyncio.sleep(0.5)
 
+    with metric_tags(chain=chain, route=Route.PMM):
+        order_status_response = await wait_for_order_status(
+            quote.quoteId, quote.expiry, fetch_status, tracker=tracker, metrics=metrics, recorder=recorder
+        )
+    success = OrderApiStatus(order_status_response.status) in SUCCESS_STATUSES
     if success:
         LOGGER.info(f"Order completed: {chain.tx_link(order.txHash)}")
     else:
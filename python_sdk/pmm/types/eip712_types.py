@@ -9,7 +9,13 @@ from python_sdk.base_eip712_types import (
     StructuredEIP712Message,
 )
 from python_sdk.pmm.constants import PMM_SETTLEMENT_ADDRESS
-from python_sdk.pmm.types.types import QuoteToSign
+from python_sdk.pmm.types.types import (
+    AggregateOrderToSign,
+    MultiOrderToSign,
+    QuoteToSign,
+    QuoteToSignApiResponse,
+    SingleOrderToSign,
+)
 
 
 class OnchainOrderType(Enum):
@@ -26,11 +32,15 @@ class PmmDomain(EIP712Domain):
 
 
 class BaseSchema(EIP712TypeSchema):
+    @classmethod
+    def domain(cls, chain_id: int) -> PmmDomain:
+        return PmmDomain(chainId=chain_id)
+
     @classmethod
     def structured_message(cls, chain_id: int, message: QuoteToSign) -> StructuredEIP712Message:
         return StructuredEIP712Message(
             primaryType=cls.name,
-            domain=PmmDomain(chainId=chain_id),
+            domain=cls.domain(chain_id),
             types={
                 EIP712DomainSeparatorSchema.name: EIP712DomainSeparatorSchema.types,
                 cls.name: cls.types,
@@ -97,3 +107,9 @@ ORDER_TYPE_TO_SCHEMA: dict[OnchainOrderType, PmmSchemas] = {
     OnchainOrderType.MultiOrder: MultiOrderSchema,
     OnchainOrderType.AggregateOrder: AggregateOrderSchema,
 }
+
+ORDER_TYPE_TO_SIGN_MODEL: dict[OnchainOrderType, type[QuoteToSignApiResponse]] = {
+    OnchainOrderType.SingleOrder: SingleOrderToSign,
+    OnchainOrderType.MultiOrder: MultiOrderToSign,
+    OnchainOrderType.AggregateOrder: AggregateOrderToSign,
+}
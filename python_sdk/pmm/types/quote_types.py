@@ -1,19 +1,23 @@
 from __future__ import annotations
 
-from dataclasses import asdict
 from decimal import Decimal
+from typing import TYPE_CHECKING, Any
 
-from eth_account.datastructures import SignedMessage
-from eth_account.messages import SignableMessage, encode_typed_data
-from eth_account.signers.local import LocalAccount
+from pydantic import model_validator
 
 from python_sdk.common.types import quote_types
 from python_sdk.pmm.types.eip712_types import (
     ORDER_TYPE_TO_SCHEMA,
+    ORDER_TYPE_TO_SIGN_MODEL,
     OnchainOrderType,
 )
 from python_sdk.pmm.types.types import ExpiryType, QuoteToSignApiResponse
 
+if TYPE_CHECKING:
+    from eth_account.datastructures import SignedMessage
+    from eth_account.messages import SignableMessage
+    from eth_account.signers.local import LocalAccount
+
 
 class QuoteRequest(quote_types.QuoteRequest):
     include_makers: str | None = None
@@ -26,11 +30,22 @@ class QuoteResponse(quote_types.QuoteResponse):
     onchainOrderType: OnchainOrderType
     partialFillOffset: int | None = None
 
-    def sign_order(self, account: LocalAccount) -> str:
-        """Sign order for gasless execution"""
-        structured_msg = ORDER_TYPE_TO_SCHEMA[self.onchainOrderType].structured_message(
+    @model_validator(mode="before")
+    @classmethod
+    def validate_to_sign(cls, data: Any) -> Any:
+        """Validate `toSign` against the model matching `onchainOrderType` instead of trying every union member"""
+        if isinstance(data, dict) and isinstance(data.get("toSign"), dict) and "onchainOrderType" in data:
+            model = ORDER_TYPE_TO_SIGN_MODEL[OnchainOrderType(data["onchainOrderType"])]
+            return data | {"toSign": model.model_validate(data["toSign"])}
+        return data
+
+    def signable_message(self) -> SignableMessage:
+        """EIP-712 message signed for gasless execution"""
+        return ORDER_TYPE_TO_SCHEMA[self.onchainOrderType].encode_typed_data(
             chain_id=self.chainId, message=self.toSign.signable_message
         )
-        signable_msg: SignableMessage = encode_typed_data(full_message=asdict(structured_msg))
-        signed_msg: SignedMessage = account.sign_message(signable_msg)
+
+    def sign_order(self, account: LocalAccount) -> str:
+        """Sign order for gasless execution"""
+        signed_msg: SignedMessage = account.sign_message(self.signable_message())
         return signed_msg.signature.hex()
@@ -3,9 +3,9 @@ from __future__ import annotations
 from enum import Enum
 
 from eth_typing import HexStr
+from eth_utils.conversions import to_bytes
 from pydantic import BaseModel
 from typing_extensions import TypedDict
-from web3 import Web3
 
 
 class ExpiryType(Enum):
@@ -85,7 +85,7 @@ class MultiOrderToSign(BaseOrderToSign):
             taker_amounts=[int(amt) for amt in self.taker_amounts],
             maker_amounts=[int(amt) for amt in self.maker_amounts],
             receiver=self.receiver,
-            commands=Web3.to_bytes(hexstr=HexStr(self.commands)),
+            commands=to_bytes(hexstr=HexStr(self.commands)),
         )
 
 
@@ -121,7 +121,7 @@ class AggregateOrderToSign(BaseOrderToSign):
             maker_tokens=self.maker_tokens,
             taker_amounts=[[int(amt) for amt in amounts] for amounts in self.taker_amounts],
             maker_amounts=[[int(amt) for amt in amounts] for amounts in self.maker_amounts],
-            commands=Web3.to_bytes(hexstr=HexStr(self.commands)),
+            commands=to_bytes(hexstr=HexStr(self.commands)),
         )
 
 
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import functools
+from collections.abc import Collection, Sequence
+from dataclasses import replace
+from types import TracebackType
+from typing import overload
+
+import aiohttp
+from web3 import AsyncWeb3
+
+from python_sdk.common.best_quote import BestQuote, BestQuoteConfig, get_best_quote
+from python_sdk.common.client_config import ClientConfig
+from python_sdk.common.funcs import get_quote_result
+from python_sdk.common.gas_oracle import GasOracle
+from python_sdk.common.nonce_manager import shared_nonce_manager
+from python_sdk.common.receipt_waiter import ReceiptWaiter
+from python_sdk.common.resilience import ResilientTransport
+from python_sdk.common.token_registry import TokenRegistry
+from python_sdk.common.token_state import TokenStateReader, default_spenders
+from python_sdk.common.transport import AioHttpTransport, Transport
+from python_sdk.common.types.quote_types import QuoteRequest, QuoteResult
+from python_sdk.common.types.types import Chain, Env, Route
+from python_sdk.common.utils.logger import Logger
+from python_sdk.common.utils.utils import create_web3, gather_with_concurrency
+from python_sdk.jam.client import JamClient
+from python_sdk.jam.types.quote_types import QuoteRequest as JamQuoteRequest
+from python_sdk.jam.types.quote_types import QuoteResponse as JamQuoteResponse
+from python_sdk.pmm.client import PMMClient
+from python_sdk.pmm.types.quote_types import QuoteRequest as PmmQuoteRequest
+from python_sdk.pmm.types.quote_types import QuoteResponse as PmmQuoteResponse
+
+LOGGER = Logger(__name__)
+
+ChainRequest = tuple[Chain | int, PmmQuoteRequest | JamQuoteRequest]
+
+
+class BebopRouter:
+    """Multi-chain facade over the PMM and JAM clients.
+
+    All chains share one HTTP transport (and its connection pool) for the Bebop API, one nonce manager, one token
+    registry and, if given, one quote cache. Each chain gets a single RPC provider, gas oracle, receipt waiter and
+    token state reader, shared by its PMM and JAM clients. They are created on first use, so only the chains and
+    routes actually traded are set up. The per-chain resources of `config` (`web3`, `ws_rpc_url`, ...) are ignored,
+    use `rpc_urls` and `ws_rpc_urls` instead.
+    """
+
+    def __init__(
+        self,
+        env: Env,
+        private_key: str | None = None,
+        chains: Collection[Chain] | None = None,
+        rpc_urls: dict[Chain, str] | None = None,
+        ws_rpc_urls: dict[Chain, str] | None = None,
+        source_auth: str | None = None,
+        auth: aiohttp.BasicAuth | None = None,
+        config: ClientConfig | None = None,
+    ):
+        config = config or ClientConfig()
+        self.__env = env
+        self.__private_key = private_key
+        self.__chains = frozenset(chains) if chains is not None else None
+        self.__rpc_urls = rpc_urls or {}
+        self.__ws_rpc_urls = ws_rpc_urls or {}
+        self.__source_auth = source_auth
+        self.__auth = auth
+        # ------------------------------ HTTP Transport ------------------------------ #
+        # A transport passed in by the caller is used as is and not closed by the router, the one it creates is
+        self.__owns_transport = config.transport is None
+        self.__transport: Transport = config.transport or ResilientTransport(
+            AioHttpTransport(config=config.session_config, session=config.session, metrics=config.metrics),
+            config.resilience,
+        )
+        # ----------------------------- Shared Resources ----------------------------- #
+        self.metrics = config.metrics
+        self.signer = config.signer  # owned and closed by the caller
+        self.recorder = config.recorder  # owned and closed by the caller
+        self.nonce_manager = config.nonce_manager or shared_nonce_manager()
+        self.token_registry = config.token_registry or TokenRegistry()
+        self.quote_cache = config.quote_cache
+        self.__config = replace(
+            config, transport=self.__transport, nonce_manager=self.nonce_manager, token_registry=self.token_registry
+        )
+        # --------------------------- Per-chain (lazy) state -------------------------- #
+        self.__web3: dict[Chain, AsyncWeb3] = {}
+        self.__chain_configs: dict[Chain, ClientConfig] = {}
+        self.__pmm: dict[Chain, PMMClient] = {}
+        self.__jam: dict[Chain, JamClient] = {}
+
+    async def __aenter__(self) -> BebopRouter:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        clients: list[PMMClient | JamClient] = [*self.__pmm.values(), *self.__jam.values()]
+        receipt_waiters = [config.receipt_waiter for config in self.__chain_configs.values() if config.receipt_waiter]
+        self.__pmm.clear()
+        self.__jam.clear()
+        self.__chain_configs.clear()
+        for closeable in [*clients, *receipt_waiters]:
+            try:
+                await closeable.close()
+            except Exception as e:
+                LOGGER.warning(f"Failed to close {type(closeable).__name__}: {e}")
+        if self.__owns_transport:
+            await self.__transport.close()
+
+    @property
+    def active_chains(self) -> list[Chain]:
+        """Chains with at least one client created"""
+        return sorted({*self.__pmm, *self.__jam})
+
+    def chain(self, chain_id: Chain | int) -> Chain:
+        chain = Chain(chain_id)
+        if self.__chains is not None and chain not in self.__chains:
+            raise ValueError(f"Chain {chain.name} is not enabled on this router")
+        return chain
+
+    def web3(self, chain_id: Chain | int) -> AsyncWeb3:
+        """The RPC provider of a chain, shared by its PMM and JAM clients"""
+        chain = self.chain(chain_id)
+        if chain not in self.__web3:
+            self.__web3[chain] = create_web3(chain, self.__rpc_urls.get(chain), timeout=self.__config.rpc_timeout)
+        return self.__web3[chain]
+
+    def pmm(self, chain_id: Chain | int) -> PMMClient:
+        chain = self.chain(chain_id)
+        if chain not in self.__pmm:
+            self.__pmm[chain] = PMMClient(
+                self.__env,
+                chain,
+                self.__private_key,
+                source_auth=self.__source_auth,
+                auth=self.__auth,
+                config=self.__chain_config(chain),
+            )
+        return self.__pmm[chain]
+
+    def jam(self, chain_id: Chain | int) -> JamClient:
+        chain = self.chain(chain_id)
+        if chain not in self.__jam:
+            self.__jam[chain] = JamClient(
+                self.__env,
+                chain,
+                self.__private_key,
+                source_auth=self.__source_auth,
+                auth=self.__auth,
+                config=self.__chain_config(chain),
+            )
+        return self.__jam[chain]
+
+    def client(self, chain_id: Chain | int, route: Route) -> PMMClient | JamClient:
+        return self.jam(chain_id) if route == Route.JAM else self.pmm(chain_id)
+
+    @overload
+    async def get_quote(
+        self, chain_id: Chain | int, quote_request: PmmQuoteRequest, cached: bool = True
+    ) -> PmmQuoteResponse: ...
+
+    @overload
+    async def get_quote(
+        self, chain_id: Chain | int, quote_request: JamQuoteRequest, cached: bool = True
+    ) -> JamQuoteResponse: ...
+
+    async def get_quote(
+        self, chain_id: Chain | int, quote_request: PmmQuoteRequest | JamQuoteRequest, cached: bool = True
+    ) -> PmmQuoteResponse | JamQuoteResponse:
+        """Request a quote on `chain_id`, routed to PMM or JAM by the type of `quote_request`"""
+        if isinstance(quote_request, JamQuoteRequest):
+            return await self.jam(chain_id).get_quote(quote_request, cached=cached)
+        return await self.pmm(chain_id).get_quote(quote_request, cached=cached)
+
+    async def get_quotes(
+        self, quote_requests: Sequence[ChainRequest], max_concurrency: int = 10, timeout: float | None = None
+    ) -> list[QuoteResult[PmmQuoteRequest | JamQuoteRequest, PmmQuoteResponse | JamQuoteResponse]]:
+        """Request quotes across chains and routes concurrently, results are returned in request order"""
+        return await gather_with_concurrency(
+            max_concurrency,
+            *(
+                get_quote_result(functools.partial(self.get_quote, chain_id), index, request, timeout)
+                for index, (chain_id, request) in enumerate(quote_requests)
+            ),
+        )
+
+    async def get_best_quote(
+        self, chain_id: Chain | int, quote_request: QuoteRequest, config: BestQuoteConfig | None = None
+    ) -> BestQuote:
+        """Race PMM and JAM for `quote_request` on `chain_id`, see `get_best_quote`. Quotes are never cached."""
+        chain = self.chain(chain_id)
+
+        async def get_pmm_quote(request: PmmQuoteRequest) -> PmmQuoteResponse:
+            return await self.pmm(chain).get_quote(request, cached=False)
+
+        async def get_jam_quote(request: JamQuoteRequest) -> JamQuoteResponse:
+            return await self.jam(chain).get_quote(request, cached=False)
+
+        return await get_best_quote(get_pmm_quote, get_jam_quote, quote_request, config)
+
+    def __chain_config(self, chain: Chain) -> ClientConfig:
+        """The router-wide config, with the RPC resources of `chain` shared by its PMM and JAM clients"""
+        if chain not in self.__chain_configs:
+            web3 = self.web3(chain)
+            ws_rpc_url = self.__ws_rpc_urls.get(chain)
+            self.__chain_configs[chain] = replace(
+                self.__config,
+                ws_rpc_url=ws_rpc_url,
+                web3=web3,
+                gas_oracle=GasOracle(chain=chain, web3=web3, config=self.__config.gas_config),
+                receipt_waiter=ReceiptWaiter(
+                    chain=chain, web3=web3, ws_rpc_url=ws_rpc_url, config=self.__config.receipt_config
+                ),
+                token_state=TokenStateReader(
+                    chain=chain, web3=web3, spenders=[*default_spenders(chain), chain.permit2_address]
+                ),
+            )
+        return self.__chain_configs[chain]
@@ -0,0 +1,162 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from python_sdk.common.best_quote import BestQuoteConfig, get_best_quote, is_better, quote_score, route_request
+from python_sdk.common.exceptions import BebopAPIError, NoQuoteError
+from python_sdk.common.types.quote_types import QuoteRequest
+from python_sdk.common.types.types import Route
+from python_sdk.jam.types.quote_types import QuoteRequest as JamQuoteRequest
+from python_sdk.jam.types.quote_types import QuoteResponse as JamQuoteResponse
+from python_sdk.mock.payloads import USDC, USDT, WETH, build_jam_quote, build_pmm_quote
+from python_sdk.pmm.types.quote_types import QuoteRequest as PmmQuoteRequest
+from python_sdk.pmm.types.quote_types import QuoteResponse as PmmQuoteResponse
+
+REQUEST = QuoteRequest(sell_tokens=[USDT], buy_tokens=[WETH], sell_amounts=[1_000_000_000], source_auth="secret")
+
+
+def _pmm(sell: dict[str, int], buy: dict[str, int], priced: bool = True, gasless: bool = True) -> PmmQuoteResponse:
+    return PmmQuoteResponse.model_validate(_priced(build_pmm_quote(sell, buy, gasless=gasless), priced))
+
+
+def _jam(sell: dict[str, int], buy: dict[str, int], priced: bool = True) -> JamQuoteResponse:
+    return JamQuoteResponse.model_validate(_priced(build_jam_quote(sell, buy), priced))
+
+
+def _priced(quote: dict[str, Any], priced: bool) -> dict[str, Any]:
+    if not priced:
+        for token in [*quote["sellTokens"].values(), *quote["buyTokens"].values()]:
+            token["priceUsd"] = None
+    return quote
+
+
+class FakeRoute:
+    """Quote getter answering `quote` after `delay` seconds, or raising `error`"""
+
+    def __init__(self, quote: Any = None, delay: float = 0.0, error: Exception | None = None) -> None:
+        self.quote = quote
+        self.delay = delay
+        self.error = error
+        self.requests: list[QuoteRequest] = []
+        self.cancelled = False
+
+    async def __call__(self, request: Any) -> Any:
+        self.requests.append(request)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error is not None:
+            raise self.error
+        return self.quote
+
+
+def test_quote_score() -> None:
+    # 1000 USDT for 0.4 WETH, at $0.9998 and $2650.12
+    quote = _pmm({USDT: 1_000_000_000}, {WETH: 4 * 10**17})
+    assert quote_score(quote) == pytest.approx(0.4 * 2650.12 / (1000 * 0.9998))
+    # Gas is only paid by the taker on self-execution
+    self_executed = _pmm({USDT: 1_000_000_000}, {WETH: 4 * 10**17}, gasless=False)
+    assert quote_score(self_executed) == pytest.approx((0.4 * 2650.12 - 0.0038) / (1000 * 0.9998))
+    assert quote_score(_pmm({USDT: 1_000_000_000}, {WETH: 4 * 10**17}, priced=False)) is None
+
+
+def test_score_needs_a_price_for_every_token() -> None:
+    quote = build_pmm_quote({USDT: 1_000_000_000}, {WETH: 4 * 10**17, USDC: 10_000_000})
+    quote["buyTokens"][USDC]["priceUsd"] = None
+    assert quote_score(PmmQuoteResponse.model_validate(quote)) is None
+
+
+def test_priced_quotes_are_ranked_by_score() -> None:
+    pmm = _pmm({USDT: 1_000_000_000}, {WETH: 4 * 10**17})
+    jam = _jam({USDT: 1_000_000_000}, {WETH: 401 * 10**15})
+    assert is_better(jam, pmm) and not is_better(pmm, jam)
+    assert not is_better(pmm, pmm)
+
+
+def test_mixed_decimals_are_not_summed() -> None:
+    # 0.1 WETH less but 2900 USDC more: summing the raw amounts would favour `weth_heavy`, by 18 decimals to 6
+    weth_heavy = {WETH: 10**18, USDC: 100_000_000}
+    usdc_heavy = {WETH: 9 * 10**17, USDC: 3_000_000_000}
+    assert is_better(_jam({USDT: 10**10}, usdc_heavy), _pmm({USDT: 10**10}, weth_heavy))
+    assert not is_better(_pmm({USDT: 10**10}, weth_heavy), _jam({USDT: 10**10}, usdc_heavy))
+    # Without prices neither quote gives more of every token, so they are not ranked
+    assert not is_better(_jam({USDT: 10**10}, usdc_heavy, priced=False), _pmm({USDT: 10**10}, weth_heavy, False))
+    assert not is_better(_pmm({USDT: 10**10}, weth_heavy, False), _jam({USDT: 10**10}, usdc_heavy, priced=False))
+
+
+def test_unpriced_quotes_are_compared_token_by_token() -> None:
+    pmm = _pmm({USDT: 1_000_000_000}, {WETH: 4 * 10**17, USDC: 10_000_000}, priced=False)
+    more_weth = _jam({USDT: 1_000_000_000}, {WETH: 41 * 10**16, USDC: 10_000_000}, priced=False)
+    assert is_better(more_weth, pmm) and not is_better(pmm, more_weth)
+    # Paying less for the same amounts
+    cheaper = _jam({USDT: 999_000_000}, {WETH: 4 * 10**17, USDC: 10_000_000}, priced=False)
+    assert is_better(cheaper, pmm) and not is_better(pmm, cheaper)
+    # Addresses are compared case-insensitively
+    lower = _jam({USDT.lower(): 1_000_000_000}, {WETH.lower(): 41 * 10**16, USDC.lower(): 10_000_000}, False)
+    assert is_better(lower, pmm)
+    assert not is_better(pmm, pmm)
+
+
+def test_unpriced_quotes_for_other_tokens_are_not_ranked() -> None:
+    weth = _pmm({USDT: 1_000_000_000}, {WETH: 4 * 10**17}, priced=False)
+    usdc = _jam({USDT: 1_000_000_000}, {USDC: 10**12}, priced=False)
+    assert not is_better(usdc, weth) and not is_better(weth, usdc)
+    # One priced quote is not enough
+    priced_usdc = _jam({USDT: 1_000_000_000}, {USDC: 10**12})
+    assert not is_better(priced_usdc, weth) and not is_better(weth, priced_usdc)
+
+
+def test_route_request_keeps_common_fields_and_source_auth() -> None:
+    pmm, jam = route_request(REQUEST, Route.PMM), route_request(REQUEST, Route.JAM)
+    assert isinstance(pmm, PmmQuoteRequest) and isinstance(jam, JamQuoteRequest)
+    for routed in (pmm, jam):
+        assert routed.sell_amounts == REQUEST.sell_amounts and routed.source_auth == "secret"
+    assert route_request(REQUEST.model_copy(update={"source_auth": None}), Route.JAM).source_auth is None
+    # Route specific fields are not carried over, requests already for the route are kept as is
+    jam_request = JamQuoteRequest(sell_tokens=[USDT], buy_tokens=[WETH], sell_amounts=[1], fee=10)
+    assert route_request(jam_request, Route.JAM) is jam_request
+    assert route_request(jam_request, Route.PMM).to_params() == route_request(REQUEST, Route.PMM).to_params() | {
+        "sell_amounts": "1"
+    }
+
+
+@pytest.mark.asyncio
+async def test_best_quote_wins_with_the_other_attached() -> None:
+    pmm_quote = _pmm({USDT: 1_000_000_000}, {WETH: 4 * 10**17})
+    jam_quote = _jam({USDT: 1_000_000_000}, {WETH: 401 * 10**15})
+    pmm, jam = FakeRoute(pmm_quote, delay=0.01), FakeRoute(jam_quote)
+    best = await get_best_quote(pmm, jam, REQUEST)
+    assert (best.route, best.quote, best.runner_up, best.errors) == (Route.JAM, jam_quote, pmm_quote, {})
+    assert best.score == quote_score(jam_quote)
+    assert isinstance(pmm.requests[0], PmmQuoteRequest) and isinstance(jam.requests[0], JamQuoteRequest)
+    assert pmm.requests[0].source_auth == jam.requests[0].source_auth == "secret"
+
+
+@pytest.mark.asyncio
+async def test_failed_and_late_routes_are_left_out() -> None:
+    pmm_quote = _pmm({USDT: 1_000_000_000}, {WETH: 4 * 10**17})
+    jam = FakeRoute(delay=1.0)
+    best = await get_best_quote(FakeRoute(pmm_quote), jam, REQUEST, BestQuoteConfig(deadline=0.02))
+    assert (best.route, best.quote, best.runner_up) == (Route.PMM, pmm_quote, None)
+    assert isinstance(best.errors[Route.JAM], TimeoutError) and jam.cancelled
+
+    error = BebopAPIError({"errorCode": 102, "message": "No quote"})
+    jam_quote = _jam({USDT: 1_000_000_000}, {WETH: 4 * 10**17})
+    best = await get_best_quote(FakeRoute(error=error), FakeRoute(jam_quote), REQUEST)
+    assert (best.route, best.quote, best.errors) == (Route.JAM, jam_quote, {Route.PMM: error})
+
+    with pytest.raises(NoQuoteError, match="PMM: .*No quote.*JAM: "):
+        await get_best_quote(FakeRoute(error=error), FakeRoute(delay=1.0), REQUEST, BestQuoteConfig(deadline=0.02))
+
+
+@pytest.mark.asyncio
+async def test_good_enough_quote_cancels_the_slower_route() -> None:
+    # Worth ~1.06 per USD sold
+    pmm_quote = _pmm({USDT: 1_000_000_000}, {WETH: 4 * 10**17})
+    jam = FakeRoute(_jam({USDT: 1_000_000_000}, {WETH: 10**18}), delay=1.0)
+    best = await get_best_quote(FakeRoute(pmm_quote), jam, REQUEST, BestQuoteConfig(good_enough=1.0))
+    assert (best.route, best.quote, best.runner_up, best.errors) == (Route.PMM, pmm_quote, None, {})
+    assert jam.cancelled
@@ -71,53 +71,63 @@ def pytest_addoption(parser: Parser) -> None:
     )
 
 
-@pytest.fixture(scope="session", autouse=True)
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """The integration tests need a funded key and the network, they only run when `--chain-id` is given"""
+    if config.option.CHAINID is not None:
+        return
+    skip = pytest.mark.skip(reason="integration test, run it with --chain-id (see the Makefile)")
+    for item in items:
+        if item.path.name.endswith("_integration_test.py"):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
 def chain(request: pytest.FixtureRequest) -> Chain:
     chain_value = request.config.option.CHAINID
     return Chain(chain_value)
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def solver(request: pytest.FixtureRequest) -> str:
     solver: str = request.config.option.SOLVER
     return solver
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def maker(request: pytest.FixtureRequest) -> str:
     maker: str = request.config.option.MAKER
     return maker
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def gasless(request: pytest.FixtureRequest) -> bool:
     gasless: str = request.config.option.GASLESS
     return gasless.lower() == "true"
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def rpc(request: pytest.FixtureRequest) -> str:
     rpc_url: str = request.config.option.RPC
     return rpc_url
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def env(request: pytest.FixtureRequest) -> Env:
     env: str = request.config.option.ENV
     return Env(env.upper())
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def jam(chain: Chain, rpc: str, env: Env) -> JamClient:
     return JamClient(chain=chain, private_key=PRIVATE_KEY, rpc_url=rpc if rpc else chain.public_rpc, env=env, auth=AUTH)
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def pmm(chain: Chain, rpc: str, env: Env) -> PMMClient:
     return PMMClient(chain=chain, private_key=PRIVATE_KEY, rpc_url=rpc if rpc else chain.public_rpc, env=env, auth=AUTH)
 
 
-@pytest.fixture(scope="session", autouse=True)
+@pytest.fixture(scope="session")
 def account() -> LocalAccount:
     account: LocalAccount = Account.from_key(PRIVATE_KEY)
     return account
@@ -0,0 +1,90 @@
+from dataclasses import asdict
+from typing import Any
+
+import pytest
+from eth_abi.exceptions import EncodingError
+from eth_account.messages import SignableMessage, encode_typed_data
+from hexbytes import HexBytes
+
+from python_sdk.base_eip712_types import EIP712TypeSchema
+from python_sdk.jam.types.eip712_types import JamOrderSchema
+from python_sdk.jam.types.quote_types import QuoteResponse as JamQuoteResponse
+from python_sdk.mock.payloads import CHAIN, jam_quote, pmm_aggregate_quote, pmm_multi_quote, pmm_single_quote
+from python_sdk.pmm.types.eip712_types import ORDER_TYPE_TO_SCHEMA
+from python_sdk.pmm.types.quote_types import QuoteResponse as PmmQuoteResponse
+
+TAKER = "0x5Aeda56215b167893e80B4fE645BA6d5Bab767DE"
+BAD_ADDRESSES: dict[str, Any] = {
+    "no prefix": TAKER[2:] + "00",
+    "short": TAKER[:-2],
+    "long": TAKER + "00",
+    "not hex": TAKER[:-1] + "g",
+    "not a string": 42,
+}
+
+
+def _orders() -> dict[str, tuple[type[EIP712TypeSchema], dict[str, Any]]]:
+    pmm = [
+        PmmQuoteResponse.model_validate(quote()) for quote in (pmm_single_quote, pmm_multi_quote, pmm_aggregate_quote)
+    ]
+    orders: dict[str, tuple[type[EIP712TypeSchema], dict[str, Any]]] = {
+        quote.onchainOrderType.value: (
+            ORDER_TYPE_TO_SCHEMA[quote.onchainOrderType],
+            dict(quote.toSign.signable_message),
+        )
+        for quote in pmm
+    }
+    jam = JamQuoteResponse.model_validate(jam_quote())
+    orders["JamOrder"] = (JamOrderSchema, dict(jam.toSign.signable_message))
+    return orders
+
+
+def _reference(schema: type[EIP712TypeSchema], message: dict[str, Any]) -> SignableMessage:
+    """`eth_account`'s own encoding, which the cached schemas must match"""
+    return encode_typed_data(full_message=asdict(schema.structured_message(CHAIN.id, message)))
+
+
+def _taker_field(message: dict[str, Any]) -> str:
+    return "taker" if "taker" in message else "taker_address"
+
+
+@pytest.mark.parametrize("order_type", list(_orders()))
+def test_cached_encoding_matches_eth_account(order_type: str) -> None:
+    schema, message = _orders()[order_type]
+    assert schema.encode_typed_data(CHAIN.id, message) == _reference(schema, message)
+    # Lower case and checksummed addresses are the same address
+    message[_taker_field(message)] = TAKER.lower()
+    assert schema.encode_typed_data(CHAIN.id, message) == _reference(schema, message)
+
+
+@pytest.mark.parametrize("order_type", list(_orders()))
+@pytest.mark.parametrize("case", list(BAD_ADDRESSES))
+def test_malformed_taker_is_rejected(order_type: str, case: str) -> None:
+    schema, message = _orders()[order_type]
+    message[_taker_field(message)] = BAD_ADDRESSES[case]
+    with pytest.raises(Exception) as reference_error:
+        _reference(schema, message)
+    with pytest.raises(type(reference_error.value)):
+        schema.encode_typed_data(CHAIN.id, message)
+
+
+def test_malformed_address_in_array_is_rejected() -> None:
+    schema, message = _orders()["MultiOrder"]
+    message["maker_tokens"] = [*message["maker_tokens"][:-1], BAD_ADDRESSES["short"]]
+    with pytest.raises(EncodingError):
+        _reference(schema, message)
+    with pytest.raises(EncodingError):
+        schema.encode_typed_data(CHAIN.id, message)
+
+
+@pytest.mark.parametrize("hooks_hash", ["0x" + "11" * 33, b"\x11" * 33, "0x" + "11" * 31, "0x1234"])
+def test_fixed_bytes_length_is_checked(hooks_hash: str | bytes) -> None:
+    schema, message = _orders()["JamOrder"]
+    message["hooksHash"] = hooks_hash
+    if len(HexBytes(hooks_hash)) > 32:
+        with pytest.raises(EncodingError):
+            _reference(schema, message)
+        with pytest.raises(EncodingError):
+            schema.encode_typed_data(CHAIN.id, message)
+    else:
+        assert schema.encode_typed_data(CHAIN.id, message) == _reference(schema, message)
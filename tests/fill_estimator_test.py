@@ -0,0 +1,35 @@
+import math
+
+import orjson
+import pytest
+
+from python_sdk.common.fill_estimator import FillEstimator
+from python_sdk.common.price_book import PriceBook
+from python_sdk.common.token_registry import TokenRegistry
+from python_sdk.mock.payloads import CHAIN, USDC, WBTC, WETH, pricing_message
+
+pytest.importorskip("numpy")
+
+
+def _estimator() -> tuple[PriceBook, FillEstimator]:
+    book = PriceBook()
+    book.update(CHAIN, orjson.dumps(pricing_message(CHAIN, levels=20)))
+    registry = TokenRegistry()
+    for token, decimals in ((WETH, 18), (USDC, 6), (WBTC, 8)):
+        registry.add(CHAIN.id, token, decimals=decimals)
+    return book, FillEstimator(book, registry)
+
+
+def test_fill_estimates_match_level_walk() -> None:
+    book, estimator = _estimator()
+    prices = book.get(CHAIN, WETH, USDC)
+    assert prices is not None
+    for size in (0.5, 3.0, 20.0):
+        sold = estimator.estimate(CHAIN, WETH, USDC, [int(size * 10**18)]).raw()[0]
+        bought = estimator.estimate(CHAIN, USDC, WETH, [int(size * 10**18)], exact_in=False).raw()[0]
+        assert sold == math.floor(prices.fill_price(size, buy=False) * size * 10**6)  # type: ignore[operator]
+        assert bought == pytest.approx(prices.fill_price(size, buy=True) * size * 10**6, abs=1)  # type: ignore[operator]
+    # Selling the quote token for what the base costs buys back the same base amount
+    cost = estimator.estimate(CHAIN, USDC, WETH, [10**18], exact_in=False).raw()[0]
+    assert estimator.estimate(CHAIN, USDC, WETH, [cost]).raw()[0] == pytest.approx(10**18, rel=1e-9)
+    assert estimator.estimate(CHAIN, WETH, USDC, [10**24]).raw() == [None]
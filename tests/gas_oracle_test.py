@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from python_sdk.common.gas_oracle import GasConfig, GasOracle
+from python_sdk.common.types.types import Chain
+from python_sdk.mock.rpc import MockRpcNode
+
+BASE_FEE = 10_000_000
+PRIORITY_FEE = 1_000_000
+GAS_PRICE = 20_000_000
+
+
+def _oracle(node: MockRpcNode, chain: Chain, config: GasConfig | None = None) -> GasOracle:
+    return GasOracle(chain, AsyncWeb3(AsyncHTTPProvider(node.url)), config)
+
+
+@pytest.mark.asyncio
+async def test_eip1559_fees_from_fee_history() -> None:
+    async with MockRpcNode(base_fee=BASE_FEE, priority_fee=PRIORITY_FEE) as node:
+        fees = await _oracle(node, Chain.ethereum).fees()
+        assert fees.eip1559 and fees.block_number == node.block_number
+        assert fees.max_priority_fee_per_gas == PRIORITY_FEE
+        assert fees.max_fee_per_gas == 2 * BASE_FEE + PRIORITY_FEE
+        assert fees.tx_params() == {"maxFeePerGas": 2 * BASE_FEE + PRIORITY_FEE, "maxPriorityFeePerGas": PRIORITY_FEE}
+        assert node.calls == {"eth_feeHistory": 1}
+
+
+@pytest.mark.asyncio
+async def test_fee_multipliers() -> None:
+    config = GasConfig(base_fee_multiplier=1.5, priority_fee_multiplier=3.0, gas_limit_multiplier=1.2)
+    async with MockRpcNode(base_fee=BASE_FEE, priority_fee=PRIORITY_FEE) as node:
+        oracle = _oracle(node, Chain.ethereum, config)
+        assert await oracle.tx_params() == {
+            "maxFeePerGas": int(1.5 * BASE_FEE) + 3 * PRIORITY_FEE,
+            "maxPriorityFeePerGas": 3 * PRIORITY_FEE,
+        }
+        assert oracle.gas_limit(100_000) == 120_000
+
+
+@pytest.mark.asyncio
+async def test_chain_specific_priority_fees() -> None:
+    async with MockRpcNode(base_fee=BASE_FEE, priority_fee=0) as node:
+        # Arbitrum ignores priority fees, OP-stack chains get a floor
+        arbitrum = await _oracle(node, Chain.arbitrum).fees()
+        assert (arbitrum.max_fee_per_gas, arbitrum.max_priority_fee_per_gas) == (2 * BASE_FEE, 0)
+        optimism = await _oracle(node, Chain.optimism).fees()
+        assert (optimism.max_fee_per_gas, optimism.max_priority_fee_per_gas) == (2 * BASE_FEE + 1_000_000, 1_000_000)
+        ethereum = await _oracle(node, Chain.ethereum, GasConfig(min_priority_fee=5)).fees()
+        assert ethereum.max_priority_fee_per_gas == 5
+        node.priority_fee = PRIORITY_FEE
+        arbitrum = await _oracle(node, Chain.arbitrum).fees()
+        assert arbitrum.max_priority_fee_per_gas == 0
+
+
+@pytest.mark.asyncio
+async def test_legacy_gas_price_without_base_fee() -> None:
+    async with MockRpcNode(base_fee=BASE_FEE, gas_price=GAS_PRICE) as node:
+        node.base_fee = None
+        oracle = _oracle(node, Chain.bsc, GasConfig(max_age=0))
+        fees = await oracle.fees()
+        assert not fees.eip1559 and fees.block_number is None
+        assert fees.tx_params() == {"gasPrice": int(GAS_PRICE * 1.5)}
+        # The chain is not asked for a base fee again
+        await oracle.fees()
+        assert node.calls == {"eth_feeHistory": 1, "eth_gasPrice": 2}
+
+
+@pytest.mark.asyncio
+async def test_legacy_gas_price_when_configured() -> None:
+    async with MockRpcNode(gas_price=GAS_PRICE) as node:
+        config = GasConfig(eip1559=False, legacy_gas_price_multiplier=1.0)
+        assert await _oracle(node, Chain.ethereum, config).tx_params() == {"gasPrice": GAS_PRICE}
+        assert node.calls == {"eth_gasPrice": 1}
+
+
+@pytest.mark.asyncio
+async def test_fees_are_cached_for_max_age() -> None:
+    async with MockRpcNode(base_fee=BASE_FEE, priority_fee=PRIORITY_FEE) as node:
+        oracle = _oracle(node, Chain.ethereum, GasConfig(max_age=0.1))
+        fees = await asyncio.gather(*(oracle.fees() for _ in range(10)))
+        assert all(fee is fees[0] for fee in fees)
+        assert await oracle.fees() is fees[0]
+        assert node.calls["eth_feeHistory"] == 1
+        node.base_fee = 2 * BASE_FEE
+        await asyncio.sleep(0.1)
+        refreshed = await oracle.fees()
+        assert refreshed.max_fee_per_gas == 4 * BASE_FEE + PRIORITY_FEE
+        assert node.calls["eth_feeHistory"] == 2
+
+
+def test_max_age_defaults_to_the_block_time() -> None:
+    web3 = AsyncWeb3(AsyncHTTPProvider("http://127.0.0.1:1"))
+    assert GasOracle(Chain.ethereum, web3).max_age == Chain.ethereum.block_time
+    assert GasOracle(Chain.arbitrum, web3, GasConfig(max_age=3)).max_age == 3
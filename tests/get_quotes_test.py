@@ -0,0 +1,118 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from python_sdk.common.client_config import ClientConfig
+from python_sdk.common.exceptions import BebopAPIError
+from python_sdk.common.funcs import get_quotes, iter_quotes
+from python_sdk.common.transport import AioHttpTransport
+from python_sdk.common.types.types import Env
+from python_sdk.mock.payloads import CHAIN, USDC, USDT, WETH, pmm_single_quote
+from python_sdk.mock.server import MockBebopServer
+from python_sdk.pmm.client import PMMClient
+from python_sdk.pmm.types.quote_types import QuoteRequest, QuoteResponse
+
+QUOTE = QuoteResponse.model_validate(pmm_single_quote())
+
+
+class FakeQuotes:
+    """`get_quote` answering after `delays[amount]` seconds, failing for the `failing` sell amounts"""
+
+    def __init__(self, delays: dict[int, float], failing: frozenset[int] = frozenset()) -> None:
+        self.delays = delays
+        self.failing = failing
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+
+    async def get_quote(self, request: QuoteRequest) -> QuoteResponse:
+        amount = request.sell_amounts[0]
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays[amount])
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+        if amount in self.failing:
+            raise BebopAPIError({"errorCode": 102, "message": f"No quote for {amount}"})
+        return QUOTE
+
+
+def _requests(amounts: list[int]) -> list[QuoteRequest]:
+    return [QuoteRequest(sell_tokens=[USDT], buy_tokens=[WETH], sell_amounts=[amount]) for amount in amounts]
+
+
+@pytest.mark.asyncio
+async def test_get_quotes_keeps_request_order_and_failures() -> None:
+    # The first requests complete last
+    quotes = FakeQuotes({1: 0.03, 2: 0.02, 3: 0.01, 4: 0.0}, failing=frozenset({2}))
+    requests = _requests([1, 2, 3, 4])
+    results = await get_quotes(quotes.get_quote, requests)
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert [result.request for result in results] == requests
+    assert [result.ok for result in results] == [True, False, True, True]
+    assert isinstance(results[1].error, BebopAPIError) and results[1].quote is None
+    assert results[0].quote is QUOTE and results[0].error is None
+
+
+@pytest.mark.asyncio
+async def test_get_quotes_bounds_concurrency() -> None:
+    quotes = FakeQuotes({amount: 0.005 for amount in range(1, 21)})
+    results = await get_quotes(quotes.get_quote, _requests(list(range(1, 21))), max_concurrency=3)
+    assert all(result.ok for result in results)
+    assert quotes.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_get_quotes_times_out_slow_requests() -> None:
+    quotes = FakeQuotes({1: 0.0, 2: 1.0})
+    results = await get_quotes(quotes.get_quote, _requests([1, 2]), timeout=0.05)
+    assert results[0].ok
+    assert isinstance(results[1].error, TimeoutError)
+    assert quotes.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_iter_quotes_yields_in_completion_order() -> None:
+    quotes = FakeQuotes({1: 0.03, 2: 0.0, 3: 0.015}, failing=frozenset({3}))
+    results = [result async for result in iter_quotes(quotes.get_quote, _requests([1, 2, 3]))]
+    assert [result.index for result in results] == [1, 2, 0]
+    assert [result.ok for result in results] == [True, False, True]
+
+
+@pytest.mark.asyncio
+async def test_iter_quotes_cancels_pending_requests_when_closed() -> None:
+    quotes = FakeQuotes({1: 0.0, 2: 1.0, 3: 1.0})
+    results = iter_quotes(quotes.get_quote, _requests([1, 2, 3]))
+    assert isinstance(results, AsyncGenerator)
+    first = await anext(results)
+    assert first.index == 0
+    await results.aclose()
+    await asyncio.sleep(0)
+    assert quotes.cancelled == 2
+    assert quotes.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_client_get_quotes_against_mock_server() -> None:
+    requests = [
+        QuoteRequest(sell_tokens=[USDT], buy_tokens=[WETH], sell_amounts=[1_000_000]),
+        # One amount for two sell tokens, rejected by the server
+        QuoteRequest(sell_tokens=[USDT, USDC], buy_tokens=[WETH], sell_amounts=[1_000_000]),
+        QuoteRequest(sell_tokens=[USDC], buy_tokens=[WETH], sell_amounts=[2_000_000]),
+    ]
+    async with MockBebopServer() as server:
+        transport = AioHttpTransport(base_url=server.url)
+        async with PMMClient(Env.PROD, CHAIN, private_key=None, config=ClientConfig(transport=transport)) as client:
+            results = await client.get_quotes(requests, max_concurrency=2)
+        await transport.close()
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].error, BebopAPIError) and results[1].error.code == 102
+    for result, request in zip(results, requests, strict=True):
+        if result.quote is not None:
+            assert list(result.quote.sellTokens) == request.sell_tokens
+            assert int(result.quote.sellTokens[request.sell_tokens[0]].amount) == request.sell_amounts[0]
@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+import pytest
+
+CLIENTS = ["python_sdk.pmm.client", "python_sdk.jam.client"]
+QUOTE_TYPES = ["python_sdk.pmm.types.quote_types", "python_sdk.jam.types.quote_types"]
+# Loaded on first access of the constants that need them
+LAZY_MODULES = ["python_sdk.common.abis", "python_sdk.jam.abis"]
+# Only needed to sign, parsing and analysing quotes does not import them
+SIGNING_MODULES = ["web3", "eth_account"]
+
+
+def loaded_modules(modules: list[str]) -> set[str]:
+    """Modules loaded by importing `modules` in a fresh interpreter"""
+    code = f"import sys, {', '.join(modules)}; print('\\n'.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize("modules", [CLIENTS, QUOTE_TYPES])
+def test_abis_are_not_loaded_on_import(modules: list[str]) -> None:
+    loaded = loaded_modules(modules)
+    assert set(modules) <= loaded
+    assert not loaded & set(LAZY_MODULES), "ABIs must only be loaded on first access"
+
+
+def test_quote_types_do_not_import_the_signing_dependencies() -> None:
+    assert not loaded_modules(QUOTE_TYPES) & set(SIGNING_MODULES), "web3 and eth_account must only be imported to sign"
+
+
+def test_lazy_constants() -> None:
+    from python_sdk.common import constants
+    from python_sdk.jam import constants as jam_constants
+
+    assert constants.ERC20_ABI[0]["name"] == "name"
+    assert {item["name"] for item in constants.MULTICALL3_ABI} == {"aggregate3", "getEthBalance"}
+    assert jam_constants.HASH_HOOKS_ABI["name"] == "hashHooks"
+    assert "ERC20_ABI" in vars(constants)
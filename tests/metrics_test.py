@@ -0,0 +1,197 @@
+import asyncio
+import sys
+from typing import Any
+
+import pytest
+
+from python_sdk.common.client_config import ClientConfig
+from python_sdk.common.metrics import (
+    CallbackSink,
+    MetricEvent,
+    Metrics,
+    MetricTags,
+    OpenTelemetrySink,
+    Phase,
+    PrometheusSink,
+    current_tags,
+    metric_tags,
+    timed,
+)
+from python_sdk.common.order_tracker import TrackerConfig
+from python_sdk.common.transport import AioHttpTransport
+from python_sdk.common.types.types import Chain, Env, Route
+from python_sdk.mock.payloads import CHAIN, USDT, WETH
+from python_sdk.mock.server import MockBebopServer, MockServerConfig
+from python_sdk.pmm.client import PMMClient
+from python_sdk.pmm.types.quote_types import QuoteRequest
+
+PRIVATE_KEY = "0x" + "11" * 32
+
+
+class Events:
+    """Sink collecting the recorded events"""
+
+    def __init__(self) -> None:
+        self.events: list[MetricEvent] = []
+        self.sink = CallbackSink(self.events.append)
+
+    def phases(self) -> list[Phase]:
+        return [event.phase for event in self.events]
+
+    def of(self, phase: Phase) -> list[MetricEvent]:
+        return [event for event in self.events if event.phase == phase]
+
+
+def test_measure_records_the_block() -> None:
+    events = Events()
+    metrics = Metrics(events.sink)
+    with metrics.measure(Phase.SIGN, route=Route.PMM) as tags:
+        tags["quote_id"] = "abc"
+    with metrics.measure(Phase.SETTLEMENT) as tags:
+        tags["success"] = False
+    (sign, settlement) = events.events
+    assert (sign.phase, sign.success, sign.tags) == (Phase.SIGN, True, MetricTags(route=Route.PMM, quote_id="abc"))
+    assert sign.duration >= 0
+    assert (settlement.phase, settlement.success) == (Phase.SETTLEMENT, False)
+
+
+def test_failed_block_is_recorded_and_its_error_propagates() -> None:
+    events = Events()
+    metrics = Metrics(events.sink)
+    with pytest.raises(ValueError, match="bad quote"), metrics.measure(Phase.VALIDATE):
+        raise ValueError("bad quote")
+    # `success` set before the block failed neither wins nor hides the error
+    with pytest.raises(ValueError, match="reverted"), metrics.measure(Phase.SETTLEMENT) as tags:
+        tags["success"] = True
+        raise ValueError("reverted")
+    assert [event.success for event in events.events] == [False, False]
+
+
+def test_sink_errors_do_not_propagate() -> None:
+    def failing(event: MetricEvent) -> None:
+        raise RuntimeError("sink down")
+
+    events = Events()
+    metrics = Metrics(CallbackSink(failing))
+    metrics.add_sink(events.sink)
+    metrics.record(Phase.DECODE, 0.001)
+    assert events.phases() == [Phase.DECODE] and len(metrics.sinks) == 2
+
+
+def test_timed_without_metrics_is_a_no_op() -> None:
+    with timed(None, Phase.SIGN, quote_id="abc") as tags:
+        tags["success"] = False
+    assert tags == {"quote_id": "abc", "success": False}
+
+
+@pytest.mark.asyncio
+async def test_metric_tags_propagate_to_nested_blocks_and_tasks() -> None:
+    events = Events()
+    metrics = Metrics(events.sink)
+
+    async def child() -> None:
+        with metric_tags(quote_id="abc"):
+            metrics.record(Phase.ORDER_POST, 0.001)
+
+    with metric_tags(chain=CHAIN, route=Route.JAM):
+        with metric_tags(route=Route.PMM):
+            assert current_tags() == MetricTags(chain=CHAIN, route=Route.PMM)
+        await asyncio.create_task(child())
+        # Tags passed to `record` override the current ones, `None` does not
+        metrics.record(Phase.SIGN, 0.001, chain=Chain.ethereum, quote_id=None)
+    assert current_tags() == MetricTags()
+    assert [event.tags for event in events.events] == [
+        MetricTags(chain=CHAIN, route=Route.JAM, quote_id="abc"),
+        MetricTags(chain=Chain.ethereum, route=Route.JAM),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_client_records_every_phase_of_a_gasless_order() -> None:
+    events = Events()
+    metrics = Metrics(events.sink)
+    async with MockBebopServer(MockServerConfig(settle_after=0.01)) as server:
+        transport = AioHttpTransport(base_url=server.url, metrics=metrics)
+        config = ClientConfig(transport=transport, metrics=metrics, tracker_config=TrackerConfig(initial_interval=0.01))
+        async with PMMClient(Env.PROD, CHAIN, PRIVATE_KEY, config=config) as client:
+            handle = await client.submit_gasless_order(
+                QuoteRequest(sell_tokens=[USDT], buy_tokens=[WETH], sell_amounts=[1_000_000])
+            )
+            await handle.settled()
+        await transport.close()
+
+    phases = set(events.phases())
+    # The trace config of the transport records the network phases, the client the others
+    assert {Phase.CONNECT, Phase.SEND, Phase.FIRST_BYTE, Phase.DECODE, Phase.VALIDATE} <= phases
+    assert {Phase.SIGN, Phase.ORDER_POST, Phase.SETTLEMENT} <= phases
+    assert all(event.success and event.tags.chain == CHAIN for event in events.events)
+    assert all(event.tags.route == Route.PMM for event in events.events if event.phase != Phase.CONNECT)
+    # Order events are tagged with their quote id
+    for phase in (Phase.SIGN, Phase.ORDER_POST, Phase.SETTLEMENT):
+        assert [event.tags.quote_id for event in events.of(phase)] == [handle.quote_id]
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_are_recorded_as_failures() -> None:
+    events = Events()
+    metrics = Metrics(events.sink)
+    transport = AioHttpTransport(base_url="http://127.0.0.1:1", metrics=metrics)
+    async with PMMClient(Env.PROD, CHAIN, None, config=ClientConfig(transport=transport, metrics=metrics)) as client:
+        with pytest.raises(Exception):  # noqa: B017
+            await client.get_quote(QuoteRequest(sell_tokens=[USDT], buy_tokens=[WETH], sell_amounts=[1_000_000]))
+    await transport.close()
+    assert events.events and not any(event.success for event in events.events)
+
+
+@pytest.mark.parametrize("sink", [PrometheusSink, OpenTelemetrySink])
+def test_sinks_name_the_metrics_extra_when_missing(sink: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    for module in ("prometheus_client", "opentelemetry", "opentelemetry.trace"):
+        monkeypatch.setitem(sys.modules, module, None)
+    with pytest.raises(ImportError, match=r"pip install 'python-sdk\[metrics\]'"):
+        sink()
+
+
+def test_prometheus_sink() -> None:
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    sink = PrometheusSink(registry=registry)
+    sink.record(MetricEvent(Phase.SIGN, 0.002, tags=MetricTags(chain=CHAIN, route=Route.PMM, quote_id="abc")))
+    sink.record(MetricEvent(Phase.SIGN, 0.5, success=False))
+    labels = {"phase": "sign", "chain": CHAIN.name, "route": "PMM", "success": "true"}
+    assert registry.get_sample_value("bebop_sdk_phase_seconds_count", labels) == 1
+    assert registry.get_sample_value("bebop_sdk_phase_seconds_sum", labels) == pytest.approx(0.002)
+    failed = {"phase": "sign", "chain": "", "route": "", "success": "false"}
+    assert registry.get_sample_value("bebop_sdk_phase_seconds_count", failed) == 1
+
+
+def test_open_telemetry_sink() -> None:
+    trace = pytest.importorskip("opentelemetry.trace")
+
+    class Span:
+        def __init__(self, name: str, start_time: int, attributes: dict[str, str]) -> None:
+            self.name, self.start_time, self.attributes = name, start_time, attributes
+            self.status: Any = None
+            self.end_time: int | None = None
+
+        def set_status(self, status: Any) -> None:
+            self.status = status
+
+        def end(self, end_time: int) -> None:
+            self.end_time = end_time
+
+    class Tracer:
+        def __init__(self) -> None:
+            self.spans: list[Span] = []
+
+        def start_span(self, name: str, start_time: int, attributes: dict[str, str]) -> Span:
+            self.spans.append(Span(name, start_time, attributes))
+            return self.spans[-1]
+
+    tracer = Tracer()
+    sink = OpenTelemetrySink(tracer)
+    sink.record(MetricEvent(Phase.ORDER_POST, 0.25, tags=MetricTags(route=Route.JAM, quote_id="abc"), timestamp=10))
+    sink.record(MetricEvent(Phase.SETTLEMENT, 1.0, success=False, timestamp=20))
+    posted, settled = tracer.spans
+    assert (posted.name, posted.start_time, posted.end_time) == ("bebop.order_post", 9_750_000_000, 10_000_000_000)
+    assert posted.attributes == {"phase": "order_post", "route": "JAM", "quote_id": "abc"} and posted.status is None
+    assert settled.status.status_code == trace.StatusCode.ERROR
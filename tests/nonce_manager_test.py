@@ -0,0 +1,182 @@
+import asyncio
+from typing import Any
+
+import pytest
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from python_sdk.common.client_config import ClientConfig
+from python_sdk.common.nonce_manager import NonceManager, shared_nonce_manager
+from python_sdk.common.types.types import Env
+from python_sdk.jam.client import JamClient
+from python_sdk.mock.payloads import CHAIN, TAKER
+from python_sdk.mock.rpc import MockRpcNode
+from python_sdk.pmm.client import PMMClient
+
+
+class PendingCount:
+    """`eth_getTransactionCount` handler, answering with `value`"""
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __call__(self, params: list[Any]) -> str:
+        assert params[0].lower() == TAKER.lower() and params[1] == "pending"
+        return hex(self.value)
+
+
+async def _allocate(manager: NonceManager, web3: AsyncWeb3, count: int) -> list[int]:
+    nonces = []
+    for _ in range(count):
+        async with manager.reserve(web3, CHAIN.id, TAKER) as reservation:
+            nonces.append(reservation.nonce)
+    return nonces
+
+
+@pytest.mark.asyncio
+async def test_nonces_follow_the_pending_count() -> None:
+    async with MockRpcNode(handlers={"eth_getTransactionCount": PendingCount(5)}) as node:
+        web3 = AsyncWeb3(AsyncHTTPProvider(node.url))
+        manager = NonceManager()
+        assert await _allocate(manager, web3, 3) == [5, 6, 7]
+        # Addresses are case insensitive
+        async with manager.reserve(web3, CHAIN.id, TAKER.lower()) as reservation:
+            assert reservation.nonce == 8
+        assert node.calls["eth_getTransactionCount"] == 1
+        assert manager.account(CHAIN.id, TAKER).in_flight == frozenset()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reservations_get_distinct_nonces() -> None:
+    async with MockRpcNode(handlers={"eth_getTransactionCount": PendingCount(0)}) as node:
+        web3 = AsyncWeb3(AsyncHTTPProvider(node.url))
+        manager = NonceManager()
+
+        async def send() -> int:
+            async with manager.reserve(web3, CHAIN.id, TAKER) as reservation:
+                await asyncio.sleep(0.001)
+                return reservation.nonce
+
+        assert sorted(await asyncio.gather(*(send() for _ in range(20)))) == list(range(20))
+        assert node.calls["eth_getTransactionCount"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_send_releases_its_nonce() -> None:
+    async with MockRpcNode(handlers={"eth_getTransactionCount": PendingCount(0)}) as node:
+        web3 = AsyncWeb3(AsyncHTTPProvider(node.url))
+        manager = NonceManager()
+        account = manager.account(CHAIN.id, TAKER)
+        first, second = await account.allocate(web3), await account.allocate(web3)
+        with pytest.raises(ValueError, match="insufficient funds"):
+            async with manager.reserve(web3, CHAIN.id, TAKER):
+                raise ValueError("insufficient funds")
+        account.release(first)
+        account.consume(second)
+        # The lowest released nonce is handed out first
+        assert await _allocate(manager, web3, 3) == [0, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_resync_skips_nonces_in_flight() -> None:
+    pending = PendingCount(5)
+    async with MockRpcNode(handlers={"eth_getTransactionCount": pending}) as node:
+        web3 = AsyncWeb3(AsyncHTTPProvider(node.url))
+        manager = NonceManager()
+        failing, sending = asyncio.Event(), asyncio.Event()
+        allocated: list[int] = []
+
+        async def send(sent: asyncio.Event, error: str | None = None) -> None:
+            async with manager.reserve(web3, CHAIN.id, TAKER) as reservation:
+                allocated.append(reservation.nonce)
+                await sent.wait()
+                if error:
+                    raise ValueError(error)
+
+        failed = asyncio.create_task(send(failing, "nonce too low"))
+        others = [asyncio.create_task(send(sending)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        assert allocated == [5, 6, 7]
+        # 5 was taken by a transaction sent from elsewhere, 6 and 7 are still being sent from here
+        pending.value = 6
+        failing.set()
+        with pytest.raises(ValueError, match="nonce too low"):
+            await failed
+        assert await _allocate(manager, web3, 2) == [8, 9]
+        assert node.calls["eth_getTransactionCount"] == 2
+        sending.set()
+        await asyncio.gather(*others)
+
+
+@pytest.mark.asyncio
+async def test_in_flight_nonces_are_skipped_after_resync() -> None:
+    async with MockRpcNode(handlers={"eth_getTransactionCount": PendingCount(5)}) as node:
+        web3 = AsyncWeb3(AsyncHTTPProvider(node.url))
+        account = NonceManager().account(CHAIN.id, TAKER)
+        held = [await account.allocate(web3) for _ in range(3)]
+        account.resync()
+        # The RPC has not seen any of them yet
+        assert [await account.allocate(web3) for _ in range(2)] == [8, 9]
+        assert account.in_flight == frozenset([*held, 8, 9])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("sent", "next_nonce"), [(True, 1), (False, 0)])
+async def test_cancelled_send_reuses_its_nonce_only_if_not_sent(sent: bool, next_nonce: int) -> None:
+    async with MockRpcNode(handlers={"eth_getTransactionCount": PendingCount(0)}) as node:
+        web3 = AsyncWeb3(AsyncHTTPProvider(node.url))
+        manager = NonceManager()
+
+        async def send() -> None:
+            async with manager.reserve(web3, CHAIN.id, TAKER) as reservation:
+                reservation.sent = sent
+                await asyncio.sleep(1)
+
+        task = asyncio.create_task(send())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert await _allocate(manager, web3, 1) == [next_nonce]
+
+
+@pytest.mark.asyncio
+async def test_check_resyncs_on_a_nonce_gap() -> None:
+    pending = PendingCount(0)
+    async with MockRpcNode(handlers={"eth_getTransactionCount": pending}) as node:
+        web3 = AsyncWeb3(AsyncHTTPProvider(node.url))
+        manager = NonceManager()
+        assert not await manager.check(web3, CHAIN.id, TAKER)  # nothing allocated yet
+        assert await _allocate(manager, web3, 3) == [0, 1, 2]
+        # Every nonce reached the RPC
+        pending.value = 3
+        assert not await manager.check(web3, CHAIN.id, TAKER)
+        # 3 was consumed by a transaction the RPC never saw, 4 is queued behind it
+        assert await _allocate(manager, web3, 2) == [3, 4]
+        assert await manager.check(web3, CHAIN.id, TAKER)
+        assert await _allocate(manager, web3, 1) == [3]
+
+
+def test_manager_can_be_shared_across_event_loops() -> None:
+    manager = NonceManager()
+
+    async def allocate() -> list[int]:
+        async with MockRpcNode(handlers={"eth_getTransactionCount": PendingCount(0)}) as node:
+            web3 = AsyncWeb3(AsyncHTTPProvider(node.url))
+            batches = await asyncio.gather(*(_allocate(manager, web3, 2) for _ in range(2)))
+            return sorted(nonce for batch in batches for nonce in batch)
+
+    assert asyncio.run(allocate()) == [0, 1, 2, 3]
+    assert asyncio.run(allocate()) == [4, 5, 6, 7]
+
+
+@pytest.mark.asyncio
+async def test_clients_share_nonces_by_default() -> None:
+    pmm = PMMClient(Env.PROD, CHAIN, private_key=None)
+    jam = JamClient(Env.PROD, CHAIN, private_key=None)
+    try:
+        assert pmm.nonce_manager is jam.nonce_manager is shared_nonce_manager()
+        manager = NonceManager()
+        assert PMMClient(Env.PROD, CHAIN, None, config=ClientConfig(nonce_manager=manager)).nonce_manager is manager
+    finally:
+        await pmm.close()
+        await jam.close()
@@ -0,0 +1,190 @@
+import asyncio
+import time
+from collections import Counter
+from collections.abc import Sequence
+
+import pytest
+
+from python_sdk.common.exceptions import BebopServerError
+from python_sdk.common.metrics import CallbackSink, MetricEvent, Metrics, Phase
+from python_sdk.common.order_tracker import OrderHandle, OrderTracker, TrackerConfig, wait_for_order_status
+from python_sdk.common.types.order_types import OrderApiStatus, OrderResponse, OrderStatusResponse
+from python_sdk.mock.payloads import pmm_single_quote
+from python_sdk.pmm.types.quote_types import QuoteResponse
+
+UNAVAILABLE = BebopServerError(503, "Service Unavailable")
+QUOTE = QuoteResponse.model_validate(pmm_single_quote())
+FAST = TrackerConfig(initial_interval=0.005, max_interval=0.01, settlement_grace=0, min_duration=0.1)
+
+
+class FakeStatuses:
+    """Status source answering each quote id with its scripted statuses in turn, repeating the last one"""
+
+    def __init__(self, **scripts: Sequence[str | Exception]) -> None:
+        self.scripts = scripts
+        self.calls: Counter[str] = Counter()
+
+    async def fetch(self, quote_id: str) -> OrderStatusResponse:
+        script = self.scripts[quote_id]
+        step = script[min(self.calls[quote_id], len(script) - 1)]
+        self.calls[quote_id] += 1
+        if isinstance(step, Exception):
+            raise step
+        return OrderStatusResponse(status=OrderApiStatus(step), txHash="0x01")
+
+
+def _expiry() -> int:
+    """An expiry already passed, so that orders are tracked for `FAST.min_duration`"""
+    return int(time.time()) - 1
+
+
+@pytest.mark.asyncio
+async def test_resolves_on_final_status() -> None:
+    statuses = FakeStatuses(a=["Pending", "Pending", "Settled"], b=["Failed"])
+    seen: list[OrderStatusResponse | None] = []
+    tracker = OrderTracker(statuses.fetch, FAST)
+    settled = tracker.track("a", _expiry(), callback=seen.append)
+    failed = tracker.track("b", _expiry())
+    assert tracker.pending == 2
+    assert (await settled).status == OrderApiStatus.Settled
+    assert (await failed).status == OrderApiStatus.Failed
+    assert statuses.calls == {"a": 3, "b": 1}
+    assert [status.status if status else None for status in seen] == [OrderApiStatus.Settled]
+    assert tracker.pending == 0
+    await tracker.close()
+
+
+@pytest.mark.asyncio
+async def test_deadline_resolves_with_last_known_status() -> None:
+    statuses = FakeStatuses(a=["Pending", UNAVAILABLE])
+    tracker = OrderTracker(statuses.fetch, FAST)
+    status = await tracker.track("a", _expiry())
+    assert status.status == OrderApiStatus.Pending
+    assert statuses.calls["a"] > 2  # polling went on despite the errors
+    await tracker.close()
+
+
+@pytest.mark.asyncio
+async def test_timeout_without_status_fails_and_calls_back() -> None:
+    statuses = FakeStatuses(a=[UNAVAILABLE])
+    seen: list[OrderStatusResponse | None] = []
+
+    def failing_callback(status: OrderStatusResponse | None) -> None:
+        raise RuntimeError("callback bug")
+
+    events: list[MetricEvent] = []
+    tracker = OrderTracker(statuses.fetch, FAST, metrics=Metrics(CallbackSink(events.append)))
+    future = tracker.track("a", _expiry(), callback=failing_callback)
+    tracker.track("a", _expiry(), callback=seen.append)
+    with pytest.raises(TimeoutError, match="No status received"):
+        await future
+    # A failing callback does not prevent the next one from being called
+    assert seen == [None]
+    assert [(event.phase, event.success) for event in events] == [(Phase.SETTLEMENT, False)]
+    await tracker.close()
+
+
+@pytest.mark.asyncio
+async def test_same_order_is_polled_once() -> None:
+    statuses = FakeStatuses(a=["Pending", "Confirmed"])
+    tracker = OrderTracker(statuses.fetch, FAST)
+    first, second = tracker.track("a", _expiry()), tracker.track("a", _expiry())
+    assert tracker.pending == 1
+    results = await asyncio.gather(first, second)
+    assert [result.status for result in results] == [OrderApiStatus.Confirmed] * 2
+    assert statuses.calls["a"] == 2
+    await tracker.close()
+
+
+@pytest.mark.asyncio
+async def test_tracking_an_order_again_does_not_poll_it_twice() -> None:
+    statuses = FakeStatuses(a=["Pending"])
+    config = TrackerConfig(initial_interval=0.01, max_interval=0.01, backoff=1.0)
+    tracker = OrderTracker(statuses.fetch, config)
+    # Dropped before its first poll, its schedule entry stays in the heap
+    tracker.track("a", int(time.time()) + 60).cancel()
+    await asyncio.sleep(0)
+    assert tracker.pending == 0
+    tracker.track("a", int(time.time()) + 60)
+    await asyncio.sleep(0.105)
+    # One poll per interval, not two
+    assert 0 < statuses.calls["a"] <= 11
+    await tracker.close()
+
+
+def _handle(tracker: OrderTracker) -> OrderHandle[QuoteResponse]:
+    return OrderHandle(QUOTE, OrderResponse(status="Success", expiry=QUOTE.expiry), tracker)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_a_handle_leaves_other_waiters() -> None:
+    statuses = FakeStatuses(**{QUOTE.quoteId: ["Pending", "Pending", "Pending", "Settled"]})
+    seen: list[OrderStatusResponse | None] = []
+    tracker = OrderTracker(statuses.fetch, FAST)
+    cancelled, kept = _handle(tracker), _handle(tracker)
+    tracker.track(QUOTE.quoteId, _expiry(), callback=seen.append)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    assert cancelled.done and tracker.pending == 1
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled.settled()
+    assert (await kept.settled()).status == OrderApiStatus.Settled
+    assert kept.success and not cancelled.success
+    assert [status.status if status else None for status in seen] == [OrderApiStatus.Settled]
+    await tracker.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_callback_is_not_called() -> None:
+    statuses = FakeStatuses(a=["Pending", "Settled"])
+    seen: list[OrderStatusResponse | None] = []
+    tracker = OrderTracker(statuses.fetch, FAST)
+    tracker.track("a", _expiry(), callback=seen.append).cancel()
+    kept = tracker.track("a", _expiry())
+    assert (await kept).status == OrderApiStatus.Settled
+    assert seen == []
+    await tracker.close()
+
+
+@pytest.mark.asyncio
+async def test_polling_stops_once_every_handle_is_cancelled() -> None:
+    statuses = FakeStatuses(**{QUOTE.quoteId: ["Pending"]})
+    tracker = OrderTracker(statuses.fetch, TrackerConfig(initial_interval=0.005, max_interval=0.005))
+    handles = [_handle(tracker), _handle(tracker)]
+    await asyncio.sleep(0.03)
+    handles[0].cancel()
+    await asyncio.sleep(0)  # cancelled waiters are dropped by their done callback
+    assert tracker.pending == 1
+    handles[1].cancel()
+    await asyncio.sleep(0)
+    assert tracker.pending == 0
+    await asyncio.sleep(0.01)  # lets a poll already in flight finish
+    calls = statuses.calls[QUOTE.quoteId]
+    await asyncio.sleep(0.03)
+    assert statuses.calls[QUOTE.quoteId] == calls
+    # Tracking the order again starts polling it afresh
+    again = _handle(tracker)
+    assert tracker.pending == 1 and not again.done
+    await tracker.close()
+    assert again.done
+
+
+@pytest.mark.asyncio
+async def test_close_stops_polling() -> None:
+    statuses = FakeStatuses(a=["Pending"])
+    tracker = OrderTracker(statuses.fetch, TrackerConfig(initial_interval=0.005, max_interval=0.005))
+    future = tracker.track("a", int(time.time()) + 60)
+    await asyncio.sleep(0.03)
+    await tracker.close()
+    assert future.cancelled()
+    calls = statuses.calls["a"]
+    await asyncio.sleep(0.03)
+    assert statuses.calls["a"] == calls
+    assert tracker.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_wait_for_order_status_with_one_off_tracker() -> None:
+    statuses = FakeStatuses(a=["Pending", "Settled"])
+    status = await wait_for_order_status("a", _expiry(), statuses.fetch)
+    assert status.status == OrderApiStatus.Settled
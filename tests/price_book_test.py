@@ -0,0 +1,83 @@
+import orjson
+import pytest
+
+from python_sdk.common.price_book import PriceBook
+from python_sdk.common.types.types import Chain
+from python_sdk.mock.payloads import CHAIN, USDC, USDT, WETH, pricing_message
+
+PAIR = f"{WETH}/{USDC}"
+BIDS = [[2000.0, 1.0], [1990.0, 2.0]]
+ASKS = [[2010.0, 1.0], [2020.0, 2.0]]
+
+
+def _book(bids: list[list[float]] = BIDS, asks: list[list[float]] = ASKS) -> PriceBook:
+    book = PriceBook()
+    book.apply(CHAIN, {PAIR: {"bids": bids, "asks": asks, "last_update_ts": 1.5}})
+    return book
+
+
+def test_updates_replace_the_levels_of_their_pairs() -> None:
+    book = PriceBook()
+    assert book.update(CHAIN, orjson.dumps(pricing_message(CHAIN))) == len(pricing_message(CHAIN)) == len(book)
+    other = f"{WETH}/{USDT}".lower()
+    before = book.get(CHAIN, WETH, USDT)
+    assert book.update(CHAIN, orjson.dumps({PAIR: {"bids": BIDS, "asks": ASKS, "last_update_ts": 1.5}})) == 1
+    prices = book.get(CHAIN, WETH.lower(), USDC.upper().replace("0X", "0x"))
+    assert prices is not None
+    assert (prices.bids, prices.asks, prices.timestamp) == (BIDS, ASKS, 1.5)
+    assert (prices.best_bid, prices.best_ask, prices.mid) == (2000.0, 2010.0, 2005.0)
+    # Other pairs are left as they were
+    assert book.get(CHAIN, WETH, USDT) is before and other in book.pairs(CHAIN)
+    assert {(chain, pair) for chain, pair, _ in book} == {(CHAIN, pair) for pair in book.pairs(CHAIN)}
+
+
+def test_missing_sides_and_unknown_pairs() -> None:
+    book = _book(asks=[])
+    prices = book.get(CHAIN, WETH, USDC)
+    assert prices is not None and prices.best_ask is None and prices.mid is None
+    assert book.get(CHAIN, USDC, WETH) is None
+    assert book.get(Chain.ethereum, WETH, USDC) is None
+    book.apply(CHAIN, {PAIR: {"bids": None}})
+    prices = book.get(CHAIN, WETH, USDC)
+    assert prices is not None and prices.bids == prices.asks == [] and prices.timestamp == 0.0
+
+
+def test_stale_prices_are_not_served() -> None:
+    book = _book()
+    assert book.get(CHAIN, WETH, USDC, max_age=60) is not None
+    assert book.get(CHAIN, WETH, USDC, max_age=-1) is None
+
+
+def test_clear() -> None:
+    book = _book()
+    book.update(Chain.ethereum, orjson.dumps(pricing_message(Chain.ethereum)))
+    book.clear(CHAIN)
+    assert book.pairs(CHAIN) == [] and book.pairs(Chain.ethereum)
+    book.clear()
+    assert len(book) == 0
+
+
+def test_fill_price_walks_the_levels() -> None:
+    prices = _book().get(CHAIN, WETH, USDC)
+    assert prices is not None
+    assert prices.fill_price(0.5, buy=True) == 2010.0
+    assert prices.fill_price(2.0, buy=True) == pytest.approx((2010.0 + 2020.0) / 2)
+    assert prices.fill_price(3.0, buy=False) == pytest.approx((2000.0 + 2 * 1990.0) / 3)
+
+
+def test_fill_price_of_shallow_and_empty_books() -> None:
+    prices = _book().get(CHAIN, WETH, USDC)
+    assert prices is not None
+    assert prices.fill_price(3.0, buy=True) is not None
+    assert prices.fill_price(3.01, buy=True) is None
+    empty = _book(bids=[], asks=[]).get(CHAIN, WETH, USDC)
+    assert empty is not None
+    assert empty.fill_price(1.0, buy=True) is None and empty.fill_price(1.0, buy=False) is None
+
+
+@pytest.mark.parametrize("size", [0, 0.0, -1.0])
+def test_fill_price_rejects_non_positive_sizes(size: float) -> None:
+    prices = _book().get(CHAIN, WETH, USDC)
+    assert prices is not None
+    with pytest.raises(ValueError, match="must be positive"):
+        prices.fill_price(size, buy=True)
@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from python_sdk.common.price_stream import PriceStream, PriceStreamConfig
+from python_sdk.common.types.types import Chain, Env, Route
+from python_sdk.mock.payloads import CHAIN, USDC, WETH
+from python_sdk.mock.server import MockBebopServer, MockServerConfig
+
+SERVER = MockServerConfig(price_interval=0.01, seed=0)
+
+
+@pytest.mark.asyncio
+async def test_price_stream_reconnects() -> None:
+    updates: list[tuple[Route, Chain, int]] = []
+    async with (
+        MockBebopServer(SERVER) as server,
+        PriceStream(
+            base_url=server.url,
+            config=PriceStreamConfig(reconnect_delay=0.01),
+            on_update=lambda *update: updates.append(update),
+        ) as stream,
+    ):
+        await stream.wait_ready(CHAIN, timeout=5)
+        await stream.wait_ready(Chain.ethereum, Route.JAM, timeout=5)
+        assert stream.book().get(CHAIN, WETH, USDC) is not None
+        assert stream.book(Route.JAM).pairs(Chain.ethereum)
+        assert {(route, chain) for route, chain, _ in updates} == {(Route.PMM, CHAIN), (Route.JAM, Chain.ethereum)}
+
+        await server.drop_streams()
+        while stream.connected(CHAIN) or stream.connected(Chain.ethereum, Route.JAM):
+            await asyncio.sleep(0.001)
+        await stream.wait_ready(CHAIN, timeout=5)
+        await stream.wait_ready(Chain.ethereum, Route.JAM, timeout=5)
+        assert server.requests["pmm/pricing"] == 2
+        assert server.requests["jam/pricing"] == 2
+        assert stream.book().get(CHAIN, WETH.lower(), USDC.lower(), max_age=1) is not None
+        assert set(stream.subscriptions) == {(Route.PMM, CHAIN), (Route.JAM, Chain.ethereum)}
+
+        await stream.unsubscribe(CHAIN)
+        assert stream.book().pairs(CHAIN) == [] and not stream.connected(CHAIN)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("clear_on_disconnect", [True, False])
+async def test_prices_of_a_disconnected_stream(clear_on_disconnect: bool) -> None:
+    # Reconnects too late to refill the book during the test
+    config = PriceStreamConfig(reconnect_delay=10, clear_on_disconnect=clear_on_disconnect)
+    async with MockBebopServer(SERVER) as server, PriceStream(base_url=server.url, config=config) as stream:
+        await stream.wait_ready(CHAIN, timeout=5)
+        await server.drop_streams()
+        while stream.connected(CHAIN):
+            await asyncio.sleep(0.001)
+        assert bool(stream.book().pairs(CHAIN)) is not clear_on_disconnect
+
+
+def test_stream_urls() -> None:
+    assert PriceStream().url(CHAIN, Route.PMM).startswith("wss://api.bebop.xyz/")
+    assert PriceStream(base_url="http://127.0.0.1:8080").url(CHAIN, Route.JAM).startswith("ws://127.0.0.1:8080/jam/")
+    with pytest.raises(ValueError, match="BasicAuth"):
+        PriceStream(Env.TEST)
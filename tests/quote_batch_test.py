@@ -0,0 +1,79 @@
+import math
+import random
+import sys
+from typing import Any
+
+import pytest
+
+from python_sdk.common.best_quote import quote_score
+from python_sdk.common.quote_batch import QuoteBatch
+from python_sdk.mock.payloads import USDC, WBTC, WETH, build_pmm_quote
+from python_sdk.pmm.types.quote_types import QuoteResponse
+
+QUOTES = 200
+
+
+def _quotes() -> list[QuoteResponse]:
+    rng = random.Random(0)  # noqa: S311
+    quotes = []
+    for i in range(QUOTES):
+        buy = {USDC: rng.randrange(1, 10**12)} if i % 3 else {USDC: rng.randrange(1, 10**12), WBTC: 10**8 + i}
+        raw = build_pmm_quote({WETH: rng.randrange(1, 10**24)}, buy, gasless=bool(i % 2))
+        if i % 4 == 0:
+            raw["protocolFee"] = {USDC.lower(): str(10**5 + i)}
+        quotes.append(QuoteResponse.model_validate(raw))
+    return quotes
+
+
+def _unpriced(raw: dict[str, Any], side: str, token: str) -> QuoteResponse:
+    raw[side][token]["priceUsd"] = None
+    return QuoteResponse.model_validate(raw)
+
+
+def test_quote_batch_matches_quotes() -> None:
+    pytest.importorskip("numpy")
+    quotes = _quotes()
+    batch = QuoteBatch(quotes)
+    for i, quote in enumerate(quotes):
+        assert batch.sell_usd[i] == pytest.approx(quote.sell_usd_amount, rel=1e-12)
+        assert batch.buy_usd[i] == pytest.approx(quote.buy_usd_amount, rel=1e-12)
+        assert batch.scores[i] == pytest.approx(quote_score(quote), rel=1e-12)
+        assert (len(quote.buyTokens) == 1) != math.isnan(batch.price[i])
+    assert batch.sell.raw_amounts() == [int(quote.sellTokens[WETH].amount) for quote in quotes]
+    chain_id = quotes[0].chainId
+    assert batch.sell.totals() == {(chain_id, WETH.lower()): sum(batch.sell.raw_amounts())}
+    assert batch.fee_totals() == {(chain_id, USDC.lower()): sum(10**5 + i for i in range(0, QUOTES, 4))}
+
+
+def test_unpriced_tokens_are_not_valued_at_zero() -> None:
+    pytest.importorskip("numpy")
+    quotes = [
+        _unpriced(build_pmm_quote({WETH: 10**18}, {USDC: 2 * 10**9}), "sellTokens", WETH),
+        _unpriced(build_pmm_quote({WETH: 10**18}, {USDC: 2 * 10**9, WBTC: 10**6}, gasless=False), "buyTokens", WBTC),
+        _unpriced(build_pmm_quote({WETH: 10**18, WBTC: 10**6}, {USDC: 2 * 10**9}), "sellTokens", WBTC),
+        QuoteResponse.model_validate(build_pmm_quote({WETH: 10**18}, {USDC: 2 * 10**9}, gasless=False)),
+    ]
+    batch = QuoteBatch(quotes)
+    for i, quote in enumerate(quotes):
+        score = quote_score(quote)
+        assert math.isnan(batch.scores[i]) if score is None else batch.scores[i] == pytest.approx(score, rel=1e-12)
+    assert [math.isnan(usd) for usd in batch.sell_usd] == [True, False, True, False]
+    assert [math.isnan(usd) for usd in batch.buy_usd] == [False, True, False, False]
+    assert [math.isnan(score) for score in batch.scores] == [True, True, True, False]
+
+
+def test_amounts_above_64_bits_are_exact() -> None:
+    pytest.importorskip("numpy")
+    amounts = [2**64, 2**64 + 1, 10**30 + 7, 2**256 - 1]
+    quotes = [QuoteResponse.model_validate(build_pmm_quote({WETH: amount}, {USDC: 1})) for amount in amounts]
+    batch = QuoteBatch(quotes)
+    assert batch.sell.raw_amounts() == amounts
+    assert [batch.sell.raw(i) for i in range(len(amounts))] == amounts
+    assert batch.sell.totals() == {(quotes[0].chainId, WETH.lower()): sum(amounts)}
+    assert batch.sell.amounts.tolist() == pytest.approx([amount / 10**18 for amount in amounts], rel=1e-12)
+
+
+def test_missing_numpy_names_the_extra(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    with pytest.raises(ImportError, match=r"QuoteBatch requires .*pip install 'python-sdk\[numpy\]'"):
+        QuoteBatch([])
@@ -0,0 +1,160 @@
+import asyncio
+import time
+
+import pytest
+
+from python_sdk.common.client_config import ClientConfig
+from python_sdk.common.exceptions import BebopAPIError
+from python_sdk.common.quote_cache import QuoteCache, QuoteCacheConfig, quote_cache_key
+from python_sdk.common.transport import AioHttpTransport
+from python_sdk.common.types.types import Env, Route
+from python_sdk.mock.payloads import CHAIN, USDT, WETH, build_pmm_quote
+from python_sdk.mock.server import MockBebopServer
+from python_sdk.pmm.client import PMMClient
+from python_sdk.pmm.types.quote_types import QuoteRequest, QuoteResponse
+
+
+def _quote(expiry: int | None = None) -> QuoteResponse:
+    return QuoteResponse.model_validate(build_pmm_quote({USDT: 1_000_000}, {WETH: 10**15}, expiry=expiry))
+
+
+class FakeFetch:
+    """Quote fetch answering a fresh quote after `delay` seconds, or raising `error`"""
+
+    def __init__(self, delay: float = 0.0, expiry: int | None = None, error: Exception | None = None) -> None:
+        self.delay = delay
+        self.expiry = expiry
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(self) -> QuoteResponse:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return _quote(self.expiry)
+
+
+@pytest.mark.asyncio
+async def test_quotes_are_served_within_the_staleness_budget() -> None:
+    cache = QuoteCache(QuoteCacheConfig(staleness_budget=0.05))
+    fetch = FakeFetch()
+    first = await cache.get("key", fetch)
+    assert await cache.get("key", fetch) is first
+    assert fetch.calls == 1 and len(cache) == 1
+    await asyncio.sleep(0.05)
+    refreshed = await cache.get("key", fetch)
+    assert refreshed is not first and fetch.calls == 2
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.coalesced) == (1, 2, 0)
+    assert cache.stats.requests == 3
+
+
+@pytest.mark.asyncio
+async def test_quotes_close_to_expiry_are_not_served() -> None:
+    cache = QuoteCache(QuoteCacheConfig(staleness_budget=60, min_time_to_expiry=5))
+    # Never stored
+    expiring = FakeFetch(expiry=int(time.time()) + 3)
+    await cache.get("expiring", expiring)
+    await cache.get("expiring", expiring)
+    assert expiring.calls == 2 and len(cache) == 0
+    # Stored, then dropped once it gets too close to its expiry
+    fetch = FakeFetch(expiry=int(time.time()) + 7)
+    await cache.get("key", fetch)
+    assert len(cache) == 1
+    cache = QuoteCache(QuoteCacheConfig(staleness_budget=60, min_time_to_expiry=10))
+    await cache.get("key", fetch)
+    assert len(cache) == 0 and fetch.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_fetch() -> None:
+    cache = QuoteCache()
+    fetch = FakeFetch(delay=0.01)
+    quotes = await asyncio.gather(*(cache.get("key", fetch) for _ in range(10)))
+    assert fetch.calls == 1 and all(quote is quotes[0] for quote in quotes)
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.coalesced) == (0, 1, 9)
+    # Other keys are fetched on their own
+    await asyncio.gather(cache.get("key", fetch), cache.get("other", fetch))
+    assert fetch.calls == 2 and cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_shared_and_not_cached() -> None:
+    cache = QuoteCache()
+    fetch = FakeFetch(delay=0.01, error=BebopAPIError({"errorCode": 102, "message": "No quote"}))
+    results = await asyncio.gather(*(cache.get("key", fetch) for _ in range(3)), return_exceptions=True)
+    assert fetch.calls == 1 and all(isinstance(result, BebopAPIError) for result in results)
+    assert len(cache) == 0
+    fetch.error = None
+    await cache.get("key", fetch)
+    assert fetch.calls == 2 and len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_shared_fetch() -> None:
+    cache = QuoteCache()
+    fetch = FakeFetch(delay=0.02)
+    cancelled = asyncio.create_task(cache.get("key", fetch))
+    waiting = asyncio.create_task(cache.get("key", fetch))
+    await asyncio.sleep(0.005)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    quote = await waiting
+    assert fetch.calls == 1 and fetch.cancelled == 0
+    assert await cache.get("key", fetch) is quote
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_quotes_are_evicted() -> None:
+    cache = QuoteCache(QuoteCacheConfig(max_size=2))
+    fetch = FakeFetch()
+    first = await cache.get("first", fetch)
+    await cache.get("second", fetch)
+    assert await cache.get("first", fetch) is first
+    await cache.get("third", fetch)
+    assert len(cache) == 2 and fetch.calls == 3
+    assert await cache.get("first", fetch) is first
+    await cache.get("second", fetch)
+    assert fetch.calls == 4
+    cache.invalidate("first")
+    await cache.get("first", fetch)
+    assert fetch.calls == 5
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_cache_keys_ignore_address_case_and_param_order() -> None:
+    request = QuoteRequest(sell_tokens=[USDT], buy_tokens=[WETH], sell_amounts=[1_000_000])
+    params = request.to_params()
+    key = quote_cache_key(Route.PMM, Env.PROD, CHAIN, params)
+    lowered = {name: value.lower() if value.startswith("0x") else value for name, value in reversed(params.items())}
+    assert quote_cache_key(Route.PMM, Env.PROD, CHAIN, lowered) == key
+    assert quote_cache_key(Route.JAM, Env.PROD, CHAIN, params) != key
+    assert quote_cache_key(Route.PMM, Env.TEST, CHAIN, params) != key
+    other = QuoteRequest(sell_tokens=[USDT], buy_tokens=[WETH], sell_amounts=[2_000_000]).to_params()
+    assert quote_cache_key(Route.PMM, Env.PROD, CHAIN, other) != key
+
+
+@pytest.mark.asyncio
+async def test_client_serves_identical_requests_from_its_cache() -> None:
+    def request(amount: int = 1_000_000) -> QuoteRequest:
+        return QuoteRequest(sell_tokens=[USDT], buy_tokens=[WETH], sell_amounts=[amount])
+
+    cache = QuoteCache()
+    async with MockBebopServer() as server:
+        transport = AioHttpTransport(base_url=server.url)
+        async with PMMClient(
+            Env.PROD, CHAIN, None, config=ClientConfig(transport=transport, quote_cache=cache)
+        ) as client:
+            first = await client.get_quote(request())
+            assert (await client.get_quote(request())).quoteId == first.quoteId
+            assert (await client.get_quote(request(), cached=False)).quoteId != first.quoteId
+            assert (await client.get_quote(request(2_000_000))).quoteId != first.quoteId
+        await transport.close()
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
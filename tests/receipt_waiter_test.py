@@ -0,0 +1,143 @@
+import asyncio
+from collections.abc import Callable
+
+import pytest
+from eth_typing import HexStr
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from python_sdk.common.receipt_waiter import ReceiptWaiter, ReceiptWaiterConfig
+from python_sdk.mock.payloads import CHAIN
+from python_sdk.mock.rpc import MockRpcNode
+
+TX_HASHES = [HexStr("0x" + f"{i:02x}" * 32) for i in range(1, 4)]
+# Polling so slow that a test only passes through the subscription
+SUBSCRIPTION_ONLY = ReceiptWaiterConfig(poll_interval=60, reconnect_delay=0.01)
+POLLING = ReceiptWaiterConfig(poll_interval=0.01, reconnect_delay=0.01)
+
+
+async def _until(condition: Callable[[], bool], timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.002)
+
+
+async def _subscribed(node: MockRpcNode, checks: int) -> None:
+    """Wait for the subscription and for the catch-up check of the `checks` pending hashes that follows it"""
+    await _until(lambda: node.subscribers == 1 and node.calls["eth_getTransactionReceipt"] >= checks)
+
+
+@pytest.mark.asyncio
+async def test_receipts_are_checked_on_new_heads() -> None:
+    async with MockRpcNode() as node:
+        waiter = ReceiptWaiter(CHAIN, AsyncWeb3(AsyncHTTPProvider(node.url)), node.ws_url, SUBSCRIPTION_ONLY)
+        waits = [asyncio.create_task(waiter.wait(tx_hash, timeout=5)) for tx_hash in TX_HASHES]
+        await _subscribed(node, checks=3)
+        block = await node.mine(TX_HASHES[0], TX_HASHES[2])
+        first, third = await waits[0], await waits[2]
+        assert first is not None and third is not None
+        assert (first["blockNumber"], first["transactionHash"].hex()) == (block, TX_HASHES[0])
+        assert not waits[1].done()
+        await node.mine()
+        await _until(lambda: node.calls["eth_getTransactionReceipt"] == 3 + 3 + 1)
+        await node.mine(TX_HASHES[1])
+        second = await waits[1]
+        assert second is not None and second["blockNumber"] == block + 2
+        # One catch-up check once subscribed, then one per head for the hashes still pending
+        assert node.calls["eth_getTransactionReceipt"] == 3 + 3 + 1 + 1
+        assert node.calls["eth_subscribe"] == 1
+        await waiter.close()
+
+
+@pytest.mark.asyncio
+async def test_same_hash_is_checked_once() -> None:
+    async with MockRpcNode() as node:
+        waiter = ReceiptWaiter(CHAIN, AsyncWeb3(AsyncHTTPProvider(node.url)), node.ws_url, SUBSCRIPTION_ONLY)
+        waits = [asyncio.create_task(waiter.wait(TX_HASHES[0], timeout=5)) for _ in range(3)]
+        await _subscribed(node, checks=1)
+        await node.mine(TX_HASHES[0])
+        receipts = await asyncio.gather(*waits)
+        assert all(receipt == receipts[0] for receipt in receipts)
+        assert node.calls["eth_getTransactionReceipt"] == 2
+        await waiter.close()
+
+
+@pytest.mark.asyncio
+async def test_waiter_timing_out_leaves_the_others_of_the_hash() -> None:
+    async with MockRpcNode() as node:
+        waiter = ReceiptWaiter(CHAIN, AsyncWeb3(AsyncHTTPProvider(node.url)), config=POLLING)
+        patient = asyncio.create_task(waiter.wait(TX_HASHES[0], timeout=5))
+        cancelled = asyncio.create_task(waiter.wait(TX_HASHES[0], timeout=5))
+        assert await waiter.wait(TX_HASHES[0], timeout=0.02) is None
+        cancelled.cancel()
+        await asyncio.sleep(0.02)
+        await node.mine(TX_HASHES[0])
+        receipt = await asyncio.wait_for(patient, timeout=1)
+        assert receipt is not None and receipt["transactionHash"].hex() == TX_HASHES[0]
+        await waiter.close()
+
+
+@pytest.mark.asyncio
+async def test_receipts_are_polled_without_websocket() -> None:
+    async with MockRpcNode() as node:
+        waiter = ReceiptWaiter(CHAIN, AsyncWeb3(AsyncHTTPProvider(node.url)), config=POLLING)
+        wait = asyncio.create_task(waiter.wait(TX_HASHES[0], timeout=5))
+        await asyncio.sleep(0.05)
+        assert not wait.done() and node.calls["eth_getTransactionReceipt"] > 1
+        await node.mine(TX_HASHES[0])
+        receipt = await wait
+        assert receipt is not None and receipt["status"] == 1
+        # Polling stops once nothing is pending
+        calls = node.calls["eth_getTransactionReceipt"]
+        await asyncio.sleep(0.05)
+        assert node.calls["eth_getTransactionReceipt"] == calls
+        await waiter.close()
+
+
+@pytest.mark.asyncio
+async def test_polling_takes_over_while_the_subscription_is_down() -> None:
+    async with MockRpcNode() as node:
+        config = ReceiptWaiterConfig(poll_interval=0.01, reconnect_delay=0.2, heartbeat=0.02)
+        waiter = ReceiptWaiter(CHAIN, AsyncWeb3(AsyncHTTPProvider(node.url)), node.ws_url, config)
+        wait = asyncio.create_task(waiter.wait(TX_HASHES[0], timeout=5))
+        await _subscribed(node, checks=1)
+        await node.drop_subscriptions()
+        await node.mine(TX_HASHES[0])  # no subscriber left to notify
+        assert await asyncio.wait_for(wait, timeout=0.15) is not None  # within a heartbeat and a poll interval
+        # The subscription comes back after `reconnect_delay`
+        wait = asyncio.create_task(waiter.wait(TX_HASHES[1], timeout=5))
+        await _until(lambda: node.calls["eth_subscribe"] == 2 and node.subscribers == 1)
+        await node.mine(TX_HASHES[1])
+        assert await wait is not None
+        await waiter.close()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_websocket_falls_back_to_polling() -> None:
+    async with MockRpcNode() as node:
+        waiter = ReceiptWaiter(CHAIN, AsyncWeb3(AsyncHTTPProvider(node.url)), "ws://127.0.0.1:1", POLLING)
+        wait = asyncio.create_task(waiter.wait(TX_HASHES[0], timeout=5))
+        await node.mine(TX_HASHES[0])
+        assert await wait is not None
+        await waiter.close()
+
+
+@pytest.mark.asyncio
+async def test_timeout_returns_none_and_stops_waiting() -> None:
+    async with MockRpcNode() as node:
+        waiter = ReceiptWaiter(CHAIN, AsyncWeb3(AsyncHTTPProvider(node.url)), config=POLLING)
+        assert await waiter.wait(TX_HASHES[0], timeout=0.05) is None
+        await asyncio.sleep(0.02)  # lets a check already in flight finish
+        calls = node.calls["eth_getTransactionReceipt"]
+        await asyncio.sleep(0.05)
+        assert node.calls["eth_getTransactionReceipt"] == calls
+        await waiter.close()
+
+
+def test_timeout_and_poll_interval_follow_the_block_time() -> None:
+    web3 = AsyncWeb3(AsyncHTTPProvider("http://127.0.0.1:1"))
+    waiter = ReceiptWaiter(CHAIN, web3, config=ReceiptWaiterConfig(timeout_blocks=100, min_timeout=1))
+    assert waiter.timeout == CHAIN.block_time * 100
+    assert waiter.poll_interval == min(max(CHAIN.block_time / 2, 0.25), 2.0)
+    assert ReceiptWaiter(CHAIN, web3, config=ReceiptWaiterConfig(timeout_blocks=0, min_timeout=3)).timeout == 3
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from python_sdk.common.recorder import (
+    COLUMNS,
+    Recorder,
+    RecorderConfig,
+    RecordFormat,
+    RecordKind,
+    Row,
+    read_records,
+)
+from python_sdk.common.types.types import Route
+from python_sdk.mock.payloads import CHAIN, pmm_single_quote
+from python_sdk.pmm.types.quote_types import QuoteResponse
+
+QUOTE = QuoteResponse.model_validate(pmm_single_quote())
+
+
+class BlockedWriter:
+    """Holds the writer thread until released, to fill the queue"""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.rows: list[Row] = []
+
+    def write(self, kind: RecordKind, rows: list[Row]) -> None:
+        self.release.wait()
+        self.rows.extend(rows)
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_recorder_sheds_load_without_blocking() -> None:
+    writer = BlockedWriter()
+    config = RecorderConfig(queue_size=1_000, batch_size=1, sample_above=0.5, sample_rate=0.1)
+    recorder = Recorder(config, writer=writer)
+    try:
+        start = time.perf_counter()
+        for _ in range(10_000):
+            recorder.record_quote(CHAIN, Route.PMM, QUOTE)
+        recorder.record_order(CHAIN, Route.PMM, QUOTE.quoteId, error=TimeoutError("order"))
+        elapsed = time.perf_counter() - start
+        stats = recorder.stats
+    finally:
+        writer.release.set()
+        await recorder.close()
+    assert elapsed < 1
+    # Half the queue fills up, then one quote in ten is kept, until the queue is full (the writer may hold one more)
+    assert config.queue_size <= stats.recorded <= config.queue_size + 1
+    assert stats.sampled_out == pytest.approx(0.9 * (10_000 - config.queue_size / 2), abs=10)
+    assert stats.dropped == 10_000 + 1 - stats.recorded - stats.sampled_out
+    assert recorder.stats.written == len(writer.rows) == stats.recorded
+    assert all(row["quote_id"] == QUOTE.quoteId for row in writer.rows)
+
+
+@pytest.mark.asyncio
+async def test_recorder_rotates_files(tmp_path: Path) -> None:
+    config = RecorderConfig(directory=str(tmp_path), format=RecordFormat.JSONL, batch_size=10, rotate_bytes=20_000)
+    async with Recorder(config) as recorder:
+        for i in range(200):
+            recorder.record_quote(CHAIN, Route.PMM, QUOTE)
+            recorder.record_status(CHAIN, Route.PMM, str(i), error=TimeoutError("no status"))
+    files = sorted((tmp_path / RecordKind.QUOTE.value).iterdir())
+    assert len(files) > 1
+    rows = [row for file in files for row in read_records(file)]
+    assert len(rows) == 200 and set(rows[0]) == set(COLUMNS[RecordKind.QUOTE])
+    assert rows[0]["buy_amounts"] == [token.amount for token in QUOTE.buyTokens.values()]
+    statuses = [row for file in sorted((tmp_path / RecordKind.STATUS.value).iterdir()) for row in read_records(file)]
+    assert [row["quote_id"] for row in statuses] == [str(i) for i in range(200)]
+
+
+@pytest.mark.asyncio
+async def test_flush_after_close_returns(tmp_path: Path) -> None:
+    config = RecorderConfig(directory=str(tmp_path), format=RecordFormat.JSONL)
+    recorder = Recorder(config)
+    recorder.record_quote(CHAIN, Route.PMM, QUOTE)
+    await recorder.flush()
+    assert len(read_records(next((tmp_path / RecordKind.QUOTE.value).iterdir()))) == 1
+    await recorder.close()
+    await asyncio.wait_for(recorder.flush(), timeout=1)
+    # Flushing while closing waits for the records written by `close()`
+    recorder = Recorder(config)
+    recorder.record_quote(CHAIN, Route.PMM, QUOTE)
+    await asyncio.wait_for(asyncio.gather(recorder.close(), recorder.flush()), timeout=1)
+    assert recorder.stats.written == 1
@@ -0,0 +1,170 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+import pytest
+
+from python_sdk.common.exceptions import (
+    BebopAPIError,
+    BebopConnectionError,
+    BebopError,
+    BebopHTTPError,
+    BebopRateLimitError,
+    BebopServerError,
+    BebopTimeoutError,
+    BebopTransportError,
+    ReplayMismatchError,
+)
+from python_sdk.common.replay import (
+    Exchange,
+    RecordingTransport,
+    ReplayTransport,
+    _capture_error,
+    _replay_error,
+    exchange_key,
+    load_traffic,
+    replayed_quotes,
+)
+from python_sdk.common.types.types import Chain, Route
+from python_sdk.mock.payloads import USDT, WETH
+from python_sdk.pmm.types.quote_types import QuoteRequest
+
+QUOTE_URL = "https://api.bebop.xyz/pmm/arbitrum/v3/quote"
+ORDER_URL = "https://api.bebop.xyz/jam/ethereum/v2/order"
+PARAMS = QuoteRequest(sell_tokens=[USDT], buy_tokens=[WETH], sell_amounts=[1_000_000]).to_params()
+
+
+def _quote(ts: float, params: dict[str, Any] | None = None, error: BebopError | None = None) -> Exchange:
+    response = None if error is not None else {"quoteId": f"quote-{ts}"}
+    captured = _capture_error(error) if error is not None else None
+    return Exchange(ts, 0.001, "GET", QUOTE_URL, params=params or PARAMS, response=response, error=captured)
+
+
+class FakeTransport:
+    """Answers every request with `response`, or raises `error` after `delay` seconds"""
+
+    def __init__(self, response: dict[str, Any] | None = None, error: Exception | None = None) -> None:
+        self.response = response or {"status": "ok"}
+        self.error = error
+        self.delay = 0.0
+        self.closed = False
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        auth: aiohttp.BasicAuth | None = None,
+    ) -> dict[str, Any]:
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def test_exchange_key() -> None:
+    key = exchange_key("get", QUOTE_URL, PARAMS, None)
+    assert key.startswith("GET /pmm/arbitrum/v3/quote ")
+    # The host and the param order are left out
+    assert (
+        exchange_key("GET", "http://127.0.0.1:8080/pmm/arbitrum/v3/quote", dict(reversed(PARAMS.items())), None) == key
+    )
+    assert exchange_key("GET", QUOTE_URL, PARAMS | {"sell_amounts": "2000000"}, None) != key
+    # Orders are matched on their quote id, not on the signature
+    order = exchange_key("POST", ORDER_URL, None, {"quote_id": "abc", "signature": "0x01"})
+    assert order == exchange_key("POST", ORDER_URL, None, {"quote_id": "abc", "signature": "0x02"})
+    assert order != exchange_key("POST", ORDER_URL, None, {"quote_id": "def", "signature": "0x01"})
+
+    exchange = Exchange(0.0, 0.0, "POST", ORDER_URL, json={"quote_id": "abc"})
+    assert (exchange.key, exchange.route, exchange.chain) == (order, Route.JAM, Chain.ethereum)
+
+
+def test_replayed_quotes_leave_out_retried_failures() -> None:
+    other = PARAMS | {"sell_amounts": "2000000"}
+    failed, retried = _quote(0.0, error=BebopServerError(503, "Unavailable")), _quote(0.1)
+    given_up = _quote(0.2, params=other, error=BebopTimeoutError("slow"))
+    status = Exchange(0.3, 0.0, "GET", QUOTE_URL.replace("quote", "order-status"), params={"quote_id": "abc"})
+    order = Exchange(0.4, 0.0, "POST", ORDER_URL, json={"quote_id": "quote-0.1"})
+    assert replayed_quotes([failed, retried, given_up, status, order]) == [retried, given_up]
+    # The same quote asked again later is replayed again
+    again = _quote(0.5)
+    assert replayed_quotes([failed, retried, again]) == [retried, again]
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        BebopAPIError({"errorCode": 102, "message": "No quote"}),
+        BebopHTTPError(404, "Not Found"),
+        BebopRateLimitError(429, "Too Many Requests", retry_after=1.5),
+        BebopRateLimitError(429, "Too Many Requests"),
+        BebopServerError(503, "Unavailable"),
+        BebopConnectionError("refused"),
+        BebopTimeoutError("slow"),
+        BebopTransportError("reset"),
+    ],
+)
+def test_errors_round_trip(error: BebopError) -> None:
+    replayed = _replay_error(_capture_error(error), "GET")
+    assert type(replayed) is type(error) and str(replayed) == str(error)
+    if isinstance(error, BebopAPIError):
+        assert isinstance(replayed, BebopAPIError) and replayed.code == error.code
+    if isinstance(error, BebopRateLimitError):
+        assert isinstance(replayed, BebopRateLimitError) and replayed.retry_after == error.retry_after
+
+
+@pytest.mark.asyncio
+async def test_unknown_requests_raise_a_mismatch() -> None:
+    transport = ReplayTransport([_quote(0.0)], speed=None)
+    other = PARAMS | {"sell_amounts": "2000000"}
+    with pytest.raises(ReplayMismatchError) as error:
+        await transport.request("GET", QUOTE_URL, params=other)
+    assert error.value.key == exchange_key("GET", QUOTE_URL, other, None)
+    assert (transport.served, transport.misses) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_recorded_exchanges_are_replayed_in_order() -> None:
+    transport = ReplayTransport([_quote(0.0, error=BebopServerError(503, "Unavailable")), _quote(0.1)], speed=None)
+    with pytest.raises(BebopServerError):
+        await transport.request("get", QUOTE_URL, params=PARAMS)
+    assert await transport.request("GET", QUOTE_URL, params=PARAMS) == {"quoteId": "quote-0.1"}
+    # The last one is repeated once they are used up
+    assert await transport.request("GET", QUOTE_URL, params=PARAMS) == {"quoteId": "quote-0.1"}
+    assert (transport.served, transport.misses) == (3, 0)
+
+
+@pytest.mark.asyncio
+async def test_recording_captures_responses_and_errors(tmp_path: Path) -> None:
+    path = tmp_path / "traffic.jsonl"
+    fake = FakeTransport({"quoteId": "abc"})
+    recording = RecordingTransport(fake, path)
+    assert await recording.request("get", QUOTE_URL, params=PARAMS) == {"quoteId": "abc"}
+    fake.error = BebopServerError(503, "Unavailable")
+    with pytest.raises(BebopServerError):
+        await recording.request("POST", ORDER_URL, json={"quote_id": "abc"})
+    # Cancelled requests are not captured
+    fake.delay = 1.0
+    cancelled = asyncio.create_task(recording.request("GET", QUOTE_URL, params=PARAMS))
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    await recording.close()
+    assert fake.closed and recording.captured == 2
+
+    quote, order = load_traffic(path)
+    assert (quote.method, quote.response, quote.error) == ("GET", {"quoteId": "abc"}, None)
+    assert quote.key == exchange_key("GET", QUOTE_URL, PARAMS, None) and order.ts >= quote.ts
+    assert order.response is None and order.error == _capture_error(BebopServerError(503, "Unavailable"))
+    # Captured traffic answers the same requests
+    replay = ReplayTransport(path, speed=None)
+    assert await replay.request("GET", QUOTE_URL, params=PARAMS) == {"quoteId": "abc"}
+    with pytest.raises(BebopServerError):
+        await replay.request("POST", ORDER_URL, json={"quote_id": "abc", "signature": "0x"})
@@ -0,0 +1,305 @@
+import asyncio
+import time
+from typing import Any
+
+import aiohttp
+import pytest
+
+from python_sdk.common.exceptions import (
+    BebopAPIError,
+    BebopConnectionError,
+    BebopHTTPError,
+    BebopRateLimitError,
+    BebopServerError,
+    BebopTimeoutError,
+    CircuitOpenError,
+)
+from python_sdk.common.resilience import (
+    BreakerConfig,
+    CircuitBreaker,
+    CircuitState,
+    HedgeConfig,
+    ResilienceConfig,
+    ResilientTransport,
+    RetryConfig,
+)
+
+URL = "https://api.bebop.xyz/pmm/arbitrum/v3/quote"
+ORDER_URL = "https://api.bebop.xyz/pmm/arbitrum/v3/order"
+OK = {"status": "ok"}
+RETRY = RetryConfig(max_attempts=3, backoff=0.001, jitter=0)
+BREAKER = BreakerConfig(failure_threshold=2, reset_timeout=0.05)
+API_ERROR = BebopAPIError({"errorCode": 102, "message": "No quote"})
+
+Step = dict[str, Any] | Exception | tuple[float, "dict[str, Any] | Exception"]
+
+
+class FakeTransport:
+    """Answers each request with the next scripted step: a result, an exception, or either after a delay"""
+
+    def __init__(self, *steps: Step) -> None:
+        self.steps = list(steps)
+        self.calls = 0
+        self.cancelled = 0
+        self.closed = False
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        auth: aiohttp.BasicAuth | None = None,
+    ) -> dict[str, Any]:
+        self.calls += 1
+        step = self.steps.pop(0) if self.steps else OK
+        if isinstance(step, tuple):
+            delay, step = step
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        if isinstance(step, Exception):
+            raise step
+        return step
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _transport(
+    fake: FakeTransport,
+    retry: RetryConfig | None = RETRY,
+    hedge: HedgeConfig | None = None,
+    breaker: BreakerConfig | None = None,
+) -> ResilientTransport:
+    return ResilientTransport(fake, ResilienceConfig(retry=retry, hedge=hedge, breaker=breaker))
+
+
+# ---------------------------------- Retries --------------------------------- #
+@pytest.mark.asyncio
+async def test_get_is_retried_on_transport_errors_and_retry_statuses() -> None:
+    fake = FakeTransport(BebopTimeoutError("slow"), BebopServerError(503, "Unavailable"), OK)
+    assert await _transport(fake).request("GET", URL) == OK
+    assert fake.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_retries_stop_after_max_attempts() -> None:
+    fake = FakeTransport(*[BebopServerError(502, "Bad Gateway")] * 3)
+    with pytest.raises(BebopServerError):
+        await _transport(fake).request("GET", URL)
+    assert fake.calls == 3
+    fake = FakeTransport(BebopServerError(502, "Bad Gateway"))
+    with pytest.raises(BebopServerError):
+        await _transport(fake, retry=None).request("GET", URL)
+    assert fake.calls == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [API_ERROR, BebopHTTPError(400, "Bad Request"), ValueError("malformed")])
+async def test_caller_errors_are_not_retried(error: Exception) -> None:
+    fake = FakeTransport(error)
+    with pytest.raises(type(error)):
+        await _transport(fake).request("GET", URL)
+    assert fake.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_post_is_only_retried_when_it_was_not_processed() -> None:
+    fake = FakeTransport(BebopConnectionError("refused"), BebopServerError(503, "Unavailable"), OK)
+    assert await _transport(fake).request("POST", ORDER_URL, json={}) == OK
+    assert fake.calls == 3
+    # The order may have been accepted
+    for error in (BebopTimeoutError("slow"), BebopServerError(502, "Bad Gateway")):
+        fake = FakeTransport(error)
+        with pytest.raises(type(error)):
+            await _transport(fake).request("POST", ORDER_URL, json={})
+        assert fake.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honoured_up_to_max_backoff() -> None:
+    retry = RetryConfig(backoff=1.0, max_backoff=0.05, jitter=0)
+    fake = FakeTransport(BebopRateLimitError(429, "Too Many Requests", retry_after=0.03), OK)
+    start = time.monotonic()
+    assert await _transport(fake, retry=retry).request("GET", URL) == OK
+    assert 0.03 <= time.monotonic() - start < 0.05
+    fake = FakeTransport(BebopRateLimitError(429, "Too Many Requests", retry_after=60), OK)
+    start = time.monotonic()
+    assert await _transport(fake, retry=retry).request("GET", URL) == OK
+    assert time.monotonic() - start < 0.5
+
+
+# ---------------------------------- Hedging --------------------------------- #
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged_and_the_first_response_wins() -> None:
+    fake = FakeTransport((1.0, {"first": True}), (0.0, OK))
+    start = time.monotonic()
+    assert await _transport(fake, hedge=HedgeConfig(delay=0.02)).request("GET", URL) == OK
+    assert time.monotonic() - start < 0.5
+    await asyncio.sleep(0)
+    assert fake.calls == 2 and fake.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_failure_does_not_hide_a_later_success() -> None:
+    fake = FakeTransport((0.05, OK), (0.0, BebopServerError(503, "Unavailable")))
+    assert await _transport(fake, retry=None, hedge=HedgeConfig(delay=0.01)).request("GET", URL) == OK
+    assert fake.calls == 2
+    # Every copy failing raises
+    fake = FakeTransport((0.02, BebopTimeoutError("slow")), (0.0, BebopServerError(503, "Unavailable")))
+    with pytest.raises(BebopTimeoutError):
+        await _transport(fake, retry=None, hedge=HedgeConfig(delay=0.01)).request("GET", URL)
+
+
+@pytest.mark.asyncio
+async def test_only_configured_gets_are_hedged() -> None:
+    hedge = HedgeConfig(delay=0.01)
+    post, status = FakeTransport((0.03, OK)), FakeTransport((0.03, OK))
+    await _transport(post, hedge=hedge).request("POST", ORDER_URL, json={})
+    await _transport(status, hedge=hedge).request("GET", ORDER_URL + "-status")
+    assert post.calls == status.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_delay_follows_recent_latencies() -> None:
+    hedge = HedgeConfig(min_samples=3, percentile=0.5, min_delay=0.01)
+    fake = FakeTransport(*[(0.001, OK)] * 3)
+    transport = _transport(fake, hedge=hedge)
+    # Not hedged until enough latencies were observed
+    for _ in range(3):
+        await transport.request("GET", URL)
+    assert fake.calls == 3
+    fake.steps = [(1.0, {"first": True}), (0.0, OK)]
+    assert await transport.request("GET", URL) == OK
+    assert fake.calls == 5
+
+
+# ------------------------------ Circuit breaker ----------------------------- #
+def test_breaker_transitions() -> None:
+    breaker = CircuitBreaker("GET /quote", BREAKER)
+    assert breaker.state == CircuitState.CLOSED and breaker.before_request() is False
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED  # failures must be consecutive
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_request()
+    assert error.value.endpoint == "GET /quote" and 0 < error.value.retry_in <= BREAKER.reset_timeout
+
+    time.sleep(BREAKER.reset_timeout)
+    assert breaker.before_request() is True and breaker.state == CircuitState.HALF_OPEN
+    # Only one trial at a time
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+
+    time.sleep(BREAKER.reset_timeout)
+    assert breaker.before_request() is True
+    breaker.release_trial()
+    assert breaker.state == CircuitState.OPEN
+    # The next request is the new trial, without waiting for another reset timeout
+    assert breaker.before_request() is True
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED and breaker.before_request() is False
+    breaker.release_trial()
+    assert breaker.state == CircuitState.CLOSED
+
+
+async def _open(transport: ResilientTransport, fake: FakeTransport) -> None:
+    fake.steps = [BebopServerError(503, "Unavailable")] * BREAKER.failure_threshold
+    for _ in range(BREAKER.failure_threshold):
+        with pytest.raises((BebopServerError, CircuitOpenError)):
+            await transport.request("GET", URL)
+    breaker = transport.breaker(f"GET {URL.removeprefix('https://api.bebop.xyz')}")
+    assert breaker is not None and breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        await transport.request("GET", URL)
+    await asyncio.sleep(BREAKER.reset_timeout)
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_on_endpoint_failures_and_fails_fast() -> None:
+    fake = FakeTransport()
+    transport = _transport(fake, retry=RetryConfig(max_attempts=5, backoff=0.001), breaker=BREAKER)
+    fake.steps = [BebopServerError(503, "Unavailable")] * 5
+    # Retries stop once the circuit opens
+    with pytest.raises(CircuitOpenError):
+        await transport.request("GET", URL)
+    assert fake.calls == BREAKER.failure_threshold
+    # Endpoints have their own breaker
+    fake.steps = []
+    assert await transport.request("GET", URL.replace("quote", "pricing")) == OK
+    breaker = transport.breaker("GET /pmm/arbitrum/v3/pricing")
+    assert breaker is not None and breaker.state == CircuitState.CLOSED
+    assert _transport(fake).breaker("GET /pmm/arbitrum/v3/pricing") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("outcome", "state"),
+    [
+        (OK, CircuitState.CLOSED),
+        (API_ERROR, CircuitState.CLOSED),
+        (BebopHTTPError(404, "Not Found"), CircuitState.CLOSED),
+        (ValueError("malformed"), CircuitState.CLOSED),
+        (BebopServerError(500, "Internal Server Error"), CircuitState.OPEN),
+        (BebopTimeoutError("slow"), CircuitState.OPEN),
+    ],
+)
+async def test_trial_request_resolves_the_circuit(outcome: dict[str, Any] | Exception, state: CircuitState) -> None:
+    fake = FakeTransport()
+    transport = _transport(fake, retry=None, breaker=BREAKER)
+    await _open(transport, fake)
+    fake.steps = [outcome]
+    try:
+        await transport.request("GET", URL)
+    except Exception as e:
+        assert e is outcome
+    breaker = transport.breaker("GET /pmm/arbitrum/v3/quote")
+    assert breaker is not None and breaker.state == state
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_lets_the_next_request_through() -> None:
+    fake = FakeTransport()
+    transport = _transport(fake, retry=None, breaker=BREAKER)
+    await _open(transport, fake)
+    fake.steps = [(1.0, OK)]
+    trial = asyncio.create_task(transport.request("GET", URL))
+    await asyncio.sleep(0.01)
+    # The trial is still in flight
+    with pytest.raises(CircuitOpenError):
+        await transport.request("GET", URL)
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+    breaker = transport.breaker("GET /pmm/arbitrum/v3/quote")
+    assert breaker is not None and breaker.state == CircuitState.OPEN
+    assert await transport.request("GET", URL) == OK
+    assert breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_failed_trial_is_not_retried_through_the_open_circuit() -> None:
+    fake = FakeTransport()
+    transport = _transport(fake, retry=RetryConfig(max_attempts=5, backoff=0.001), breaker=BREAKER)
+    await _open(transport, fake)
+    calls = fake.calls
+    fake.steps = [BebopServerError(503, "Unavailable"), OK]
+    with pytest.raises(CircuitOpenError):
+        await transport.request("GET", URL)
+    assert fake.calls == calls + 1
+
+
+@pytest.mark.asyncio
+async def test_close_closes_the_wrapped_transport() -> None:
+    fake = FakeTransport()
+    await _transport(fake).close()
+    assert fake.closed
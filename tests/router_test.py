@@ -0,0 +1,113 @@
+from typing import Any
+
+import aiohttp
+import pytest
+
+from python_sdk.common.client_config import ClientConfig
+from python_sdk.common.exceptions import BebopAPIError
+from python_sdk.common.nonce_manager import NonceManager, shared_nonce_manager
+from python_sdk.common.quote_cache import QuoteCache
+from python_sdk.common.token_state import default_spenders
+from python_sdk.common.transport import AioHttpTransport
+from python_sdk.common.types.types import Chain, Env, Route
+from python_sdk.jam.types.quote_types import QuoteRequest as JamQuoteRequest
+from python_sdk.jam.types.quote_types import QuoteResponse as JamQuoteResponse
+from python_sdk.mock.payloads import CHAIN, USDC, USDT, WETH
+from python_sdk.mock.server import MockBebopServer
+from python_sdk.pmm.types.quote_types import QuoteRequest as PmmQuoteRequest
+from python_sdk.pmm.types.quote_types import QuoteResponse as PmmQuoteResponse
+from python_sdk.router import BebopRouter
+
+OTHER_CHAIN = Chain.ethereum
+
+
+class ClosingTransport(AioHttpTransport):
+    """Counts how many times it is closed"""
+
+    def __init__(self, base_url: str) -> None:
+        super().__init__(base_url=base_url)
+        self.closed = 0
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, Any] | None = None,
+        auth: aiohttp.BasicAuth | None = None,
+    ) -> dict[str, Any]:
+        assert not self.closed
+        return await super().request(method, url, params=params, json=json, headers=headers, auth=auth)
+
+    async def close(self) -> None:
+        self.closed += 1
+        await super().close()
+
+
+@pytest.mark.asyncio
+async def test_clients_of_a_chain_share_its_resources() -> None:
+    cache = QuoteCache()
+    async with BebopRouter(Env.PROD, config=ClientConfig(quote_cache=cache)) as router:
+        pmm, jam = router.pmm(CHAIN), router.jam(CHAIN.id)
+        assert router.pmm(CHAIN.id) is pmm and router.client(CHAIN, Route.JAM) is jam
+        assert pmm.web3 is jam.web3 is router.web3(CHAIN)
+        assert pmm.gas_oracle is jam.gas_oracle
+        assert pmm.token_state is jam.token_state
+        # One reader for the allowances to every spender of both routes
+        assert pmm.token_state.spenders == [*default_spenders(CHAIN), CHAIN.permit2_address]
+        assert pmm.nonce_manager is jam.nonce_manager is router.nonce_manager is shared_nonce_manager()
+        assert pmm.token_registry is jam.token_registry is router.token_registry
+        assert pmm.quote_cache is jam.quote_cache is cache
+
+        other = router.pmm(OTHER_CHAIN)
+        assert other.web3 is not pmm.web3 and other.gas_oracle is not pmm.gas_oracle
+        assert other.token_state is not pmm.token_state and other.token_registry is pmm.token_registry
+        assert router.active_chains == sorted([CHAIN, OTHER_CHAIN])
+
+
+@pytest.mark.asyncio
+async def test_resources_passed_in_are_used() -> None:
+    manager = NonceManager()
+    async with BebopRouter(Env.PROD, config=ClientConfig(nonce_manager=manager)) as router:
+        assert router.nonce_manager is router.jam(CHAIN).nonce_manager is manager
+
+
+@pytest.mark.asyncio
+async def test_only_enabled_chains_are_served() -> None:
+    async with BebopRouter(Env.PROD, chains=[CHAIN]) as router:
+        assert router.chain(CHAIN.id) == CHAIN
+        with pytest.raises(ValueError, match="not enabled"):
+            router.pmm(OTHER_CHAIN)
+        with pytest.raises(ValueError, match="not enabled"):
+            router.web3(OTHER_CHAIN.id)
+        assert router.active_chains == []
+
+
+@pytest.mark.asyncio
+async def test_quotes_are_routed_by_request_type_and_chain() -> None:
+    requests: list[tuple[Chain | int, PmmQuoteRequest | JamQuoteRequest]] = [
+        (CHAIN, PmmQuoteRequest(sell_tokens=[USDT], buy_tokens=[WETH], sell_amounts=[1_000_000])),
+        (CHAIN.id, JamQuoteRequest(sell_tokens=[USDC], buy_tokens=[WETH], sell_amounts=[2_000_000])),
+        (
+            OTHER_CHAIN,
+            PmmQuoteRequest(
+                sell_tokens=[OTHER_CHAIN.tokens["USDT"]], buy_tokens=[OTHER_CHAIN.tokens["WETH"]], sell_amounts=[3]
+            ),
+        ),
+        # One amount for two sell tokens, rejected by the server
+        (CHAIN, JamQuoteRequest(sell_tokens=[USDT, USDC], buy_tokens=[WETH], sell_amounts=[1_000_000])),
+    ]
+    async with MockBebopServer() as server:
+        transport = ClosingTransport(base_url=server.url)
+        async with BebopRouter(Env.PROD, config=ClientConfig(transport=transport)) as router:
+            results = await router.get_quotes(requests, max_concurrency=2)
+            assert router.active_chains == sorted([CHAIN, OTHER_CHAIN])
+        # The transport passed in is shared by all clients, and not closed by them or the router
+        assert transport.closed == 0
+        await transport.close()
+
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert [type(result.quote) for result in results[:3]] == [PmmQuoteResponse, JamQuoteResponse, PmmQuoteResponse]
+    assert [result.quote.chainId for result in results[:3] if result.quote] == [CHAIN.id, CHAIN.id, OTHER_CHAIN.id]
+    assert isinstance(results[3].error, BebopAPIError)
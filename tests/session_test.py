@@ -0,0 +1,90 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+import pytest
+
+from python_sdk.common.session import SessionConfig, SessionManager, create_session
+from python_sdk.mock.server import MockBebopServer
+
+
+def _connection_counter() -> tuple[aiohttp.TraceConfig, dict[str, int]]:
+    counts = {"created": 0, "reused": 0}
+    trace = aiohttp.TraceConfig()
+
+    async def on_create(session: aiohttp.ClientSession, context: SimpleNamespace, params: Any) -> None:
+        counts["created"] += 1
+
+    async def on_reuse(session: aiohttp.ClientSession, context: SimpleNamespace, params: Any) -> None:
+        counts["reused"] += 1
+
+    # aiohttp 3.10 annotates its trace signals with the wrong callback type
+    signals: list[Any] = [trace.on_connection_create_end, trace.on_connection_reuseconn]
+    signals[0].append(on_create)
+    signals[1].append(on_reuse)
+    return trace, counts
+
+
+@pytest.mark.asyncio
+async def test_session_is_created_lazily_and_reused() -> None:
+    manager = SessionManager()
+    assert manager.closed
+    sessions = await asyncio.gather(*(manager.get() for _ in range(10)))
+    assert all(session is sessions[0] for session in sessions)
+    assert await manager.get() is sessions[0]
+    assert not manager.closed
+    await manager.close()
+    assert manager.closed and sessions[0].closed
+
+
+@pytest.mark.asyncio
+async def test_closed_session_is_recreated() -> None:
+    manager = SessionManager()
+    first = await manager.get()
+    await manager.close()
+    second = await manager.get()
+    assert second is not first and not second.closed
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_injected_session_is_never_closed() -> None:
+    session = aiohttp.ClientSession()
+    manager = SessionManager(session=session)
+    assert await manager.get() is session
+    await manager.close()
+    assert not session.closed
+    assert await manager.get() is session
+    await session.close()
+    with pytest.raises(RuntimeError, match="has been closed"):
+        await manager.get()
+
+
+@pytest.mark.asyncio
+async def test_create_session_applies_config() -> None:
+    config = SessionConfig(limit=7, limit_per_host=3, total_timeout=5.0, connect_timeout=1.0, ttl_dns_cache=None)
+    session = create_session(config, headers={"source-auth": "key"})
+    try:
+        connector = session.connector
+        assert isinstance(connector, aiohttp.TCPConnector)
+        assert (connector.limit, connector.limit_per_host) == (7, 3)
+        assert not connector.use_dns_cache
+        assert (session.timeout.total, session.timeout.connect) == (5.0, 1.0)
+        assert session.headers["source-auth"] == "key"
+    finally:
+        await session.close()
+
+
+@pytest.mark.asyncio
+async def test_connections_are_pooled() -> None:
+    trace, counts = _connection_counter()
+    manager = SessionManager(trace_configs=[trace])
+    async with MockBebopServer() as server:
+        for _ in range(5):
+            session = await manager.get()
+            async with session.get(f"{server.url}/pmm/arbitrum/v3/order-status", params={"quote_id": "1"}) as response:
+                assert response.ok
+                await response.read()
+        await manager.close()
+    assert counts == {"created": 1, "reused": 4}
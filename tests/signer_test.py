@@ -0,0 +1,138 @@
+import asyncio
+import threading
+
+import pytest
+from eth_account import Account
+from eth_account.messages import SignableMessage
+from eth_account.signers.local import LocalAccount
+from web3.types import Nonce, TxParams, Wei
+
+from python_sdk.common import signer as signer_module
+from python_sdk.common.funcs import sign_order
+from python_sdk.common.signer import LocalSigner, PoolSigner, Signer, SignerPoolConfig, _sign_messages
+from python_sdk.jam.types.quote_types import QuoteResponse as JamQuoteResponse
+from python_sdk.mock.payloads import jam_quote, pmm_aggregate_quote, pmm_multi_quote, pmm_single_quote
+from python_sdk.pmm.types.quote_types import QuoteResponse as PmmQuoteResponse
+
+PRIVATE_KEY = "0x" + "11" * 32
+ACCOUNT: LocalAccount = Account.from_key(PRIVATE_KEY)
+THREADS = SignerPoolConfig(max_workers=1, use_threads=True, max_batch_size=1)
+
+
+def _quotes() -> list[PmmQuoteResponse | JamQuoteResponse]:
+    return [
+        PmmQuoteResponse.model_validate(pmm_single_quote()),
+        PmmQuoteResponse.model_validate(pmm_multi_quote()),
+        PmmQuoteResponse.model_validate(pmm_aggregate_quote()),
+        JamQuoteResponse.model_validate(jam_quote()),
+    ]
+
+
+class BlockedSigning:
+    """`_sign_messages` replacement holding every batch in the pool until released"""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.batches = 0
+
+    def __call__(self, messages: list[SignableMessage]) -> list[str]:
+        self.batches += 1
+        self.release.wait(timeout=10)
+        return _sign_messages(messages)
+
+
+@pytest.fixture
+def blocked(monkeypatch: pytest.MonkeyPatch) -> BlockedSigning:
+    signing = BlockedSigning()
+    monkeypatch.setattr(signer_module, "_sign_messages", signing)
+    return signing
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_threads", [False, True])
+async def test_pool_signer_signatures_are_identical(use_threads: bool) -> None:
+    quotes = _quotes()
+    async with PoolSigner(PRIVATE_KEY, SignerPoolConfig(max_workers=2, use_threads=use_threads)) as signer:
+        assert signer.address == ACCOUNT.address
+        signatures = await signer.sign_messages([quote.signable_message() for quote in quotes])
+        assert signatures == [quote.sign_order(ACCOUNT) for quote in quotes]
+        assert await asyncio.gather(*(sign_order(quote, signer) for quote in quotes)) == signatures
+        tx: TxParams = {
+            "to": ACCOUNT.address,
+            "value": Wei(1),
+            "gas": 21_000,
+            "gasPrice": Wei(10**8),
+            "nonce": Nonce(0),
+            "chainId": 42161,
+        }
+        assert await signer.sign_transactions([tx]) == [ACCOUNT.sign_transaction(tx).rawTransaction]
+
+
+async def _start_signing(
+    signer: Signer, quotes: list[PmmQuoteResponse | JamQuoteResponse]
+) -> asyncio.Future[list[str]]:
+    """Sign `quotes` concurrently in the background, after running the event loop for 100 more iterations"""
+    signing = asyncio.ensure_future(asyncio.gather(*(sign_order(quote, signer) for quote in quotes)))
+    for _ in range(100):
+        await asyncio.sleep(0)
+    return signing
+
+
+@pytest.mark.asyncio
+async def test_pool_signer_keeps_loop_responsive(blocked: BlockedSigning) -> None:
+    quotes = [quote for _ in range(4) for quote in _quotes()]
+    expected = [quote.sign_order(ACCOUNT) for quote in quotes]
+    # Signing inline is over by then: it ran on the loop thread, blocking it
+    local = await _start_signing(LocalSigner(ACCOUNT), quotes)
+    assert local.done() and local.result() == expected
+
+    # Every batch is held in the pool: the loop must keep running callbacks in the meantime
+    async with PoolSigner(PRIVATE_KEY, SignerPoolConfig(max_workers=2, use_threads=True)) as signer:
+        signing = await _start_signing(signer, quotes)
+        assert not signing.done()
+        blocked.release.set()
+        assert await signing == expected
+
+
+@pytest.mark.asyncio
+async def test_cancelled_messages_are_not_signed(blocked: BlockedSigning) -> None:
+    (quote, *_) = _quotes()
+    blocked.release.set()
+    async with PoolSigner(PRIVATE_KEY, THREADS) as signer:
+        cancelled = asyncio.ensure_future(signer.sign_messages([quote.signable_message()]))
+        await asyncio.sleep(0)  # queued, the batch is flushed on the next loop iteration
+        cancelled.cancel()
+        assert await signer.sign_messages([quote.signable_message()]) == [quote.sign_order(ACCOUNT)]
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+    assert blocked.batches == 1
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_queued_messages(blocked: BlockedSigning) -> None:
+    quotes = _quotes()
+    signer = PoolSigner(PRIVATE_KEY, THREADS)
+    # Not flushed yet
+    queued = asyncio.ensure_future(signer.sign_messages([quotes[0].signable_message()]))
+    await asyncio.sleep(0)
+    await signer.close()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    assert blocked.batches == 0
+
+    # One batch signing in the single worker, the others waiting for it are cancelled by `close()`
+    signing = await _start_signing(signer, quotes)
+    while not blocked.batches:
+        await asyncio.sleep(0.001)
+    closing = asyncio.ensure_future(signer.close())
+    await asyncio.sleep(0.01)
+    assert not closing.done()  # waits for the batch in progress
+    blocked.release.set()
+    await closing
+    with pytest.raises(asyncio.CancelledError):
+        await signing
+    assert blocked.batches == 1
+
+    # The pool is started again on next use
+    assert await signer.sign_messages([quotes[0].signable_message()]) == [quotes[0].sign_order(ACCOUNT)]
+    await signer.close()
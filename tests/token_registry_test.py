@@ -0,0 +1,148 @@
+import sqlite3
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import pytest
+from eth_abi.abi import decode, encode
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from python_sdk.common.constants import NATIVE_TOKEN
+from python_sdk.common.token_registry import DECIMALS_SELECTOR, SYMBOL_SELECTOR, TokenRegistry, _decode_symbol
+from python_sdk.common.token_state import TokenStateReader
+from python_sdk.mock.payloads import CHAIN, USDC, USDT, WETH, pmm_single_quote
+from python_sdk.mock.rpc import MockRpcNode
+from python_sdk.pmm.types.quote_types import QuoteResponse
+
+NEW = AsyncWeb3.to_checksum_address("0x" + "42" * 20)
+MKR_LIKE = AsyncWeb3.to_checksum_address("0x" + "43" * 20)
+BROKEN = AsyncWeb3.to_checksum_address("0x" + "44" * 20)
+
+
+def _bytes32(symbol: str) -> bytes:
+    return symbol.encode().ljust(32, b"\x00")
+
+
+class FakeTokens:
+    """`eth_call` handler executing Multicall3 `aggregate3` calls to `decimals()` and `symbol()`"""
+
+    def __init__(self, results: dict[tuple[str, bytes], bytes]) -> None:
+        self.results = {(address.lower(), selector): data for (address, selector), data in results.items()}
+        self.calls: list[tuple[str, bytes]] = []
+
+    def __call__(self, params: list[Any]) -> str:
+        (calls,) = decode(["(address,bool,bytes)[]"], bytes.fromhex(params[0]["data"][2:])[4:])
+        self.calls.extend((target.lower(), calldata) for target, _, calldata in calls)
+        results = [
+            (key in self.results, self.results.get(key, b""))
+            for key in ((target.lower(), calldata) for target, _, calldata in calls)
+        ]
+        return "0x" + encode(["(bool,bytes)[]"], [results]).hex()
+
+
+def test_chains_are_seeded() -> None:
+    registry = TokenRegistry()
+    usdc = registry.by_symbol(CHAIN.id, "usdc")
+    assert usdc is not None and usdc.address == AsyncWeb3.to_checksum_address(USDC) and usdc.decimals is None
+    assert registry.get(CHAIN.id, USDC.lower()) == usdc
+    native = registry.get(CHAIN.id, NATIVE_TOKEN)
+    assert native is not None and (native.symbol, native.decimals) == (CHAIN.native_symbol, 18)
+    with pytest.raises(ValueError, match="Unknown decimals"):
+        registry.decimals(CHAIN.id, USDC)
+    assert registry.get(CHAIN.id, NEW) is None
+    # Unknown chains are not seeded
+    assert registry.get(999_999, NATIVE_TOKEN) is None
+
+
+def test_tokens_are_learned_from_quotes() -> None:
+    registry = TokenRegistry()
+    quote = QuoteResponse.model_validate(pmm_single_quote())
+    registry.learn(quote)
+    for address, token in [*quote.sellTokens.items(), *quote.buyTokens.items()]:
+        assert registry.decimals(CHAIN.id, address) == token.decimals
+        assert registry.amount_decimal(CHAIN.id, address, token.amount) == token.amount_decimal
+    usdt = registry.by_symbol(CHAIN.id, "USDT")
+    assert usdt is not None and usdt.complete
+    assert registry.amount_raw(CHAIN.id, USDT, "1.5") == 1_500_000
+    assert registry.amount_decimal(CHAIN.id, USDT, 1_500_000) == Decimal("1.5")
+
+
+def test_add_keeps_known_values() -> None:
+    registry = TokenRegistry()
+    token = registry.add(CHAIN.id, NEW, symbol="NEW")
+    assert registry.add(CHAIN.id, NEW.lower()) is token
+    completed = registry.add(CHAIN.id, NEW, decimals=9)
+    assert (completed.symbol, completed.decimals) == ("NEW", 9)
+    assert registry.by_symbol(CHAIN.id, "new") == completed
+
+
+def test_tokens_are_persisted(tmp_path: Path) -> None:
+    path = tmp_path / "tokens.sqlite"
+    registry = TokenRegistry(path)
+    registry.learn(QuoteResponse.model_validate(pmm_single_quote()))
+    registry.add(CHAIN.id, NEW, symbol="NEW", decimals=9)
+    registry.add(CHAIN.id, NEW, decimals=12)
+    registry.close()
+
+    with sqlite3.connect(path) as db:
+        rows = db.execute("SELECT chain_id, address, symbol, decimals FROM tokens WHERE address = ?", [NEW]).fetchall()
+    assert rows == [(CHAIN.id, NEW, "NEW", 12)]
+
+    restarted = TokenRegistry(path)
+    assert restarted.get(CHAIN.id, NEW) == registry.get(CHAIN.id, NEW)
+    assert restarted.by_symbol(CHAIN.id, "NEW") == registry.get(CHAIN.id, NEW)
+    assert restarted.decimals(CHAIN.id, USDT) == 6
+    # Seeding does not overwrite what was persisted
+    weth = restarted.by_symbol(CHAIN.id, "WETH")
+    assert weth is not None and weth.decimals == 18
+    restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_missing_tokens_are_loaded_with_one_multicall(tmp_path: Path) -> None:
+    tokens = FakeTokens(
+        {
+            (NEW, DECIMALS_SELECTOR): encode(["uint8"], [9]),
+            (NEW, SYMBOL_SELECTOR): encode(["string"], ["NEW"]),
+            (MKR_LIKE, DECIMALS_SELECTOR): encode(["uint8"], [18]),
+            (MKR_LIKE, SYMBOL_SELECTOR): _bytes32("MKR"),
+            (WETH, DECIMALS_SELECTOR): encode(["uint8"], [18]),
+            (WETH, SYMBOL_SELECTOR): encode(["string"], ["Wrapped Ether"]),
+        }
+    )
+    registry = TokenRegistry(tmp_path / "tokens.sqlite")
+    async with MockRpcNode(handlers={"eth_call": tokens}) as node:
+        reader = TokenStateReader(CHAIN, AsyncWeb3(AsyncHTTPProvider(node.url)))
+        loaded = await registry.load(reader, [NEW, MKR_LIKE, WETH, BROKEN, NEW])
+        assert node.calls["eth_call"] == 1 and len(tokens.calls) == 8
+        assert [(token.symbol, token.decimals) for token in loaded] == [
+            ("NEW", 9),
+            ("MKR", 18),
+            ("WETH", 18),  # the seeded symbol is kept over the on-chain one
+            (None, None),
+            ("NEW", 9),
+        ]
+        # Complete tokens are not read again, incomplete ones are
+        await registry.load(reader, [NEW, MKR_LIKE, WETH, BROKEN])
+        assert node.calls["eth_call"] == 2 and tokens.calls[8:] == [
+            (BROKEN.lower(), DECIMALS_SELECTOR),
+            (BROKEN.lower(), SYMBOL_SELECTOR),
+        ]
+    registry.close()
+    restarted = TokenRegistry(tmp_path / "tokens.sqlite")
+    assert restarted.by_symbol(CHAIN.id, "MKR") == loaded[1]
+    restarted.close()
+
+
+@pytest.mark.parametrize(
+    ("data", "symbol"),
+    [
+        (encode(["string"], ["USDC"]), "USDC"),
+        (_bytes32("MKR"), "MKR"),
+        (_bytes32(""), None),
+        (b"", None),
+        (None, None),
+    ],
+)
+def test_decode_symbol(data: bytes | None, symbol: str | None) -> None:
+    assert _decode_symbol(data) == symbol
@@ -0,0 +1,151 @@
+from typing import Any
+
+import pytest
+from eth_abi.abi import decode, encode
+from eth_utils.abi import function_signature_to_4byte_selector
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from python_sdk.common import constants
+from python_sdk.common.token_state import (
+    ALLOWANCE_SELECTOR,
+    BALANCE_OF_SELECTOR,
+    GET_ETH_BALANCE_SELECTOR,
+    MAX_UINT256,
+    TokenStateReader,
+    default_spenders,
+    missing_approvals,
+)
+from python_sdk.mock import payloads
+from python_sdk.mock.payloads import CHAIN
+from python_sdk.mock.rpc import MockRpcNode
+
+AGGREGATE3_SELECTOR = function_signature_to_4byte_selector("aggregate3((address,bool,bytes)[])")
+# Checksummed, as the states are keyed
+TAKER, OTHER = AsyncWeb3.to_checksum_address(payloads.TAKER), AsyncWeb3.to_checksum_address("0x" + "42" * 20)
+USDT, USDC, WETH = (AsyncWeb3.to_checksum_address(token) for token in (payloads.USDT, payloads.USDC, payloads.WETH))
+NATIVE_TOKEN = AsyncWeb3.to_checksum_address(constants.NATIVE_TOKEN)
+SPENDERS = default_spenders(CHAIN)
+
+
+class FakeMulticall:
+    """`eth_call` handler executing Multicall3 `aggregate3` against in-memory balances and allowances.
+
+    Calls to tokens in `reverting` fail, tokens in `empty` return no data, as non-standard tokens can.
+    """
+
+    def __init__(self) -> None:
+        self.balances: dict[tuple[str, str], int] = {}
+        self.allowances: dict[tuple[str, str, str], int] = {}
+        self.reverting: set[str] = set()
+        self.empty: set[str] = set()
+        self.batches: list[int] = []
+
+    def __call__(self, params: list[Any]) -> str:
+        tx = params[0]
+        assert tx["to"].lower() == CHAIN.multicall_address.lower()
+        data = bytes.fromhex(tx["data"][2:])
+        assert data[:4] == AGGREGATE3_SELECTOR
+        (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+        self.batches.append(len(calls))
+        results = [self.__execute(target.lower(), calldata) for target, _, calldata in calls]
+        return "0x" + encode(["(bool,bytes)[]"], [results]).hex()
+
+    def __execute(self, target: str, calldata: bytes) -> tuple[bool, bytes]:
+        selector, args = calldata[:4], calldata[4:]
+        if target in self.reverting:
+            return False, b""
+        if target in self.empty:
+            return True, b""
+        if selector == GET_ETH_BALANCE_SELECTOR:
+            (owner,) = decode(["address"], args)
+            return True, encode(["uint256"], [self.balances.get((NATIVE_TOKEN.lower(), owner.lower()), 0)])
+        if selector == BALANCE_OF_SELECTOR:
+            (owner,) = decode(["address"], args)
+            return True, encode(["uint256"], [self.balances.get((target, owner.lower()), 0)])
+        if selector == ALLOWANCE_SELECTOR:
+            owner, spender = decode(["address", "address"], args)
+            return True, encode(["uint256"], [self.allowances.get((target, owner.lower(), spender.lower()), 0)])
+        return False, b""
+
+    def set_balance(self, token: str, owner: str, amount: int) -> None:
+        self.balances[(token.lower(), owner.lower())] = amount
+
+    def set_allowance(self, token: str, owner: str, spender: str, amount: int) -> None:
+        self.allowances[(token.lower(), owner.lower(), spender.lower())] = amount
+
+
+@pytest.mark.asyncio
+async def test_read_decodes_every_token_and_account() -> None:
+    multicall = FakeMulticall()
+    multicall.set_balance(USDT, TAKER, 1_000)
+    multicall.set_balance(USDC, OTHER, 2_000)
+    multicall.set_balance(NATIVE_TOKEN, TAKER, 3 * 10**18)
+    multicall.set_allowance(USDT, TAKER, SPENDERS[0], MAX_UINT256)
+    multicall.set_allowance(USDC, OTHER, SPENDERS[1], 500)
+    async with MockRpcNode(handlers={"eth_call": multicall}) as node:
+        reader = TokenStateReader(CHAIN, AsyncWeb3(AsyncHTTPProvider(node.url)))
+        # Lower case addresses come back checksummed
+        states = await reader.read([USDT.lower(), USDC, NATIVE_TOKEN], [TAKER, OTHER.lower()])
+    assert set(states) == {(token, owner) for token in (USDT, USDC, NATIVE_TOKEN) for owner in (TAKER, OTHER)}
+    assert multicall.batches == [
+        2 * (1 + 2) * 2 + 2
+    ]  # a balance and 2 allowances per ERC20 pair, a native balance per account
+
+    usdt = states[(USDT, TAKER)]
+    assert (usdt.balance, usdt.allowances) == (1_000, {SPENDERS[0]: MAX_UINT256, SPENDERS[1]: 0})
+    assert usdt.is_approved(SPENDERS[0].lower(), 10**30) and not usdt.is_approved(SPENDERS[1], 1)
+    usdc = states[(USDC, OTHER)]
+    assert (usdc.balance, usdc.allowance(SPENDERS[1])) == (2_000, 500)
+    assert usdc.is_approved(SPENDERS[1], 500) and not usdc.is_approved(SPENDERS[1], 501)
+    assert states[(USDC, TAKER)].balance == 0
+    # Native balances need no approval
+    native = states[(NATIVE_TOKEN, TAKER)]
+    assert native.balance == 3 * 10**18 and all(native.is_approved(spender, 10**30) for spender in SPENDERS)
+
+
+@pytest.mark.asyncio
+async def test_failed_calls_read_as_none() -> None:
+    multicall = FakeMulticall()
+    multicall.reverting.add(USDT.lower())
+    multicall.empty.add(WETH.lower())
+    multicall.set_balance(USDC, TAKER, 7)
+    async with MockRpcNode(handlers={"eth_call": multicall}) as node:
+        reader = TokenStateReader(CHAIN, AsyncWeb3(AsyncHTTPProvider(node.url)))
+        states = await reader.read([USDT, WETH, USDC], [TAKER])
+    for token in (USDT, WETH):
+        assert states[(token, TAKER)].balance is None
+        assert states[(token, TAKER)].allowances == dict.fromkeys(SPENDERS)
+        assert not states[(token, TAKER)].is_approved(SPENDERS[0], 0)
+    # The calls after a failed one are decoded in their own place
+    assert states[(USDC, TAKER)].balance == 7
+
+
+@pytest.mark.asyncio
+async def test_calls_are_split_in_chunks() -> None:
+    multicall = FakeMulticall()
+    tokens = [USDT, USDC, WETH]
+    for amount, token in enumerate(tokens, start=1):
+        multicall.set_balance(token, TAKER, amount)
+        multicall.set_allowance(token, TAKER, SPENDERS[0], amount * 10)
+    async with MockRpcNode(handlers={"eth_call": multicall}) as node:
+        reader = TokenStateReader(CHAIN, AsyncWeb3(AsyncHTTPProvider(node.url)), spenders=SPENDERS[:1], max_calls=4)
+        states = await reader.read(tokens, [TAKER])
+    assert sorted(multicall.batches) == [2, 4]
+    assert [(states[(token, TAKER)].balance, states[(token, TAKER)].allowance(SPENDERS[0])) for token in tokens] == [
+        (1, 10),
+        (2, 20),
+        (3, 30),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_missing_approvals() -> None:
+    multicall = FakeMulticall()
+    multicall.set_allowance(USDT, TAKER, SPENDERS[0], 100)
+    multicall.set_allowance(USDC, TAKER, SPENDERS[0], MAX_UINT256)
+    async with MockRpcNode(handlers={"eth_call": multicall}) as node:
+        reader = TokenStateReader(CHAIN, AsyncWeb3(AsyncHTTPProvider(node.url)))
+        assert await missing_approvals(reader, TAKER, SPENDERS[0], [USDT, USDC, WETH]) == [WETH]
+        assert await missing_approvals(reader, TAKER, SPENDERS[0], [USDT, USDC], amounts=[101, 10**30]) == [USDT]
+        with pytest.raises(ValueError, match="is not read by this TokenStateReader"):
+            await missing_approvals(reader, TAKER, OTHER, [USDT])